@@ -1,14 +1,14 @@
 """Camera service orchestration."""
 
 import asyncio
-import base64
 import io
 import logging
 import time
 
 from PIL import Image
 from tars.adapters.mqtt_client import MQTTClient  # type: ignore[import]
-from tars.contracts.v1.camera import CameraFrame  # type: ignore[import]
+from tars.contracts.binary import CONTENT_TYPE_JPEG  # type: ignore[import]
+from tars.contracts.v1.camera import EVENT_TYPE_CAMERA_FRAME  # type: ignore[import]
 
 from .capture import CameraCapture
 from .config import ServiceConfig
@@ -215,23 +215,21 @@ class CameraService:
         backend: str | None,
         consecutive_failures: int,
     ) -> None:
-        """Publish frame to MQTT (base64 encoded)."""
-        frame_b64 = base64.b64encode(jpeg_data).decode("ascii")
-
-        frame = CameraFrame(
-            frame_data=frame_b64,
-            format="jpeg",
-            width=width,
-            height=height,
-            frame_number=self.frame_count,
-            fps=mqtt_rate if mqtt_rate > 0 else None,
-        )
+        """Publish frame to MQTT as a binary envelope (raw JPEG bytes).
+
+        Frame attributes travel as content-type parameters so consumers can
+        read them without decoding the image.
+        """
+        content_type = f"{CONTENT_TYPE_JPEG};w={width};h={height};n={self.frame_count}"
+        if mqtt_rate > 0:
+            content_type += f";fps={mqtt_rate}"
 
         try:
-            await self.mqtt.publish_event(
+            await self.mqtt.publish_binary(
                 topic=self.cfg.mqtt.frame_topic,
-                event_type="camera.frame",
-                data=frame,
+                event_type=EVENT_TYPE_CAMERA_FRAME,
+                payload=jpeg_data,
+                content_type=content_type,
                 qos=0,
             )
         except Exception as e:
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Measure time to first token and failed turns with failover and hedging.
+
+Two local stand-ins for the chat completions endpoint stream a short SSE
+reply. The "primary" usually answers in ``--fast-ms`` but stalls for
+``--stall-ms`` on a ``--stall`` share of requests and returns 503 on an
+``--error`` share. The "backup" always answers in ``--backup-ms``. Each turn
+runs against the primary alone, through ``ProviderRouter`` with failover
+only, and with a hedge sent after ``--hedge-ms``.
+
+Usage:
+    python scripts/benchmark_failover.py [--turns 100] [--stall 0.1] [--error 0.1] [--hedge-ms 400]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from llm_worker.providers.base import LLMProvider  # noqa: E402
+from llm_worker.providers.openai import OpenAIProvider  # noqa: E402
+from llm_worker.providers.router import Endpoint, EndpointHealth, ProviderRouter  # noqa: E402
+
+_BODY = (
+    b'data: {"choices": [{"delta": {"content": "Hello"}}]}\n\n'
+    b'data: {"choices": [{"delta": {"content": " there."}}]}\n\n'
+    b"data: [DONE]\n\n"
+)
+_ERROR = b'{"error": {"message": "overloaded"}}'
+
+
+async def serve(pick_delay, error_rate: float, rng: random.Random) -> tuple[asyncio.Server, int]:
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                await reader.readexactly(length)
+                await asyncio.sleep(pick_delay())
+                if rng.random() < error_rate:
+                    status, kind, body = b"503 Service Unavailable", b"application/json", _ERROR
+                else:
+                    status, kind, body = b"200 OK", b"text/event-stream", _BODY
+                writer.write(
+                    b"HTTP/1.1 %s\r\ncontent-type: %s\r\ncontent-length: %d\r\n\r\n%s"
+                    % (status, kind, len(body), body)
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+def provider(port: int) -> OpenAIProvider:
+    return OpenAIProvider(
+        api_key="sk-bench", base_url=f"http://127.0.0.1:{port}/v1", responses_model_patterns=["none"]
+    )
+
+
+async def first_token(target: LLMProvider) -> float | None:
+    started = time.perf_counter()
+    try:
+        stream = target.stream_chat([{"role": "user", "content": "hi"}], model="gpt-test")
+        await stream.__anext__()
+        elapsed = time.perf_counter() - started
+        async for _ in stream:
+            pass
+        return elapsed
+    except Exception:
+        return None
+
+
+async def run(args: argparse.Namespace) -> None:
+    rng = random.Random(7)
+    primary_server, primary_port = await serve(
+        lambda: (args.stall_ms if rng.random() < args.stall else args.fast_ms) / 1000, args.error, rng
+    )
+    backup_server, backup_port = await serve(lambda: args.backup_ms / 1000, 0.0, rng)
+
+    def router(hedge_after: float) -> ProviderRouter:
+        # A circuit that never opens keeps every turn comparable with "primary only"
+        health = EndpointHealth(failure_threshold=10**6)
+        return ProviderRouter(
+            [
+                Endpoint("primary", provider(primary_port), health=health),
+                Endpoint("backup", provider(backup_port)),
+            ],
+            hedge_after=hedge_after,
+        )
+
+    targets: list[tuple[str, LLMProvider]] = [
+        ("primary", provider(primary_port)),
+        ("failover", router(0.0)),
+        ("hedged", router(args.hedge_ms / 1000)),
+    ]
+    for name, target in targets:
+        await target.start()
+        samples = [await first_token(target) for _ in range(args.turns)]
+        await target.aclose()
+        ok = sorted(s for s in samples if s is not None)
+        print(
+            f"{name:<9} ttft median={statistics.median(ok) * 1000:7.1f} ms "
+            f"p95={ok[int(len(ok) * 0.95) - 1] * 1000:7.1f} ms  "
+            f"failed turns={len(samples) - len(ok)}/{args.turns}"
+        )
+
+    for server in (primary_server, backup_server):
+        server.close()
+        await server.wait_closed()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=100)
+    parser.add_argument("--fast-ms", type=float, default=100.0, help="Usual primary latency")
+    parser.add_argument("--stall-ms", type=float, default=2000.0, help="Primary latency when it stalls")
+    parser.add_argument("--stall", type=float, default=0.1, help="Share of primary requests that stall")
+    parser.add_argument("--error", type=float, default=0.1, help="Share of primary requests answered 503")
+    parser.add_argument("--backup-ms", type=float, default=250.0, help="Backup latency")
+    parser.add_argument("--hedge-ms", type=float, default=400.0, help="Hedge deadline")
+    args = parser.parse_args()
+    import logging
+
+    logging.disable(logging.CRITICAL)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Measure time to first streamed token with and without the pooled HTTP client.
+
+A local stand-in for the chat completions endpoint streams a short SSE reply
+over HTTP/1.1 keep-alive. ``--setup-ms`` delays the first request on every
+new connection to stand in for DNS + TCP + TLS setup to a remote API. The
+"fresh" case opens a new ``httpx.AsyncClient`` per call (the provider's former
+behaviour); the "pooled" case reuses ``OpenAIProvider``'s client.
+
+Usage:
+    python scripts/benchmark_http_pool.py [--calls 50] [--setup-ms 80]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from llm_worker.providers.openai import OpenAIProvider  # noqa: E402
+
+_BODY = (
+    b'data: {"choices": [{"delta": {"content": "Hello"}}]}\n\n'
+    b'data: {"choices": [{"delta": {"content": " there."}}]}\n\n'
+    b"data: [DONE]\n\n"
+)
+
+
+async def serve(setup_s: float) -> tuple[asyncio.Server, int]:
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        await asyncio.sleep(setup_s)  # per-connection handshake cost
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                await reader.readexactly(length)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\ncontent-type: text/event-stream\r\n"
+                    b"content-length: %d\r\n\r\n%s" % (len(_BODY), _BODY)
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+async def first_token(provider: OpenAIProvider) -> float:
+    started = time.perf_counter()
+    stream = provider.stream("hi", model="gpt-test")
+    await stream.__anext__()
+    elapsed = time.perf_counter() - started
+    async for _ in stream:
+        pass
+    return elapsed
+
+
+async def run(calls: int, setup_ms: float) -> None:
+    server, port = await serve(setup_ms / 1000)
+    base_url = f"http://127.0.0.1:{port}/v1"
+
+    fresh = []
+    for _ in range(calls):
+        provider = OpenAIProvider(api_key="sk-bench", base_url=base_url, responses_model_patterns=["none"])
+        fresh.append(await first_token(provider))
+        await provider.aclose()
+
+    pooled = []
+    provider = OpenAIProvider(api_key="sk-bench", base_url=base_url, responses_model_patterns=["none"])
+    await provider.start()
+    for _ in range(calls):
+        pooled.append(await first_token(provider))
+    await provider.aclose()
+
+    server.close()
+    await server.wait_closed()
+    for name, samples in (("fresh", fresh), ("pooled", pooled)):
+        print(
+            f"{name:<7} ttfb median={statistics.median(samples) * 1000:7.2f} ms "
+            f"p95={sorted(samples)[int(len(samples) * 0.95) - 1] * 1000:7.2f} ms"
+        )
+    print(f"saved   {(statistics.median(fresh) - statistics.median(pooled)) * 1000:7.2f} ms per call")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=50)
+    parser.add_argument("--setup-ms", type=float, default=80.0, help="Simulated connection setup per new connection")
+    args = parser.parse_args()
+    import logging
+
+    logging.disable(logging.CRITICAL)
+    asyncio.run(run(args.calls, args.setup_ms))
+
+
+if __name__ == "__main__":
+    main()
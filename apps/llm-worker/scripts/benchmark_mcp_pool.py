@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Compare cold (process per call) and warm (pooled session) MCP tool latency.
+
+Runs the repo's tars-mcp-character and tars-mcp-movement stdio servers. The
+"cold" case launches and initializes a fresh server for every call, as
+MCPToolClient did before the pool; the "warm" case borrows an initialized
+session from MCPServerPool. The first pooled call pays the launch once.
+
+Usage:
+    python scripts/benchmark_mcp_pool.py [--calls 10]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from mcp.client.stdio import StdioServerParameters  # noqa: E402
+
+from llm_worker.mcp_pool import MCPServerPool, stdio_session_factory  # noqa: E402
+
+SERVERS = {
+    "tars-character": ("tars_mcp_character", REPO / "packages" / "tars-mcp-character", "get_current_traits", {}),
+    "tars-movement": ("tars_mcp_movement", REPO / "packages" / "tars-mcp-movement", "wave", {"speed": 0.7}),
+}
+
+
+def _params(module: str, package_dir: Path) -> StdioServerParameters:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(package_dir), os.environ.get("PYTHONPATH", "")]), "LOG_LEVEL": "WARNING"}
+    return StdioServerParameters(command=sys.executable, args=["-m", module], env=env)
+
+
+def _fmt(samples: list[float]) -> str:
+    return f"median={statistics.median(samples) * 1000:8.1f} ms  max={max(samples) * 1000:8.1f} ms"
+
+
+async def run(calls: int) -> None:
+    devnull = open(os.devnull, "w")
+    for server, (module, package_dir, tool, arguments) in SERVERS.items():
+        connect = stdio_session_factory(_params(module, package_dir), errlog=devnull)
+
+        cold = []
+        for _ in range(calls):
+            started = time.perf_counter()
+            async with connect() as session:
+                await session.call_tool(tool, arguments)
+            cold.append(time.perf_counter() - started)
+
+        pool = MCPServerPool(server, connect)
+        started = time.perf_counter()
+        await pool.call_tool(tool, arguments)
+        first = time.perf_counter() - started
+        warm = []
+        for _ in range(calls):
+            started = time.perf_counter()
+            await pool.call_tool(tool, arguments)
+            warm.append(time.perf_counter() - started)
+        await pool.close()
+
+        print(f"{server} ({tool})")
+        print(f"  cold   {_fmt(cold)}")
+        print(f"  warm   {_fmt(warm)}  (first pooled call {first * 1000:.1f} ms, spawned={pool.spawned})")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=10)
+    args = parser.parse_args()
+    import logging
+
+    logging.disable(logging.CRITICAL)
+    asyncio.run(run(args.calls))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Time token counting + packing of a prompt's RAG chunks and history.
+
+A turn counts every history message and RAG chunk, then packs them into the
+context budget. The history is re-sent on every turn, so after the first
+turn its counts come from the per-text cache. The bench reports the first
+turn ("cold") and later turns ("warm"), where only the new chunks and the
+newest messages are counted.
+
+Pass a real ranks file with ``--vocab`` (e.g. cl100k_base.tiktoken). Without
+one, a small BPE is trained on synthetic text so the bench runs offline.
+
+Usage:
+    python scripts/benchmark_prompt_packing.py [--vocab cl100k_base.tiktoken] [--history 40] [--chunks 10]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from llm_worker.handlers.context_packer import MESSAGE_OVERHEAD_TOKENS, pack_context  # noqa: E402
+from llm_worker.tokenizer import BPETokenizer, HeuristicTokenizer, Tokenizer  # noqa: E402
+
+WORDS = (
+    "the weather today is sunny with light wind from the west and my dog Rex likes "
+    "long walks near the river when it is warm outside remind me to buy coffee "
+    "beans tomorrow morning before the meeting at nine thirty"
+).split()
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def train_toy_bpe(corpus: str, merges: int) -> BPETokenizer:
+    ranks = {bytes([i]): i for i in range(256)}
+    words = Counter(tuple(bytes([b]) for b in (" " + w).encode()) for w in corpus.split())
+    for _ in range(merges):
+        pairs: Counter = Counter()
+        for word, freq in words.items():
+            for pair in zip(word, word[1:]):
+                pairs[pair] += freq
+        if not pairs:
+            break
+        (a, b), _ = pairs.most_common(1)[0]
+        ranks[a + b] = len(ranks)
+        merged: Counter = Counter()
+        for word, freq in words.items():
+            out, i = [], 0
+            while i < len(word):
+                if i + 1 < len(word) and word[i] == a and word[i + 1] == b:
+                    out.append(a + b)
+                    i += 2
+                else:
+                    out.append(word[i])
+                    i += 1
+            merged[tuple(out)] += freq
+        words = merged
+    return BPETokenizer(ranks)
+
+
+def turn(tokenizer: Tokenizer, history: list[str], chunks: list[str], budget: int) -> float:
+    started = time.perf_counter()
+    history_costs = [tokenizer.count(m) + MESSAGE_OVERHEAD_TOKENS for m in history]
+    chunk_costs = [tokenizer.count(c) + 1 for c in chunks]
+    pack_context(budget, chunk_costs, list(range(len(chunks))), history_costs)
+    return time.perf_counter() - started
+
+
+def run(tokenizer: Tokenizer, label: str, history_len: int, chunk_count: int, turns: int) -> None:
+    rng = random.Random(3)
+    history = [sentence(rng, rng.randint(8, 60)) for _ in range(history_len)]
+    cold = turn(tokenizer, history, [sentence(rng, 40) for _ in range(chunk_count)], 6000)
+    warm = []
+    for _ in range(turns):
+        history += [sentence(rng, 12), sentence(rng, 30)]  # last user turn + reply
+        warm.append(turn(tokenizer, history, [sentence(rng, 40) for _ in range(chunk_count)], 6000))
+    print(
+        f"{label:<10} cold={cold * 1000:7.2f} ms  warm median={statistics.median(warm) * 1000:6.2f} ms"
+        f"  ({history_len}+ messages, {chunk_count} chunks)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--vocab", type=Path, help="tiktoken-format ranks file")
+    parser.add_argument("--history", type=int, default=40, help="History messages on the first turn")
+    parser.add_argument("--chunks", type=int, default=10, help="RAG chunks per turn")
+    parser.add_argument("--turns", type=int, default=20)
+    args = parser.parse_args()
+    if args.vocab:
+        bpe = BPETokenizer.from_file(args.vocab)
+    else:
+        rng = random.Random(1)
+        bpe = train_toy_bpe(" ".join(sentence(rng, 20) for _ in range(200)), merges=300)
+    run(HeuristicTokenizer(), "heuristic", args.history, args.chunks, args.turns)
+    run(bpe, "bpe", args.history, args.chunks, args.turns)
+
+
+if __name__ == "__main__":
+    main()
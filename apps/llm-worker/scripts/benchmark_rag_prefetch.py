@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Measure prompt-ready latency of a RAG turn: serial retrieval vs prefetch.
+
+A stand-in memory service answers memory/query after ``--rag-ms`` and another
+request holds the only scheduler slot for ``--queue-ms``. "serial" starts
+retrieval when the request gets its slot (the former behaviour), so the
+prompt is ready after queue wait + retrieval. "prefetch" goes through
+process_request, which starts retrieval on arrival, so the two overlap.
+"similar" repeats the prefetch turn with a reworded follow-up that is served
+from the similar-query cache.
+
+Usage:
+    python scripts/benchmark_rag_prefetch.py [--rag-ms 300] [--queue-ms 200] [--rounds 5]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from llm_worker.handlers.rag import RAGHandler  # noqa: E402
+from llm_worker.handlers.request_handler import RequestHandler  # noqa: E402
+from llm_worker.handlers.scheduler import RequestScheduler  # noqa: E402
+from tars.contracts.envelope import Envelope  # type: ignore[import]  # noqa: E402
+from tars.contracts.v1 import LLMRequest  # type: ignore[import]  # noqa: E402
+
+
+class PromptClock:
+    """Provider stand-in recording when the prompt reached it."""
+
+    name = "openai"
+
+    def __init__(self) -> None:
+        self.ready = asyncio.Event()
+
+    async def generate_chat(self, messages, **kwargs):
+        self.ready.set()
+        result = MagicMock()
+        result.text, result.usage = "ok", None
+        return result
+
+
+def build(rag_s: float, prefetch: bool) -> tuple[RequestHandler, PromptClock, RequestScheduler]:
+    async def memory_request(topic, event_type, query, **kwargs):
+        await asyncio.sleep(rag_s)
+        data = {"results": [{"document": {"text": "the dog is called Rex"}}], "total_tokens": 6}
+        return Envelope.new(event_type="memory.results", data=data)
+
+    mqtt_wrapper = MagicMock()
+    mqtt_wrapper.publish_event = AsyncMock()
+    mqtt_wrapper.request = memory_request
+    character_mgr = MagicMock()
+    character_mgr.build_system_prompt.return_value = None
+    tool_executor = MagicMock()
+    tool_executor.tools = []
+    tool_executor.extract_tool_calls.return_value = []
+    provider = PromptClock()
+    scheduler = RequestScheduler(max_concurrent=1)
+    handler = RequestHandler(
+        provider=provider,
+        character_mgr=character_mgr,
+        tool_executor=tool_executor,
+        rag_handler=RAGHandler("memory/query", similar_cache_size=32 if prefetch else 0),
+        mqtt_client=mqtt_wrapper,
+        config={"RAG_ENABLED": True, "OPENAI_API_KEY": "bench"},
+        scheduler=scheduler,
+    )
+    return handler, provider, scheduler
+
+
+async def turn(rag_s: float, queue_s: float, prefetch: bool, texts: list[str]) -> float:
+    handler, provider, scheduler = build(rag_s, prefetch)
+    for i, text in enumerate(texts):
+        provider.ready.clear()
+        request = LLMRequest(id=f"r{i}", text=text, stream=False)
+        payload = Envelope.new(event_type="llm.request", data=request.model_dump())
+        payload = payload.model_dump_json().encode()
+        started = time.perf_counter()
+        if prefetch:
+            scheduler.submit(f"busy-{i}", lambda: asyncio.sleep(queue_s), on_cancel=AsyncMock())
+            await handler.process_request(MagicMock(), payload)
+        else:
+            # Retrieval only starts once the request holds its slot
+            await asyncio.sleep(queue_s)
+            handler.scheduler = None
+            await handler.process_request(MagicMock(), payload)
+            handler.scheduler = scheduler
+        await provider.ready.wait()
+        elapsed = time.perf_counter() - started
+    await scheduler.aclose()
+    return elapsed
+
+
+async def run(rag_ms: float, queue_ms: float, rounds: int) -> None:
+    rag_s, queue_s = rag_ms / 1000, queue_ms / 1000
+    first = ["what did I say about my dog"]
+    follow_up = first + ["What did I say about my dog?"]
+    for label, prefetch, texts in (
+        ("serial", False, first),
+        ("prefetch", True, first),
+        ("similar", True, follow_up),
+    ):
+        samples = [await turn(rag_s, queue_s, prefetch, texts) for _ in range(rounds)]
+        print(f"{label:<9} prompt ready median={statistics.median(samples) * 1000:8.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rag-ms", type=float, default=300.0, help="memory/query latency")
+    parser.add_argument("--queue-ms", type=float, default=200.0, help="time spent waiting for a slot")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    import logging
+
+    logging.disable(logging.CRITICAL)
+    asyncio.run(run(args.rag_ms, args.queue_ms, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Replay token timings through StreamCoalescer: message rate vs added latency.
+
+Each trace entry is ``[seconds since request, delta text]``. A recorded trace
+can be passed with ``--trace``. Without one, a synthetic trace is generated:
+a 400 ms first token, then ~25 ms between 1-4 character tokens, and an
+occasional 300 ms stall. Both runs replay the same timings. "per-chunk"
+publishes every delta, as before. "coalesced" uses the given window and byte
+threshold. For each run the bench reports messages published, when the first
+delta went out, and how long characters waited in the buffer.
+
+Usage:
+    python scripts/benchmark_stream_coalescing.py [--trace tokens.json] [--window-ms 50] [--max-bytes 64]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from llm_worker.handlers.stream_coalescer import StreamCoalescer  # noqa: E402
+
+WORDS = (
+    "Sure, here is what I found. The forecast calls for light rain this afternoon, "
+    "clearing by evening; temperatures stay mild. Would you like a reminder to take "
+    "an umbrella? I can also check the traffic on your route."
+).split(" ")
+
+
+def synthetic_trace(tokens: int, seed: int = 7) -> list[tuple[float, str]]:
+    rng = random.Random(seed)
+    text = " ".join(WORDS[i % len(WORDS)] for i in range(tokens))
+    trace, at, pos = [], 0.4, 0
+    while pos < len(text):
+        size = rng.randint(1, 4)
+        trace.append((at, text[pos : pos + size]))
+        pos += size
+        at += 0.3 if rng.random() < 0.01 else rng.uniform(0.01, 0.04)
+    return trace
+
+
+async def replay(trace: list[tuple[float, str]], window: float, max_bytes: int) -> dict:
+    received: list[float] = []  # arrival time of each character
+    published: list[tuple[float, int]] = []
+
+    async def publish(text: str) -> None:
+        published.append((time.perf_counter(), len(text)))
+
+    coalescer = StreamCoalescer(publish, window=window, max_bytes=max_bytes)
+    started = time.perf_counter()
+    for offset, text in trace:
+        await asyncio.sleep(max(0.0, started + offset - time.perf_counter()))
+        received.extend([time.perf_counter()] * len(text))
+        await coalescer.push(text)
+    await coalescer.flush()
+
+    waits, char = [], 0
+    for at, length in published:
+        waits.extend(at - arrived for arrived in received[char : char + length])
+        char += length
+    return {
+        "messages": len(published),
+        "first_ms": (published[0][0] - started) * 1000,
+        "wait_mean_ms": statistics.fmean(waits) * 1000,
+        "wait_p95_ms": statistics.quantiles(waits, n=20)[-1] * 1000,
+    }
+
+
+async def run(trace: list[tuple[float, str]], window: float, max_bytes: int) -> None:
+    print(f"{len(trace)} chunks over {trace[-1][0]:.2f}s")
+    for label, win in (("per-chunk", 0.0), ("coalesced", window)):
+        r = await replay(trace, win, max_bytes)
+        print(
+            f"{label:<10} messages={r['messages']:5d} first={r['first_ms']:7.1f} ms "
+            f"char wait mean={r['wait_mean_ms']:6.1f} ms p95={r['wait_p95_ms']:6.1f} ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trace", type=Path, help="JSON list of [seconds, text] pairs")
+    parser.add_argument("--tokens", type=int, default=120, help="Words in the synthetic trace")
+    parser.add_argument("--window-ms", type=float, default=50.0)
+    parser.add_argument("--max-bytes", type=int, default=64)
+    args = parser.parse_args()
+    if args.trace:
+        trace = [(float(at), str(text)) for at, text in json.loads(args.trace.read_text())]
+    else:
+        trace = synthetic_trace(args.tokens)
+    asyncio.run(run(trace, args.window_ms / 1000, args.max_bytes))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Measure wall time of a multi-tool turn with sequential vs concurrent execution.
+
+A stand-in MCP client sleeps for each tool's latency. "sequential" runs the
+calls through a ToolExecutor limited to one call at a time (the former for
+loop); "concurrent" uses the default semaphore, so wall time should drop from
+the sum of the latencies to roughly the slowest one.
+
+Usage:
+    python scripts/benchmark_tool_calls.py [--latencies 0.3,0.2,0.1] [--rounds 5]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from llm_worker.handlers.tools import ToolExecutor  # noqa: E402
+
+
+class SleepingMCPClient:
+    def __init__(self, latencies: dict[str, float]):
+        self.latencies = latencies
+
+    async def execute_tool(self, name: str, arguments: dict) -> dict:
+        await asyncio.sleep(self.latencies[name])
+        return {"content": name}
+
+
+async def turn(executor: ToolExecutor, calls: list[dict]) -> float:
+    started = time.perf_counter()
+    await executor.execute_tool_calls(calls)
+    return time.perf_counter() - started
+
+
+async def run(latencies: list[float], rounds: int) -> None:
+    names = {f"mcp__bench__tool{i}": latency for i, latency in enumerate(latencies)}
+    calls = [{"id": f"call-{i}", "function": {"name": name, "arguments": "{}"}} for i, name in enumerate(names)]
+    with patch("llm_worker.handlers.tools.get_mcp_client", return_value=SleepingMCPClient(names)):
+        for label, max_concurrent in (("sequential", 1), ("concurrent", len(calls))):
+            executor = ToolExecutor(max_concurrent=max_concurrent, timeout=60.0)
+            executor._initialized = True
+            samples = [await turn(executor, calls) for _ in range(rounds)]
+            print(f"{label:<10} wall median={statistics.median(samples) * 1000:8.1f} ms")
+    print(f"sum(latencies)={sum(latencies) * 1000:.1f} ms  max(latencies)={max(latencies) * 1000:.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latencies", default="0.3,0.2,0.1", help="Comma-separated tool latencies in seconds")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    import logging
+
+    logging.disable(logging.CRITICAL)
+    asyncio.run(run([float(v) for v in args.latencies.split(",")], args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -50,9 +50,44 @@ def env_csv(key: str, default: str = "") -> list[str]:
     return [item.strip() for item in raw.split(",") if item and item.strip()]
 
 
+def env_float_map(key: str, default: str = "") -> dict[str, float]:
+    """Parse "name=1.5,other=3" into a dict, skipping malformed items."""
+    out: dict[str, float] = {}
+    for item in env_csv(key, default):
+        name, _, value = item.partition("=")
+        try:
+            out[name.strip()] = float(value)
+        except ValueError:
+            continue
+    return out
+
+
+def env_str_map(key: str, default: str = "") -> dict[str, str]:
+    """Parse "name=value,other=value" into a dict, skipping malformed items."""
+    out: dict[str, str] = {}
+    for item in env_csv(key, default):
+        name, sep, value = item.partition("=")
+        if sep and name.strip() and value.strip():
+            out[name.strip()] = value.strip()
+    return out
+
+
 MQTT_URL = env_str("MQTT_URL", "mqtt://127.0.0.1:1883")
 LOG_LEVEL = env_str("LLM_LOG_LEVEL", "INFO")
 
+# Horizontal scaling: replicas sharing a group split llm/request between them.
+# Leave empty to run a single worker that receives every request.
+LLM_SHARE_GROUP = env_str("LLM_SHARE_GROUP", "")
+
+# QoS 1 replies (llm/response, tts/say, llm/stream) published while the broker
+# is away wait in an outbox of this size and replay on reconnect. 0 disables.
+MQTT_OUTBOX_MAX_ENTRIES = env_int("MQTT_OUTBOX_MAX_ENTRIES", 256)
+
+# Requests run as cancellable tasks: at most LLM_MAX_CONCURRENT at once, up to
+# LLM_MAX_QUEUED more waiting (served round-robin per source), the rest rejected.
+LLM_MAX_CONCURRENT = env_int("LLM_MAX_CONCURRENT", 2)
+LLM_MAX_QUEUED = env_int("LLM_MAX_QUEUED", 32)
+
 # Provider selection
 LLM_PROVIDER = env_str("LLM_PROVIDER", "openai")
 LLM_MODEL = env_str("LLM_MODEL", "gpt-4o-mini")
@@ -61,6 +96,9 @@ LLM_TEMPERATURE = env_float("LLM_TEMPERATURE", 0.7)
 LLM_TOP_P = env_float("LLM_TOP_P", 1.0)
 LLM_TOP_K = env_int("LLM_TOP_K", 0)
 LLM_CTX_WINDOW = env_int("LLM_CTX_WINDOW", 8192)
+# Local tiktoken-format BPE ranks file (e.g. cl100k_base.tiktoken) for exact prompt
+# budgeting; unset falls back to a word-count estimate
+LLM_TOKENIZER_PATH = env_str("LLM_TOKENIZER_PATH", "")
 LLM_DEVICE = env_str("LLM_DEVICE", "cpu")
 
 # Provider creds/urls
@@ -70,6 +108,24 @@ OPENAI_RESPONSES_MODELS = env_csv(
     "OPENAI_RESPONSES_MODELS",
     "gpt-4.1*,gpt-4o-mini*,gpt-5*,gpt-5-mini,gpt-5-nano",
 )
+# Pooled HTTP client: keep-alive connections are reused across requests
+OPENAI_TIMEOUT = env_float("OPENAI_TIMEOUT", 60.0)
+OPENAI_CONNECT_TIMEOUT = env_float("OPENAI_CONNECT_TIMEOUT", 5.0)
+OPENAI_STREAM_READ_TIMEOUT = env_float("OPENAI_STREAM_READ_TIMEOUT", 60.0)  # max gap between chunks
+OPENAI_MAX_CONNECTIONS = env_int("OPENAI_MAX_CONNECTIONS", 10)
+OPENAI_KEEPALIVE_EXPIRY = env_float("OPENAI_KEEPALIVE_EXPIRY", 30.0)
+OPENAI_HTTP2 = env_bool("OPENAI_HTTP2", False)  # requires the 'h2' package
+# Failover: extra OpenAI-compatible endpoints tried after OPENAI_BASE_URL, in order
+# ("local=http://127.0.0.1:8080/v1,backup=https://..."). Per-endpoint model and
+# key overrides use the same names; keys default to OPENAI_API_KEY.
+LLM_FALLBACK_ENDPOINTS = env_str_map("LLM_FALLBACK_ENDPOINTS", "")
+LLM_FALLBACK_MODELS = env_str_map("LLM_FALLBACK_MODELS", "")
+LLM_FALLBACK_API_KEYS = env_str_map("LLM_FALLBACK_API_KEYS", "")
+# Duplicate a request on the next endpoint when no first token arrived by then (0 = off)
+LLM_HEDGE_AFTER_SEC = env_float("LLM_HEDGE_AFTER_SEC", 0.0)
+# Circuit breaker: consecutive failures before an endpoint is skipped, and for how long
+LLM_CIRCUIT_FAILURES = env_int("LLM_CIRCUIT_FAILURES", 3)
+LLM_CIRCUIT_COOLDOWN_SEC = env_float("LLM_CIRCUIT_COOLDOWN_SEC", 30.0)
 LLM_SERVER_URL = env_str("LLM_SERVER_URL", "")
 GEMINI_API_KEY = env_str("GEMINI_API_KEY", "")
 GEMINI_BASE_URL = env_str("GEMINI_BASE_URL", "")
@@ -90,6 +146,15 @@ RAG_CONTEXT_WINDOW = env_int("RAG_CONTEXT_WINDOW", 1)  # Number of prev/next ent
 RAG_STRATEGY = env_str("RAG_STRATEGY", "hybrid")  # "hybrid", "recent", "similarity"
 RAG_DYNAMIC_PROMPTS = env_bool("RAG_DYNAMIC_PROMPTS", True)  # Enable token-aware prompt building
 RAG_CACHE_TTL = env_int("RAG_CACHE_TTL", 300)  # Cache TTL in seconds (default 5 minutes)
+# Near-duplicate queries reuse a recent result (Jaccard word overlap >= threshold)
+RAG_SIMILAR_CACHE_TTL = env_float("RAG_SIMILAR_CACHE_TTL", 60.0)
+RAG_SIMILAR_CACHE_THRESHOLD = env_float("RAG_SIMILAR_CACHE_THRESHOLD", 0.8)
+RAG_SIMILAR_CACHE_SIZE = env_int("RAG_SIMILAR_CACHE_SIZE", 32)  # 0 disables
+# RAG is prefetched when a request arrives; its deadline is a share of what is
+# left of the turn budget, capped at RAG_TIMEOUT_SEC
+LLM_TURN_BUDGET_SEC = env_float("LLM_TURN_BUDGET_SEC", 8.0)
+RAG_BUDGET_FRACTION = env_float("RAG_BUDGET_FRACTION", 0.4)
+RAG_TIMEOUT_SEC = env_float("RAG_TIMEOUT_SEC", 5.0)
 
 # Topics - use constants from tars-core (re-export for backward compatibility)
 # These can still be overridden via environment if needed, but default to contract constants
@@ -108,6 +173,25 @@ TOPIC_CHARACTER_RESULT = TOPIC_CHARACTER_RESULT
 
 # Tool calling
 TOOL_CALLING_ENABLED = env_bool("TOOL_CALLING_ENABLED", False)
+# Streaming turns: tool-call rounds before the model must answer without tools
+TOOL_MAX_ROUNDS = env_int("TOOL_MAX_ROUNDS", 3)
+# Independent tool calls run concurrently; tools matching TOOL_SERIAL_TOOLS
+# (fnmatch patterns over mcp__server__tool names) have side effects and run one at a time.
+TOOL_MAX_CONCURRENT = env_int("TOOL_MAX_CONCURRENT", 4)
+TOOL_TIMEOUT_SEC = env_float("TOOL_TIMEOUT_SEC", 10.0)
+TOOL_SERIAL_TOOLS = env_csv("TOOL_SERIAL_TOOLS", "mcp__tars-movement__*")
+# Read-only tool results reused for a TTL: "pattern=seconds,..." (registry cache_ttl wins)
+TOOL_CACHE_TTLS = env_float_map("TOOL_CACHE_TTLS")
+TOOL_CACHE_MAX_ENTRIES = env_int("TOOL_CACHE_MAX_ENTRIES", 256)
+
+# Warm MCP stdio servers: up to MCP_POOL_MAX_SESSIONS initialized processes per
+# server, pinged before reuse after MCP_POOL_HEALTH_INTERVAL_SEC, closed after
+# MCP_POOL_IDLE_SEC unused. Disable to launch a fresh process per tool call.
+MCP_POOL_ENABLED = env_bool("MCP_POOL_ENABLED", True)
+MCP_POOL_MAX_SESSIONS = env_int("MCP_POOL_MAX_SESSIONS", 2)
+MCP_POOL_IDLE_SEC = env_float("MCP_POOL_IDLE_SEC", 300.0)
+MCP_POOL_HEALTH_INTERVAL_SEC = env_float("MCP_POOL_HEALTH_INTERVAL_SEC", 30.0)
+MCP_POOL_START_TIMEOUT_SEC = env_float("MCP_POOL_START_TIMEOUT_SEC", 15.0)
 TOPIC_TOOLS_REGISTRY = TOPIC_LLM_TOOLS_REGISTRY
 TOPIC_TOOL_CALL_REQUEST = TOPIC_LLM_TOOL_CALL_REQUEST
 TOPIC_TOOL_CALL_RESULT = TOPIC_LLM_TOOL_CALL_RESULT
@@ -118,3 +202,10 @@ TOPIC_TTS_SAY = TOPIC_TTS_SAY
 STREAM_MIN_CHARS = env_int("STREAM_MIN_CHARS", 60)
 STREAM_MAX_CHARS = env_int("STREAM_MAX_CHARS", 240)
 STREAM_BOUNDARY_CHARS = env_str("STREAM_BOUNDARY_CHARS", ".!?;:")
+# llm/stream deltas are batched for up to this long / this many bytes; the first
+# delta and sentence boundaries publish immediately. 0 publishes every chunk.
+STREAM_COALESCE_MS = env_float("STREAM_COALESCE_MS", 50.0)
+STREAM_COALESCE_MAX_BYTES = env_int("STREAM_COALESCE_MAX_BYTES", 64)
+# Queued llm/stream deltas older than this (seconds) are dropped on replay;
+# the final llm/response still carries the full reply.
+STREAM_DELTA_EXPIRY = env_float("STREAM_DELTA_EXPIRY", 2.0)
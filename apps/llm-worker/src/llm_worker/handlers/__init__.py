@@ -3,15 +3,21 @@
 from .character import CharacterManager
 from .messages import MessageHandler
 from .tools import ToolExecutor
+from .tool_cache import ToolResultCache
 from .rag import RAGHandler
 from .message_router import MessageRouter
 from .request_handler import RequestHandler
+from .scheduler import RequestScheduler
+from .stream_coalescer import StreamCoalescer
 
 __all__ = [
     "CharacterManager",
     "MessageHandler",
     "ToolExecutor",
+    "ToolResultCache",
     "RAGHandler",
     "MessageRouter",
     "RequestHandler",
+    "RequestScheduler",
+    "StreamCoalescer",
 ]
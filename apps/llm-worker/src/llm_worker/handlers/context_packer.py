@@ -0,0 +1,69 @@
+"""Packing of RAG chunks and conversation history into a prompt token budget."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import List, Sequence
+
+# Chat formatting cost per message (role and separators) on OpenAI-style models
+MESSAGE_OVERHEAD_TOKENS = 4
+# Tokens priming the assistant reply
+REPLY_OVERHEAD_TOKENS = 3
+
+
+@dataclass(slots=True)
+class PackedContext:
+    rag: List[int] = field(default_factory=list)  # chosen chunk indices, ascending
+    history_start: int = 0  # history[history_start:] is kept
+    rag_tokens: int = 0
+    history_tokens: int = 0
+
+    @property
+    def tokens(self) -> int:
+        return self.rag_tokens + self.history_tokens
+
+
+def pack_context(
+    budget: int,
+    rag_costs: Sequence[int],
+    rag_priority: Sequence[int],
+    history_costs: Sequence[int],
+    rag_share: float = 0.5,
+) -> PackedContext:
+    """Choose RAG chunks and a history suffix that fit ``budget`` tokens.
+
+    Chunks are taken in ``rag_priority`` order, first-fit: a chunk that does
+    not fit is skipped and smaller lower-ranked ones are still tried. Up to
+    ``rag_share`` of the budget goes to chunks first. The newest history
+    messages then fill what is left, as a contiguous suffix so the
+    conversation stays coherent. Budget still unused after that goes to the
+    chunks skipped by the share. Each phase is greedy by priority. That is
+    the optimum when any one higher-priority item is worth more than any
+    number of lower-priority ones, so no left-out chunk outranks a chosen one
+    it could replace.
+    """
+    packed = PackedContext(history_start=len(history_costs))
+    remaining = max(0, budget)
+    chosen: set[int] = set()
+
+    def fill_rag(limit: int) -> None:
+        nonlocal remaining
+        for index in rag_priority:
+            cost = rag_costs[index]
+            if index not in chosen and cost <= limit and cost <= remaining:
+                chosen.add(index)
+                packed.rag_tokens += cost
+                remaining -= cost
+                limit -= cost
+
+    fill_rag(int(remaining * rag_share))
+    for index in range(len(history_costs) - 1, -1, -1):
+        cost = history_costs[index]
+        if cost > remaining:
+            break
+        packed.history_start = index
+        packed.history_tokens += cost
+        remaining -= cost
+    fill_rag(remaining)
+    packed.rag = sorted(chosen)
+    return packed
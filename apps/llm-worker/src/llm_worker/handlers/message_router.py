@@ -49,6 +49,7 @@ class MessageRouter:
         tools_result_topic: str,
         memory_results_topic: str,
         llm_request_topic: str,
+        llm_cancel_topic: str | None = None,
     ) -> None:
         """Route a single MQTT message to the appropriate handler.
 
@@ -100,43 +101,19 @@ class MessageRouter:
                 logger.warning("Failed to handle tool result: %s", e, exc_info=True)
             return
 
-        # Memory/RAG results
+        # Memory/RAG results are consumed by MQTTClient.request() inside
+        # RAGHandler.query(); nothing to route here.
         if topic == memory_results_topic:
-            logger.info(
-                "MEMORY RESULTS MESSAGE RECEIVED: topic=%s, payload_size=%d",
-                topic,
-                len(message.payload),
-            )
-            try:
-                # Parse envelope to extract data and correlation ID
-                envelope = Envelope.model_validate_json(message.payload)
-                data = envelope.data if isinstance(envelope.data, dict) else {}
-                # Add correlation ID to data for RAG handler
-                data["correlate"] = envelope.id
-                logger.debug(
-                    "Memory results received: envelope_id=%s, data_keys=%s",
-                    envelope.id,
-                    list(data.keys()),
-                )
-                self.rag_handler.handle_results(data)
-            except ValidationError:
-                # Fallback to direct JSON parsing for backward compatibility
-                try:
-                    data = json.loads(message.payload)
-                    logger.info(
-                        "MEMORY RESULTS FALLBACK PARSING: data_keys=%s",
-                        list(data.keys()) if isinstance(data, dict) else "not_dict",
-                    )
-                    self.rag_handler.handle_results(data)
-                except Exception as e:
-                    logger.warning("Failed to parse memory/results payload: %s", e)
-            except Exception as e:
-                logger.warning("Failed to handle memory/results: %s", e)
             return
 
         # LLM requests
         if topic == llm_request_topic:
             await self.request_handler.process_request(client, message.payload)
+            return
+
+        # Cancellation of queued or in-flight requests
+        if llm_cancel_topic and topic == llm_cancel_topic:
+            await self.request_handler.cancel_request(message.payload)
 
     async def _handle_character_current(self, message) -> None:
         """Handle character/current retained message with envelope support."""
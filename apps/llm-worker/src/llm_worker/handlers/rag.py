@@ -5,32 +5,95 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import logging
+import re
 import time
-from typing import Dict, Tuple, Optional
+from collections import deque
+from typing import Deque, Dict, FrozenSet, List, Tuple, Optional
 
 import asyncio_mqtt as mqtt
 
 logger = logging.getLogger(__name__)
 
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+# Function words dropped before comparing queries; what is left names what is asked about
+_STOPWORDS = frozenset(
+    """
+    a about am an and any are as at be been but by can could did do does for from had has
+    have he her him his how i if in into is it its me my of on or our she so some than
+    that the their them then there these they this those to us was we were what when where
+    which who whom why will with would you your
+    """.split()
+)
+
+
+def query_terms(text: str) -> FrozenSet[str]:
+    """Normalized content words of a query (stopwords removed)."""
+    return frozenset(w for w in _WORD_RE.findall(text.lower()) if w not in _STOPWORDS)
+
+
+def query_similarity(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Jaccard similarity of two query term sets."""
+    if not a or not b:
+        return 1.0 if a == b else 0.0
+    return len(a & b) / len(a | b)
+
+
+def query_covers(terms: FrozenSet[str], cached: FrozenSet[str], threshold: float) -> bool:
+    """Whether a result cached for ``cached`` terms may answer a query with ``terms``.
+
+    Every cached content word must appear in the new query, so a query that
+    swaps the entity it asks about ("...in boston" / "...in chicago") never
+    matches; the threshold then bounds how many words the new query may add.
+    """
+    return bool(cached) and cached <= terms and query_similarity(terms, cached) >= threshold
+
 
 class RAGContext:
     """Container for RAG retrieval results with metadata."""
 
     def __init__(
-        self, content: str, token_count: int, truncated: bool = False, strategy_used: str = "hybrid"
+        self,
+        content: str,
+        token_count: int,
+        truncated: bool = False,
+        strategy_used: str = "hybrid",
+        chunks: Optional[List[str]] = None,
+        priority: Optional[List[int]] = None,
     ):
         self.content = content
         self.token_count = token_count
         self.truncated = truncated
         self.strategy_used = strategy_used
+        # Snippets in display order (content is their newline join) and their
+        # indices from most to least relevant, so prompts can keep a subset
+        self.chunks = chunks if chunks is not None else ([content] if content else [])
+        self.priority = priority if priority is not None else list(range(len(self.chunks)))
 
 
 class RAGHandler:
     """Enhanced RAG handler with token-aware retrieval, caching, and observability."""
 
-    def __init__(self, memory_query_topic: str, cache_ttl: int = 300):
+    def __init__(
+        self,
+        memory_query_topic: str,
+        cache_ttl: int = 300,
+        memory_results_topic: str = "memory/results",
+        similar_cache_ttl: float = 60.0,
+        similar_cache_threshold: float = 0.8,
+        similar_cache_size: int = 32,
+    ):
         self.memory_query_topic = memory_query_topic
-        self._pending_queries: Dict[str, asyncio.Future[RAGContext]] = {}
+        self.memory_results_topic = memory_results_topic
+
+        # Recent contexts matched by content words (see query_covers), so reworded
+        # follow-ups ("what did I say about my dog" / "what did I say about the dog?")
+        # skip the memory/query round trip. Entries: (params key, terms, context, timestamp)
+        self._similar: Deque[Tuple[str, FrozenSet[str], RAGContext, float]] = deque(
+            maxlen=max(1, similar_cache_size)
+        )
+        self._similar_ttl = similar_cache_ttl if similar_cache_size > 0 else 0.0
+        self._similar_threshold = similar_cache_threshold
 
         # Query result cache (Priority 2)
         self._cache: Dict[str, Tuple[RAGContext, float]] = {}  # (query_hash, (result, timestamp))
@@ -43,6 +106,7 @@ class RAGHandler:
             "queries_timeout": 0,
             "queries_error": 0,
             "cache_hits": 0,
+            "cache_similar_hits": 0,
             "cache_misses": 0,
             "latency_sum": 0.0,
             "tokens_retrieved_sum": 0,
@@ -60,6 +124,7 @@ class RAGHandler:
         context_window: int = 1,
         retrieval_strategy: str = "hybrid",
         use_cache: bool = True,
+        timeout: float = 5.0,
     ) -> RAGContext:
         """Execute enhanced RAG query with token budget, caching, and observability.
 
@@ -73,6 +138,7 @@ class RAGHandler:
             context_window: Number of previous/next entries to include
             retrieval_strategy: "hybrid", "recent", or "similarity"
             use_cache: Whether to use cached results (default: True)
+            timeout: Seconds to wait for memory/results before answering without context
 
         Returns:
             RAGContext with formatted content and metadata
@@ -97,11 +163,22 @@ class RAGHandler:
                     cache_key[:12],
                 )
                 return cached_result
+            params_key = self._params_key(
+                top_k, max_tokens, include_context, context_window, retrieval_strategy
+            )
+            similar = self._get_similar(prompt, params_key)
+            if similar is not None:
+                self._metrics["cache_hits"] += 1
+                self._metrics["cache_similar_hits"] += 1
+                self._metrics["queries_success"] += 1
+                logger.info(
+                    "RAG similar-query cache hit: latency=%.3fs, tokens=%d",
+                    time.monotonic() - start_time,
+                    similar.token_count,
+                )
+                return similar
             self._metrics["cache_misses"] += 1
 
-        future: asyncio.Future[RAGContext] = asyncio.Future()
-        self._pending_queries[correlation_id] = future
-
         try:
             # Create MemoryQuery payload
             from tars.contracts.v1 import EVENT_TYPE_MEMORY_QUERY
@@ -116,26 +193,29 @@ class RAGHandler:
                 retrieval_strategy=retrieval_strategy,
             )
 
-            # Publish using envelope with correlation ID
-            await mqtt_client.publish_event(
-                topic=self.memory_query_topic,
-                event_type=EVENT_TYPE_MEMORY_QUERY,
-                data=query.model_dump(),
-                correlation_id=correlation_id,
-                qos=1,
-                retain=False,
-            )
             logger.debug(
-                "Published enhanced RAG query: correlation_id=%s, strategy=%s, max_tokens=%s, context=%s",
+                "Sending enhanced RAG query: correlation_id=%s, strategy=%s, max_tokens=%s, context=%s",
                 correlation_id,
                 retrieval_strategy,
                 max_tokens,
                 include_context,
             )
 
-            # Wait with timeout (5s - reduced from 10s per Priority 1 recommendation)
-            # Typical queries: embedding ~100-500ms, retrieval ~200-500ms = <1s total
-            context = await asyncio.wait_for(future, timeout=5.0)
+            # Request/reply over memory/query -> memory/results. Identical queries
+            # already in flight (e.g. several components during one turn) share
+            # a single round trip.
+            # Default timeout 5s - typical queries: embedding ~100-500ms, retrieval
+            # ~200-500ms; callers shrink it to what is left of the turn budget.
+            reply = await mqtt_client.request(
+                self.memory_query_topic,
+                EVENT_TYPE_MEMORY_QUERY,
+                query,
+                reply_topic=self.memory_results_topic,
+                correlation_id=correlation_id,
+                timeout=timeout,
+                qos=1,
+            )
+            context = self.build_context(reply.data)
 
             # Update metrics and cache on success
             latency = time.monotonic() - start_time
@@ -157,11 +237,11 @@ class RAGHandler:
                     prompt, top_k, max_tokens, include_context, context_window, retrieval_strategy
                 )
                 self._add_to_cache(cache_key, context)
+                self._add_to_similar(prompt, params_key, context)
 
             return context
 
         except asyncio.TimeoutError:
-            self._pending_queries.pop(correlation_id, None)
             self._metrics["queries_timeout"] += 1
             latency = time.monotonic() - start_time
             logger.warning(
@@ -170,7 +250,6 @@ class RAGHandler:
             return RAGContext("", 0, truncated=False, strategy_used=retrieval_strategy)
 
         except Exception as e:
-            self._pending_queries.pop(correlation_id, None)
             self._metrics["queries_error"] += 1
             latency = time.monotonic() - start_time
             logger.warning(
@@ -207,16 +286,8 @@ class RAGHandler:
         )
         return context.content, context.token_count
 
-    def handle_results(self, results_data: dict) -> None:
-        """Handle enhanced memory/results response and resolve pending future."""
-        corr_id = results_data.get("correlate") or results_data.get("id")
-        if not corr_id or corr_id not in self._pending_queries:
-            return
-
-        future = self._pending_queries.pop(corr_id)
-        if future.done():
-            return
-
+    def build_context(self, results_data: dict) -> RAGContext:
+        """Format a memory/results payload into a RAGContext."""
         results = results_data.get("results", [])
         total_tokens = results_data.get("total_tokens", 0)
         truncated = results_data.get("truncated", False)
@@ -260,17 +331,22 @@ class RAGHandler:
             token_count=total_tokens,
             truncated=truncated,
             strategy_used=strategy_used,
+            chunks=all_snippets,
+            # Direct hits rank above their surrounding conversation
+            priority=[
+                *range(len(context_snippets), len(all_snippets)),
+                *range(len(context_snippets)),
+            ],
         )
 
-        future.set_result(rag_context)
         logger.debug(
-            "Resolved enhanced RAG query %s: %d results, %d tokens, truncated=%s, strategy=%s",
-            corr_id,
+            "Built RAG context: %d results, %d tokens, truncated=%s, strategy=%s",
             len(results),
             total_tokens,
             truncated,
             strategy_used,
         )
+        return rag_context
 
     def _extract_text_from_document(self, doc: dict) -> str:
         """Extract meaningful text from a document."""
@@ -313,6 +389,43 @@ class RAGHandler:
         )
         return hashlib.sha256(cache_input.encode()).hexdigest()
 
+    @staticmethod
+    def _params_key(
+        top_k: int,
+        max_tokens: Optional[int],
+        include_context: bool,
+        context_window: int,
+        retrieval_strategy: str,
+    ) -> str:
+        """Query parameters other than the text; similar-query hits must match these exactly."""
+        return f"{top_k}|{max_tokens}|{include_context}|{context_window}|{retrieval_strategy}"
+
+    def _get_similar(self, prompt: str, params_key: str) -> Optional[RAGContext]:
+        """Most similar recent context for the same parameters that covers the query."""
+        if self._similar_ttl <= 0:
+            return None
+        now = time.time()
+        while self._similar and now - self._similar[0][3] > self._similar_ttl:
+            self._similar.popleft()
+        terms = query_terms(prompt)
+        best: Optional[RAGContext] = None
+        best_score = self._similar_threshold
+        for key, cached_terms, context, _ in self._similar:
+            if key != params_key:
+                continue
+            if not query_covers(terms, cached_terms, self._similar_threshold):
+                continue
+            score = query_similarity(terms, cached_terms)
+            if score >= best_score:
+                best, best_score = context, score
+        if best is not None:
+            logger.debug("Similar RAG query matched: score=%.2f", best_score)
+        return best
+
+    def _add_to_similar(self, prompt: str, params_key: str, context: RAGContext) -> None:
+        if self._similar_ttl > 0 and context.content:
+            self._similar.append((params_key, query_terms(prompt), context, time.time()))
+
     def _get_from_cache(self, cache_key: str) -> Optional[RAGContext]:
         """Retrieve cached result if still valid."""
         if cache_key not in self._cache:
@@ -385,6 +498,7 @@ class RAGHandler:
         """
         count = len(self._cache)
         self._cache.clear()
+        self._similar.clear()
         logger.info("Cleared RAG cache: %d entries removed", count)
         return count
 
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any, Dict, Optional, Tuple
+import time
+from contextlib import nullcontext
+from typing import Any, ContextManager, Dict, Optional, Tuple
 
 import asyncio_mqtt as mqtt
 import orjson as json
@@ -12,11 +14,19 @@ from pydantic import ValidationError
 
 from tars.contracts.envelope import Envelope  # type: ignore[import]
 from tars.contracts.v1 import (  # type: ignore[import]
+    LLMCancel,
     LLMRequest,
     LLMResponse,
     LLMStreamDelta,
     TtsSay,
 )
+from tars.domain.segmenter import SegmentPolicy, SentenceSegmenter  # type: ignore[import]
+from tars.runtime.tracing import Tracer  # type: ignore[import]
+
+from ..tokenizer import HeuristicTokenizer, Tokenizer
+from .context_packer import MESSAGE_OVERHEAD_TOKENS, REPLY_OVERHEAD_TOKENS, pack_context
+from .scheduler import RequestScheduler
+from .stream_coalescer import StreamCoalescer
 
 logger = logging.getLogger("llm-worker.handlers.request")
 
@@ -33,6 +43,9 @@ class RequestHandler:
         rag_handler,
         mqtt_client,
         config: Dict[str, Any],
+        tracer: Optional[Tracer] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        tokenizer: Optional[Tokenizer] = None,
     ):
         """Initialize request handler with dependencies.
 
@@ -43,6 +56,10 @@ class RequestHandler:
             rag_handler: RAG query handler
             mqtt_client: MQTT client wrapper for publishing
             config: Configuration dict with all LLM/RAG/TTS settings
+            tracer: Optional tracer for llm.request/llm.rag/llm.first_token spans
+            scheduler: Optional scheduler running requests as cancellable tasks;
+                without one, requests run inline on the dispatch path
+            tokenizer: Token counter for prompt budgeting (word-count estimate if omitted)
         """
         self.provider = provider
         self.character_mgr = character_mgr
@@ -50,8 +67,16 @@ class RequestHandler:
         self.rag_handler = rag_handler
         self.mqtt_client = mqtt_client
         self.config = config
+        self.tracer = tracer
+        self.scheduler = scheduler
+        self.tokenizer = tokenizer or HeuristicTokenizer()
+
+    def _span(self, name: str, **attrs: Any) -> ContextManager[Any]:
+        return self.tracer.span(name, **attrs) if self.tracer else nullcontext()
 
-    def _decode_llm_request(self, payload: bytes) -> Tuple[Optional[LLMRequest], Optional[str]]:
+    def _decode_llm_request(
+        self, payload: bytes
+    ) -> Tuple[Optional[LLMRequest], Optional[Envelope]]:
         """Decode LLM request from payload with envelope support."""
         envelope: Optional[Envelope] = None
         try:
@@ -68,26 +93,18 @@ class RequestHandler:
             request = LLMRequest.model_validate(data)
         except ValidationError as exc:
             logger.warning("Invalid llm/request payload: %s", exc)
-            return None, envelope.id if envelope else None
-
-        return request, envelope.id if envelope else None
+            return None, envelope
 
-    def _should_flush(self, buf: str, incoming: str = "") -> bool:
-        """Check if streaming buffer should be flushed."""
-        boundary_chars = self.config.get("STREAM_BOUNDARY_CHARS", ".!?")
-        max_chars = self.config.get("STREAM_MAX_CHARS", 200)
+        return request, envelope
 
-        if any(ch in buf for ch in boundary_chars):
-            return True
-        return len(buf) + len(incoming) >= max_chars
-
-    def _split_on_boundary(self, text: str) -> Tuple[str, str]:
-        """Split text at last sentence boundary."""
-        boundary_chars = self.config.get("STREAM_BOUNDARY_CHARS", ".!?")
-        idx = max((text.rfind(ch) for ch in boundary_chars), default=-1)
-        if idx >= 0:
-            return text[: idx + 1].strip(), text[idx + 1 :].lstrip()
-        return "", text
+    def _tts_segmenter(self) -> SentenceSegmenter:
+        """Sentence segmenter for forwarding streamed text to TTS."""
+        return SentenceSegmenter(
+            SegmentPolicy(
+                boundary_chars=self.config.get("STREAM_BOUNDARY_CHARS", ".!?") or ".!?",
+                max_chars=self.config.get("STREAM_MAX_CHARS", 200) or None,
+            )
+        )
 
     async def process_request(self, client: mqtt.Client, payload: bytes) -> None:
         """Process a complete LLM request: decode, prepare, execute, and respond.
@@ -96,7 +113,8 @@ class RequestHandler:
             client: MQTT client for publishing responses
             payload: Raw MQTT message payload
         """
-        request, envelope_id = self._decode_llm_request(payload)
+        received_at = time.time()
+        request, envelope = self._decode_llm_request(payload)
         if request is None:
             return
 
@@ -113,20 +131,71 @@ class RequestHandler:
             return
 
         # Extract parameters
-        params = self._extract_request_params(request, envelope_id)
+        params = self._extract_request_params(request, envelope.id if envelope else None)
+        # The turn started when the router published the request (bounded for clock skew)
+        params["turn_started"] = (
+            min(received_at, max(envelope.ts, received_at - self._turn_budget()))
+            if envelope
+            else received_at
+        )
 
         # Fast-fail on missing credentials
         if not self._check_credentials(client, params):
             return
 
-        # Execute request (streaming or non-streaming)
+        # Retrieval runs while the request waits for a slot and the prompt is assembled
+        self._start_rag_prefetch(client, params)
+
+        if self.scheduler is None:
+            await self._run_request(client, params)
+            return
+
+        async def on_cancel() -> None:
+            self._drop_rag_prefetch(params)
+            await self._publish_stream_end(client, params, params.get("seq", 0))
+
         try:
-            if params["want_stream"] and getattr(self.provider, "name", "") == "openai":
-                await self._handle_streaming_request(client, params)
-            else:
-                await self._handle_non_streaming_request(client, params)
-        except Exception as e:
-            await self._publish_error(client, params, str(e))
+            accepted = self.scheduler.submit(
+                request.id,
+                lambda: self._run_request(client, params),
+                on_cancel=on_cancel,
+                source=request.source,
+            )
+        except asyncio.QueueFull:
+            self._drop_rag_prefetch(params)
+            await self._publish_error(client, params, "LLM worker overloaded; request rejected")
+            return
+        if not accepted:
+            # Duplicate id: the original request owns the turn, so this copy's
+            # prefetch would only run unawaited
+            self._drop_rag_prefetch(params)
+
+    async def cancel_request(self, payload: bytes) -> None:
+        """Cancel a queued or running request named by an llm/cancel payload."""
+        try:
+            try:
+                data = Envelope.model_validate_json(payload).data
+            except ValidationError:
+                data = json.loads(payload)
+            cancel = LLMCancel.model_validate(data)
+        except Exception:
+            logger.warning("Invalid llm/cancel payload")
+            return
+        if self.scheduler is None or not await self.scheduler.cancel(cancel.id):
+            logger.debug("llm/cancel for unknown or finished id=%s", cancel.id)
+
+    async def _run_request(self, client: mqtt.Client, params: Dict[str, Any]) -> None:
+        """Execute a request (streaming or non-streaming), publishing errors as responses."""
+        with self._span("llm.request", id=params["req_id"], stream=params["want_stream"]):
+            try:
+                if params["want_stream"] and getattr(self.provider, "name", "") == "openai":
+                    await self._handle_streaming_request(client, params)
+                else:
+                    await self._handle_non_streaming_request(client, params)
+            except Exception as e:
+                await self._publish_error(client, params, str(e))
+            finally:
+                self._drop_rag_prefetch(params)
 
     def _extract_request_params(
         self, request: LLMRequest, envelope_id: Optional[str]
@@ -162,24 +231,15 @@ class RequestHandler:
 
         # Build system prompt with character
         system = self.character_mgr.build_system_prompt(request.system)
+        if request.conversation_summary:
+            # Router-side memory: pinned facts and a summary of turns outside the history window
+            system = f"{system}\n\n{request.conversation_summary}" if system else request.conversation_summary
 
-        # Tools - CRITICAL: Disable tools for streaming requests
-        # Tool calls in streaming mode fail because OpenAI returns empty content deltas
-        # when tool_calls are present. The streaming parser only handles text content,
-        # not tool_calls, resulting in empty responses (0 chunks).
-        # See: apps/llm-worker/src/llm_worker/providers/openai.py:495 (only yields if delta.content)
+        # Tools (streaming turns run them mid-stream, see _stream_round)
         tool_calling_enabled = self.config.get("TOOL_CALLING_ENABLED", False)
-        if want_stream and tool_calling_enabled and self.tool_executor.tools:
-            logger.warning(
-                "Tools disabled for streaming request (streaming doesn't support tool calls yet)"
-            )
-            tools = None
-        else:
-            tools = (
-                self.tool_executor.tools
-                if tool_calling_enabled and self.tool_executor.tools
-                else None
-            )
+        tools = (
+            self.tool_executor.tools if tool_calling_enabled and self.tool_executor.tools else None
+        )
 
         # Debug: log tool status
         logger.info(
@@ -223,6 +283,106 @@ class RequestHandler:
             return False
         return True
 
+    def _turn_budget(self) -> float:
+        return float(self.config.get("LLM_TURN_BUDGET_SEC", 8.0))
+
+    def _rag_timeout(self, params: Dict[str, Any]) -> float:
+        """RAG deadline: a share of what is left of the turn budget, within [0.2s, RAG_TIMEOUT_SEC]."""
+        elapsed = time.time() - params.get("turn_started", time.time())
+        remaining = max(0.0, self._turn_budget() - elapsed)
+        share = remaining * float(self.config.get("RAG_BUDGET_FRACTION", 0.4))
+        return min(float(self.config.get("RAG_TIMEOUT_SEC", 5.0)), max(0.2, share))
+
+    def _rag_token_budget(self, params: Dict[str, Any]) -> Optional[int]:
+        """max_tokens for the RAG query, or None when the prompt has no room for context."""
+        if not self.config.get("RAG_DYNAMIC_PROMPTS", True):
+            return params.get("rag_max_tokens")
+        memory_budget = self._available_prompt_tokens(params) - self._base_prompt_tokens(params)
+        if memory_budget <= 100:  # Minimum viable RAG budget
+            return None
+        return min(memory_budget // 2, params.get("rag_max_tokens", 2000))  # Up to half the budget
+
+    def _available_prompt_tokens(self, params: Dict[str, Any]) -> int:
+        context_size = self.config.get("LLM_CTX_WINDOW", 8192)
+        # Reserve space for max_tokens response
+        return context_size - params["max_tokens"] - 100  # Small buffer
+
+    def _base_prompt_tokens(self, params: Dict[str, Any]) -> int:
+        """Tokens always spent: system prompt, user message and chat formatting.
+
+        Estimated counts also hold back the tokenizer's reserve for counting error.
+        """
+        base_tokens = (
+            self.tokenizer.reserve + 2 * MESSAGE_OVERHEAD_TOKENS + REPLY_OVERHEAD_TOKENS
+        )
+        system_prompt = params.get("system", "")
+        if system_prompt:
+            base_tokens += self._estimate_tokens(system_prompt)
+        return base_tokens + self._estimate_tokens(params["text"])
+
+    def _messages_tokens(self, params: Dict[str, Any], messages: list[dict]) -> int:
+        """Prompt size of system prompt + messages as sent, including chat formatting."""
+        system = params.get("system") or ""
+        tokens = REPLY_OVERHEAD_TOKENS
+        if system:
+            tokens += self._estimate_tokens(system) + MESSAGE_OVERHEAD_TOKENS
+        return tokens + sum(
+            self._estimate_tokens(m["content"]) + MESSAGE_OVERHEAD_TOKENS for m in messages
+        )
+
+    def _start_rag_prefetch(self, client: mqtt.Client, params: Dict[str, Any]) -> None:
+        """Start the RAG query as a task; prompt builders await it via _rag_context."""
+        if not params["use_rag"] or "rag_task" in params:
+            return
+        max_tokens = self._rag_token_budget(params)
+        if max_tokens is None:
+            return
+        timeout = self._rag_timeout(params)
+        params["rag_started"] = time.time()
+        params["rag_task"] = asyncio.create_task(
+            self.rag_handler.query(
+                self.mqtt_client,  # MQTT wrapper for proper envelope publishing
+                client,  # Raw MQTT client
+                params["text"],
+                top_k=params["rag_k"],
+                correlation_id=params["correlation_id"],
+                max_tokens=max_tokens,
+                include_context=params.get("rag_include_context", True),  # Include surrounding context
+                context_window=params.get("rag_context_window", 1),
+                retrieval_strategy=params.get("rag_strategy", "hybrid"),
+                timeout=timeout,
+            ),
+            name=f"llm-rag-{params['req_id']}",
+        )
+        logger.debug(
+            "RAG prefetch started for id=%s (max_tokens=%s, timeout=%.2fs)",
+            params["req_id"],
+            max_tokens,
+            timeout,
+        )
+
+    async def _rag_context(self, client: mqtt.Client, params: Dict[str, Any]) -> Any:
+        """Await the prefetched RAG context (starting the query now if it was not prefetched)."""
+        self._start_rag_prefetch(client, params)
+        task = params.get("rag_task")
+        if task is None:
+            return None
+        waited = time.time()
+        context = await task
+        done = time.time()
+        if self.tracer:
+            # The query ran from prefetch; blocked_s is the part the turn actually waited for
+            self.tracer.record(
+                "llm.rag", params["rag_started"], done, k=params["rag_k"], blocked_s=round(done - waited, 4)
+            )
+        return context
+
+    @staticmethod
+    def _drop_rag_prefetch(params: Dict[str, Any]) -> None:
+        task = params.pop("rag_task", None)
+        if task is not None and not task.done():
+            task.cancel()
+
     async def _prepare_prompt_with_rag(
         self, client: mqtt.Client, params: Dict[str, Any]
     ) -> Tuple[str, list[dict]]:
@@ -231,23 +391,15 @@ class RequestHandler:
         context = ""
         rag_metadata = {}
 
+        # History is assembled while the prefetched RAG query is in flight
+        messages = []
+        if params.get("conversation_history"):
+            for msg in params["conversation_history"]:
+                messages.append({"role": msg.role, "content": msg.content})
+
         # Enhanced RAG query if enabled
-        if params["use_rag"]:
-            # Use enhanced RAG with context expansion and token awareness
-            # Enhanced RAG query with context expansion and token awareness
-            rag_context = await self.rag_handler.query(
-                self.mqtt_client,  # MQTT wrapper for proper envelope publishing
-                client,  # Raw MQTT client
-                text,
-                top_k=params["rag_k"],
-                correlation_id=params["correlation_id"],
-                max_tokens=params.get("rag_max_tokens"),  # Optional token budget
-                include_context=params.get(
-                    "rag_include_context", True
-                ),  # Include surrounding context
-                context_window=params.get("rag_context_window", 1),
-                retrieval_strategy=params.get("rag_strategy", "hybrid"),
-            )
+        rag_context = await self._rag_context(client, params)
+        if rag_context is not None:
             context = rag_context.content
             rag_metadata = {
                 "token_count": rag_context.token_count,
@@ -273,18 +425,13 @@ class RequestHandler:
         # Store RAG metadata for logging
         params["rag_metadata"] = rag_metadata
 
-        # Build messages list
-        messages = []
-        if params.get("conversation_history"):
-            for msg in params["conversation_history"]:
-                messages.append({"role": msg.role, "content": msg.content})
         messages.append({"role": "user", "content": prompt})
 
         return prompt, messages
 
     def _estimate_tokens(self, text: str) -> int:
-        """Rough token estimation (can be improved with tiktoken later)."""
-        return int(len(text.split()) * 1.3)
+        """Token count of text (exact with a BPE vocab, otherwise an estimate); cached per text."""
+        return self.tokenizer.count(text)
 
     async def _build_context_aware_prompt(
         self, client: mqtt.Client, params: Dict[str, Any], available_tokens: int
@@ -306,14 +453,7 @@ class RequestHandler:
             Tuple of (formatted_prompt, messages_list)
         """
         text = params["text"]
-
-        # Reserve tokens for base prompt structure (system prompt, user message, assistant prefix)
-        base_tokens = 300  # Conservative estimate
-        system_prompt = params.get("system", "")
-        if system_prompt:
-            base_tokens += self._estimate_tokens(system_prompt)
-
-        base_tokens += self._estimate_tokens(text)
+        base_tokens = self._base_prompt_tokens(params)
 
         if available_tokens <= base_tokens:
             logger.warning(
@@ -331,71 +471,60 @@ class RequestHandler:
             memory_budget,
         )
 
-        # Get RAG context with token budget (highest priority)
-        context = ""
-        context_tokens = 0
+        # Start RAG (if not prefetched) and count the history while it is in flight
         rag_metadata = {}
-
-        if params["use_rag"] and memory_budget > 100:  # Minimum viable RAG budget
-            rag_budget = min(
-                memory_budget // 2, params.get("rag_max_tokens", 2000)
-            )  # Up to half the budget
-
-            rag_context = await self.rag_handler.query(
-                self.mqtt_client,  # MQTT wrapper
-                client,  # Raw MQTT client
-                text,
-                top_k=params["rag_k"],
-                correlation_id=params["correlation_id"],
-                max_tokens=rag_budget,
-                include_context=params.get("rag_include_context", True),
-                context_window=params.get("rag_context_window", 1),
-                retrieval_strategy=params.get("rag_strategy", "hybrid"),
-            )
-
-            context = rag_context.content
-            context_tokens = rag_context.token_count
+        if memory_budget > 100:  # Minimum viable RAG budget
+            self._start_rag_prefetch(client, params)
+        history = list(params.get("conversation_history") or [])
+        history_costs = [
+            self._estimate_tokens(msg.content) + MESSAGE_OVERHEAD_TOKENS for msg in history
+        ]
+
+        # RAG chunks (highest priority) and the newest history share the budget
+        rag_context = await self._rag_context(client, params) if "rag_task" in params else None
+        rag_template = self.config.get(
+            "RAG_PROMPT_TEMPLATE", "Context:\n{context}\n\nUser: {user}"
+        )
+        chunks = rag_context.chunks if rag_context is not None else []
+        packed = pack_context(
+            memory_budget - self._estimate_tokens(rag_template.format(context="", user="")),
+            [self._estimate_tokens(chunk) + 1 for chunk in chunks],  # + joining newline
+            rag_context.priority if rag_context is not None else [],
+            history_costs,
+            rag_share=0.5,  # as requested from memory by _rag_token_budget
+        )
+        if chunks and not packed.rag:
+            # No context fits after all; give history the template's share back
+            packed = pack_context(memory_budget, [], [], history_costs)
+        context = "\n".join(chunks[i] for i in packed.rag)
+        context_tokens = packed.rag_tokens
+        if rag_context is not None:
             rag_metadata = {
-                "token_count": rag_context.token_count,
-                "truncated": rag_context.truncated,
+                "token_count": context_tokens,
+                "truncated": rag_context.truncated or len(packed.rag) < len(chunks),
                 "strategy": rag_context.strategy_used,
             }
-
             logger.info(
-                "RAG context: %d tokens (budget: %d), truncated=%s",
+                "RAG context: %d/%d chunks, %d tokens, truncated=%s",
+                len(packed.rag),
+                len(chunks),
                 context_tokens,
-                rag_budget,
-                rag_context.truncated,
+                rag_metadata["truncated"],
             )
 
-        # Add conversation history if space allows (medium priority)
-        messages = []
-        remaining_budget = memory_budget - context_tokens
-
-        if params.get("conversation_history") and remaining_budget > 50:
-            history_tokens = 0
-
-            # Add history in reverse order (most recent first) until budget exhausted
-            for msg in reversed(params["conversation_history"]):
-                msg_tokens = self._estimate_tokens(msg.content)
-                if history_tokens + msg_tokens > remaining_budget:
-                    break
-
-                messages.insert(0, {"role": msg.role, "content": msg.content})
-                history_tokens += msg_tokens
-
+        messages = [
+            {"role": msg.role, "content": msg.content} for msg in history[packed.history_start :]
+        ]
+        if history:
             logger.info(
                 "Conversation history: %d messages, %d tokens (budget: %d)",
                 len(messages),
-                history_tokens,
-                remaining_budget,
+                packed.history_tokens,
+                memory_budget - context_tokens,
             )
 
         # Build final prompt with hierarchical structure
         if context:
-            rag_template = self.config.get(
-                "RAG_PROMPT_TEMPLATE", "Context:\n{context}\n\nUser: {user}"
-            )
             prompt = rag_template.format(context=context, user=text)
         else:
             prompt = text
@@ -410,7 +539,7 @@ class RequestHandler:
             "base_tokens": base_tokens,
             "context_tokens": context_tokens,
             "history_messages": len(messages) - 1,  # Exclude final user message
-            "final_tokens": sum(self._estimate_tokens(m["content"]) for m in messages),
+            "final_tokens": self._messages_tokens(params, messages),
         }
 
         return prompt, messages
@@ -440,9 +569,9 @@ class RequestHandler:
             # Use standard prompt building
             prompt, messages = await self._prepare_prompt_with_rag(client, params)
 
-        seq = 0
+        params["seq"] = 0  # shared across rounds; a cancel's done event continues from here
         full_chunks: list[str] = []
-        tts_buf = ""
+        tts_segmenter = self._tts_segmenter()
 
         logger.info(
             "Starting streaming for id=%s via provider=%s (system_len=%s, history_len=%d)",
@@ -452,68 +581,146 @@ class RequestHandler:
             len(messages) - 1,
         )
 
-        # Stream from provider
-        async for ch in self.provider.stream_chat(
-            messages=messages,
-            model=params["model"],
-            max_tokens=params["max_tokens"],
-            temperature=params["temperature"],
-            top_p=params["top_p"],
-            system=params["system"],
-            tools=params["tools"],
-        ):
-            seq += 1
-            delta_text = ch.get("delta")
+        # Each tool round streams text, runs the calls the model made and resumes
+        # streaming the follow-up on the same llm/stream id. The last round is
+        # offered no tools so the turn always ends in an answer.
+        stream_started = time.time()
+        max_rounds = max(0, int(self.config.get("TOOL_MAX_ROUNDS", 3)))
+        for round_no in range(max_rounds + 1):
+            tools = params["tools"] if round_no < max_rounds else None
+            round_text, tool_calls, tool_results = await self._stream_round(
+                client, params, messages, tools, tts_segmenter, stream_started
+            )
+            full_chunks.append(round_text)
+            if not tool_calls:
+                break
+            logger.info(
+                "Streaming round %d for id=%s ran %d tool call(s)",
+                round_no + 1,
+                params["req_id"],
+                len(tool_calls),
+            )
+            messages.append(
+                {"role": "assistant", "content": round_text or None, "tool_calls": tool_calls}
+            )
+            messages.extend(self.tool_executor.format_tool_messages(tool_results))
+
+        seq = params["seq"]
+        if self.tracer:
+            self.tracer.record("llm.generate", stream_started, time.time(), model=params["model"], deltas=seq)
+
+        # Publish stream end marker
+        await self._publish_stream_end(client, params, seq)
+
+        # Flush remaining TTS buffer
+        tts_rest = tts_segmenter.finish()
+        if self.config.get("LLM_TTS_STREAM", False) and tts_rest:
+            await self._publish_tts_chunk(client, params, tts_rest)
+
+        # Publish final accumulated response
+        final_text = "".join(full_chunks)
+        await self._publish_response(client, params, final_text)
+
+    async def _stream_round(
+        self,
+        client: mqtt.Client,
+        params: Dict[str, Any],
+        messages: list[dict],
+        tools: Optional[list[dict]],
+        tts_segmenter: SentenceSegmenter,
+        stream_started: float,
+    ) -> Tuple[str, list[dict], list[dict]]:
+        """Stream one completion, starting each tool call as soon as it is complete.
 
-            # Publish stream delta
+        Returns:
+            Tuple of (streamed text, tool calls made, tool results)
+        """
+        text_chunks: list[str] = []
+        tool_calls: list[dict] = []
+        tool_tasks: list[asyncio.Task[list[dict]]] = []
+        coalescer = self._stream_coalescer(client, params, stream_started)
+        try:
+            async for ch in self.provider.stream_chat(
+                messages=messages,
+                model=params["model"],
+                max_tokens=params["max_tokens"],
+                temperature=params["temperature"],
+                top_p=params["top_p"],
+                system=params["system"],
+                tools=tools,
+            ):
+                call = ch.get("tool_call")
+                if call:
+                    # Run the tool while the model is still streaming the rest of its turn
+                    tool_calls.append(call)
+                    tool_tasks.append(
+                        asyncio.create_task(
+                            self.tool_executor.execute_tool_calls([call], self.mqtt_client, client)
+                        )
+                    )
+                    continue
+
+                delta_text = ch.get("delta")
+                if not delta_text:
+                    continue
+                text_chunks.append(delta_text)
+                await coalescer.push(delta_text)
+
+                # Optional TTS forwarding
+                if self.config.get("LLM_TTS_STREAM", False):
+                    for sent in tts_segmenter.push(delta_text):
+                        logger.info("TTS chunk publish len=%d", len(sent))
+                        await self.mqtt_client.publish_event(
+                            topic=self.config.get("TOPIC_TTS_SAY", "tts/say"),
+                            event_type=self.config.get("EVENT_TYPE_SAY", "tts.say"),
+                            data=TtsSay(text=sent),
+                            correlation_id=params["correlation_id"],
+                            qos=1,
+                        )
+
+            await coalescer.flush()
+            tool_results = [result for batch in await asyncio.gather(*tool_tasks) for result in batch]
+        except BaseException:
+            coalescer.cancel()
+            for task in tool_tasks:
+                task.cancel()
+            raise
+        return "".join(text_chunks), tool_calls, tool_results
+
+    def _stream_coalescer(
+        self, client: mqtt.Client, params: Dict[str, Any], stream_started: float
+    ) -> StreamCoalescer:
+        """Coalescer publishing batched deltas as llm/stream events with consecutive seq."""
+
+        async def publish(text: str) -> None:
+            seq = params["seq"] + 1
+            params["seq"] = seq
+            if seq == 1 and self.tracer:
+                self.tracer.record("llm.first_token", stream_started, time.time(), model=params["model"])
             out = LLMStreamDelta(
                 id=params["req_id"],
                 seq=seq,
-                delta=delta_text,
+                delta=text,
                 done=False,
                 provider=self.provider.name,
                 model=params["model"],
             )
-
-            if delta_text:
-                full_chunks.append(delta_text)
-
-            logger.debug(
-                "llm/stream id=%s seq=%d len=%d", params["req_id"], seq, len(delta_text or "")
-            )
+            logger.debug("llm/stream id=%s seq=%d len=%d", params["req_id"], seq, len(text))
             await self.mqtt_client.publish_event(
                 topic=self.config.get("TOPIC_LLM_STREAM", "llm/stream"),
                 event_type=self.config.get("EVENT_TYPE_LLM_STREAM", "llm.stream"),
                 data=out,
                 correlation_id=params["correlation_id"],
+                qos=1,
+                expiry=float(self.config.get("STREAM_DELTA_EXPIRY", 2.0)),
             )
 
-            # Optional TTS forwarding
-            if self.config.get("LLM_TTS_STREAM", False) and delta_text:
-                tts_buf += delta_text
-                while self._should_flush(tts_buf):
-                    sent, remainder = self._split_on_boundary(tts_buf)
-                    if not sent:
-                        break
-                    logger.info("TTS chunk publish len=%d", len(sent))
-                    await self.mqtt_client.publish_event(
-                        topic=self.config.get("TOPIC_TTS_SAY", "tts/say"),
-                        event_type=self.config.get("EVENT_TYPE_SAY", "tts.say"),
-                        data=TtsSay(text=sent),
-                        correlation_id=params["correlation_id"],
-                    )
-                    tts_buf = remainder
-
-        # Publish stream end marker
-        await self._publish_stream_end(client, params, seq)
-
-        # Flush remaining TTS buffer
-        if self.config.get("LLM_TTS_STREAM", False) and tts_buf.strip():
-            await self._publish_tts_chunk(client, params, tts_buf.strip())
-
-        # Publish final accumulated response
-        final_text = "".join(full_chunks)
-        await self._publish_response(client, params, final_text)
+        return StreamCoalescer(
+            publish,
+            window=float(self.config.get("STREAM_COALESCE_MS", 50)) / 1000,
+            max_bytes=int(self.config.get("STREAM_COALESCE_MAX_BYTES", 64)),
+            boundary_chars=(self.config.get("STREAM_BOUNDARY_CHARS", ".!?") or ".!?") + "\n",
+        )
 
     async def _handle_non_streaming_request(
         self, client: mqtt.Client, params: Dict[str, Any]
@@ -543,15 +750,16 @@ class RequestHandler:
             prompt, messages = await self._prepare_prompt_with_rag(client, params)
 
         # Generate response
-        result = await self.provider.generate_chat(
-            messages=messages,
-            model=params["model"],
-            max_tokens=params["max_tokens"],
-            temperature=params["temperature"],
-            top_p=params["top_p"],
-            system=params["system"],
-            tools=params["tools"],
-        )
+        with self._span("llm.generate", model=params["model"]):
+            result = await self.provider.generate_chat(
+                messages=messages,
+                model=params["model"],
+                max_tokens=params["max_tokens"],
+                temperature=params["temperature"],
+                top_p=params["top_p"],
+                system=params["system"],
+                tools=params["tools"],
+            )
 
         # Check for tool calls
         tool_calls = self.tool_executor.extract_tool_calls(result)
@@ -621,6 +829,7 @@ class RequestHandler:
             event_type=self.config.get("EVENT_TYPE_LLM_STREAM", "llm.stream"),
             data=done,
             correlation_id=params["correlation_id"],
+            qos=1,
         )
 
     async def _publish_tts_chunk(
@@ -633,6 +842,7 @@ class RequestHandler:
             event_type=self.config.get("EVENT_TYPE_SAY", "tts.say"),
             data=TtsSay(text=text),
             correlation_id=params["correlation_id"],
+            qos=1,
         )
 
     async def _publish_response(
@@ -658,6 +868,7 @@ class RequestHandler:
             event_type=self.config.get("EVENT_TYPE_LLM_RESPONSE", "llm.response"),
             data=resp,
             correlation_id=params["correlation_id"],
+            qos=1,
         )
 
     async def _publish_error(self, client: mqtt.Client, params: Dict[str, Any], error: str) -> None:
@@ -674,4 +885,5 @@ class RequestHandler:
             event_type=self.config.get("EVENT_TYPE_LLM_RESPONSE", "llm.response"),
             data=error_resp,
             correlation_id=params.get("correlation_id"),
+            qos=1,
         )
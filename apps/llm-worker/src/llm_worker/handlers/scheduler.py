@@ -0,0 +1,190 @@
+"""Concurrent, cancellable execution of LLM requests."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Optional
+
+from tars.runtime.metrics import MetricsRegistry  # type: ignore[import]
+
+logger = logging.getLogger("llm-worker.handlers.scheduler")
+
+DEFAULT_SOURCE = "default"
+
+
+@dataclass(slots=True)
+class _Job:
+    id: str
+    source: str
+    run: Callable[[], Awaitable[None]]
+    on_cancel: Callable[[], Awaitable[None]]
+    enqueued: float = field(default_factory=time.monotonic)
+    task: Optional[asyncio.Task[None]] = None
+    started: bool = False
+    cancelled: bool = False
+
+
+class RequestScheduler:
+    """Runs each request as a tracked task under a concurrency limit.
+
+    Waiting requests are queued per source (capture device / router session)
+    and started round-robin across sources, so one busy source cannot starve
+    the others. ``cancel`` drops a queued request or cancels the running task;
+    cancellation propagates into the provider call, which closes the upstream
+    HTTP stream. Either way the request's ``on_cancel`` hook runs once.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrent: int = 2,
+        max_queued: int = 32,
+        metrics: Optional[MetricsRegistry] = None,
+        metrics_topic: str = "llm/request",
+    ):
+        """Initialize scheduler.
+
+        Args:
+            max_concurrent: Requests executing at once
+            max_queued: Waiting requests accepted before ``submit`` rejects
+            metrics: Registry receiving queue wait and active/queued gauges
+            metrics_topic: Topic the queue wait histogram is recorded under
+        """
+        if max_concurrent <= 0:
+            raise ValueError("max_concurrent must be positive")
+        self.max_concurrent = max_concurrent
+        self.max_queued = max(0, max_queued)
+        self._queues: OrderedDict[str, deque[_Job]] = OrderedDict()
+        self._queued: Dict[str, _Job] = {}
+        self._running: Dict[str, _Job] = {}
+        self._metrics = metrics
+        self._metrics_topic = metrics_topic
+        self.completed = 0
+        self.cancelled = 0
+        self.rejected = 0
+        if metrics is not None:
+            metrics.register_gauge("llm.requests.active", lambda: len(self._running))
+            metrics.register_gauge("llm.requests.queued", lambda: len(self._queued))
+
+    @property
+    def active(self) -> int:
+        return len(self._running)
+
+    @property
+    def queued(self) -> int:
+        return len(self._queued)
+
+    def submit(
+        self,
+        request_id: str,
+        run: Callable[[], Awaitable[None]],
+        *,
+        on_cancel: Callable[[], Awaitable[None]],
+        source: Optional[str] = None,
+    ) -> bool:
+        """Queue a request; returns False if the id is already queued or running.
+
+        Raises:
+            asyncio.QueueFull: If ``max_queued`` requests are already waiting
+        """
+        if request_id in self._running or request_id in self._queued:
+            logger.warning("Duplicate llm/request id=%s ignored", request_id)
+            return False
+        if len(self._queued) >= self.max_queued and len(self._running) >= self.max_concurrent:
+            self.rejected += 1
+            logger.warning(
+                "Request queue full (%d queued); rejecting id=%s", len(self._queued), request_id
+            )
+            raise asyncio.QueueFull
+        job = _Job(id=request_id, source=source or DEFAULT_SOURCE, run=run, on_cancel=on_cancel)
+        self._queues.setdefault(job.source, deque()).append(job)
+        self._queued[request_id] = job
+        self._start_ready()
+        return True
+
+    async def cancel(self, request_id: str) -> bool:
+        """Cancel a queued or running request; returns False if it is unknown."""
+        job = self._queued.pop(request_id, None)
+        if job is not None:
+            queue = self._queues.get(job.source)
+            if queue is not None:
+                queue.remove(job)
+                if not queue:
+                    del self._queues[job.source]
+            logger.info("Cancelled queued request id=%s", request_id)
+            self.cancelled += 1
+            await job.on_cancel()
+            return True
+        job = self._running.get(request_id)
+        if job is None or job.task is None:
+            return False
+        if job.cancelled:
+            return True
+        logger.info("Cancelling running request id=%s", request_id)
+        job.cancelled = True
+        job.task.cancel()
+        if not job.started:
+            # A task cancelled before its first step never enters _execute.
+            self._running.pop(job.id, None)
+            self.cancelled += 1
+            await job.on_cancel()
+            self._start_ready()
+        return True
+
+    async def aclose(self) -> None:
+        """Drop queued requests and cancel running ones (service shutdown)."""
+        self._queues.clear()
+        self._queued.clear()
+        tasks = [job.task for job in self._running.values() if job.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _next_job(self) -> Optional[_Job]:
+        if not self._queues:
+            return None
+        source, queue = self._queues.popitem(last=False)
+        job = queue.popleft()
+        if queue:
+            # Round-robin: a source with more waiting work goes to the back of the line.
+            self._queues[source] = queue
+        return job
+
+    def _start_ready(self) -> None:
+        while len(self._running) < self.max_concurrent:
+            job = self._next_job()
+            if job is None:
+                return
+            del self._queued[job.id]
+            self._running[job.id] = job
+            job.task = asyncio.create_task(self._execute(job), name=f"llm-request-{job.id}")
+
+    async def _execute(self, job: _Job) -> None:
+        job.started = True
+        wait = time.monotonic() - job.enqueued
+        if self._metrics is not None:
+            self._metrics.observe_queue_wait(self._metrics_topic, wait)
+        logger.debug(
+            "Request id=%s started after %.3fs in queue (active=%d queued=%d)",
+            job.id,
+            wait,
+            len(self._running),
+            len(self._queued),
+        )
+        try:
+            await job.run()
+            self.completed += 1
+        except asyncio.CancelledError:
+            if not job.cancelled:
+                raise
+            self.cancelled += 1
+            await job.on_cancel()
+        except Exception:
+            logger.exception("Request id=%s failed", job.id)
+        finally:
+            self._running.pop(job.id, None)
+            self._start_ready()
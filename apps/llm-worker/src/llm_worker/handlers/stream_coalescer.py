@@ -0,0 +1,104 @@
+"""Coalescing of streamed text deltas into fewer llm/stream publishes."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class StreamCoalescer:
+    """Buffers provider deltas and publishes them in batches.
+
+    Each provider chunk is often one token. Publishing each one separately
+    costs a model, an envelope, JSON encoding and an MQTT message, and every
+    subscriber then processes it too. The coalescer holds text for at most
+    ``window`` seconds or ``max_bytes`` bytes. It publishes straight away in
+    three cases:
+
+    - the first delta, so first-token latency is unchanged
+    - text ending at a sentence boundary
+    - a delta that follows a pause of at least ``window``, when there is no burst to batch
+
+    ``window <= 0`` publishes every delta as it arrives.
+    """
+
+    def __init__(
+        self,
+        publish: Callable[[str], Awaitable[None]],
+        *,
+        window: float = 0.05,
+        max_bytes: int = 64,
+        boundary_chars: str = ".!?;:\n",
+    ):
+        self._publish = publish
+        self.window = window
+        self.max_bytes = max(1, max_bytes)
+        self.boundary_chars = boundary_chars
+        self._buffer: list[str] = []
+        self._buffered_bytes = 0
+        self._last_push: Optional[float] = None
+        self._timer: Optional[asyncio.Task[None]] = None  # waiting to flush
+        self._timed_flushes: set[asyncio.Task[None]] = set()
+        self._lock = asyncio.Lock()
+        self.published = 0
+        self.received = 0
+
+    async def push(self, text: Optional[str]) -> None:
+        """Add a delta, publishing the buffer if a flush condition is met."""
+        if not text:
+            return
+        self.received += 1
+        now = time.monotonic()
+        paused = self._last_push is None or now - self._last_push >= self.window
+        self._last_push = now
+        self._buffer.append(text)
+        self._buffered_bytes += len(text.encode())
+        last = text.rstrip(" \t")[-1:]
+        if (
+            self.window <= 0
+            or self.published == 0
+            or (paused and len(self._buffer) == 1)
+            or self._buffered_bytes >= self.max_bytes
+            or (last and last in self.boundary_chars)
+        ):
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+            self._timed_flushes.add(self._timer)
+            self._timer.add_done_callback(self._timed_flushes.discard)
+
+    async def flush(self) -> None:
+        """Publish whatever is buffered."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        async with self._lock:
+            if not self._buffer:
+                return
+            text = "".join(self._buffer)
+            self._buffer.clear()
+            self._buffered_bytes = 0
+            self.published += 1
+            await self._publish(text)
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.window)
+        # From here on the flush is under way; a concurrent flush() must not
+        # cancel it mid-publish.
+        self._timer = None
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Timed stream flush failed")
+
+    def cancel(self) -> None:
+        """Drop buffered text and stop any timed flush (stream abandoned)."""
+        for task in list(self._timed_flushes):
+            task.cancel()
+        self._timer = None
+        self._buffer.clear()
+        self._buffered_bytes = 0
@@ -0,0 +1,125 @@
+"""Result cache for read-only tools."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import orjson as json
+
+logger = logging.getLogger(__name__)
+
+
+def tool_server(tool_name: str) -> str:
+    """Server prefix of an ``mcp__server__tool`` name (the whole name otherwise)."""
+    head, sep, _ = tool_name.rpartition("__")
+    return head if sep else tool_name
+
+
+class ToolResultCache:
+    """TTL + LRU cache of tool results keyed by tool name and canonical arguments.
+
+    Concurrent calls for the same key share one execution: the first caller
+    starts it as a task and later callers await that task, so a caller being
+    cancelled does not fail the others. Error results are never stored, and
+    neither are results of calls that were in flight when their server was
+    invalidated (they may have read state from before the write).
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[str, Tuple[dict, float]] = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task[dict]] = {}
+        # Bumped by invalidate(), per server and for everything
+        self._generation = 0
+        self._server_generations: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def key(tool_name: str, arguments: Any) -> str:
+        return f"{tool_name}\x00{json.dumps(arguments, option=json.OPT_SORT_KEYS).decode()}"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_call(
+        self,
+        tool_name: str,
+        arguments: Any,
+        ttl: float,
+        call: Callable[[], Awaitable[dict]],
+    ) -> dict:
+        """Return a fresh cached result, join an identical in-flight call, or run ``call``."""
+        key = self.key(tool_name, arguments)
+        cached = self._get(key)
+        if cached is not None:
+            self.hits += 1
+            logger.debug("Tool cache hit: %s", tool_name)
+            return dict(cached)
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            logger.debug("Tool cache joined in-flight call: %s", tool_name)
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(self._fill(key, ttl, call))
+            self._inflight[key] = task
+        return dict(await asyncio.shield(task))
+
+    def _generation_of(self, key: str) -> Tuple[int, int]:
+        server = tool_server(key.partition("\x00")[0])
+        return self._generation, self._server_generations.get(server, 0)
+
+    async def _fill(self, key: str, ttl: float, call: Callable[[], Awaitable[dict]]) -> dict:
+        task = asyncio.current_task()
+        generation = self._generation_of(key)
+        try:
+            result = await call()
+        finally:
+            if self._inflight.get(key) is task:
+                del self._inflight[key]
+        if generation != self._generation_of(key):
+            logger.debug("Tool cache skipped result invalidated mid-call")
+        elif not result.get("error"):
+            self._entries[key] = (dict(result), time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    def _get(self, key: str) -> Optional[dict]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        result, expires = entry
+        if time.monotonic() >= expires:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return result
+
+    def invalidate(self, server: Optional[str] = None) -> int:
+        """Drop cached results (for one ``mcp__server`` prefix, or all); returns how many."""
+        if server is None:
+            self._generation += 1
+            dropped = len(self._entries)
+            self._entries.clear()
+            self._inflight.clear()
+        else:
+            self._server_generations[server] = self._server_generations.get(server, 0) + 1
+            stale = [k for k in self._entries if tool_server(k.partition("\x00")[0]) == server]
+            for k in stale:
+                del self._entries[k]
+            dropped = len(stale)
+            # Later callers start a fresh call instead of joining a pre-write one
+            for k in [k for k in self._inflight if tool_server(k.partition("\x00")[0]) == server]:
+                del self._inflight[k]
+        if dropped:
+            logger.debug("Tool cache invalidated %d entr%s", dropped, "y" if dropped == 1 else "ies")
+        return dropped
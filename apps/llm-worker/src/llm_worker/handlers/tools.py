@@ -2,32 +2,91 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import List
+from fnmatch import fnmatchcase
+from typing import Dict, List, Mapping, Optional, Sequence
 
 import orjson as json
 
 from ..mcp_client import get_mcp_client
 from ..providers.base import LLMResult
+from .tool_cache import ToolResultCache, tool_server
 
 logger = logging.getLogger(__name__)
 
 
-class ToolExecutor:
-    """Handles MCP tool execution and conversation management."""
+DEFAULT_SERIAL_TOOLS = ("mcp__tars-movement__*",)
+
 
-    def __init__(self, mqtt_client=None):
+class ToolExecutor:
+    """Handles MCP tool execution and conversation management.
+
+    Independent tool calls run concurrently (bounded by ``max_concurrent``)
+    with a per-call timeout. Tools matching ``serial_tools`` have side effects
+    (e.g. movement) and run one at a time, in call order, across requests.
+
+    Read-only tools may declare a result TTL, either as ``cache_ttl`` on their
+    registry entry or through ``cache_ttls`` (fnmatch pattern -> seconds).
+    Their results are cached per canonical arguments and identical concurrent
+    calls share one execution. Running any other tool on the same server, or
+    reloading the registry, invalidates that server's cached results.
+    """
+
+    def __init__(
+        self,
+        mqtt_client=None,
+        *,
+        max_concurrent: int = 4,
+        timeout: float = 10.0,
+        serial_tools: Sequence[str] = DEFAULT_SERIAL_TOOLS,
+        cache_ttls: Optional[Mapping[str, float]] = None,
+        cache_max_entries: int = 256,
+    ):
         self.tools: List[dict] = []
         self._initialized = False
         self.mqtt_client = mqtt_client
+        self.timeout = timeout
+        self.serial_tools = tuple(serial_tools)
+        self._slots = asyncio.Semaphore(max(1, max_concurrent))
+        self._serial_lock = asyncio.Lock()
+        self.cache_ttls = dict(cache_ttls or {})
+        self._registry_ttls: Dict[str, float] = {}
+        self.cache = ToolResultCache(max_entries=cache_max_entries)
+
+    def is_serial(self, tool_name: str | None) -> bool:
+        """Whether a tool must not run concurrently with other side-effecting tools."""
+        return bool(tool_name) and any(fnmatchcase(tool_name, p) for p in self.serial_tools)
+
+    def cache_ttl(self, tool_name: str | None) -> float:
+        """Seconds a tool's result may be reused; 0 for tools that are not cacheable."""
+        if not tool_name:
+            return 0.0
+        if tool_name in self._registry_ttls:
+            return self._registry_ttls[tool_name]
+        for pattern, ttl in self.cache_ttls.items():
+            if fnmatchcase(tool_name, pattern):
+                return ttl
+        return 0.0
 
     async def load_tools_from_registry(self, registry_payload: dict) -> None:
         """Load tools from MCP bridge registry and initialize client."""
         logger.info(
             "load_tools_from_registry called with payload keys: %s", list(registry_payload.keys())
         )
+        self.cache.invalidate()
         try:
-            self.tools = registry_payload.get("tools", [])
+            # cache_ttl is tool metadata for this worker, not part of the spec sent to the model
+            self._registry_ttls = {}
+            self.tools = []
+            for tool in registry_payload.get("tools", []):
+                if isinstance(tool, dict) and "cache_ttl" in tool:
+                    tool = dict(tool)
+                    ttl = tool.pop("cache_ttl")
+                    name = (tool.get("function") or {}).get("name") or tool.get("name")
+                    if name and ttl:
+                        self._registry_ttls[name] = float(ttl)
+                self.tools.append(tool)
             logger.info("Loaded %d tools from registry", len(self.tools))
 
             if self.tools:
@@ -69,47 +128,66 @@ class ToolExecutor:
 
         mcp_client = get_mcp_client()
         mqtt_wrapper = mqtt_client_wrapper or self.mqtt_client
-        mqtt_client = client
-        results = []
-
-        for call in tool_calls:
-            call_id = call.get("id")
-            if not call_id:
-                continue
-
-            tool_name = call.get("function", {}).get("name")
-            arguments_str = call.get("function", {}).get("arguments", "{}")
-
-            try:
-                arguments = json.loads(arguments_str)
-                logger.info("Executing tool: %s with args: %s", tool_name, arguments)
-
-                # Execute tool directly via MCP
-                result = await mcp_client.execute_tool(tool_name, arguments)
-
-                # Parse content if it's a JSON string
-                content = result.get("content", "")
-                if content:
-                    try:
-                        parsed = json.loads(content)
-                        # If result contains MQTT publish request, handle it
-                        if mqtt_client and isinstance(parsed, dict) and "mqtt_publish" in parsed:
-                            mqtt_data = parsed.pop("mqtt_publish")
-                            await self._publish_tool_mqtt(mqtt_wrapper, mqtt_client, mqtt_data)
-                            # Update content with the parsed result (without mqtt_publish)
-                            result["content"] = json.dumps(parsed).decode("utf-8")
-                    except json.JSONDecodeError:
-                        # Content is not JSON, leave as is
-                        pass
-
-                result["call_id"] = call_id
-                results.append(result)
-
-            except Exception as e:
-                logger.error("Tool %s failed: %s", tool_name, e, exc_info=True)
-                results.append({"call_id": call_id, "error": str(e)})
-
-        return results
+        calls = [call for call in tool_calls if call.get("id")]
+        # gather keeps results in call order, as format_tool_messages expects
+        return list(
+            await asyncio.gather(
+                *(self._execute_one(call, mcp_client, mqtt_wrapper, client) for call in calls)
+            )
+        )
+
+    async def _execute_one(self, call: dict, mcp_client, mqtt_wrapper, mqtt_client) -> dict:
+        """Execute one tool call, honouring the serial lane, concurrency limit and timeout."""
+        call_id = call["id"]
+        tool_name = call.get("function", {}).get("name")
+        arguments_str = call.get("function", {}).get("arguments", "{}")
+
+        try:
+            arguments = json.loads(arguments_str)
+            ttl = self.cache_ttl(tool_name)
+            if ttl > 0:
+                result = await self.cache.get_or_call(
+                    tool_name, arguments, ttl, lambda: self._call_tool(mcp_client, tool_name, arguments)
+                )
+            else:
+                # A tool that may write invalidates the cached reads of its server
+                self.cache.invalidate(tool_server(tool_name or ""))
+                if self.is_serial(tool_name):
+                    async with self._serial_lock:
+                        result = await self._call_tool(mcp_client, tool_name, arguments)
+                else:
+                    result = await self._call_tool(mcp_client, tool_name, arguments)
+                self.cache.invalidate(tool_server(tool_name or ""))
+
+            # Parse content if it's a JSON string
+            content = result.get("content", "")
+            if content:
+                try:
+                    parsed = json.loads(content)
+                    # If result contains MQTT publish request, handle it
+                    if mqtt_client and isinstance(parsed, dict) and "mqtt_publish" in parsed:
+                        mqtt_data = parsed.pop("mqtt_publish")
+                        await self._publish_tool_mqtt(mqtt_wrapper, mqtt_client, mqtt_data)
+                        # Update content with the parsed result (without mqtt_publish)
+                        result["content"] = json.dumps(parsed).decode("utf-8")
+                except json.JSONDecodeError:
+                    # Content is not JSON, leave as is
+                    pass
+
+            result["call_id"] = call_id
+            return result
+
+        except asyncio.TimeoutError:
+            logger.error("Tool %s timed out after %.1fs", tool_name, self.timeout)
+            return {"call_id": call_id, "error": f"Tool {tool_name} timed out after {self.timeout:g}s"}
+        except Exception as e:
+            logger.error("Tool %s failed: %s", tool_name, e, exc_info=True)
+            return {"call_id": call_id, "error": str(e)}
+
+    async def _call_tool(self, mcp_client, tool_name: str, arguments: dict) -> dict:
+        async with self._slots:
+            logger.info("Executing tool: %s with args: %s", tool_name, arguments)
+            return await asyncio.wait_for(mcp_client.execute_tool(tool_name, arguments), self.timeout)
 
     async def _publish_tool_mqtt(self, mqtt_wrapper, client, mqtt_data: dict) -> None:
         """Publish tool result data to MQTT.
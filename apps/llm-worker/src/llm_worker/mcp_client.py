@@ -13,16 +13,33 @@ from mcp import ClientSession
 from mcp.client.stdio import stdio_client, StdioServerParameters
 from mcp.client.streamable_http import streamablehttp_client
 
+from .config import (
+    MCP_POOL_ENABLED,
+    MCP_POOL_HEALTH_INTERVAL_SEC,
+    MCP_POOL_IDLE_SEC,
+    MCP_POOL_MAX_SESSIONS,
+    MCP_POOL_START_TIMEOUT_SEC,
+)
+from .mcp_pool import MCPSessionPool, stdio_session_factory
+
 logger = logging.getLogger(__name__)
 
 
 class MCPToolClient:
     """Client for executing MCP tools directly."""
 
-    def __init__(self):
+    def __init__(self, pool: Optional[MCPSessionPool] = None):
+        """Initialize client.
+
+        Args:
+            pool: Keeps stdio servers warm between calls; without one every
+                call launches and initializes a fresh server process
+        """
+        self.pool = pool
         self.sessions: Dict[str, ClientSession] = {}
         self.contexts: List[Any] = []  # Store context managers to keep them alive
         self.tools: Dict[str, dict] = {}  # tool_name -> {server, mcp_tool_name, schema}
+        self._server_tools: Dict[str, List[dict]] = {}  # server -> tool schemas at last load
         self._initialized = False
         self._context_task: Optional[asyncio.Task] = None
 
@@ -37,7 +54,8 @@ class MCPToolClient:
             tools = registry_payload.get("tools", [])
             logger.info(f"Initializing MCP client with {len(tools)} tools from registry")
 
-            # Group tools by server
+            # Group tools by server; a reload replaces the previous tool set
+            self.tools = {}
             servers_by_name = {}
             for tool in tools:
                 func = tool.get("function", {})
@@ -69,6 +87,20 @@ class MCPToolClient:
 
             logger.info(f"Loaded {len(self.tools)} tools from {len(servers_by_name)} servers")
 
+            # A reload that changes or drops a server's tools means the server
+            # itself changed, so its warm processes must not be reused
+            server_tools: Dict[str, List[dict]] = {}
+            for info in self.tools.values():
+                server_tools.setdefault(info["server"], []).append(info["schema"])
+            changed = [
+                name for name, schemas in self._server_tools.items()
+                if server_tools.get(name) != schemas
+            ]
+            self._server_tools = server_tools
+            if changed and self.pool is not None:
+                logger.info(f"Registry changed for {changed}; restarting pooled sessions")
+                await self.pool.discard(*changed)
+
             # Note: We don't connect here anymore. Connection happens lazily on first tool execution.
             # This avoids async context issues during message processing.
 
@@ -80,10 +112,7 @@ class MCPToolClient:
     async def _execute_with_stdio(
         self, server_name: str, command: str, args: list, tool_name: str, arguments: dict
     ) -> dict:
-        """Execute a tool by launching stdio subprocess for each call.
-
-        This is simpler than managing long-lived connections and avoids
-        async context issues.
+        """Execute a tool over stdio, on a pooled session when a pool is configured.
 
         Args:
             server_name: Name of the server
@@ -95,6 +124,19 @@ class MCPToolClient:
         Returns:
             Dict with 'content' or 'error'
         """
+        if self.pool is not None:
+            try:
+                server = self.pool.server(
+                    server_name,
+                    stdio_session_factory(StdioServerParameters(command=command, args=args)),
+                    spec=(command, tuple(args)),
+                )
+                result = await server.call_tool(tool_name, arguments)
+                return self._tool_content(result)
+            except Exception as e:
+                logger.error(f"Tool execution failed: {e}", exc_info=True)
+                return {"error": str(e)}
+
         try:
             logger.info(f"Launching MCP server for tool execution: {command} {' '.join(args)}")
             # Use python -m for better stdio handling compared to console scripts
@@ -124,23 +166,24 @@ class MCPToolClient:
                     # Execute tool
                     logger.info(f"Executing tool: {server_name}:{tool_name} with args: {arguments}")
                     result = await session.call_tool(tool_name, arguments)
-
-                    # Extract content
-                    if hasattr(result, "content") and result.content:
-                        content_text = " ".join(
-                            item.text if hasattr(item, "text") else str(item)
-                            for item in result.content
-                        )
-                        logger.info(f"Tool result: {content_text}")
-                        return {"content": content_text}
-                    else:
-                        logger.warning(f"Tool returned no content: {result}")
-                        return {"content": ""}
+                    return self._tool_content(result)
 
         except Exception as e:
             logger.error(f"Tool execution failed: {e}", exc_info=True)
             return {"error": str(e)}
 
+    @staticmethod
+    def _tool_content(result: Any) -> dict:
+        """Flatten an MCP CallToolResult into {'content': text}."""
+        if hasattr(result, "content") and result.content:
+            content_text = " ".join(
+                item.text if hasattr(item, "text") else str(item) for item in result.content
+            )
+            logger.info(f"Tool result: {content_text}")
+            return {"content": content_text}
+        logger.warning(f"Tool returned no content: {result}")
+        return {"content": ""}
+
     async def connect_to_http_server(self, server_name: str, url: str):
         """Connect to an MCP server via HTTP.
 
@@ -206,7 +249,9 @@ class MCPToolClient:
         return await self._execute_with_stdio(server_name, command, args, mcp_tool_name, arguments)
 
     async def close(self):
-        """Close client - nothing to clean up with per-call subprocess approach."""
+        """Close client, stopping any pooled server processes."""
+        if self.pool is not None:
+            await self.pool.close()
         self.tools.clear()
         self._initialized = False
 
@@ -219,5 +264,15 @@ def get_mcp_client() -> MCPToolClient:
     """Get or create the global MCP client instance."""
     global _mcp_client
     if _mcp_client is None:
-        _mcp_client = MCPToolClient()
+        pool = (
+            MCPSessionPool(
+                max_sessions_per_server=MCP_POOL_MAX_SESSIONS,
+                idle_sec=MCP_POOL_IDLE_SEC,
+                health_interval=MCP_POOL_HEALTH_INTERVAL_SEC,
+                start_timeout=MCP_POOL_START_TIMEOUT_SEC,
+            )
+            if MCP_POOL_ENABLED
+            else None
+        )
+        _mcp_client = MCPToolClient(pool=pool)
     return _mcp_client
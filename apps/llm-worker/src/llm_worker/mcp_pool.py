@@ -0,0 +1,297 @@
+"""
+Persistent MCP stdio session pool.
+
+Starting an MCP server costs an interpreter launch plus the initialize
+handshake. The pool keeps initialized sessions alive per server and hands
+them out for tool calls, respawning crashed processes and reaping idle ones.
+"""
+
+import asyncio
+import logging
+import sys
+import time
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    TextIO,
+)
+
+from mcp import ClientSession
+from mcp.client.stdio import StdioServerParameters, stdio_client
+
+logger = logging.getLogger(__name__)
+
+SessionFactory = Callable[[], AsyncContextManager[Any]]
+
+
+def stdio_session_factory(
+    params: StdioServerParameters, errlog: TextIO = sys.stderr
+) -> SessionFactory:
+    """Factory opening an initialized ClientSession over a stdio subprocess."""
+
+    @asynccontextmanager
+    async def connect() -> AsyncIterator[ClientSession]:
+        async with stdio_client(params, errlog=errlog) as (read_stream, write_stream):
+            async with ClientSession(read_stream, write_stream) as session:
+                await session.initialize()
+                yield session
+
+    return connect
+
+
+class PooledSession:
+    """One initialized server session, held open by its own task.
+
+    The stdio transport and session are anyio context managers that must be
+    exited by the task that entered them, so a dedicated task enters them,
+    parks until ``close`` and then unwinds. The session itself may be used
+    from any task.
+    """
+
+    def __init__(self, server: str, connect: SessionFactory):
+        self.server = server
+        self._connect = connect
+        self.session: Any = None
+        self.last_used = time.monotonic()
+        self.last_checked = self.last_used
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._error: Optional[BaseException] = None
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def alive(self) -> bool:
+        return self.session is not None and self._task is not None and not self._task.done()
+
+    async def start(self, timeout: float) -> None:
+        self._task = asyncio.create_task(self._run(), name=f"mcp-session-{self.server}")
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            await self.close()
+            raise
+        if not self.alive:
+            raise RuntimeError(f"MCP server {self.server} failed to start: {self._error}")
+
+    async def _run(self) -> None:
+        try:
+            async with self._connect() as session:
+                self.session = session
+                self._ready.set()
+                await self._closing.wait()
+        except Exception as exc:
+            self._error = exc
+            logger.warning("MCP session for %s ended: %s", self.server, exc)
+        finally:
+            self.session = None
+            self._ready.set()
+
+    async def ping(self, timeout: float) -> bool:
+        """Health check: a round trip through the server."""
+        if not self.alive:
+            return False
+        try:
+            await asyncio.wait_for(self.session.send_ping(), timeout)
+        except Exception as exc:
+            logger.info("MCP session for %s failed health check: %s", self.server, exc)
+            return False
+        self.last_checked = time.monotonic()
+        return True
+
+    async def close(self, timeout: float = 5.0) -> None:
+        self._closing.set()
+        if self._task is None:
+            return
+        done, _ = await asyncio.wait({self._task}, timeout=timeout)
+        if not done:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
+class MCPServerPool:
+    """Warm sessions for one MCP server with bounded concurrency.
+
+    Each call borrows an idle session (spawning one when none is free), so up
+    to ``max_sessions`` calls run in parallel against their own processes.
+    Sessions idle longer than ``health_interval`` are pinged before reuse; a
+    dead session is dropped and replaced. A call whose session crashed
+    mid-call (the session stops answering pings) is retried once on a fresh
+    process.
+    """
+
+    def __init__(
+        self,
+        server: str,
+        connect: SessionFactory,
+        *,
+        max_sessions: int = 2,
+        idle_sec: float = 300.0,
+        health_interval: float = 30.0,
+        start_timeout: float = 15.0,
+        spec: Hashable = None,
+    ):
+        self.server = server
+        self._connect = connect
+        self.spec = spec
+        self.max_sessions = max(1, max_sessions)
+        self.idle_sec = idle_sec
+        self.health_interval = health_interval
+        self.start_timeout = start_timeout
+        self._slots = asyncio.Semaphore(self.max_sessions)
+        self._idle: List[PooledSession] = []
+        self._sessions: set[PooledSession] = set()
+        self.spawned = 0
+
+    @property
+    def size(self) -> int:
+        return len(self._sessions)
+
+    async def call_tool(self, tool_name: str, arguments: dict) -> Any:
+        async with self._slots:
+            retried = False
+            while True:
+                pooled = await self._acquire()
+                try:
+                    result = await pooled.session.call_tool(tool_name, arguments)
+                except asyncio.CancelledError:
+                    # A call abandoned mid-flight (e.g. a tool timeout) may leave the
+                    # server busy; replace the process rather than reuse it.
+                    await self._discard(pooled)
+                    raise
+                except Exception:
+                    # Tool failures come back as results; an exception is a transport
+                    # or protocol problem, so check whether the server is still there.
+                    if await pooled.ping(self.start_timeout):
+                        self._release(pooled)
+                        raise
+                    await self._discard(pooled)
+                    if retried:
+                        raise
+                    logger.warning("MCP server %s crashed during %s; respawning", self.server, tool_name)
+                    retried = True
+                    continue
+                self._release(pooled)
+                return result
+
+    async def _acquire(self) -> PooledSession:
+        now = time.monotonic()
+        while self._idle:
+            pooled = self._idle.pop()
+            if pooled.alive and (
+                now - pooled.last_checked < self.health_interval
+                or await pooled.ping(self.start_timeout)
+            ):
+                return pooled
+            await self._discard(pooled)
+        pooled = PooledSession(self.server, self._connect)
+        await pooled.start(self.start_timeout)
+        self._sessions.add(pooled)
+        self.spawned += 1
+        logger.info("Started MCP session for %s (%d live)", self.server, len(self._sessions))
+        return pooled
+
+    def _release(self, pooled: PooledSession) -> None:
+        pooled.last_used = pooled.last_checked = time.monotonic()
+        self._idle.append(pooled)
+
+    async def _discard(self, pooled: PooledSession) -> None:
+        self._sessions.discard(pooled)
+        await pooled.close()
+
+    async def reap_idle(self) -> int:
+        """Close sessions unused for ``idle_sec``; returns how many were closed."""
+        cutoff = time.monotonic() - self.idle_sec
+        stale = [p for p in self._idle if p.last_used < cutoff or not p.alive]
+        self._idle = [p for p in self._idle if p not in stale]
+        for pooled in stale:
+            await self._discard(pooled)
+        if stale:
+            logger.info("Reaped %d idle MCP session(s) for %s", len(stale), self.server)
+        return len(stale)
+
+    async def close(self) -> None:
+        sessions, self._idle = list(self._sessions), []
+        self._sessions.clear()
+        await asyncio.gather(*(p.close() for p in sessions), return_exceptions=True)
+
+
+class MCPSessionPool:
+    """Per-server MCPServerPools plus a background idle reaper.
+
+    A pool remembers the ``spec`` (e.g. command and args) it was created
+    for; asking for the same server with a different spec closes the old
+    processes and starts a new pool.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_sessions_per_server: int = 2,
+        idle_sec: float = 300.0,
+        health_interval: float = 30.0,
+        start_timeout: float = 15.0,
+    ):
+        self.max_sessions_per_server = max_sessions_per_server
+        self.idle_sec = idle_sec
+        self.health_interval = health_interval
+        self.start_timeout = start_timeout
+        self.servers: Dict[str, MCPServerPool] = {}
+        self._reaper: Optional[asyncio.Task[None]] = None
+        self._retiring: set[asyncio.Task[None]] = set()
+
+    def server(self, name: str, connect: SessionFactory, *, spec: Hashable = None) -> MCPServerPool:
+        pool = self.servers.get(name)
+        if pool is not None and pool.spec != spec:
+            logger.info("MCP server %s changed; replacing its pool", name)
+            self._retire(pool)
+            pool = None
+        if pool is None:
+            pool = self.servers[name] = MCPServerPool(
+                name,
+                connect,
+                max_sessions=self.max_sessions_per_server,
+                idle_sec=self.idle_sec,
+                health_interval=self.health_interval,
+                start_timeout=self.start_timeout,
+                spec=spec,
+            )
+        if self.idle_sec > 0 and (self._reaper is None or self._reaper.done()):
+            self._reaper = asyncio.create_task(self._reap_loop(), name="mcp-pool-reaper")
+        return pool
+
+    async def discard(self, *names: str) -> None:
+        """Close the pools of ``names`` so their next call starts fresh processes."""
+        pools = [self.servers.pop(name) for name in names if name in self.servers]
+        await asyncio.gather(*(pool.close() for pool in pools), return_exceptions=True)
+
+    def _retire(self, pool: MCPServerPool) -> None:
+        task = asyncio.create_task(pool.close(), name=f"mcp-pool-close-{pool.server}")
+        self._retiring.add(task)
+        task.add_done_callback(self._retiring.discard)
+
+    async def _reap_loop(self) -> None:
+        interval = max(1.0, self.idle_sec / 2)
+        while True:
+            await asyncio.sleep(interval)
+            for pool in list(self.servers.values()):
+                try:
+                    await pool.reap_idle()
+                except Exception:
+                    logger.exception("Idle reaping failed for %s", pool.server)
+
+    async def close(self) -> None:
+        if self._reaper is not None:
+            self._reaper.cancel()
+            await asyncio.gather(self._reaper, return_exceptions=True)
+            self._reaper = None
+        pools, self.servers = list(self.servers.values()), {}
+        await asyncio.gather(
+            *(pool.close() for pool in pools), *self._retiring, return_exceptions=True
+        )
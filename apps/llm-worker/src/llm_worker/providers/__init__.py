@@ -1,6 +1,14 @@
 """Provider implementations for the LLM worker."""
 
 from .base import LLMProvider
-from .openai import OpenAIProvider
+from .openai import OpenAIProvider, ProviderHTTPError
+from .router import Endpoint, EndpointHealth, ProviderRouter
 
-__all__ = ["LLMProvider", "OpenAIProvider"]
+__all__ = [
+    "LLMProvider",
+    "OpenAIProvider",
+    "ProviderHTTPError",
+    "Endpoint",
+    "EndpointHealth",
+    "ProviderRouter",
+]
@@ -16,6 +16,12 @@ class LLMResult:
 class LLMProvider:
     name: str = "base"
 
+    async def start(self) -> None:
+        """Acquire long-lived resources (connection pools) at service startup."""
+
+    async def aclose(self) -> None:
+        """Release resources acquired in ``start``."""
+
     async def generate(self, prompt: str, **kwargs) -> LLMResult:  # pragma: no cover - abstract
         raise NotImplementedError
 
@@ -29,6 +29,7 @@ class ChatCompletionRequest(BaseModel):
 class ChoiceDelta(BaseModel):
     content: Optional[str] = None
     role: Optional[str] = None
+    tool_calls: Optional[list[dict]] = None  # fragments keyed by "index"
 
     model_config = {"extra": "ignore"}
 
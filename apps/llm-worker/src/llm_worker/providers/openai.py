@@ -163,6 +163,116 @@ def parse_responses_event(event: dict[str, Any]) -> tuple[str | None, bool, dict
     return None, False, None
 
 
+class ToolCallAssembler:
+    """Assemble tool calls from streamed fragments.
+
+    Chat Completions streams ``delta.tool_calls`` fragments keyed by index;
+    the Responses API streams ``function_call`` items and argument deltas
+    keyed by item id. A call is released as soon as its arguments parse as
+    complete JSON, so it can run while the rest of the stream arrives;
+    ``finish`` releases whatever is left when the stream ends.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Any, dict[str, Any]] = {}
+        self._released: set[Any] = set()
+
+    def add_chat_fragment(self, fragment: dict[str, Any]) -> dict[str, Any] | None:
+        function = fragment.get("function") or {}
+        return self._update(
+            fragment.get("index", 0),
+            call_id=fragment.get("id"),
+            name=function.get("name"),
+            arguments=function.get("arguments"),
+        )
+
+    def add_responses_event(self, event: dict[str, Any]) -> dict[str, Any] | None:
+        event_type = event.get("type")
+        if event_type in {"response.output_item.added", "response.output_item.done"}:
+            item = event.get("item") or {}
+            if item.get("type") != "function_call":
+                return None
+            done = event_type == "response.output_item.done"
+            return self._update(
+                item.get("id") or item.get("call_id"),
+                call_id=item.get("call_id") or item.get("id"),
+                name=item.get("name"),
+                arguments=_stringify_arguments(item.get("arguments")) if done else None,
+                replace=done,
+            )
+        if event_type == "response.function_call_arguments.delta":
+            return self._update(event.get("item_id"), arguments=event.get("delta"))
+        if event_type == "response.function_call_arguments.done":
+            return self._update(
+                event.get("item_id"), arguments=event.get("arguments"), replace=True
+            )
+        return None
+
+    def finish(self) -> list[dict[str, Any]]:
+        """Release calls never seen complete (e.g. tools without arguments)."""
+        pending = []
+        for key, call in self._calls.items():
+            if key in self._released or not call["id"] or not call["function"]["name"]:
+                continue
+            self._released.add(key)
+            call["function"]["arguments"] = call["function"]["arguments"] or "{}"
+            pending.append(call)
+        return pending
+
+    def _update(
+        self,
+        key: Any,
+        *,
+        call_id: str | None = None,
+        name: str | None = None,
+        arguments: str | None = None,
+        replace: bool = False,
+    ) -> dict[str, Any] | None:
+        if key is None or key in self._released:
+            return None
+        call = self._calls.get(key)
+        if call is None:
+            call = self._calls[key] = {
+                "id": None,
+                "type": "function",
+                "function": {"name": None, "arguments": ""},
+            }
+        if call_id:
+            call["id"] = call_id
+        if name:
+            call["function"]["name"] = name
+        if arguments is not None:
+            if replace:
+                call["function"]["arguments"] = arguments
+            else:
+                call["function"]["arguments"] += arguments
+        args = call["function"]["arguments"].rstrip()
+        if not (call["id"] and call["function"]["name"] and args.endswith(("}", "]"))):
+            return None
+        try:
+            orjson.loads(args)
+        except orjson.JSONDecodeError:
+            return None
+        self._released.add(key)
+        return call
+
+
+def _h2_available() -> bool:
+    try:
+        import h2  # noqa: F401  # type: ignore[import]
+    except ImportError:
+        return False
+    return True
+
+
+class ProviderHTTPError(RuntimeError):
+    """Upstream answered with an HTTP error status."""
+
+    def __init__(self, message: str, status: int | None = None):
+        super().__init__(message)
+        self.status = status
+
+
 class OpenAIProvider(LLMProvider):
     name = "openai"
 
@@ -172,20 +282,73 @@ class OpenAIProvider(LLMProvider):
         base_url: str | None = None,
         timeout: float = 60.0,
         responses_model_patterns: Sequence[str] | None = None,
+        *,
+        connect_timeout: float = 5.0,
+        stream_read_timeout: float | None = 60.0,
+        max_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        transport: httpx.AsyncBaseTransport | None = None,
     ):
         self.api_key = api_key
         self.base_url = base_url or "https://api.openai.com/v1"
         self.timeout = timeout
         patterns = responses_model_patterns or OPENAI_RESPONSES_MODELS
         self._router = _ModelRouter(patterns)
+        # One pooled client per provider: keep-alive connections skip TCP/TLS setup on
+        # every turn and on the follow-up call after tool execution.
+        self._timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        # Streams wait at most stream_read_timeout between chunks, not for the whole reply.
+        self._stream_timeout = httpx.Timeout(
+            timeout, connect=connect_timeout, read=stream_read_timeout
+        )
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._http2 = http2 and _h2_available()
+        if http2 and not self._http2:
+            logger.warning("OPENAI_HTTP2 requested but the 'h2' package is missing; using HTTP/1.1")
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
         logger.debug(
-            "OpenAIProvider initialized base_url=%s timeout=%.1fs responses_patterns=%s",
+            "OpenAIProvider initialized base_url=%s timeout=%.1fs connect_timeout=%.1fs "
+            "http2=%s max_connections=%d responses_patterns=%s",
             self.base_url,
             self.timeout,
+            connect_timeout,
+            self._http2,
+            max_connections,
             ",".join(patterns),
         )
 
-    def _http_error(self, exc: HTTPStatusError) -> RuntimeError:
+    def _http(self) -> httpx.AsyncClient:
+        """Shared HTTP client, created on first use and after ``aclose``."""
+
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self._timeout,
+                limits=self._limits,
+                http2=self._http2,
+                transport=self._transport,
+            )
+        return self._client
+
+    async def start(self) -> None:
+        """Create the pooled client at service startup."""
+
+        self._http()
+
+    async def aclose(self) -> None:
+        """Close pooled connections at service shutdown."""
+
+        client, self._client = self._client, None
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
+    def _http_error(self, exc: HTTPStatusError) -> ProviderHTTPError:
         status = exc.response.status_code if exc.response else "?"
         body: str | None = None
         if exc.response is not None:
@@ -201,13 +364,13 @@ class OpenAIProvider(LLMProvider):
         message = f"OpenAI request failed with status {status}"
         if body:
             message += f": {body}"
-        return RuntimeError(message)
+        return ProviderHTTPError(message, exc.response.status_code if exc.response else None)
 
     async def generate(self, prompt: str, **kwargs) -> LLMResult:
         messages = [{"role": "user", "content": prompt}]
         return await self.generate_chat(messages=messages, **kwargs)
 
-    async def stream(self, prompt: str, **kwargs) -> AsyncIterator[dict[str, str | None]]:
+    async def stream(self, prompt: str, **kwargs) -> AsyncIterator[dict[str, Any]]:
         messages = [{"role": "user", "content": prompt}]
         async for chunk in self.stream_chat(messages=messages, **kwargs):
             yield chunk
@@ -246,7 +409,8 @@ class OpenAIProvider(LLMProvider):
 
     async def stream_chat(
         self, messages: list[dict[str, Any]], **kwargs
-    ) -> AsyncIterator[dict[str, str | None]]:
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream ``{"delta": text}`` chunks, plus ``{"tool_call": call}`` as each call completes."""
         model = kwargs.get("model")
         max_tokens = kwargs.get("max_tokens")
         temperature = kwargs.get("temperature")
@@ -319,22 +483,22 @@ class OpenAIProvider(LLMProvider):
             len(messages),
             len(tools or []),
         )
-        async with httpx.AsyncClient(timeout=self.timeout, base_url=self.base_url) as client:
-            resp = await client.post(
-                "/chat/completions",
-                json=payload.model_dump(exclude_none=True),
-                headers=headers,
-            )
-            logger.debug("openai.generate_chat HTTP status=%s", resp.status_code)
-            if resp.status_code >= 400:
-                logger.error(f"🔴 OpenAI API error response: {resp.text}")
-            resp.raise_for_status()
-            data = resp.json()
-            try:
-                parsed = ChatCompletionResponse.model_validate(data)
-            except ValidationError as exc:
-                logger.error("openai.generate_chat validation error: %s", exc)
-                raise
+        client = self._http()
+        resp = await client.post(
+            "/chat/completions",
+            json=payload.model_dump(exclude_none=True),
+            headers=headers,
+        )
+        logger.debug("openai.generate_chat HTTP status=%s", resp.status_code)
+        if resp.status_code >= 400:
+            logger.error(f"🔴 OpenAI API error response: {resp.text}")
+        resp.raise_for_status()
+        data = resp.json()
+        try:
+            parsed = ChatCompletionResponse.model_validate(data)
+        except ValidationError as exc:
+            logger.error("openai.generate_chat validation error: %s", exc)
+            raise
         text = parsed.choices[0].message.content
         usage = parsed.usage.dict(exclude_none=True) if parsed.usage else None
         raw_tool_calls = (
@@ -390,18 +554,18 @@ class OpenAIProvider(LLMProvider):
             len(messages),
             len(tools or []),
         )
-        async with httpx.AsyncClient(timeout=self.timeout, base_url=self.base_url) as client:
-            try:
-                resp = await client.post(
-                    "/responses",
-                    json={k: v for k, v in payload.items() if v is not None},
-                    headers=headers,
-                )
-                logger.debug("openai.generate_chat HTTP status=%s", resp.status_code)
-                resp.raise_for_status()
-            except HTTPStatusError as exc:
-                raise self._http_error(exc) from exc
-            data = resp.json()
+        client = self._http()
+        try:
+            resp = await client.post(
+                "/responses",
+                json={k: v for k, v in payload.items() if v is not None},
+                headers=headers,
+            )
+            logger.debug("openai.generate_chat HTTP status=%s", resp.status_code)
+            resp.raise_for_status()
+        except HTTPStatusError as exc:
+            raise self._http_error(exc) from exc
+        data = resp.json()
 
         text, tool_calls = extract_responses_output(data)
         usage = data.get("usage") if isinstance(data, dict) else None
@@ -432,7 +596,7 @@ class OpenAIProvider(LLMProvider):
         temperature: float | None,
         top_p: float | None,
         tools: list[dict[str, Any]] | None,
-    ) -> AsyncIterator[dict[str, str | None]]:
+    ) -> AsyncIterator[dict[str, Any]]:
         payload = ChatCompletionRequest(
             model=model,
             messages=messages,
@@ -457,51 +621,61 @@ class OpenAIProvider(LLMProvider):
             len(messages),
             len(tools or []),
         )
-        async with httpx.AsyncClient(timeout=None, base_url=self.base_url) as client:
-            async with client.stream(
-                "POST",
-                "/chat/completions",
-                json=payload.model_dump(exclude_none=True),
-                headers=headers,
-            ) as resp:
-                logger.debug("openai.stream_chat HTTP status=%s", resp.status_code)
-                resp.raise_for_status()
-                async for line in resp.aiter_lines():
-                    if not line or line.startswith(":"):
-                        continue
-                    if line.startswith("data: "):
-                        data_str = line[6:].strip()
-                    elif line.startswith("data:"):
-                        data_str = line[5:].strip()
-                    else:
-                        continue
-                    if not data_str:
-                        continue
-                    if data_str == "[DONE]":
-                        logger.debug("openai.stream_chat received [DONE]")
-                        break
-                    try:
-                        chunk = StreamChunk.model_validate_json(data_str)
-                    except ValidationError as exc:
-                        logger.debug("openai.stream_chat JSON parse error: %s", exc)
-                        continue
-                    if not chunk.choices:
-                        continue
-                    delta = chunk.choices[0].delta
-                    text = delta.content if delta else None
-                    if text:
-                        if first_dt is None:
-                            first_dt = time.time() - t0
-                            logger.info("openai.stream_chat first_token_latency=%.3fs", first_dt)
-                        total_len += len(text)
-                        chunks += 1
-                        logger.debug(
-                            "openai.stream_chat chunk endpoint=%s #%d len=%d",
-                            OpenAIEndpoint.CHAT_COMPLETIONS.value,
-                            chunks,
-                            len(text),
-                        )
-                        yield {"delta": text}
+        tool_calls = ToolCallAssembler()
+        client = self._http()
+        async with client.stream(
+            "POST",
+            "/chat/completions",
+            timeout=self._stream_timeout,
+            json=payload.model_dump(exclude_none=True),
+            headers=headers,
+        ) as resp:
+            logger.debug("openai.stream_chat HTTP status=%s", resp.status_code)
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                if not line or line.startswith(":"):
+                    continue
+                if line.startswith("data: "):
+                    data_str = line[6:].strip()
+                elif line.startswith("data:"):
+                    data_str = line[5:].strip()
+                else:
+                    continue
+                if not data_str:
+                    continue
+                if data_str == "[DONE]":
+                    # Read on to EOF: leaving the body unread would drop the pooled connection.
+                    logger.debug("openai.stream_chat received [DONE]")
+                    continue
+                try:
+                    chunk = StreamChunk.model_validate_json(data_str)
+                except ValidationError as exc:
+                    logger.debug("openai.stream_chat JSON parse error: %s", exc)
+                    continue
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+                for fragment in (delta.tool_calls or []) if delta else []:
+                    call = tool_calls.add_chat_fragment(fragment)
+                    if call:
+                        logger.info("openai.stream_chat tool_call ready name=%s", call["function"]["name"])
+                        yield {"tool_call": call}
+                text = delta.content if delta else None
+                if text:
+                    if first_dt is None:
+                        first_dt = time.time() - t0
+                        logger.info("openai.stream_chat first_token_latency=%.3fs", first_dt)
+                    total_len += len(text)
+                    chunks += 1
+                    logger.debug(
+                        "openai.stream_chat chunk endpoint=%s #%d len=%d",
+                        OpenAIEndpoint.CHAT_COMPLETIONS.value,
+                        chunks,
+                        len(text),
+                    )
+                    yield {"delta": text}
+        for call in tool_calls.finish():
+            yield {"tool_call": call}
         dt = time.time() - t0
         logger.info(
             "openai.stream_chat done endpoint=%s chunks=%d total_len=%d elapsed=%.3fs first_token_latency=%.3fs",
@@ -521,7 +695,7 @@ class OpenAIProvider(LLMProvider):
         temperature: float | None,
         top_p: float | None,
         tools: list[dict[str, Any]] | None,
-    ) -> AsyncIterator[dict[str, str | None]]:
+    ) -> AsyncIterator[dict[str, Any]]:
         payload: dict[str, Any] = {
             "model": model,
             "input": build_responses_input(messages),
@@ -540,6 +714,7 @@ class OpenAIProvider(LLMProvider):
         total_len = 0
         chunks = 0
         completed_payload: dict[str, Any] | None = None
+        finished = False
         logger.info(
             "openai.stream_chat start endpoint=%s model=%s temp=%s top_p=%s messages=%d tools=%d",
             OpenAIEndpoint.RESPONSES.value,
@@ -549,60 +724,69 @@ class OpenAIProvider(LLMProvider):
             len(messages),
             len(tools or []),
         )
-        async with httpx.AsyncClient(timeout=None, base_url=self.base_url) as client:
-            async with client.stream(
-                "POST",
-                "/responses",
-                json={k: v for k, v in payload.items() if v is not None},
-                headers=headers,
-            ) as resp:
-                logger.debug("openai.stream_chat HTTP status=%s", resp.status_code)
+        tool_calls = ToolCallAssembler()
+        client = self._http()
+        async with client.stream(
+            "POST",
+            "/responses",
+            timeout=self._stream_timeout,
+            json={k: v for k, v in payload.items() if v is not None},
+            headers=headers,
+        ) as resp:
+            logger.debug("openai.stream_chat HTTP status=%s", resp.status_code)
+            try:
+                resp.raise_for_status()
+            except HTTPStatusError as exc:
+                raise self._http_error(exc) from exc
+            async for line in resp.aiter_lines():
+                if not line or line.startswith(":"):
+                    continue
+                if line.startswith("data: "):
+                    data_str = line[6:].strip()
+                elif line.startswith("data:"):
+                    data_str = line[5:].strip()
+                else:
+                    continue
+                if not data_str:
+                    continue
+                if data_str == "[DONE]" or finished:
+                    # Read on to EOF: leaving the body unread would drop the pooled connection.
+                    logger.debug("openai.stream_chat responses received [DONE]")
+                    continue
+                try:
+                    event = orjson.loads(data_str)
+                except orjson.JSONDecodeError as exc:
+                    logger.debug("openai.stream_chat responses parse error: %s", exc)
+                    continue
+                call = tool_calls.add_responses_event(event)
+                if call:
+                    logger.info("openai.stream_chat tool_call ready name=%s", call["function"]["name"])
+                    yield {"tool_call": call}
                 try:
-                    resp.raise_for_status()
-                except HTTPStatusError as exc:
-                    raise self._http_error(exc) from exc
-                async for line in resp.aiter_lines():
-                    if not line or line.startswith(":"):
-                        continue
-                    if line.startswith("data: "):
-                        data_str = line[6:].strip()
-                    elif line.startswith("data:"):
-                        data_str = line[5:].strip()
-                    else:
-                        continue
-                    if not data_str:
-                        continue
-                    if data_str == "[DONE]":
-                        logger.debug("openai.stream_chat responses received [DONE]")
-                        break
-                    try:
-                        event = orjson.loads(data_str)
-                    except orjson.JSONDecodeError as exc:
-                        logger.debug("openai.stream_chat responses parse error: %s", exc)
-                        continue
-                    try:
-                        delta_text, done, response_payload = parse_responses_event(event)
-                    except RuntimeError as exc:
-                        logger.error("openai.stream_chat responses error: %s", exc)
-                        raise
-                    if delta_text:
-                        if first_dt is None:
-                            first_dt = time.time() - t0
-                            logger.info("openai.stream_chat first_token_latency=%.3fs", first_dt)
-                        total_len += len(delta_text)
-                        chunks += 1
-                        logger.debug(
-                            "openai.stream_chat chunk endpoint=%s #%d len=%d",
-                            OpenAIEndpoint.RESPONSES.value,
-                            chunks,
-                            len(delta_text),
-                        )
-                        yield {"delta": delta_text}
-                    if response_payload:
-                        completed_payload = response_payload
-                    if done:
-                        logger.debug("openai.stream_chat responses completed event received")
-                        break
+                    delta_text, done, response_payload = parse_responses_event(event)
+                except RuntimeError as exc:
+                    logger.error("openai.stream_chat responses error: %s", exc)
+                    raise
+                if delta_text:
+                    if first_dt is None:
+                        first_dt = time.time() - t0
+                        logger.info("openai.stream_chat first_token_latency=%.3fs", first_dt)
+                    total_len += len(delta_text)
+                    chunks += 1
+                    logger.debug(
+                        "openai.stream_chat chunk endpoint=%s #%d len=%d",
+                        OpenAIEndpoint.RESPONSES.value,
+                        chunks,
+                        len(delta_text),
+                    )
+                    yield {"delta": delta_text}
+                if response_payload:
+                    completed_payload = response_payload
+                if done:
+                    logger.debug("openai.stream_chat responses completed event received")
+                    finished = True
+        for call in tool_calls.finish():
+            yield {"tool_call": call}
         dt = time.time() - t0
         logger.info(
             "openai.stream_chat done endpoint=%s chunks=%d total_len=%d elapsed=%.3fs first_token_latency=%.3fs",
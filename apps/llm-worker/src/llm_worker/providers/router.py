@@ -0,0 +1,367 @@
+"""
+Failover and hedging across several OpenAI-compatible endpoints.
+
+``ProviderRouter`` fronts one ``OpenAIProvider`` per endpoint (e.g. a remote
+API and a local llama.cpp server) and presents them as a single provider.
+Each endpoint keeps a health record: an error-rate and time-to-first-token
+EWMA plus a circuit breaker that takes it out of rotation after repeated
+failures and lets a single trial request through once the cooldown expires.
+
+Requests go to the healthiest endpoint, in configured order among equals.
+When it fails before producing output (connection error, timeout, 5xx, 429)
+the next one is tried. With ``hedge_after`` set, a request that has produced
+no first token by then is duplicated on the next endpoint; whichever starts
+first is kept and the other is cancelled. Once a stream has yielded text it
+is committed to its endpoint: a later failure is raised, not retried.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional, Sequence
+
+import httpx
+
+from .base import LLMProvider, LLMResult
+from .openai import OpenAIProvider
+
+logger = logging.getLogger(__name__)
+
+# Statuses that mean the request itself is bad; another endpoint would reject it too
+_REQUEST_ERRORS = frozenset({400, 413, 422})
+
+
+def _status(exc: BaseException) -> Optional[int]:
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code
+    return getattr(exc, "status", None)
+
+
+def is_endpoint_failure(exc: BaseException) -> bool:
+    """True when another endpoint may succeed where this one failed."""
+    status = _status(exc)
+    if status is not None:
+        return status not in _REQUEST_ERRORS
+    return isinstance(exc, (httpx.TransportError, asyncio.TimeoutError, OSError))
+
+
+@dataclass(slots=True)
+class EndpointHealth:
+    """Rolling health of one endpoint plus its circuit breaker."""
+
+    failure_threshold: int = 3
+    cooldown: float = 30.0
+    alpha: float = 0.3
+    error_rate: float = 0.0  # EWMA of failures (1) and successes (0)
+    ttft: Optional[float] = None  # EWMA of seconds to first token / response
+    consecutive_failures: int = 0
+    open_until: float = 0.0
+    trial_in_flight: bool = False
+    requests: int = 0
+    failures: int = 0
+
+    @property
+    def state(self) -> str:
+        if self.consecutive_failures < self.failure_threshold:
+            return "closed"
+        return "open" if time.monotonic() < self.open_until else "half-open"
+
+    def available(self) -> bool:
+        state = self.state
+        return state == "closed" or (state == "half-open" and not self.trial_in_flight)
+
+    def begin(self) -> bool:
+        """Count a request; returns True if it is the half-open trial."""
+        self.requests += 1
+        if self.state == "half-open":
+            self.trial_in_flight = True
+            return True
+        return False
+
+    def success(self, ttft: Optional[float]) -> None:
+        self.trial_in_flight = False
+        self.consecutive_failures = 0
+        self.error_rate *= 1 - self.alpha
+        if ttft is not None:
+            self.ttft = ttft if self.ttft is None else self.ttft + self.alpha * (ttft - self.ttft)
+
+    def failure(self) -> None:
+        self.trial_in_flight = False
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.error_rate += self.alpha * (1 - self.error_rate)
+        if self.consecutive_failures >= self.failure_threshold:
+            self.open_until = time.monotonic() + self.cooldown
+
+    def abandon(self, trial: bool) -> None:
+        """Request ended without an outcome (lost a hedge race, cancelled, bad request)."""
+        if trial:
+            self.trial_in_flight = False
+
+
+@dataclass(slots=True)
+class Endpoint:
+    name: str
+    provider: OpenAIProvider
+    model: Optional[str] = None  # overrides the requested model (local servers)
+    health: EndpointHealth = field(default_factory=EndpointHealth)
+
+
+class _StreamAttempt:
+    """One endpoint's stream, driven by its own task into a queue.
+
+    The HTTP stream is entered and exited by the same task (httpx requires
+    it), so a losing hedge is stopped by cancelling that task.
+    """
+
+    def __init__(self, endpoint: Endpoint, stream: AsyncIterator[dict[str, Any]], trial: bool):
+        self.endpoint = endpoint
+        self.trial = trial
+        self.produced = False
+        self.started = time.monotonic()
+        self.first: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self.error: Optional[BaseException] = None
+        self.ttft: Optional[float] = None
+        self._queue: asyncio.Queue[tuple[str, Any]] = asyncio.Queue()
+        self._task = asyncio.create_task(self._run(stream), name=f"llm-stream-{endpoint.name}")
+
+    async def _run(self, stream: AsyncIterator[dict[str, Any]]) -> None:
+        try:
+            async for chunk in stream:
+                self.produced = True
+                self._mark_first()
+                await self._queue.put(("chunk", chunk))
+            self._mark_first()
+            await self._queue.put(("end", None))
+        except Exception as exc:
+            self.error = exc
+            self._mark_first()
+            await self._queue.put(("error", exc))
+
+    def _mark_first(self) -> None:
+        if not self.first.done():
+            self.ttft = time.monotonic() - self.started
+            self.first.set_result(None)
+
+    @property
+    def failed_early(self) -> bool:
+        """Failed before producing anything (so another endpoint can take over)."""
+        return self.error is not None and not self.produced
+
+    async def chunks(self) -> AsyncIterator[dict[str, Any]]:
+        while True:
+            kind, value = await self._queue.get()
+            if kind == "end":
+                return
+            if kind == "error":
+                raise value
+            yield value
+
+    async def cancel(self) -> None:
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+
+
+class ProviderRouter(LLMProvider):
+    """OpenAI-compatible provider spread over several endpoints with failover."""
+
+    name = "openai"
+
+    def __init__(self, endpoints: Sequence[Endpoint], *, hedge_after: float = 0.0):
+        """Initialize router.
+
+        Args:
+            endpoints: Endpoints in order of preference
+            hedge_after: Seconds without a first token before the request is
+                duplicated on the next endpoint; 0 disables hedging
+        """
+        if not endpoints:
+            raise ValueError("ProviderRouter needs at least one endpoint")
+        self.endpoints = list(endpoints)
+        self.hedge_after = hedge_after
+
+    async def start(self) -> None:
+        for endpoint in self.endpoints:
+            await endpoint.provider.start()
+
+    async def aclose(self) -> None:
+        await asyncio.gather(*(e.provider.aclose() for e in self.endpoints), return_exceptions=True)
+
+    def ranked(self) -> List[Endpoint]:
+        """Available endpoints, healthiest first (configured order among equals)."""
+        available = [e for e in self.endpoints if e.health.available()]
+
+        def degraded(endpoint: Endpoint) -> bool:
+            health = endpoint.health
+            slow = bool(self.hedge_after) and (health.ttft or 0.0) > self.hedge_after
+            return health.error_rate >= 0.5 or slow
+
+        return sorted(available, key=degraded)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        return {
+            e.name: {
+                "state": e.health.state,
+                "error_rate": round(e.health.error_rate, 3),
+                "ttft": e.health.ttft,
+                "requests": e.health.requests,
+                "failures": e.health.failures,
+            }
+            for e in self.endpoints
+        }
+
+    def _candidates(self) -> List[Endpoint]:
+        candidates = self.ranked()
+        if not candidates:
+            raise RuntimeError("No LLM endpoint available (all circuits open)")
+        return candidates
+
+    def _kwargs(self, endpoint: Endpoint, kwargs: dict[str, Any]) -> dict[str, Any]:
+        return {**kwargs, "model": endpoint.model} if endpoint.model else kwargs
+
+    def _failed(self, endpoint: Endpoint, exc: BaseException, trial: bool) -> None:
+        if is_endpoint_failure(exc):
+            endpoint.health.failure()
+            logger.warning(
+                "LLM endpoint %s failed (%s); circuit %s",
+                endpoint.name,
+                exc,
+                endpoint.health.state,
+            )
+        else:
+            endpoint.health.abandon(trial)
+
+    async def generate(self, prompt: str, **kwargs) -> LLMResult:
+        return await self.generate_chat([{"role": "user", "content": prompt}], **kwargs)
+
+    async def stream(self, prompt: str, **kwargs) -> AsyncIterator[dict[str, Any]]:
+        async for chunk in self.stream_chat([{"role": "user", "content": prompt}], **kwargs):
+            yield chunk
+
+    async def generate_chat(self, messages: list[dict[str, Any]], **kwargs) -> LLMResult:
+        def call(endpoint: Endpoint) -> Awaitable[LLMResult]:
+            return endpoint.provider.generate_chat(messages, **self._kwargs(endpoint, kwargs))
+
+        return await self._race(call)
+
+    async def _race(self, call: Callable[[Endpoint], Awaitable[LLMResult]]) -> LLMResult:
+        """Run ``call`` with failover and an optional hedge; first success wins."""
+        candidates = iter(self._candidates())
+        running: dict[asyncio.Task[LLMResult], tuple[Endpoint, float, bool]] = {}
+        last_error: Optional[BaseException] = None
+        hedged = False
+
+        def launch() -> bool:
+            endpoint = next(candidates, None)
+            if endpoint is None:
+                return False
+            trial = endpoint.health.begin()
+            task = asyncio.ensure_future(call(endpoint))
+            running[task] = (endpoint, time.monotonic(), trial)
+            return True
+
+        launch()
+        try:
+            while running:
+                timeout = None
+                if self.hedge_after > 0 and not hedged and len(running) == 1:
+                    (started,) = [s for _, s, _ in running.values()]
+                    timeout = max(0.0, started + self.hedge_after - time.monotonic())
+                done, _ = await asyncio.wait(
+                    running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    hedged = True
+                    if launch():
+                        logger.info("LLM request slow to answer; hedging on a second endpoint")
+                    continue
+                for task in done:
+                    endpoint, started, trial = running.pop(task)
+                    exc = task.exception()
+                    if exc is None:
+                        endpoint.health.success(time.monotonic() - started)
+                        return task.result()
+                    self._failed(endpoint, exc, trial)
+                    if not is_endpoint_failure(exc):
+                        raise exc
+                    last_error = exc
+                if not running and not launch():
+                    break
+        finally:
+            for task, (endpoint, _, trial) in running.items():
+                task.cancel()
+                endpoint.health.abandon(trial)
+            await asyncio.gather(*running, return_exceptions=True)
+        assert last_error is not None
+        raise last_error
+
+    async def stream_chat(
+        self, messages: list[dict[str, Any]], **kwargs
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream from the first endpoint to start streaming, with failover and hedging."""
+        candidates = iter(self._candidates())
+        attempts: list[_StreamAttempt] = []
+        winner: Optional[_StreamAttempt] = None
+        last_error: Optional[BaseException] = None
+        hedged = False
+
+        def launch() -> bool:
+            endpoint = next(candidates, None)
+            if endpoint is None:
+                return False
+            trial = endpoint.health.begin()
+            stream = endpoint.provider.stream_chat(messages, **self._kwargs(endpoint, kwargs))
+            attempts.append(_StreamAttempt(endpoint, stream, trial))
+            return True
+
+        launch()
+        try:
+            while winner is None:
+                live = [a for a in attempts if not a.failed_early]
+                if not live:
+                    if launch():
+                        continue
+                    assert last_error is not None
+                    raise last_error
+                timeout = None
+                if self.hedge_after > 0 and not hedged and len(live) == 1:
+                    timeout = max(0.0, live[0].started + self.hedge_after - time.monotonic())
+                done, _ = await asyncio.wait(
+                    [a.first for a in live], timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    hedged = True
+                    if launch():
+                        logger.info("LLM stream has no first token yet; hedging on a second endpoint")
+                    continue
+                for attempt in live:
+                    if not attempt.first.done():
+                        continue
+                    if attempt.failed_early:
+                        assert attempt.error is not None
+                        self._failed(attempt.endpoint, attempt.error, attempt.trial)
+                        if not is_endpoint_failure(attempt.error):
+                            raise attempt.error
+                        last_error = attempt.error
+                    elif winner is None:
+                        winner = attempt
+
+            for attempt in attempts:
+                if attempt is not winner:
+                    await attempt.cancel()
+            if len(self.endpoints) > 1:
+                logger.debug("LLM stream served by endpoint %s", winner.endpoint.name)
+            try:
+                async for chunk in winner.chunks():
+                    yield chunk
+            except Exception as exc:
+                self._failed(winner.endpoint, exc, winner.trial)
+                raise
+            winner.endpoint.health.success(winner.ttft)
+        finally:
+            for attempt in attempts:
+                await attempt.cancel()
+                attempt.endpoint.health.abandon(attempt.trial)
@@ -6,22 +6,47 @@ import time
 from typing import Any, Dict
 
 import orjson
-from pydantic import ValidationError
 
-from tars.adapters.mqtt_client import MQTTClient
-from tars.contracts.envelope import Envelope
-from .handlers import CharacterManager, ToolExecutor, RAGHandler, MessageRouter, RequestHandler
+from tars.adapters.mqtt_client import MQTTClient, replica_client_id
+from tars.runtime.tracing import Tracer
+from .handlers import (
+    CharacterManager,
+    ToolExecutor,
+    RAGHandler,
+    MessageRouter,
+    RequestHandler,
+    RequestScheduler,
+)
+from .mcp_client import get_mcp_client
+from .tokenizer import load_tokenizer
 from .config import (
     MQTT_URL,
     LOG_LEVEL,
+    LLM_SHARE_GROUP,
+    MQTT_OUTBOX_MAX_ENTRIES,
+    LLM_MAX_CONCURRENT,
+    LLM_MAX_QUEUED,
     LLM_PROVIDER,
     LLM_MODEL,
     LLM_MAX_TOKENS,
     LLM_TEMPERATURE,
     LLM_TOP_P,
     LLM_CTX_WINDOW,
+    LLM_TOKENIZER_PATH,
+    LLM_FALLBACK_API_KEYS,
+    LLM_FALLBACK_ENDPOINTS,
+    LLM_FALLBACK_MODELS,
+    LLM_HEDGE_AFTER_SEC,
+    LLM_CIRCUIT_COOLDOWN_SEC,
+    LLM_CIRCUIT_FAILURES,
     OPENAI_API_KEY,
     OPENAI_BASE_URL,
+    OPENAI_CONNECT_TIMEOUT,
+    OPENAI_HTTP2,
+    OPENAI_KEEPALIVE_EXPIRY,
+    OPENAI_MAX_CONNECTIONS,
+    OPENAI_STREAM_READ_TIMEOUT,
+    OPENAI_TIMEOUT,
     RAG_ENABLED,
     RAG_TOP_K,
     RAG_PROMPT_TEMPLATE,
@@ -31,6 +56,12 @@ from .config import (
     RAG_STRATEGY,
     RAG_DYNAMIC_PROMPTS,
     RAG_CACHE_TTL,
+    RAG_SIMILAR_CACHE_TTL,
+    RAG_SIMILAR_CACHE_THRESHOLD,
+    RAG_SIMILAR_CACHE_SIZE,
+    LLM_TURN_BUDGET_SEC,
+    RAG_BUDGET_FRACTION,
+    RAG_TIMEOUT_SEC,
     TOPIC_LLM_REQUEST,
     TOPIC_LLM_RESPONSE,
     TOPIC_LLM_STREAM,
@@ -42,6 +73,12 @@ from .config import (
     TOPIC_CHARACTER_GET,
     TOPIC_CHARACTER_RESULT,
     TOOL_CALLING_ENABLED,
+    TOOL_CACHE_MAX_ENTRIES,
+    TOOL_CACHE_TTLS,
+    TOOL_MAX_CONCURRENT,
+    TOOL_MAX_ROUNDS,
+    TOOL_SERIAL_TOOLS,
+    TOOL_TIMEOUT_SEC,
     TOPIC_TOOLS_REGISTRY,
     TOPIC_TOOL_CALL_RESULT,
     # TTS streaming config
@@ -50,8 +87,13 @@ from .config import (
     STREAM_MIN_CHARS,
     STREAM_MAX_CHARS,
     STREAM_BOUNDARY_CHARS,
+    STREAM_COALESCE_MAX_BYTES,
+    STREAM_COALESCE_MS,
+    STREAM_DELTA_EXPIRY,
 )
+from .providers.base import LLMProvider
 from .providers.openai import OpenAIProvider
+from .providers.router import Endpoint, EndpointHealth, ProviderRouter
 
 from tars.contracts.registry import register  # type: ignore[import]
 from tars.contracts.v1 import (  # type: ignore[import]
@@ -81,29 +123,53 @@ class LLMService:
 
         # Provider selection (only OpenAI for now)
         provider = LLM_PROVIDER.lower()
-        if provider == "openai":
-            self.provider = OpenAIProvider(api_key=OPENAI_API_KEY, base_url=OPENAI_BASE_URL or None)
-        else:
+        if provider != "openai":
             logger.warning("Unsupported provider '%s', defaulting to openai", provider)
-            self.provider = OpenAIProvider(api_key=OPENAI_API_KEY, base_url=OPENAI_BASE_URL or None)
+        self.provider = self._build_provider()
+
+        # Stage spans (llm.request/llm.rag/llm.first_token) exported on system/trace/llm
+        self.tracer = Tracer("llm")
 
         # MQTT client wrapper (centralized)
         self.mqtt_client = MQTTClient(
             MQTT_URL,
-            client_id="tars-llm",
+            client_id=replica_client_id("tars-llm") if LLM_SHARE_GROUP else "tars-llm",
             source_name="llm-worker",
             enable_health=True,
             enable_heartbeat=True,
+            tracer=self.tracer,
+            outbox_max_entries=MQTT_OUTBOX_MAX_ENTRIES,
         )
 
         # Handlers for different responsibilities
         self.character_mgr = CharacterManager()
-        self.tool_executor = ToolExecutor()
-        self.rag_handler = RAGHandler(TOPIC_MEMORY_QUERY, cache_ttl=RAG_CACHE_TTL)
+        self.tool_executor = ToolExecutor(
+            max_concurrent=TOOL_MAX_CONCURRENT,
+            timeout=TOOL_TIMEOUT_SEC,
+            serial_tools=TOOL_SERIAL_TOOLS,
+            cache_ttls=TOOL_CACHE_TTLS,
+            cache_max_entries=TOOL_CACHE_MAX_ENTRIES,
+        )
+        self.rag_handler = RAGHandler(
+            TOPIC_MEMORY_QUERY,
+            cache_ttl=RAG_CACHE_TTL,
+            memory_results_topic=TOPIC_MEMORY_RESULTS,
+            similar_cache_ttl=RAG_SIMILAR_CACHE_TTL,
+            similar_cache_threshold=RAG_SIMILAR_CACHE_THRESHOLD,
+            similar_cache_size=RAG_SIMILAR_CACHE_SIZE,
+        )
 
         # Build config dict for request handler
         self.config = self._build_config()
 
+        # Requests run as tracked tasks so llm/cancel can stop them mid-stream
+        self.scheduler = RequestScheduler(
+            max_concurrent=LLM_MAX_CONCURRENT,
+            max_queued=LLM_MAX_QUEUED,
+            metrics=self.mqtt_client.metrics,
+            metrics_topic=TOPIC_LLM_REQUEST,
+        )
+
         # Request handler for LLM processing
         self.request_handler = RequestHandler(
             provider=self.provider,
@@ -112,6 +178,9 @@ class LLMService:
             rag_handler=self.rag_handler,
             mqtt_client=self.mqtt_client,
             config=self.config,
+            tracer=self.tracer,
+            scheduler=self.scheduler,
+            tokenizer=load_tokenizer(LLM_TOKENIZER_PATH),
         )
 
         # Message router to dispatch MQTT messages
@@ -149,13 +218,20 @@ class LLMService:
             "RAG_CONTEXT_WINDOW": RAG_CONTEXT_WINDOW,
             "RAG_STRATEGY": RAG_STRATEGY,
             "RAG_DYNAMIC_PROMPTS": RAG_DYNAMIC_PROMPTS,
+            "RAG_BUDGET_FRACTION": RAG_BUDGET_FRACTION,
+            "RAG_TIMEOUT_SEC": RAG_TIMEOUT_SEC,
+            "LLM_TURN_BUDGET_SEC": LLM_TURN_BUDGET_SEC,
             # Tool settings
             "TOOL_CALLING_ENABLED": TOOL_CALLING_ENABLED,
+            "TOOL_MAX_ROUNDS": TOOL_MAX_ROUNDS,
             # TTS streaming settings
             "LLM_TTS_STREAM": LLM_TTS_STREAM,
             "STREAM_MIN_CHARS": STREAM_MIN_CHARS,
             "STREAM_MAX_CHARS": STREAM_MAX_CHARS,
             "STREAM_BOUNDARY_CHARS": STREAM_BOUNDARY_CHARS,
+            "STREAM_COALESCE_MS": STREAM_COALESCE_MS,
+            "STREAM_COALESCE_MAX_BYTES": STREAM_COALESCE_MAX_BYTES,
+            "STREAM_DELTA_EXPIRY": STREAM_DELTA_EXPIRY,
             # Topics
             "TOPIC_LLM_STREAM": TOPIC_LLM_STREAM,
             "TOPIC_LLM_RESPONSE": TOPIC_LLM_RESPONSE,
@@ -166,8 +242,54 @@ class LLMService:
             "EVENT_TYPE_SAY": EVENT_TYPE_SAY,
         }
 
+    @staticmethod
+    def _build_provider() -> LLMProvider:
+        """OpenAI provider, or a failover router when fallback endpoints are configured."""
+
+        def openai(api_key: str, base_url: str | None) -> OpenAIProvider:
+            return OpenAIProvider(
+                api_key=api_key,
+                base_url=base_url,
+                timeout=OPENAI_TIMEOUT,
+                connect_timeout=OPENAI_CONNECT_TIMEOUT,
+                stream_read_timeout=OPENAI_STREAM_READ_TIMEOUT,
+                max_connections=OPENAI_MAX_CONNECTIONS,
+                keepalive_expiry=OPENAI_KEEPALIVE_EXPIRY,
+                http2=OPENAI_HTTP2,
+            )
+
+        primary = openai(OPENAI_API_KEY, OPENAI_BASE_URL or None)
+        if not LLM_FALLBACK_ENDPOINTS:
+            return primary
+
+        def health() -> EndpointHealth:
+            return EndpointHealth(
+                failure_threshold=LLM_CIRCUIT_FAILURES, cooldown=LLM_CIRCUIT_COOLDOWN_SEC
+            )
+
+        endpoints = [Endpoint("primary", primary, health=health())]
+        for name, url in LLM_FALLBACK_ENDPOINTS.items():
+            provider = openai(LLM_FALLBACK_API_KEYS.get(name, OPENAI_API_KEY), url)
+            endpoints.append(Endpoint(name, provider, LLM_FALLBACK_MODELS.get(name), health()))
+        logger.info(
+            "LLM failover across %s (hedge after %.2fs)",
+            ", ".join(e.name for e in endpoints),
+            LLM_HEDGE_AFTER_SEC,
+        )
+        return ProviderRouter(endpoints, hedge_after=LLM_HEDGE_AFTER_SEC)
+
     async def run(self):
         """Main service loop with automatic MQTT reconnection."""
+        # The HTTP pool outlives MQTT reconnects; it is closed only on shutdown.
+        await self.provider.start()
+        try:
+            await self._run_mqtt()
+        finally:
+            await self.scheduler.aclose()
+            await self.provider.aclose()
+            await get_mcp_client().close()  # stops pooled MCP server processes
+
+    async def _run_mqtt(self) -> None:
         backoff = 1.0
         max_backoff = 30.0
         
@@ -179,29 +301,20 @@ class LLMService:
 
                 # Subscribe to all topics with individual handlers
                 await self.mqtt_client.subscribe(TOPIC_CHARACTER_CURRENT, self._handle_character_current)
-                await self.mqtt_client.subscribe(TOPIC_CHARACTER_RESULT, self._handle_character_result)
-                await self.mqtt_client.subscribe(TOPIC_LLM_REQUEST, self._handle_llm_request)
-
-                if RAG_ENABLED:
-                    await self.mqtt_client.subscribe(TOPIC_MEMORY_RESULTS, self._handle_memory_results, qos=1)
-                    logger.info("RAG enabled - subscribed to memory/results")
+                await self.mqtt_client.subscribe(
+                    TOPIC_LLM_REQUEST,
+                    self._handle_llm_request,
+                    share_group=LLM_SHARE_GROUP or None,
+                )
+                await self.mqtt_client.subscribe(TOPIC_LLM_CANCEL, self._handle_llm_cancel)
 
                 if TOOL_CALLING_ENABLED:
                     await self.mqtt_client.subscribe(TOPIC_TOOLS_REGISTRY, self._handle_tools_registry)
                     await self.mqtt_client.subscribe(TOPIC_TOOL_CALL_RESULT, self._handle_tool_result)
                     logger.info("Tool calling enabled - subscribed to tool topics")
 
-                # Request initial character state
-                try:
-                    await self.mqtt_client.publish_event(
-                        topic=TOPIC_CHARACTER_GET,
-                        event_type="memory.character.get",
-                        data={"section": None},
-                        qos=0,
-                    )
-                    logger.info("Requested character/get on startup")
-                except Exception:
-                    logger.debug("character/get publish failed (may be offline)")
+                # Request initial character state (character/current may not be retained yet)
+                asyncio.create_task(self._fetch_character())
 
                 # CRITICAL: Small delay to allow retained messages to arrive
                 await asyncio.sleep(0.5)
@@ -221,11 +334,12 @@ class LLMService:
 
             except asyncio.CancelledError:
                 logger.info("LLM worker shutdown requested")
+                await self.mqtt_client.shutdown()
                 raise
             except Exception as e:
                 logger.warning("MQTT disconnected: %s; reconnecting in %.1fs...", e, backoff)
-            finally:
-                await self.mqtt_client.shutdown()
+                # Keep the client (and its outbox) for the next connect
+                await self.mqtt_client.disconnect()
             
             # Exponential backoff before reconnect
             await asyncio.sleep(backoff)
@@ -239,6 +353,28 @@ class LLMService:
         """Handle character/current retained message."""
         await self.router._handle_character_current(type("Message", (), {"payload": payload})())
 
+    async def _fetch_character(self) -> None:
+        """Fetch the character snapshot with a character/get request.
+
+        character/result only ever answers a character/get, so it is awaited
+        as a reply rather than subscribed to.
+        """
+        try:
+            reply = await self.mqtt_client.request(
+                TOPIC_CHARACTER_GET,
+                "memory.character.get",
+                {"section": None},
+                reply_topic=TOPIC_CHARACTER_RESULT,
+                qos=0,
+            )
+        except asyncio.TimeoutError:
+            logger.info("No character/result on startup; waiting for character/current")
+            return
+        except Exception:
+            logger.debug("character/get request failed (may be offline)", exc_info=True)
+            return
+        await self._handle_character_result(reply.model_dump_json().encode())
+
     async def _handle_character_result(self, payload: bytes) -> None:
         """Handle character/result message."""
         await self.router._handle_character_result(type("Message", (), {"payload": payload})())
@@ -247,27 +383,9 @@ class LLMService:
         """Handle llm/request message."""
         await self.request_handler.process_request(self.mqtt_client.client, payload)
 
-    async def _handle_memory_results(self, payload: bytes) -> None:
-        """Handle memory/results message."""
-        logger.info("Memory results received: payload_size=%d", len(payload))
-        try:
-            # Parse envelope to extract data and correlation ID
-            envelope = Envelope.model_validate_json(payload)
-            data = envelope.data if isinstance(envelope.data, dict) else {}
-            # Add correlation ID to data for RAG handler
-            data["correlate"] = envelope.id
-            logger.debug("Memory results: envelope_id=%s, data_keys=%s", envelope.id, list(data.keys()))
-            self.rag_handler.handle_results(data)
-        except ValidationError:
-            # Fallback to direct JSON parsing for backward compatibility
-            try:
-                data = orjson.loads(payload)
-                logger.info("Memory results fallback parsing: data_keys=%s", list(data.keys()) if isinstance(data, dict) else "not_dict")
-                self.rag_handler.handle_results(data)
-            except Exception as e:
-                logger.warning("Failed to parse memory/results payload: %s", e)
-        except Exception as e:
-            logger.warning("Failed to handle memory/results: %s", e)
+    async def _handle_llm_cancel(self, payload: bytes) -> None:
+        """Handle llm/cancel message."""
+        await self.request_handler.cancel_request(payload)
 
     async def _handle_tools_registry(self, payload: bytes) -> None:
         """Handle tools/registry message."""
@@ -0,0 +1,157 @@
+"""
+Token counting for prompt budgeting.
+
+``BPETokenizer`` is a byte-level BPE loaded from a local ranks file in the
+tiktoken format (one ``<base64 token> <rank>`` pair per line, e.g.
+``cl100k_base.tiktoken``). Nothing is downloaded at runtime. When no file is
+configured, or it cannot be read, ``HeuristicTokenizer`` keeps the old
+word-count estimate.
+
+Counts are cached per text, so conversation history that is re-sent every
+turn is tokenized once.
+"""
+
+from __future__ import annotations
+
+import base64
+import logging
+import re
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Pattern
+
+logger = logging.getLogger(__name__)
+
+# cl100k_base pre-tokenizer. The stdlib approximation treats \p{L} as
+# [^\W\d_] and \p{N} as \d; the ``regex`` package gives the exact classes.
+CL100K_PATTERN = (
+    r"(?i:'s|'t|'re|'ve|'m|'ll|'d)|[^\r\n\p{L}\p{N}]?\p{L}+|\p{N}{1,3}"
+    r"| ?[^\s\p{L}\p{N}]+[\r\n]*|\s*[\r\n]+|\s+(?!\S)|\s+"
+)
+_CL100K_STDLIB = (
+    r"(?i:'s|'t|'re|'ve|'m|'ll|'d)|(?:[^\r\n\w]|_)?[^\W\d_]+|\d{1,3}"
+    r"| ?(?:[^\s\w]|_)+[\r\n]*|\s*[\r\n]+|\s+(?!\S)|\s+"
+)
+
+
+def _compile(pattern: str) -> Pattern[str]:
+    try:
+        import regex  # type: ignore[import]
+    except ImportError:
+        if pattern == CL100K_PATTERN:
+            return re.compile(_CL100K_STDLIB)
+        return re.compile(pattern)
+    return regex.compile(pattern)
+
+
+class Tokenizer:
+    """Base class: ``count`` with a per-text LRU cache over ``_count``."""
+
+    #: Tokens held back from every budget to absorb counting error.
+    reserve = 0
+
+    def __init__(self, cache_size: int = 4096):
+        self._cache_size = cache_size
+        self._counts: OrderedDict[str, int] = OrderedDict()
+
+    def count(self, text: Optional[str]) -> int:
+        if not text:
+            return 0
+        cached = self._counts.get(text)
+        if cached is not None:
+            self._counts.move_to_end(text)
+            return cached
+        tokens = self._count(text)
+        self._counts[text] = tokens
+        if len(self._counts) > self._cache_size:
+            self._counts.popitem(last=False)
+        return tokens
+
+    def _count(self, text: str) -> int:
+        raise NotImplementedError
+
+
+class HeuristicTokenizer(Tokenizer):
+    """~1.3 tokens per whitespace-separated word."""
+
+    reserve = 300  # the estimate can be well off for code, numbers and non-English text
+
+    def _count(self, text: str) -> int:
+        return int(len(text.split()) * 1.3)
+
+
+class BPETokenizer(Tokenizer):
+    """Byte-level BPE over merge ranks (lower rank merges first)."""
+
+    def __init__(
+        self,
+        ranks: Dict[bytes, int],
+        pattern: str = CL100K_PATTERN,
+        cache_size: int = 4096,
+        piece_cache_size: int = 65536,
+    ):
+        super().__init__(cache_size)
+        self.ranks = ranks
+        self._pattern = _compile(pattern)
+        self._piece_cache_size = piece_cache_size
+        self._pieces: Dict[bytes, int] = {}
+
+    @classmethod
+    def from_file(cls, path: str | Path, **kwargs) -> "BPETokenizer":
+        ranks: Dict[bytes, int] = {}
+        with open(path, "rb") as fh:
+            for line in fh:
+                if line.strip():
+                    token, rank = line.split()
+                    ranks[base64.b64decode(token)] = int(rank)
+        return cls(ranks, **kwargs)
+
+    def encode(self, text: str) -> List[int]:
+        return [
+            self.ranks[part]
+            for piece in self._pattern.findall(text)
+            for part in self._merge(piece.encode("utf-8"))
+        ]
+
+    def _count(self, text: str) -> int:
+        total = 0
+        for piece in self._pattern.findall(text):
+            data = piece.encode("utf-8")
+            tokens = self._pieces.get(data)
+            if tokens is None:
+                tokens = len(self._merge(data))
+                if len(self._pieces) >= self._piece_cache_size:
+                    self._pieces.clear()
+                self._pieces[data] = tokens
+            total += tokens
+        return total
+
+    def _merge(self, data: bytes) -> List[bytes]:
+        if data in self.ranks:
+            return [data]
+        parts = [data[i : i + 1] for i in range(len(data))]
+        ranks = self.ranks
+        while len(parts) > 1:
+            best_rank: Optional[int] = None
+            best_at = 0
+            for i in range(len(parts) - 1):
+                rank = ranks.get(parts[i] + parts[i + 1])
+                if rank is not None and (best_rank is None or rank < best_rank):
+                    best_rank, best_at = rank, i
+            if best_rank is None:
+                break
+            parts[best_at : best_at + 2] = [parts[best_at] + parts[best_at + 1]]
+        return parts
+
+
+def load_tokenizer(path: str = "") -> Tokenizer:
+    """BPE tokenizer from a local ranks file, or the heuristic when unavailable."""
+    if path:
+        try:
+            tokenizer = BPETokenizer.from_file(path)
+        except (OSError, ValueError) as exc:
+            logger.warning("Cannot load tokenizer from %s (%s); using word-count estimate", path, exc)
+        else:
+            logger.info("Loaded BPE tokenizer from %s (%d ranks)", path, len(tokenizer.ranks))
+            return tokenizer
+    return HeuristicTokenizer()
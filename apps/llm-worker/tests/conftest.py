@@ -15,6 +15,38 @@ def mock_mqtt_client():
     return client
 
 
+@pytest.fixture
+def make_request_handler():
+    """Factory for a RequestHandler wired to mocks.
+
+    The MQTT wrapper's ``publish_event`` is an AsyncMock (reach it through
+    ``handler.mqtt_client``), the character manager builds no system prompt
+    and the tool executor offers no tools. Keyword arguments replace any
+    RequestHandler argument.
+    """
+    from llm_worker.handlers.request_handler import RequestHandler
+
+    def make(**kwargs) -> RequestHandler:
+        mqtt_wrapper = MagicMock()
+        mqtt_wrapper.publish_event = AsyncMock()
+        character_mgr = MagicMock()
+        character_mgr.build_system_prompt.return_value = None
+        tool_executor = MagicMock()
+        tool_executor.tools = []
+        tool_executor.extract_tool_calls.return_value = []
+        defaults = {
+            "provider": MagicMock(),
+            "character_mgr": character_mgr,
+            "tool_executor": tool_executor,
+            "rag_handler": MagicMock(),
+            "mqtt_client": mqtt_wrapper,
+            "config": {},
+        }
+        return RequestHandler(**{**defaults, **kwargs})
+
+    return make
+
+
 @pytest.fixture
 def mock_mcp_client():
     """Mock MCP client for testing."""
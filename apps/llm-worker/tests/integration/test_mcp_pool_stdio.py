@@ -0,0 +1,37 @@
+"""MCPServerPool against the real tars-mcp-character stdio server."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from llm_worker.mcp_pool import MCPServerPool, stdio_session_factory
+from mcp.client.stdio import StdioServerParameters
+
+CHARACTER_PKG = Path(__file__).resolve().parents[4] / "packages" / "tars-mcp-character"
+
+pytestmark = pytest.mark.skipif(
+    not (CHARACTER_PKG / "tars_mcp_character").is_dir(), reason="tars-mcp-character not in tree"
+)
+
+
+@pytest.mark.asyncio
+async def test_pooled_session_serves_repeated_calls_from_one_process():
+    params = StdioServerParameters(
+        command=sys.executable,
+        args=["-m", "tars_mcp_character"],
+        env={**os.environ, "PYTHONPATH": str(CHARACTER_PKG), "LOG_LEVEL": "WARNING"},
+    )
+    with open(os.devnull, "w") as devnull:
+        pool = MCPServerPool("tars-character", stdio_session_factory(params, errlog=devnull), health_interval=0.0)
+        try:
+            results = [await pool.call_tool("get_current_traits", {}) for _ in range(3)]
+        finally:
+            await pool.close()
+
+    assert all(not result.isError for result in results)
+    assert pool.spawned == 1
+    assert pool.size == 0
@@ -0,0 +1,85 @@
+"""Tests for prompt context packing."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from llm_worker.handlers.context_packer import pack_context
+from llm_worker.handlers.rag import RAGContext
+from llm_worker.tokenizer import Tokenizer
+from tars.contracts.v1 import ConversationMessage, LLMRequest  # type: ignore[import]
+
+
+def test_rag_first_fit_within_share_then_history_suffix():
+    packed = pack_context(
+        100,
+        rag_costs=[30, 40, 10],
+        rag_priority=[0, 1, 2],
+        history_costs=[20, 25, 15, 10],
+    )
+
+    # 30 fits the 50-token share, 40 does not, 10 does. History takes 10 + 15 + 25;
+    # 20 would overflow, and the skipped chunk no longer fits either
+    assert packed.rag == [0, 2]
+    assert packed.history_start == 1
+    assert packed.tokens == 90
+
+
+def test_leftover_budget_goes_back_to_skipped_chunks():
+    packed = pack_context(100, rag_costs=[60, 20], rag_priority=[0, 1], history_costs=[10])
+
+    assert packed.rag == [0, 1]
+    assert packed.history_start == 0
+    assert packed.tokens == 90
+
+
+def test_history_stays_contiguous_and_priority_wins():
+    packed = pack_context(
+        50, rag_costs=[5, 20], rag_priority=[1, 0], history_costs=[1, 40, 10]
+    )
+
+    assert packed.rag == [0, 1]  # the higher-priority chunk 1 was taken first
+    assert packed.history_start == 2  # message 0 would fit but is older than the gap
+    assert pack_context(0, [1], [0], [1]).tokens == 0
+
+
+class WordTokenizer(Tokenizer):
+    def _count(self, text: str) -> int:
+        return len(text.split())
+
+
+@pytest.mark.asyncio
+async def test_prompt_keeps_best_chunks_and_newest_history(make_request_handler):
+    rag_handler = MagicMock()
+    context = RAGContext(
+        "",
+        0,
+        chunks=["[previous] " + "x " * 99, "dog named Rex", "cat named Tom"],
+        priority=[1, 2, 0],
+    )
+    rag_handler.query = AsyncMock(return_value=context)
+    handler = make_request_handler(
+        rag_handler=rag_handler,
+        config={"RAG_ENABLED": True, "RAG_PROMPT_TEMPLATE": "{context}\n{user}"},
+        tokenizer=WordTokenizer(),
+    )
+    history = [
+        ConversationMessage(role="user", content="old " * 100),
+        ConversationMessage(role="user", content="my dog is called Rex"),
+        ConversationMessage(role="assistant", content="Nice name"),
+    ]
+    request = LLMRequest(id="r1", text="what is my dog called", conversation_history=history)
+    params = handler._extract_request_params(request, None)
+    base = handler._base_prompt_tokens(params)
+
+    # 120 for context: chunks 1 and 2 (4 each) fit the 60-token share, the two
+    # newest messages (9 + 6) fit next; neither the old message (104) nor the
+    # context chunk (101) fits the remaining 97
+    prompt, messages = await handler._build_context_aware_prompt(MagicMock(), params, base + 120)
+
+    assert prompt == "dog named Rex\ncat named Tom\nwhat is my dog called"
+    assert [m["content"] for m in messages[:-1]] == ["my dog is called Rex", "Nice name"]
+    assert params["rag_metadata"]["truncated"] is True
+    assert params["prompt_metadata"]["context_tokens"] == 8
@@ -24,7 +24,6 @@ def mock_handlers():
     tool_handler.load_tools_from_registry = AsyncMock()
 
     rag_handler = MagicMock()
-    rag_handler.handle_results = MagicMock()
 
     request_handler = MagicMock()
     request_handler.process_request = AsyncMock()
@@ -164,8 +163,8 @@ async def test_route_tools_registry(router, mock_client, mock_handlers):
 
 
 @pytest.mark.asyncio
-async def test_route_memory_results(router, mock_client, mock_handlers):
-    """Test routing memory/results message."""
+async def test_route_memory_results_ignored(router, mock_client, mock_handlers):
+    """memory/results is consumed by MQTTClient.request(), not routed."""
     results_data = {"id": "corr-1", "results": [{"document": {"text": "Result"}}]}
     message = create_message("memory/results", json.dumps(results_data))
 
@@ -180,8 +179,8 @@ async def test_route_memory_results(router, mock_client, mock_handlers):
         llm_request_topic="llm/request",
     )
 
-    # RAGHandler.handle_results is sync and receives parsed dict
-    mock_handlers["rag"].handle_results.assert_called_once_with(results_data)
+    assert mock_handlers["rag"].method_calls == []
+    mock_handlers["request"].process_request.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -223,7 +222,7 @@ async def test_route_unknown_topic(router, mock_client, mock_handlers):
     # No handlers should be called
     mock_handlers["character"].update_from_current.assert_not_called()
     mock_handlers["tool"].load_tools.assert_not_called()
-    mock_handlers["rag"].handle_results.assert_not_called()
+    assert mock_handlers["rag"].method_calls == []
     mock_handlers["request"].process_request.assert_not_called()
 
 
@@ -7,6 +7,8 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from tars.contracts.envelope import Envelope  # type: ignore[import]
+
 from llm_worker.handlers.rag import RAGContext, RAGHandler
 
 
@@ -21,10 +23,24 @@ def mock_mqtt_client():
     """Create mock MQTT client."""
     client = MagicMock()
     mqtt_wrapper = MagicMock()
-    mqtt_wrapper.publish_event = AsyncMock()
+    # No memory service answering by default: requests time out
+    mqtt_wrapper.request = AsyncMock(side_effect=asyncio.TimeoutError())
     return mqtt_wrapper, client
 
 
+def _results_reply(correlation_id: str, text: str, total_tokens: int) -> Envelope:
+    return Envelope.new(
+        event_type="memory.results",
+        data={
+            "results": [{"document": {"text": text}, "context_type": "target"}],
+            "total_tokens": total_tokens,
+            "truncated": False,
+            "strategy_used": "hybrid",
+        },
+        correlate=correlation_id,
+    )
+
+
 @pytest.mark.asyncio
 async def test_cache_key_generation(rag_handler):
     """Test that cache keys are generated consistently."""
@@ -145,21 +161,9 @@ async def test_metrics_tracking(rag_handler, mock_mqtt_client):
     """Test that metrics are tracked correctly during queries."""
     mqtt_wrapper, client = mock_mqtt_client
 
-    # Mock the memory results to resolve the query
-    async def mock_handle_results():
-        await asyncio.sleep(0.1)
-        rag_handler.handle_results(
-            {
-                "correlate": "test_corr_1",
-                "results": [{"document": {"text": "test"}, "context_type": "target"}],
-                "total_tokens": 100,
-                "truncated": False,
-                "strategy_used": "hybrid",
-            }
-        )
-
-    # Start background task to resolve the query
-    asyncio.create_task(mock_handle_results())
+    # Memory service answers the request
+    mqtt_wrapper.request.side_effect = None
+    mqtt_wrapper.request.return_value = _results_reply("test_corr_1", "test", 100)
 
     # Execute query
     await rag_handler.query(
@@ -269,20 +273,9 @@ async def test_cache_disabled_query(rag_handler, mock_mqtt_client):
     """Test that queries with use_cache=False don't cache."""
     mqtt_wrapper, client = mock_mqtt_client
 
-    # Mock the memory results
-    async def mock_handle_results():
-        await asyncio.sleep(0.1)
-        rag_handler.handle_results(
-            {
-                "correlate": "no_cache_corr",
-                "results": [{"document": {"text": "uncached"}, "context_type": "target"}],
-                "total_tokens": 75,
-                "truncated": False,
-                "strategy_used": "hybrid",
-            }
-        )
-
-    asyncio.create_task(mock_handle_results())
+    # Memory service answers the request
+    mqtt_wrapper.request.side_effect = None
+    mqtt_wrapper.request.return_value = _results_reply("no_cache_corr", "uncached", 75)
 
     # Execute query with caching disabled
     result = await rag_handler.query(
@@ -304,3 +297,75 @@ async def test_cache_disabled_query(rag_handler, mock_mqtt_client):
     metrics = rag_handler.get_metrics()
     assert metrics["cache_hits"] == 0
     assert metrics["cache_misses"] == 0
+
+
+@pytest.mark.asyncio
+async def test_similar_query_reuses_recent_result(mock_mqtt_client):
+    """A reworded follow-up within the similarity TTL skips the memory round trip."""
+    handler = RAGHandler(memory_query_topic="memory/query")
+    mqtt_wrapper, client = mock_mqtt_client
+    mqtt_wrapper.request.side_effect = None
+    mqtt_wrapper.request.return_value = _results_reply("c1", "my dog is called Rex", 20)
+
+    first = await handler.query(mqtt_wrapper, client, "what did I say about my dog", 5, "c1")
+    second = await handler.query(mqtt_wrapper, client, "What did I say about my dog?!", 5, "c2")
+    third = await handler.query(mqtt_wrapper, client, "what did I say about the dog", 5, "c3")
+
+    assert mqtt_wrapper.request.await_count == 1
+    assert second is first and third is first
+    metrics = handler.get_metrics()
+    assert metrics["cache_similar_hits"] == 2
+    assert metrics["cache_misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_similar_query_requires_same_parameters(mock_mqtt_client):
+    handler = RAGHandler(memory_query_topic="memory/query")
+    mqtt_wrapper, client = mock_mqtt_client
+    mqtt_wrapper.request.side_effect = None
+    mqtt_wrapper.request.return_value = _results_reply("c1", "my dog is called Rex", 20)
+
+    await handler.query(mqtt_wrapper, client, "what is my dog called", 5, "c1")
+    await handler.query(mqtt_wrapper, client, "what is my dog called?", 3, "c2")
+    await handler.query(mqtt_wrapper, client, "how is the weather today", 5, "c3")
+
+    assert mqtt_wrapper.request.await_count == 3
+    assert handler.get_metrics()["cache_similar_hits"] == 0
+
+
+@pytest.mark.asyncio
+async def test_similar_query_entries_expire(mock_mqtt_client, monkeypatch):
+    handler = RAGHandler(memory_query_topic="memory/query", similar_cache_ttl=10.0)
+    mqtt_wrapper, client = mock_mqtt_client
+    mqtt_wrapper.request.side_effect = None
+    mqtt_wrapper.request.return_value = _results_reply("c1", "my dog is called Rex", 20)
+    now = [1000.0]
+    monkeypatch.setattr("llm_worker.handlers.rag.time.time", lambda: now[0])
+
+    await handler.query(mqtt_wrapper, client, "what is my dog called", 5, "c1")
+    now[0] += 11.0
+    await handler.query(mqtt_wrapper, client, "what is my dog called?", 5, "c2")
+
+    assert mqtt_wrapper.request.await_count == 2
+    assert handler.clear_cache() >= 1
+    assert len(handler._similar) == 0
+
+
+@pytest.mark.asyncio
+async def test_similar_query_with_different_entity_misses(mock_mqtt_client):
+    """Queries that differ in the thing asked about never share a result."""
+    handler = RAGHandler(memory_query_topic="memory/query", similar_cache_threshold=0.5)
+    mqtt_wrapper, client = mock_mqtt_client
+    mqtt_wrapper.request.side_effect = None
+    mqtt_wrapper.request.return_value = _results_reply("c1", "my sister Ana lives in Boston", 20)
+
+    await handler.query(
+        mqtt_wrapper, client, "what is the name of my sister who lives in boston", 5, "c1"
+    )
+    await handler.query(
+        mqtt_wrapper, client, "what is the name of my sister who lives in chicago", 5, "c2"
+    )
+    await handler.query(mqtt_wrapper, client, "what is the name", 5, "c3")
+
+    assert mqtt_wrapper.request.await_count == 3
+    assert handler.get_metrics()["cache_similar_hits"] == 0
@@ -0,0 +1,149 @@
+"""Tests for RAG prefetch: retrieval overlapping queue wait and prompt assembly."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from llm_worker.handlers.rag import RAGContext
+from llm_worker.handlers.request_handler import RequestHandler
+from llm_worker.handlers.scheduler import RequestScheduler
+from tars.contracts.envelope import Envelope  # type: ignore[import]
+from tars.contracts.v1 import LLMRequest  # type: ignore[import]
+
+
+class SlowRAG:
+    """RAG handler whose query takes ``delay`` seconds, recording its arguments."""
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.calls: list[dict] = []
+        self.started = asyncio.Event()
+        self.cancelled = asyncio.Event()
+
+    async def query(self, mqtt_client, client, prompt, **kwargs) -> RAGContext:
+        self.calls.append(kwargs)
+        self.started.set()
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled.set()
+            raise
+        return RAGContext("the user's dog is called Rex", 8)
+
+
+class RecordingProvider:
+    name = "openai"
+
+    def __init__(self) -> None:
+        self.messages: list[list[dict]] = []
+
+    async def generate_chat(self, messages, **kwargs):
+        self.messages.append(messages)
+        result = MagicMock()
+        result.text = "Rex."
+        result.usage = None
+        return result
+
+
+@pytest.fixture
+def rag_handler_for(make_request_handler):
+    def make(rag, provider=None, scheduler=None, **config) -> RequestHandler:
+        return make_request_handler(
+            provider=provider or RecordingProvider(),
+            rag_handler=rag,
+            config={"RAG_ENABLED": True, "OPENAI_API_KEY": "sk-test", **config},
+            scheduler=scheduler,
+        )
+
+    return make
+
+
+def _payload(request: LLMRequest, ts: float | None = None) -> bytes:
+    envelope = Envelope.new(event_type="llm.request", data=request.model_dump())
+    if ts is not None:
+        envelope = envelope.model_copy(update={"ts": ts})
+    return envelope.model_dump_json().encode()
+
+
+@pytest.mark.asyncio
+async def test_rag_query_overlaps_queue_wait(rag_handler_for):
+    """A queued request's retrieval is done by the time it gets a slot."""
+    rag = SlowRAG(delay=0.1)
+    provider = RecordingProvider()
+    scheduler = RequestScheduler(max_concurrent=1)
+    handler = rag_handler_for(rag, provider, scheduler)
+    busy = asyncio.Event()
+    scheduler.submit("busy", busy.wait, on_cancel=AsyncMock())
+
+    request = LLMRequest(id="r1", text="what is my dog called", stream=False)
+    await handler.process_request(MagicMock(), _payload(request))
+    await asyncio.wait_for(rag.started.wait(), timeout=1.0)
+    await asyncio.sleep(0.15)  # the slot frees up only after retrieval finished
+    busy.set()
+    started = time.monotonic()
+    while not provider.messages and time.monotonic() - started < 1.0:
+        await asyncio.sleep(0.005)
+
+    assert time.monotonic() - started < 0.05
+    assert "Rex" in provider.messages[0][-1]["content"]
+
+
+@pytest.mark.asyncio
+async def test_rag_timeout_shrinks_with_turn_budget(rag_handler_for):
+    rag = SlowRAG(delay=0)
+    handler = rag_handler_for(rag, LLM_TURN_BUDGET_SEC=8.0, RAG_BUDGET_FRACTION=0.5, RAG_TIMEOUT_SEC=3.0)
+
+    await handler.process_request(
+        MagicMock(), _payload(LLMRequest(id="fresh", text="hi", stream=False))
+    )
+    await handler.process_request(
+        MagicMock(), _payload(LLMRequest(id="late", text="hi", stream=False), ts=time.time() - 6.0)
+    )
+    await handler.process_request(
+        MagicMock(), _payload(LLMRequest(id="spent", text="hi", stream=False), ts=time.time() - 60.0)
+    )
+
+    fresh, late, spent = (call["timeout"] for call in rag.calls)
+    assert fresh == 3.0  # capped at RAG_TIMEOUT_SEC
+    assert 0.9 < late < 1.1  # half of the ~2s left
+    assert spent == 0.2  # floor once the budget is gone
+
+
+@pytest.mark.asyncio
+async def test_cancelled_request_cancels_prefetch(rag_handler_for):
+    rag = SlowRAG(delay=10)
+    scheduler = RequestScheduler(max_concurrent=1)
+    handler = rag_handler_for(rag, scheduler=scheduler)
+    scheduler.submit("busy", asyncio.Event().wait, on_cancel=AsyncMock())
+
+    request = LLMRequest(id="r1", text="what is my dog called", stream=False)
+    await handler.process_request(MagicMock(), _payload(request))
+    await asyncio.wait_for(rag.started.wait(), timeout=1.0)
+    assert await scheduler.cancel("r1") is True
+
+    await asyncio.wait_for(rag.cancelled.wait(), timeout=1.0)
+    await scheduler.aclose()
+
+
+@pytest.mark.asyncio
+async def test_duplicate_request_drops_its_prefetch(rag_handler_for):
+    rag = SlowRAG(delay=10)
+    scheduler = RequestScheduler(max_concurrent=1)
+    handler = rag_handler_for(rag, scheduler=scheduler)
+    scheduler.submit("busy", asyncio.Event().wait, on_cancel=AsyncMock())
+
+    request = LLMRequest(id="r1", text="what is my dog called", stream=False)
+    await handler.process_request(MagicMock(), _payload(request))
+    await asyncio.wait_for(rag.started.wait(), timeout=1.0)
+    await handler.process_request(MagicMock(), _payload(request))
+    await asyncio.sleep(0)
+
+    # Only the queued original keeps a prefetch running
+    prefetches = [t for t in asyncio.all_tasks() if t.get_name() == "llm-rag-r1" and not t.done()]
+    assert len(prefetches) == 1
+    assert not rag.cancelled.is_set()
+    await scheduler.aclose()
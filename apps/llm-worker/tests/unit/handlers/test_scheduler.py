@@ -0,0 +1,187 @@
+"""Tests for RequestScheduler and request cancellation."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import orjson
+import pytest
+
+from llm_worker.handlers.scheduler import RequestScheduler
+from tars.contracts.envelope import Envelope  # type: ignore[import]
+from tars.contracts.v1 import LLMCancel, LLMRequest  # type: ignore[import]
+from tars.runtime.metrics import MetricsRegistry  # type: ignore[import]
+
+
+class Gate:
+    """Job body that blocks until released, recording start order."""
+
+    def __init__(self) -> None:
+        self.started: list[str] = []
+        self.release = asyncio.Event()
+
+    def job(self, name: str):
+        async def run() -> None:
+            self.started.append(name)
+            await self.release.wait()
+
+        return run
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_limits_concurrency_and_drains_queue():
+    scheduler = RequestScheduler(max_concurrent=2)
+    gate = Gate()
+    for i in range(4):
+        scheduler.submit(f"r{i}", gate.job(f"r{i}"), on_cancel=AsyncMock())
+    await _settle()
+
+    assert gate.started == ["r0", "r1"]
+    assert (scheduler.active, scheduler.queued) == (2, 2)
+
+    gate.release.set()
+    await _settle()
+
+    assert gate.started == ["r0", "r1", "r2", "r3"]
+    assert (scheduler.active, scheduler.queued, scheduler.completed) == (0, 0, 4)
+
+
+@pytest.mark.asyncio
+async def test_round_robin_across_sources():
+    scheduler = RequestScheduler(max_concurrent=1)
+    gate = Gate()
+    scheduler.submit("busy-0", gate.job("busy-0"), on_cancel=AsyncMock(), source="busy")
+    for i in range(1, 4):
+        scheduler.submit(f"busy-{i}", gate.job(f"busy-{i}"), on_cancel=AsyncMock(), source="busy")
+    scheduler.submit("quiet-0", gate.job("quiet-0"), on_cancel=AsyncMock(), source="quiet")
+
+    gate.release.set()
+    await _settle()
+
+    assert gate.started[:3] == ["busy-0", "busy-1", "quiet-0"]
+
+
+@pytest.mark.asyncio
+async def test_cancel_queued_request_runs_hook_without_starting():
+    scheduler = RequestScheduler(max_concurrent=1)
+    gate = Gate()
+    on_cancel = AsyncMock()
+    scheduler.submit("r0", gate.job("r0"), on_cancel=AsyncMock())
+    scheduler.submit("r1", gate.job("r1"), on_cancel=on_cancel)
+
+    assert await scheduler.cancel("r1") is True
+    gate.release.set()
+    await _settle()
+
+    assert gate.started == ["r0"]
+    on_cancel.assert_awaited_once()
+    assert await scheduler.cancel("r1") is False
+
+
+@pytest.mark.asyncio
+async def test_cancel_running_request_interrupts_it():
+    scheduler = RequestScheduler(max_concurrent=1)
+    gate = Gate()
+    on_cancel = AsyncMock()
+    scheduler.submit("r0", gate.job("r0"), on_cancel=on_cancel)
+    scheduler.submit("r1", gate.job("r1"), on_cancel=AsyncMock())
+    await _settle()
+
+    await scheduler.cancel("r0")
+    await _settle()
+
+    on_cancel.assert_awaited_once()
+    assert gate.started == ["r0", "r1"]  # next request started in its slot
+    assert scheduler.cancelled == 1
+
+
+@pytest.mark.asyncio
+async def test_cancel_before_task_starts():
+    scheduler = RequestScheduler(max_concurrent=1)
+    gate = Gate()
+    on_cancel = AsyncMock()
+    scheduler.submit("r0", gate.job("r0"), on_cancel=on_cancel)
+
+    await scheduler.cancel("r0")
+    await _settle()
+
+    assert gate.started == []
+    on_cancel.assert_awaited_once()
+    assert scheduler.active == 0
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_queue_full_and_ignores_duplicates():
+    scheduler = RequestScheduler(max_concurrent=1, max_queued=1)
+    gate = Gate()
+    assert scheduler.submit("r0", gate.job("r0"), on_cancel=AsyncMock())
+    assert scheduler.submit("r1", gate.job("r1"), on_cancel=AsyncMock())
+
+    assert scheduler.submit("r1", gate.job("r1"), on_cancel=AsyncMock()) is False
+    with pytest.raises(asyncio.QueueFull):
+        scheduler.submit("r2", gate.job("r2"), on_cancel=AsyncMock())
+    assert scheduler.rejected == 1
+    await scheduler.aclose()
+
+
+@pytest.mark.asyncio
+async def test_metrics_record_queue_wait_and_gauges():
+    metrics = MetricsRegistry()
+    scheduler = RequestScheduler(max_concurrent=1, metrics=metrics, metrics_topic="llm/request")
+    gate = Gate()
+    scheduler.submit("r0", gate.job("r0"), on_cancel=AsyncMock())
+    scheduler.submit("r1", gate.job("r1"), on_cancel=AsyncMock())
+    await _settle()
+
+    snapshot = metrics.snapshot()
+    assert snapshot["gauges"] == {"llm.requests.active": 1.0, "llm.requests.queued": 1.0}
+    gate.release.set()
+    await _settle()
+    assert metrics.snapshot()["topics"]["llm/request"]["queue_wait"]["count"] == 2
+
+
+class SlowStreamProvider:
+    """Streams one delta, then blocks until cancelled."""
+
+    name = "openai"
+
+    def __init__(self) -> None:
+        self.closed = asyncio.Event()
+
+    async def stream_chat(self, **kwargs):
+        try:
+            yield {"delta": "Hello"}
+            await asyncio.Event().wait()
+        finally:
+            self.closed.set()
+
+
+def _envelope(event_type: str, data) -> bytes:
+    return Envelope.new(event_type=event_type, data=data).model_dump_json().encode()
+
+
+@pytest.mark.asyncio
+async def test_llm_cancel_stops_stream_and_publishes_done(make_request_handler):
+    provider = SlowStreamProvider()
+    handler = make_request_handler(
+        provider=provider,
+        config={"RAG_DYNAMIC_PROMPTS": False},
+        scheduler=RequestScheduler(max_concurrent=1),
+    )
+    request = LLMRequest(id="r1", text="tell me a story", stream=True)
+
+    await handler.process_request(MagicMock(), _envelope("llm.request", request.model_dump()))
+    await _settle()
+    await handler.cancel_request(orjson.dumps(LLMCancel(id="r1").model_dump()))
+    await asyncio.wait_for(provider.closed.wait(), timeout=1.0)
+    await _settle()
+
+    deltas = [call.kwargs["data"] for call in handler.mqtt_client.publish_event.await_args_list]
+    assert [(d.seq, d.delta, d.done) for d in deltas] == [(1, "Hello", False), (2, None, True)]
+    assert handler.scheduler.active == 0
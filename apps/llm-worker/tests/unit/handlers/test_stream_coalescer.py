@@ -0,0 +1,141 @@
+"""Tests for StreamCoalescer and coalesced llm/stream publishing."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from llm_worker.handlers.stream_coalescer import StreamCoalescer
+from tars.contracts.v1 import LLMRequest  # type: ignore[import]
+
+
+class Published:
+    def __init__(self) -> None:
+        self.texts: list[str] = []
+
+    async def __call__(self, text: str) -> None:
+        self.texts.append(text)
+
+
+@pytest.mark.asyncio
+async def test_first_delta_is_immediate_and_burst_is_batched():
+    published = Published()
+    coalescer = StreamCoalescer(published, window=0.05, max_bytes=1000)
+
+    for token in ("Hel", "lo", " the", "re", " friend"):
+        await coalescer.push(token)
+    assert published.texts == ["Hel"]
+
+    await asyncio.sleep(0.08)
+    assert published.texts == ["Hel", "lo there friend"]
+
+
+@pytest.mark.asyncio
+async def test_sentence_boundary_and_size_flush_immediately():
+    published = Published()
+    coalescer = StreamCoalescer(published, window=10.0, max_bytes=8)
+
+    await coalescer.push("A")
+    await coalescer.push("nswer")
+    await coalescer.push(" is.")
+    await coalescer.push(" Then")
+    await coalescer.push(" éééé")  # 4 characters, 8 bytes
+
+    assert published.texts == ["A", "nswer is.", " Then éééé"]
+    coalescer.cancel()
+
+
+@pytest.mark.asyncio
+async def test_delta_after_a_pause_is_not_delayed():
+    published = Published()
+    coalescer = StreamCoalescer(published, window=0.02, max_bytes=1000)
+
+    await coalescer.push("Thinking")
+    await asyncio.sleep(0.04)
+    await coalescer.push(" slowly")
+
+    assert published.texts == ["Thinking", " slowly"]
+
+
+@pytest.mark.asyncio
+async def test_zero_window_publishes_every_delta():
+    published = Published()
+    coalescer = StreamCoalescer(published, window=0)
+
+    for token in ("a", "b", "", None, "c"):
+        await coalescer.push(token)
+
+    assert published.texts == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_cancel_drops_buffer_and_timer():
+    published = Published()
+    coalescer = StreamCoalescer(published, window=0.02, max_bytes=1000)
+    await coalescer.push("a")
+    await coalescer.push("b")
+
+    coalescer.cancel()
+    await asyncio.sleep(0.04)
+    await coalescer.flush()
+
+    assert published.texts == ["a"]
+
+
+class TokenStreamProvider:
+    """Streams one character per chunk, as fast as the consumer takes them."""
+
+    name = "openai"
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+    async def stream_chat(self, **kwargs):
+        yield {"delta": None}  # role-only chunk
+        for char in self.text:
+            yield {"delta": char}
+
+
+@pytest.mark.asyncio
+async def test_streaming_request_publishes_coalesced_deltas(make_request_handler):
+    text = "Sure thing. The weather today is sunny with a light breeze from the west."
+    handler = make_request_handler(
+        provider=TokenStreamProvider(text),
+        config={
+            "RAG_DYNAMIC_PROMPTS": False,
+            "STREAM_COALESCE_MS": 1000,
+            "STREAM_COALESCE_MAX_BYTES": 16,
+        },
+    )
+    params = handler._extract_request_params(LLMRequest(id="r1", text="weather?", stream=True), None)
+
+    await handler._handle_streaming_request(MagicMock(), params)
+
+    events = [call.kwargs["data"] for call in handler.mqtt_client.publish_event.await_args_list]
+    deltas = [event for event in events if getattr(event, "done", None) is False]
+    done = [event for event in events if getattr(event, "done", None) is True]
+    assert deltas[0].delta == "S"
+    assert deltas[1].delta == "ure thing."
+    assert "".join(d.delta for d in deltas) == text
+    assert len(deltas) < len(text) / 8
+    assert [d.seq for d in deltas] == list(range(1, len(deltas) + 1))
+    assert done[0].seq == len(deltas) + 1
+
+
+@pytest.mark.asyncio
+async def test_replies_are_qos1_and_deltas_expire(make_request_handler):
+    handler = make_request_handler(
+        provider=TokenStreamProvider("Hi."),
+        config={"RAG_DYNAMIC_PROMPTS": False, "STREAM_DELTA_EXPIRY": 1.5},
+    )
+    params = handler._extract_request_params(LLMRequest(id="r1", text="hi", stream=True), None)
+
+    await handler._handle_streaming_request(MagicMock(), params)
+
+    calls = handler.mqtt_client.publish_event.await_args_list
+    assert calls and all(call.kwargs["qos"] == 1 for call in calls)
+    deltas = [call for call in calls if getattr(call.kwargs["data"], "done", None) is False]
+    assert deltas and all(call.kwargs["expiry"] == 1.5 for call in deltas)
+    assert calls[-1].kwargs["topic"] == "llm/response"
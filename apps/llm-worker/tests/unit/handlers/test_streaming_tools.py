@@ -0,0 +1,117 @@
+"""Streaming turns that call tools: the tool runs mid-stream and the follow-up keeps streaming."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import httpx
+import orjson
+import pytest
+
+from llm_worker.handlers.tools import ToolExecutor
+from llm_worker.providers.openai import OpenAIProvider
+from tars.contracts.envelope import Envelope  # type: ignore[import]
+from tars.contracts.v1 import LLMRequest  # type: ignore[import]
+
+_WEATHER_TOOL = {"type": "function", "function": {"name": "weather", "parameters": {"type": "object"}}}
+
+
+def _event(payload: dict) -> bytes:
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
+def _tool_fragment(args: str, **extra) -> bytes:
+    fragment = {"index": 0, "function": {"arguments": args}}
+    if extra:
+        fragment.update(id=extra["id"], type="function")
+        fragment["function"]["name"] = extra["name"]
+    return _event({"choices": [{"delta": {"tool_calls": [fragment]}}]})
+
+
+def _text(text: str) -> bytes:
+    return _event({"choices": [{"delta": {"content": text}}]})
+
+
+class SSEStandIn:
+    """Chat completions stand-in: a fragmented tool call first, then a streamed answer.
+
+    The first stream holds its final chunk until the tool has started, so the
+    test deadlocks (and times out) unless the tool runs mid-stream.
+    """
+
+    def __init__(self, tool_started: asyncio.Event) -> None:
+        self.tool_started = tool_started
+        self.requests: list[dict] = []
+
+    async def _tool_turn(self):
+        yield _text("Checking the forecast. ")
+        yield _tool_fragment("", id="call_1", name="weather")
+        yield _tool_fragment('{"city": ')
+        yield _tool_fragment('"Paris"}')
+        await asyncio.wait_for(self.tool_started.wait(), timeout=2.0)
+        yield _event({"choices": [{"delta": {}, "finish_reason": "tool_calls"}]})
+        yield b"data: [DONE]\n\n"
+
+    async def _answer_turn(self):
+        for text in ("It is ", "sunny in Paris."):
+            yield _text(text)
+        yield b"data: [DONE]\n\n"
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(orjson.loads(request.content))
+        stream = self._tool_turn() if len(self.requests) == 1 else self._answer_turn()
+        return httpx.Response(200, content=stream, headers={"content-type": "text/event-stream"})
+
+
+class FakeToolExecutor:
+    tools = [_WEATHER_TOOL]
+    format_tool_messages = staticmethod(ToolExecutor.format_tool_messages)
+
+    def __init__(self) -> None:
+        self.started = asyncio.Event()
+        self.calls: list[dict] = []
+
+    async def execute_tool_calls(self, tool_calls, mqtt_wrapper=None, client=None):
+        self.started.set()
+        self.calls.extend(tool_calls)
+        return [{"call_id": call["id"], "content": '{"forecast": "sunny"}'} for call in tool_calls]
+
+
+@pytest.mark.asyncio
+async def test_streaming_turn_runs_tool_mid_stream_and_streams_follow_up(make_request_handler):
+    executor = FakeToolExecutor()
+    stand_in = SSEStandIn(executor.started)
+    provider = OpenAIProvider(
+        api_key="sk-test",
+        base_url="http://llm.test/v1",
+        responses_model_patterns=["none"],
+        transport=httpx.MockTransport(stand_in),
+    )
+    handler = make_request_handler(
+        provider=provider,
+        tool_executor=executor,
+        config={"OPENAI_API_KEY": "sk-test", "TOOL_CALLING_ENABLED": True, "RAG_DYNAMIC_PROMPTS": False},
+    )
+    request = LLMRequest(id="r1", text="weather in Paris?", stream=True)
+    payload = Envelope.new(event_type="llm.request", data=request.model_dump()).model_dump_json().encode()
+
+    await asyncio.wait_for(handler.process_request(MagicMock(), payload), timeout=5.0)
+
+    published = [call.kwargs["data"] for call in handler.mqtt_client.publish_event.await_args_list]
+    deltas, (response,) = published[:-1], published[-1:]
+    assert [(d.seq, d.delta, d.done) for d in deltas] == [
+        (1, "Checking the forecast. ", False),
+        (2, "It is ", False),
+        (3, "sunny in Paris.", False),
+        (4, None, True),
+    ]
+    assert response.reply == "Checking the forecast. It is sunny in Paris."
+    assert executor.calls[0]["function"]["arguments"] == '{"city": "Paris"}'
+
+    first, follow_up = stand_in.requests
+    assert first["tools"] == [_WEATHER_TOOL]
+    assistant, tool = follow_up["messages"][-2:]
+    assert assistant["tool_calls"][0]["id"] == "call_1"
+    assert tool == {"role": "tool", "content": '{"forecast": "sunny"}', "tool_call_id": "call_1"}
+    await provider.aclose()
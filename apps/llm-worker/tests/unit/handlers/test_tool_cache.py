@@ -0,0 +1,167 @@
+"""Tests for tool result caching and in-flight deduplication."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from llm_worker.handlers.tool_cache import ToolResultCache
+from llm_worker.handlers.tools import ToolExecutor
+
+TRAITS = "mcp__tars-character__get_current_traits"
+ADJUST = "mcp__tars-character__adjust_personality_trait"
+
+
+class CountingMCPClient:
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls: list[tuple[str, dict]] = []
+
+    async def execute_tool(self, name: str, arguments: dict) -> dict:
+        self.calls.append((name, arguments))
+        await asyncio.sleep(self.latency)
+        if name.endswith("fail"):
+            return {"error": "unavailable"}
+        return {"content": f"{name}#{len(self.calls)}"}
+
+
+def _call(name: str, arguments: str = "{}", call_id: str = "call-1") -> dict:
+    return {"id": call_id, "function": {"name": name, "arguments": arguments}}
+
+
+def _executor(**kwargs) -> ToolExecutor:
+    executor = ToolExecutor(**kwargs)
+    executor._initialized = True
+    return executor
+
+
+@pytest.mark.asyncio
+async def test_cached_tool_runs_once_per_canonical_arguments():
+    executor = _executor(cache_ttls={"mcp__tars-character__get_*": 30})
+    mcp = CountingMCPClient()
+
+    with patch("llm_worker.handlers.tools.get_mcp_client", return_value=mcp):
+        first = await executor.execute_tool_calls([_call(TRAITS, '{"a": 1, "b": 2}')])
+        second = await executor.execute_tool_calls([_call(TRAITS, '{"b": 2, "a": 1}', "call-2")])
+        other = await executor.execute_tool_calls([_call(TRAITS, '{"a": 2}', "call-3")])
+
+    assert first[0]["content"] == second[0]["content"] == f"{TRAITS}#1"
+    assert second[0]["call_id"] == "call-2"
+    assert other[0]["content"] == f"{TRAITS}#2"
+    assert executor.cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_execution():
+    executor = _executor(cache_ttls={TRAITS: 30})
+    mcp = CountingMCPClient(latency=0.05)
+
+    with patch("llm_worker.handlers.tools.get_mcp_client", return_value=mcp):
+        results = await executor.execute_tool_calls([_call(TRAITS, call_id=f"call-{i}") for i in range(3)])
+
+    assert len(mcp.calls) == 1
+    assert [r["call_id"] for r in results] == ["call-0", "call-1", "call-2"]
+    assert executor.cache.coalesced == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached_and_uncached_tools_always_run():
+    executor = _executor(cache_ttls={"*fail": 30})
+    mcp = CountingMCPClient()
+
+    with patch("llm_worker.handlers.tools.get_mcp_client", return_value=mcp):
+        for _ in range(2):
+            await executor.execute_tool_calls([_call("mcp__x__fail")])
+            await executor.execute_tool_calls([_call("mcp__x__lookup")])
+
+    assert len(mcp.calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_write_on_same_server_invalidates_cached_reads():
+    executor = _executor(cache_ttls={TRAITS: 30})
+    mcp = CountingMCPClient()
+
+    with patch("llm_worker.handlers.tools.get_mcp_client", return_value=mcp):
+        await executor.execute_tool_calls([_call(TRAITS)])
+        await executor.execute_tool_calls([_call(ADJUST, '{"trait_name": "humor", "new_value": 90}')])
+        await executor.execute_tool_calls([_call(TRAITS)])
+
+    assert [name for name, _ in mcp.calls] == [TRAITS, ADJUST, TRAITS]
+
+
+@pytest.mark.asyncio
+async def test_read_in_flight_during_write_is_not_cached():
+    cache = ToolResultCache()
+    started, release = asyncio.Event(), asyncio.Event()
+    calls = 0
+
+    async def read() -> dict:
+        nonlocal calls
+        calls += 1
+        n = calls
+        if n == 1:
+            started.set()
+            await release.wait()  # still reading when the write lands
+        return {"content": f"read#{n}"}
+
+    stale = asyncio.create_task(cache.get_or_call(TRAITS, {}, 30, read))
+    await started.wait()
+    cache.invalidate("mcp__tars-character")
+    # Does not join the pre-write call
+    fresh = await asyncio.wait_for(cache.get_or_call(TRAITS, {}, 30, read), 1.0)
+    release.set()
+
+    assert (await stale)["content"] == "read#1"
+    assert fresh["content"] == "read#2"
+    assert (await cache.get_or_call(TRAITS, {}, 30, read))["content"] == "read#2"
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_registry_metadata_declares_ttl_and_reload_invalidates(mock_mcp_client):
+    executor = ToolExecutor()
+    registry = {
+        "tools": [
+            {"type": "function", "function": {"name": TRAITS}, "cache_ttl": 60},
+            {"type": "function", "function": {"name": ADJUST}},
+        ]
+    }
+    with patch("llm_worker.handlers.tools.get_mcp_client", return_value=mock_mcp_client):
+        await executor.load_tools_from_registry(registry)
+
+    assert executor.cache_ttl(TRAITS) == 60 and executor.cache_ttl(ADJUST) == 0
+    assert all("cache_ttl" not in tool for tool in executor.tools)  # never offered to the model
+    assert "cache_ttl" in registry["tools"][0]
+
+    mcp = CountingMCPClient()
+    with patch("llm_worker.handlers.tools.get_mcp_client", return_value=mcp):
+        await executor.execute_tool_calls([_call(TRAITS)])
+    assert len(executor.cache) == 1
+
+    with patch("llm_worker.handlers.tools.get_mcp_client", return_value=mock_mcp_client):
+        await executor.load_tools_from_registry(registry)
+    assert len(executor.cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_expires_and_stays_bounded():
+    cache = ToolResultCache(max_entries=2)
+    calls = 0
+
+    async def call() -> dict:
+        nonlocal calls
+        calls += 1
+        return {"content": str(calls)}
+
+    await cache.get_or_call("t", {"n": 1}, 0.01, call)
+    await asyncio.sleep(0.02)
+    assert (await cache.get_or_call("t", {"n": 1}, 30, call))["content"] == "2"
+
+    await cache.get_or_call("t", {"n": 2}, 30, call)
+    await cache.get_or_call("t", {"n": 3}, 30, call)
+    assert len(cache) == 2
+    await cache.get_or_call("t", {"n": 1}, 30, call)  # least recently used, evicted
+    assert calls == 5
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -232,3 +234,89 @@ async def test_execute_tool_calls_invalid_json(tool_executor, mock_mcp_client):
 
     assert len(results) == 1
     assert "error" in results[0]
+
+
+class TimedMCPClient:
+    """MCP client stand-in whose tools sleep for a per-tool latency."""
+
+    def __init__(self, latencies: dict[str, float]):
+        self.latencies = latencies
+        self.running = 0
+        self.peak = 0
+        self.log: list[tuple[str, str]] = []
+
+    async def execute_tool(self, name: str, arguments: dict) -> dict:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        self.log.append(("start", name))
+        try:
+            await asyncio.sleep(self.latencies[name])
+        finally:
+            self.running -= 1
+            self.log.append(("end", name))
+        return {"content": name}
+
+
+def _calls(*names: str) -> list[dict]:
+    return [{"id": f"call-{i}", "function": {"name": name, "arguments": "{}"}} for i, name in enumerate(names)]
+
+
+@pytest.mark.asyncio
+async def test_independent_calls_run_concurrently_in_call_order():
+    """Wall time is the slowest call, not the sum; results keep call order."""
+    executor = ToolExecutor(max_concurrent=4)
+    executor._initialized = True
+    mcp = TimedMCPClient({"slow": 0.2, "medium": 0.1, "fast": 0.05})
+
+    with patch("llm_worker.handlers.tools.get_mcp_client", return_value=mcp):
+        started = time.perf_counter()
+        results = await executor.execute_tool_calls(_calls("slow", "medium", "fast"))
+        elapsed = time.perf_counter() - started
+
+    assert [r["content"] for r in results] == ["slow", "medium", "fast"]
+    assert [m["tool_call_id"] for m in ToolExecutor.format_tool_messages(results)] == ["call-0", "call-1", "call-2"]
+    assert mcp.peak == 3
+    assert elapsed < 0.3
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded():
+    executor = ToolExecutor(max_concurrent=2)
+    executor._initialized = True
+    mcp = TimedMCPClient({"a": 0.02, "b": 0.02, "c": 0.02, "d": 0.02})
+
+    with patch("llm_worker.handlers.tools.get_mcp_client", return_value=mcp):
+        await executor.execute_tool_calls(_calls("a", "b", "c", "d"))
+
+    assert mcp.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_timed_out_call_returns_error_without_blocking_others():
+    executor = ToolExecutor(timeout=0.05)
+    executor._initialized = True
+    mcp = TimedMCPClient({"hang": 5.0, "ok": 0.0})
+
+    with patch("llm_worker.handlers.tools.get_mcp_client", return_value=mcp):
+        results = await executor.execute_tool_calls(_calls("hang", "ok"))
+
+    assert "timed out" in results[0]["error"]
+    assert results[1] == {"content": "ok", "call_id": "call-1"}
+
+
+@pytest.mark.asyncio
+async def test_serial_tools_never_overlap_across_requests():
+    executor = ToolExecutor(serial_tools=["mcp__tars-movement__*"])
+    executor._initialized = True
+    wave, bow = "mcp__tars-movement__wave", "mcp__tars-movement__bow"
+    mcp = TimedMCPClient({wave: 0.05, bow: 0.05, "lookup": 0.05})
+
+    with patch("llm_worker.handlers.tools.get_mcp_client", return_value=mcp):
+        await asyncio.gather(
+            executor.execute_tool_calls(_calls(wave, "lookup")),
+            executor.execute_tool_calls(_calls(bow)),
+        )
+
+    movement = [event for event in mcp.log if event[1] != "lookup"]
+    assert movement == [("start", wave), ("end", wave), ("start", bow), ("end", bow)]
+    assert mcp.peak == 2  # the lookup still ran alongside a gesture
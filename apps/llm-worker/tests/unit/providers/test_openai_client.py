@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import httpx
+import orjson
+import pytest
+
+from llm_worker.providers.openai import OpenAIProvider  # type: ignore[import]
+
+_SSE = (
+    b'data: {"choices": [{"delta": {"content": "Hel"}}]}\n\n'
+    b'data: {"choices": [{"delta": {"content": "lo"}}]}\n\n'
+    b"data: [DONE]\n\n"
+)
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Answers chat completions (JSON or SSE) and records request timeouts."""
+
+    def __init__(self) -> None:
+        self.timeouts: list[dict] = []
+        self.closed = False
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.timeouts.append(request.extensions["timeout"])
+        if orjson.loads(request.content).get("stream"):
+            return httpx.Response(200, content=_SSE, headers={"content-type": "text/event-stream"})
+        return httpx.Response(200, json={"choices": [{"message": {"role": "assistant", "content": "Hi"}}]})
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture()
+def transport() -> RecordingTransport:
+    return RecordingTransport()
+
+
+def _provider(transport: RecordingTransport, **kwargs) -> OpenAIProvider:
+    return OpenAIProvider(
+        api_key="sk-test",
+        base_url="http://llm.test/v1",
+        responses_model_patterns=["responses-only"],
+        transport=transport,
+        **kwargs,
+    )
+
+
+async def test_requests_share_one_pooled_client(transport: RecordingTransport) -> None:
+    provider = _provider(transport)
+    await provider.start()
+    client = provider._client
+
+    result = await provider.generate("hi", model="gpt-test")
+    deltas = [chunk["delta"] async for chunk in provider.stream("hi", model="gpt-test")]
+
+    assert result.text == "Hi"
+    assert deltas == ["Hel", "lo"]
+    assert provider._client is client
+    assert len(transport.timeouts) == 2
+    await provider.aclose()
+
+
+async def test_streams_use_separate_read_timeout(transport: RecordingTransport) -> None:
+    provider = _provider(transport, timeout=30.0, connect_timeout=2.0, stream_read_timeout=7.5)
+
+    await provider.generate("hi", model="gpt-test")
+    async for _ in provider.stream("hi", model="gpt-test"):
+        pass
+
+    generate_timeout, stream_timeout = transport.timeouts
+    assert generate_timeout["connect"] == stream_timeout["connect"] == 2.0
+    assert generate_timeout["read"] == 30.0
+    assert stream_timeout["read"] == 7.5
+    await provider.aclose()
+
+
+async def test_aclose_releases_pool_and_next_call_reopens(transport: RecordingTransport) -> None:
+    provider = _provider(transport)
+    await provider.generate("hi", model="gpt-test")
+    first = provider._client
+
+    await provider.aclose()
+    assert transport.closed and provider._client is None
+
+    await provider.generate("hi", model="gpt-test")
+    assert provider._client is not None and provider._client is not first
+    await provider.aclose()
+
+
+def test_http2_falls_back_without_h2(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("llm_worker.providers.openai._h2_available", lambda: False)
+
+    provider = OpenAIProvider(api_key="sk-test", http2=True)
+
+    assert provider._http2 is False
@@ -0,0 +1,201 @@
+"""ProviderRouter against stand-in endpoints with injected latency and faults."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import orjson
+import pytest
+
+from llm_worker.providers.openai import OpenAIProvider, ProviderHTTPError  # type: ignore[import]
+from llm_worker.providers.router import (  # type: ignore[import]
+    Endpoint,
+    EndpointHealth,
+    ProviderRouter,
+    is_endpoint_failure,
+)
+
+
+class _Body(httpx.AsyncByteStream):
+    def __init__(self, deltas: list[str], break_after: int | None) -> None:
+        self.deltas = deltas
+        self.break_after = break_after
+
+    async def __aiter__(self):
+        for i, delta in enumerate(self.deltas):
+            if i == self.break_after:
+                raise httpx.ReadError("connection reset")
+            yield b"data: " + orjson.dumps({"choices": [{"delta": {"content": delta}}]}) + b"\n\n"
+        yield b"data: [DONE]\n\n"
+
+
+class StandIn(httpx.AsyncBaseTransport):
+    """Chat-completions endpoint that can be slow, answer with an error, or drop."""
+
+    def __init__(
+        self,
+        deltas: list[str] = ["Hi"],
+        *,
+        status: int = 200,
+        delay: float = 0.0,
+        fail: Exception | None = None,
+        break_after: int | None = None,
+    ) -> None:
+        self.deltas = deltas
+        self.status = status
+        self.delay = delay
+        self.fail = fail
+        self.break_after = break_after
+        self.models: list[str] = []
+        self.cancelled = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = orjson.loads(request.content)
+        self.models.append(body.get("model"))
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail is not None:
+            raise self.fail
+        if self.status >= 400:
+            return httpx.Response(self.status, json={"error": {"message": "stand-in error"}})
+        if body.get("stream"):
+            return httpx.Response(
+                200,
+                stream=_Body(self.deltas, self.break_after),
+                headers={"content-type": "text/event-stream"},
+            )
+        message = {"role": "assistant", "content": "".join(self.deltas)}
+        return httpx.Response(200, json={"choices": [{"message": message}]})
+
+
+def _endpoint(name: str, transport: StandIn, **kwargs) -> Endpoint:
+    provider = OpenAIProvider(
+        api_key="sk-test",
+        base_url=f"http://{name}.test/v1",
+        responses_model_patterns=[],
+        transport=transport,
+    )
+    return Endpoint(name, provider, **kwargs)
+
+
+def _router(*endpoints: Endpoint, hedge_after: float = 0.0) -> ProviderRouter:
+    return ProviderRouter(endpoints, hedge_after=hedge_after)
+
+
+async def _text(router: ProviderRouter) -> str:
+    chunks = router.stream_chat([{"role": "user", "content": "hi"}], model="gpt-test")
+    return "".join([chunk["delta"] async for chunk in chunks])
+
+
+async def test_fails_over_on_server_error_and_connection_error() -> None:
+    primary = StandIn(status=503)
+    dead = StandIn(fail=httpx.ConnectError("refused"))
+    backup = StandIn(["local"])
+    router = _router(
+        _endpoint("primary", primary),
+        _endpoint("dead", dead),
+        _endpoint("local", backup, model="llama-3"),
+    )
+
+    result = await router.generate("hi", model="gpt-test")
+    text = await _text(router)
+
+    assert result.text == text == "local"
+    assert backup.models == ["llama-3", "llama-3"]  # the endpoint's own model
+    assert router.stats()["primary"]["failures"] == 2
+    assert router.stats()["dead"]["failures"] == 2
+    await router.aclose()
+
+
+async def test_bad_request_is_not_retried() -> None:
+    primary = StandIn(status=400)
+    backup = StandIn()
+    router = _router(_endpoint("primary", primary), _endpoint("backup", backup))
+
+    with pytest.raises(httpx.HTTPStatusError) as err:
+        await router.generate("hi", model="gpt-test")
+
+    assert err.value.response.status_code == 400
+    assert backup.models == []
+    assert router.endpoints[0].health.failures == 0
+    assert not is_endpoint_failure(err.value)
+    assert is_endpoint_failure(ProviderHTTPError("rate limited", 429))
+
+
+async def test_circuit_opens_then_lets_one_trial_through() -> None:
+    primary = StandIn(status=502)
+    backup = StandIn(["backup"])
+    health = EndpointHealth(failure_threshold=2, cooldown=0.05)
+    router = _router(_endpoint("primary", primary, health=health), _endpoint("backup", backup))
+
+    for _ in range(3):
+        assert (await router.generate("hi", model="gpt-test")).text == "backup"
+
+    assert len(primary.models) == 2  # third request skipped the open circuit
+    assert health.state == "open"
+
+    await asyncio.sleep(0.06)
+    assert health.state == "half-open"
+    assert health.begin() is True
+    assert not health.available()  # only one trial at a time
+    health.abandon(True)
+
+    # Backup now down: the trial on the recovered primary closes its circuit
+    primary.status, backup.status = 200, 503
+    primary.deltas = ["primary"]
+    assert await _text(router) == "primary"
+    assert health.state == "closed"
+
+
+async def test_stream_hedge_keeps_first_to_start_and_cancels_loser() -> None:
+    slow = StandIn(["slow"], delay=2.0)
+    fast = StandIn(["fa", "st"])
+    router = _router(_endpoint("slow", slow), _endpoint("fast", fast), hedge_after=0.05)
+
+    started = time.monotonic()
+    text = await _text(router)
+
+    assert text == "fast"
+    assert time.monotonic() - started < 1.0
+    assert slow.cancelled == 1
+    assert router.stats()["fast"]["ttft"] is not None
+    assert router.endpoints[0].health.failures == 0  # losing a race is not a failure
+
+
+async def test_generate_hedge_returns_first_answer() -> None:
+    slow = StandIn(["slow"], delay=2.0)
+    fast = StandIn(["fast"], delay=0.02)
+    router = _router(_endpoint("slow", slow), _endpoint("fast", fast), hedge_after=0.05)
+
+    started = time.monotonic()
+    result = await router.generate("hi", model="gpt-test")
+
+    assert result.text == "fast"
+    assert time.monotonic() - started < 1.0
+    assert slow.cancelled == 1
+
+    # A fast primary answers before the deadline, so no hedge is sent
+    slow.delay = 0.0
+    fast.models.clear()
+    assert (await router.generate("hi", model="gpt-test")).text == "slow"
+    assert fast.models == []
+
+
+async def test_stream_failure_after_first_token_is_raised_not_retried() -> None:
+    primary = StandIn(["Hel", "lo"], break_after=1)
+    backup = StandIn()
+    router = _router(_endpoint("primary", primary), _endpoint("backup", backup))
+    received = []
+
+    with pytest.raises(httpx.ReadError):
+        async for chunk in router.stream_chat([{"role": "user", "content": "hi"}], model="m"):
+            received.append(chunk["delta"])
+
+    assert received == ["Hel"]
+    assert backup.models == []
+    assert router.endpoints[0].health.failures == 1
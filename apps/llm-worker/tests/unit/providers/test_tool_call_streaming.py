@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import httpx
+import orjson
+
+from llm_worker.providers.openai import OpenAIProvider, ToolCallAssembler  # type: ignore[import]
+
+
+def _sse(*events: dict) -> bytes:
+    return b"".join(b"data: " + orjson.dumps(event) + b"\n\n" for event in events) + b"data: [DONE]\n\n"
+
+
+def _chat_fragment(index: int, *, call_id: str | None = None, name: str | None = None, args: str = "") -> dict:
+    fragment: dict = {"index": index, "function": {"arguments": args}}
+    if call_id:
+        fragment["id"] = call_id
+        fragment["type"] = "function"
+    if name:
+        fragment["function"]["name"] = name
+    return {"choices": [{"delta": {"tool_calls": [fragment]}}]}
+
+
+def test_chat_fragments_release_call_once_arguments_parse() -> None:
+    assembler = ToolCallAssembler()
+
+    assert assembler.add_chat_fragment({"index": 0, "id": "c1", "function": {"name": "weather", "arguments": ""}}) is None
+    assert assembler.add_chat_fragment({"index": 0, "function": {"arguments": '{"city": {"name": "Par'}}) is None
+    assert assembler.add_chat_fragment({"index": 0, "function": {"arguments": 'is"}'}}) is None  # still open
+    call = assembler.add_chat_fragment({"index": 0, "function": {"arguments": "}"}})
+
+    assert call == {
+        "id": "c1",
+        "type": "function",
+        "function": {"name": "weather", "arguments": '{"city": {"name": "Paris"}}'},
+    }
+    assert assembler.add_chat_fragment({"index": 0, "function": {"arguments": " "}}) is None
+    assert assembler.finish() == []
+
+
+def test_interleaved_calls_and_argumentless_call_on_finish() -> None:
+    assembler = ToolCallAssembler()
+    assembler.add_chat_fragment({"index": 0, "id": "a", "function": {"name": "time", "arguments": ""}})
+    assembler.add_chat_fragment({"index": 1, "id": "b", "function": {"name": "weather", "arguments": '{"ci'}})
+
+    ready = assembler.add_chat_fragment({"index": 1, "function": {"arguments": 'ty": "Oslo"}'}})
+
+    assert ready["id"] == "b"
+    assert [(c["id"], c["function"]["arguments"]) for c in assembler.finish()] == [("a", "{}")]
+
+
+def test_responses_events_assemble_by_item_id() -> None:
+    assembler = ToolCallAssembler()
+    added = {
+        "type": "response.output_item.added",
+        "item": {"type": "function_call", "id": "fc_1", "call_id": "call_1", "name": "weather", "arguments": ""},
+    }
+
+    assert assembler.add_responses_event(added) is None
+    assert assembler.add_responses_event(
+        {"type": "response.function_call_arguments.delta", "item_id": "fc_1", "delta": '{"city": '}
+    ) is None
+    call = assembler.add_responses_event(
+        {"type": "response.function_call_arguments.delta", "item_id": "fc_1", "delta": '"Rome"}'}
+    )
+
+    assert call["id"] == "call_1"
+    assert orjson.loads(call["function"]["arguments"]) == {"city": "Rome"}
+    assert assembler.add_responses_event({"type": "response.output_text.delta", "delta": "hi"}) is None
+
+
+async def test_chat_stream_yields_tool_call_between_text_deltas() -> None:
+    body = _sse(
+        {"choices": [{"delta": {"content": "Let me check. "}}]},
+        _chat_fragment(0, call_id="c1", name="weather", args='{"city"'),
+        _chat_fragment(0, args=': "Paris"}'),
+        {"choices": [{"delta": {}, "finish_reason": "tool_calls"}]},
+    )
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, content=body, headers={"content-type": "text/event-stream"})
+    )
+    provider = OpenAIProvider(
+        api_key="sk-test", base_url="http://llm.test/v1", responses_model_patterns=["none"], transport=transport
+    )
+
+    chunks = [chunk async for chunk in provider.stream_chat([{"role": "user", "content": "weather?"}], model="gpt-test")]
+
+    assert chunks[0] == {"delta": "Let me check. "}
+    assert chunks[1]["tool_call"]["function"] == {"name": "weather", "arguments": '{"city": "Paris"}'}
+    assert len(chunks) == 2
+    await provider.aclose()
@@ -0,0 +1,200 @@
+"""Tests for the persistent MCP session pool."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+
+import pytest
+
+from llm_worker.mcp_client import MCPToolClient
+from llm_worker.mcp_pool import MCPServerPool, MCPSessionPool
+
+
+class FakeSession:
+    def __init__(self, server: "FakeServer", number: int):
+        self.server = server
+        self.number = number
+        self.crashed = False
+
+    async def call_tool(self, name: str, arguments: dict):
+        self.server.running += 1
+        self.server.peak = max(self.server.peak, self.server.running)
+        try:
+            await asyncio.sleep(self.server.latency)
+            if self.crashed:
+                raise ConnectionError("server exited")
+            if name == "boom":
+                raise RuntimeError("protocol error")
+            return f"{name}@{self.number}"
+        finally:
+            self.server.running -= 1
+
+    async def send_ping(self):
+        if self.crashed:
+            raise ConnectionError("server exited")
+
+
+class FakeServer:
+    """Session factory counting process starts and shutdowns."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.sessions: list[FakeSession] = []
+        self.closed = 0
+        self.running = 0
+        self.peak = 0
+
+    @asynccontextmanager
+    async def connect(self):
+        session = FakeSession(self, len(self.sessions))
+        self.sessions.append(session)
+        try:
+            yield session
+        finally:
+            self.closed += 1
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_reused_across_calls():
+    server = FakeServer()
+    pool = MCPServerPool("character", server.connect)
+
+    results = [await pool.call_tool("get_trait", {}) for _ in range(5)]
+
+    assert results == ["get_trait@0"] * 5
+    assert pool.spawned == 1
+    await pool.close()
+    assert server.closed == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded_per_server():
+    server = FakeServer(latency=0.02)
+    pool = MCPServerPool("movement", server.connect, max_sessions=2)
+
+    await asyncio.gather(*(pool.call_tool("wave", {}) for _ in range(6)))
+
+    assert server.peak == 2
+    assert pool.spawned == 2
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_crashed_session_is_respawned_and_call_retried():
+    server = FakeServer()
+    pool = MCPServerPool("character", server.connect)
+    await pool.call_tool("get_trait", {})
+    server.sessions[0].crashed = True
+
+    assert await pool.call_tool("get_trait", {}) == "get_trait@1"
+    assert pool.size == 1 and server.closed == 1
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_protocol_error_keeps_healthy_session():
+    server = FakeServer()
+    pool = MCPServerPool("character", server.connect)
+
+    with pytest.raises(RuntimeError):
+        await pool.call_tool("boom", {})
+
+    assert await pool.call_tool("get_trait", {}) == "get_trait@0"
+    assert pool.spawned == 1
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_stale_session_failing_health_check_is_replaced():
+    server = FakeServer()
+    pool = MCPServerPool("character", server.connect, health_interval=0.0)
+    await pool.call_tool("get_trait", {})
+    server.sessions[0].crashed = True
+
+    assert await pool.call_tool("get_trait", {}) == "get_trait@1"
+    assert pool.spawned == 2
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_call_discards_its_session():
+    server = FakeServer(latency=5.0)
+    pool = MCPServerPool("character", server.connect)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(pool.call_tool("get_trait", {}), 0.05)
+
+    assert pool.size == 0 and server.closed == 1
+
+
+@pytest.mark.asyncio
+async def test_idle_sessions_are_reaped():
+    server = FakeServer()
+    pools = MCPSessionPool(idle_sec=0.0)
+    pool = pools.server("character", server.connect)
+    await pool.call_tool("get_trait", {})
+
+    assert await pool.reap_idle() == 1
+    assert pool.size == 0 and server.closed == 1
+    await pools.close()
+
+
+@pytest.mark.asyncio
+async def test_changed_spec_replaces_pool():
+    old, new = FakeServer(), FakeServer()
+    pools = MCPSessionPool(idle_sec=0.0)
+    first = pools.server("character", old.connect, spec=("python", ("-m", "v1")))
+    await first.call_tool("get_trait", {})
+
+    assert pools.server("character", old.connect, spec=("python", ("-m", "v1"))) is first
+    second = pools.server("character", new.connect, spec=("python", ("-m", "v2")))
+    assert second is not first
+    assert await second.call_tool("get_trait", {}) == "get_trait@0"
+
+    await pools.close()
+    assert old.closed == 1 and new.closed == 1
+
+
+@pytest.mark.asyncio
+async def test_discard_closes_named_pools():
+    character, movement = FakeServer(), FakeServer()
+    pools = MCPSessionPool(idle_sec=0.0)
+    await pools.server("character", character.connect).call_tool("get_trait", {})
+    await pools.server("movement", movement.connect).call_tool("step", {})
+
+    await pools.discard("character", "unknown")
+
+    assert list(pools.servers) == ["movement"]
+    assert character.closed == 1 and movement.closed == 0
+    await pools.close()
+
+
+def _registry(*tools: tuple[str, str]) -> dict:
+    return {
+        "tools": [
+            {"type": "function", "function": {"name": name, "description": description}}
+            for name, description in tools
+        ]
+    }
+
+
+@pytest.mark.asyncio
+async def test_registry_reload_discards_changed_servers():
+    pools = MCPSessionPool()
+    pools.discard = AsyncMock()
+    client = MCPToolClient(pool=pools)
+    trait = ("mcp__tars-character__get_trait", "Read a trait")
+    step = ("mcp__tars-movement__step", "Take a step")
+
+    await client.initialize_from_registry(_registry(trait, step))
+    await client.initialize_from_registry(_registry(trait, step))
+    pools.discard.assert_not_awaited()
+
+    await client.initialize_from_registry(_registry(trait, (step[0], "Take one step")))
+    pools.discard.assert_awaited_once_with("tars-movement")
+
+    await client.initialize_from_registry(_registry((step[0], "Take one step")))
+    pools.discard.assert_awaited_with("tars-character")
+    assert list(client.tools) == [step[0]]
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from llm_worker.service import LLMService
+from tars.contracts.envelope import Envelope  # type: ignore[import]
 
 
 @pytest.fixture
@@ -158,3 +160,22 @@ def test_rag_handler_topic_configuration(mock_openai_provider):
 
         # RAGHandler should use the configured topic
         assert service.rag_handler.memory_query_topic == "custom/memory/query"
+
+
+@pytest.mark.asyncio
+async def test_fetch_character_awaits_correlated_result(mock_openai_provider):
+    """The startup character/get is a request(); its reply updates the character."""
+    with patch("llm_worker.service.OpenAIProvider", return_value=mock_openai_provider):
+        service = LLMService()
+    reply = Envelope.new(event_type="character.result", data={"name": "TARS", "traits": {}})
+    service.mqtt_client.request = AsyncMock(return_value=reply)
+
+    await service._fetch_character()
+
+    args, kwargs = service.mqtt_client.request.await_args
+    assert args[0] == "character/get"
+    assert kwargs["reply_topic"] == "character/result"
+    assert service.character_mgr.get_name() == "TARS"
+
+    service.mqtt_client.request = AsyncMock(side_effect=asyncio.TimeoutError)
+    await service._fetch_character()  # memory-worker not up yet: not an error
@@ -0,0 +1,61 @@
+"""Tests for the prompt-budgeting tokenizers."""
+
+from __future__ import annotations
+
+import base64
+
+from llm_worker.tokenizer import BPETokenizer, HeuristicTokenizer, load_tokenizer
+
+MERGES = [b"he", b"ll", b"hell", b"hello", b" w", b"or", b" wor", b" world", b"ld"]
+
+
+def _write_ranks(path, merges=MERGES) -> None:
+    tokens = [bytes([i]) for i in range(256)] + merges
+    path.write_bytes(
+        b"".join(base64.b64encode(token) + b" %d\n" % rank for rank, token in enumerate(tokens))
+    )
+
+
+def test_bpe_applies_merges_by_rank(tmp_path):
+    ranks_file = tmp_path / "toy.tiktoken"
+    _write_ranks(ranks_file)
+    tokenizer = BPETokenizer.from_file(ranks_file)
+
+    assert tokenizer.encode("hello world") == [259, 263]
+    assert tokenizer.count("hello world") == 2
+    # Unmerged bytes stay single tokens; multi-byte characters count per byte
+    assert tokenizer.count("hold") == 3  # h, o, ld
+    assert tokenizer.count("é") == 2
+
+
+def test_bpe_pretokenizes_like_cl100k(tmp_path):
+    ranks_file = tmp_path / "toy.tiktoken"
+    _write_ranks(ranks_file)
+    tokenizer = BPETokenizer.from_file(ranks_file)
+
+    pieces = tokenizer._pattern.findall("it's 12345 cats!\n\n  ok")
+    assert pieces == ["it", "'s", " ", "123", "45", " cats", "!\n\n", " ", " ok"]
+
+
+def test_counts_are_cached_per_text(tmp_path, monkeypatch):
+    ranks_file = tmp_path / "toy.tiktoken"
+    _write_ranks(ranks_file)
+    tokenizer = BPETokenizer.from_file(ranks_file)
+    calls = []
+    merge = tokenizer._merge
+    monkeypatch.setattr(tokenizer, "_merge", lambda data: calls.append(data) or merge(data))
+
+    assert tokenizer.count("hello world hello") == tokenizer.count("hello world hello")
+    assert calls == [b"hello", b" world", b" hello"]
+
+
+def test_load_falls_back_to_heuristic(tmp_path):
+    assert isinstance(load_tokenizer(""), HeuristicTokenizer)
+    assert isinstance(load_tokenizer(str(tmp_path / "missing.tiktoken")), HeuristicTokenizer)
+    bad = tmp_path / "bad.tiktoken"
+    bad.write_text("not a ranks file\n")
+    assert isinstance(load_tokenizer(str(bad)), HeuristicTokenizer)
+
+    heuristic = HeuristicTokenizer()
+    assert heuristic.count("one two three four five six seven eight nine ten") == 13
+    assert heuristic.reserve > 0
@@ -13,7 +13,7 @@ import orjson as json
 from pydantic import ValidationError
 from sentence_transformers import SentenceTransformer
 
-from tars.adapters.mqtt_client import MQTTClient
+from tars.adapters.mqtt_client import MQTTClient, replica_client_id
 from .config import (
     CHARACTER_DIR,
     CHARACTER_NAME,
@@ -21,6 +21,7 @@ from .config import (
     LOG_LEVEL,
     MEMORY_DIR,
     MEMORY_FILE,
+    MEMORY_SHARE_GROUP,
     MQTT_URL,
     RAG_STRATEGY,
     TOPIC_CHAR_CURRENT,
@@ -148,7 +149,7 @@ class MemoryService:
         self.character = self._load_character()
         self.mqtt_client = MQTTClient(
             MQTT_URL,
-            client_id="tars-memory",
+            client_id=replica_client_id("tars-memory") if MEMORY_SHARE_GROUP else "tars-memory",
             source_name=SOURCE_NAME,
             enable_health=True,
             enable_heartbeat=True,
@@ -226,8 +227,11 @@ class MemoryService:
                 await self._publish_character_current_initial()
 
                 # Subscribe to all topics with individual handlers
-                await self.mqtt_client.subscribe(TOPIC_QUERY, self._handle_query_message)
-                await self.mqtt_client.subscribe(TOPIC_CHAR_GET, self._handle_char_get_message)
+                share_group = MEMORY_SHARE_GROUP or None
+                await self.mqtt_client.subscribe(TOPIC_QUERY, self._handle_query_message, share_group=share_group)
+                await self.mqtt_client.subscribe(
+                    TOPIC_CHAR_GET, self._handle_char_get_message, share_group=share_group
+                )
                 await self.mqtt_client.subscribe(TOPIC_CHAR_UPDATE, self._handle_char_update_message)
                 await self.mqtt_client.subscribe(TOPIC_STT_FINAL, self._handle_ingest_message)
                 await self.mqtt_client.subscribe(TOPIC_TTS_SAY, self._handle_ingest_message)
@@ -5,7 +5,7 @@ import os
 from typing import Iterable
 
 from tars.adapters.mqtt_client import MQTTClient  # type: ignore[import]
-from tars.adapters.mqtt_asyncio import AsyncioMQTTPublisher, AsyncioMQTTSubscriber  # type: ignore[import]
+from tars.adapters.mqtt_asyncio import AsyncioMQTTSubscriber  # type: ignore[import]
 from tars.contracts.envelope import Envelope  # type: ignore[import]
 from tars.contracts.v1 import (  # type: ignore[import]
     FinalTranscript,
@@ -14,6 +14,7 @@ from tars.contracts.v1 import (  # type: ignore[import]
     LLMResponse,
     LLMStreamDelta,
     MovementStatusUpdate,
+    PartialTranscript,
     TtsStatus,
     WakeEvent,
 )
@@ -22,7 +23,8 @@ from tars.runtime.ctx import Ctx  # type: ignore[import]
 from tars.runtime.dispatcher import Dispatcher  # type: ignore[import]
 from tars.runtime.logging import configure_logging  # type: ignore[import]
 from tars.runtime.registry import register_topics  # type: ignore[import]
-from tars.runtime.subscription import Sub  # type: ignore[import]
+from tars.runtime.subscription import PRIORITY_BULK, PRIORITY_CONTROL, Sub  # type: ignore[import]
+from tars.runtime.tracing import Tracer  # type: ignore[import]
 
 
 def _build_subscriptions(settings: RouterSettings, policy: RouterPolicy) -> Iterable[Sub]:
@@ -32,6 +34,9 @@ def _build_subscriptions(settings: RouterSettings, policy: RouterPolicy) -> Iter
     async def handle_stt(event: FinalTranscript, ctx: Ctx) -> None:
         await policy.handle_stt_final(event, ctx)
 
+    async def handle_stt_partial(event: PartialTranscript, ctx: Ctx) -> None:
+        await policy.handle_stt_partial(event, ctx)
+
     async def handle_llm_response(event: LLMResponse, ctx: Ctx) -> None:
         await policy.handle_llm_response(event, ctx)
 
@@ -50,27 +55,38 @@ def _build_subscriptions(settings: RouterSettings, policy: RouterPolicy) -> Iter
     async def handle_movement_status(event: MovementStatusUpdate, ctx: Ctx) -> None:
         await policy.handle_movement_status(event, ctx)
 
-    return (
+    subs = [
         Sub(
             settings.topic_health_tts,
             HealthPing,
             lambda evt, ctx: handle_health("tts", evt, ctx),
             qos=1,
+            priority=PRIORITY_BULK,
         ),
         Sub(
             settings.topic_health_stt,
             HealthPing,
             lambda evt, ctx: handle_health("stt", evt, ctx),
             qos=1,
+            priority=PRIORITY_BULK,
         ),
         Sub(settings.topic_stt_final, FinalTranscript, handle_stt, qos=1),
         Sub(settings.topic_llm_resp, LLMResponse, handle_llm_response, qos=1),
         Sub(settings.topic_llm_stream, LLMStreamDelta, handle_llm_stream, qos=1),
-        Sub(settings.topic_llm_cancel, LLMCancel, handle_llm_cancel, qos=1),
-        Sub(settings.topic_wake_event, WakeEvent, handle_wake, qos=1),
+        Sub(settings.topic_llm_cancel, LLMCancel, handle_llm_cancel, qos=1, priority=PRIORITY_CONTROL),
+        Sub(settings.topic_wake_event, WakeEvent, handle_wake, qos=1, priority=PRIORITY_CONTROL),
         Sub(settings.topic_tts_status, TtsStatus, handle_tts_status, qos=1),
-        Sub(settings.topic_movement_status, MovementStatusUpdate, handle_movement_status, qos=0),
-    )
+        Sub(
+            settings.topic_movement_status,
+            MovementStatusUpdate,
+            handle_movement_status,
+            qos=0,
+            priority=PRIORITY_BULK,
+        ),
+    ]
+    if settings.speculate_enabled:
+        subs.append(Sub(settings.topic_stt_partial, PartialTranscript, handle_stt_partial, qos=0))
+    return subs
 
 
 async def run_router() -> None:
@@ -81,6 +97,7 @@ async def run_router() -> None:
 
     metrics = RouterMetrics()
     policy = RouterPolicy(settings, metrics=metrics)
+    tracer = Tracer("router")
     logger.info(
         "router.topics",
         extra={
@@ -93,53 +110,64 @@ async def run_router() -> None:
     )
     backoff = 1.0
 
-    while True:
-        logger.info("router.mqtt.connect", extra={"mqtt_url": settings.mqtt_url})
-        try:
-            mqtt_client = MQTTClient(settings.mqtt_url, "tars-router", enable_health=True)
-            await mqtt_client.connect()
-            
-            if not mqtt_client.client:
-                raise RuntimeError("MQTT client unavailable after connect")
-                
-            logger.info("router.mqtt.connected")
-            publisher = AsyncioMQTTPublisher(mqtt_client.client)
-            subscriber = AsyncioMQTTSubscriber(mqtt_client.client)
-            subs = _build_subscriptions(settings, policy)
-
-            def ctx_factory(_envelope: Envelope) -> Ctx:
-                return Ctx(pub=publisher, policy=policy, logger=logger, metrics=metrics)
-
-            dispatcher = Dispatcher(
-                subscriber,
-                subs,
-                ctx_factory,
-                logger=logger,
-                queue_maxsize=settings.stream_settings.queue_maxsize,
-                overflow_strategy=settings.stream_settings.queue_overflow,
-                handler_timeout=settings.stream_settings.handler_timeout_sec,
-            )
-            ctx = Ctx(pub=publisher, policy=policy, logger=logger, metrics=metrics)
-            await ctx.publish(
-                "system.health.router", HealthPing(ok=True, event="ready"), qos=1, retain=True
-            )
-            backoff = 1.0
-            try:
-                await dispatcher.run()
-            finally:
-                await dispatcher.stop()
-                await mqtt_client.shutdown()
-        except Exception as exc:  
-            logger.warning(
-                "router.mqtt.disconnected", extra={"error": str(exc), "backoff": backoff}
-            )
-            await asyncio.sleep(backoff)
-            backoff = min(backoff * 2.0, 8.0)
-        except Exception as exc:  # pragma: no cover - safety net
-            logger.error("router.run.error", exc_info=exc)
-            await asyncio.sleep(backoff)
-            backoff = min(backoff * 2.0, 8.0)
+    # One client for the whole process: its outbox holds QoS>=1 publishes
+    # made while the broker is away and replays them on the next connect
+    mqtt_client = MQTTClient(
+        settings.mqtt_url,
+        "tars-router",
+        enable_health=True,
+        tracer=tracer,
+        outbox_max_entries=int(os.getenv("MQTT_OUTBOX_MAX_ENTRIES", "256")),
+    )
 
+    def ctx_factory(_envelope: Envelope) -> Ctx:
+        return Ctx(pub=mqtt_client, policy=policy, logger=logger, metrics=metrics)
+
+    try:
+        while True:
+            logger.info("router.mqtt.connect", extra={"mqtt_url": settings.mqtt_url})
+            try:
+                await mqtt_client.connect()
+
+                if not mqtt_client.client:
+                    raise RuntimeError("MQTT client unavailable after connect")
+
+                logger.info("router.mqtt.connected")
+                subscriber = AsyncioMQTTSubscriber(mqtt_client.client)
+                subs = _build_subscriptions(settings, policy)
+
+                dispatcher = Dispatcher(
+                    subscriber,
+                    subs,
+                    ctx_factory,
+                    logger=logger,
+                    queue_maxsize=settings.stream_settings.queue_maxsize,
+                    overflow_strategy=settings.stream_settings.queue_overflow,
+                    handler_timeout=settings.stream_settings.handler_timeout_sec,
+                    worker_count=settings.stream_settings.worker_count,
+                    starvation_limit=settings.stream_settings.starvation_limit,
+                    metrics=mqtt_client.metrics,
+                    tracer=tracer,
+                )
+                ctx = Ctx(pub=mqtt_client, policy=policy, logger=logger, metrics=metrics)
+                await ctx.publish(
+                    "system.health.router", HealthPing(ok=True, event="ready"), qos=1, retain=True
+                )
+                backoff = 1.0
+                try:
+                    await dispatcher.run()
+                finally:
+                    await dispatcher.stop()
+                    await mqtt_client.disconnect()
+            except Exception as exc:
+                logger.warning(
+                    "router.mqtt.disconnected", extra={"error": str(exc), "backoff": backoff}
+                )
+                await mqtt_client.disconnect()
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2.0, 8.0)
+    finally:
+        await mqtt_client.shutdown()
 
 def main() -> None:
     asyncio.run(run_router())
@@ -0,0 +1,153 @@
+"""wake/event -> router -> tts/say through the in-process loopback broker.
+
+Runs the real router subscriptions, policy and Dispatcher against
+LoopbackBroker clients, so the whole path (including broker hops with seeded
+latency) can be exercised and timed without Mosquitto.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+from contextlib import suppress
+from typing import Any
+
+import orjson
+import pytest
+
+from router.__main__ import _build_subscriptions  # type: ignore[import]
+from tars.adapters.mqtt_asyncio import AsyncioMQTTPublisher, AsyncioMQTTSubscriber  # type: ignore[import]
+from tars.adapters.mqtt_client import MQTTClient  # type: ignore[import]
+from tars.adapters.mqtt_loopback import LoopbackBroker  # type: ignore[import]
+from tars.contracts.v1 import WakeEvent  # type: ignore[import]
+from tars.domain.router import RouterMetrics, RouterPolicy, RouterSettings  # type: ignore[import]
+from tars.loadgen import LLMStandIn, LoadGenerator, TTSStandIn, TurnProfile  # type: ignore[import]
+from tars.runtime.ctx import Ctx  # type: ignore[import]
+from tars.runtime.dispatcher import Dispatcher  # type: ignore[import]
+from tars.runtime.registry import register_topics  # type: ignore[import]
+
+
+class _QuietLogger:
+    def debug(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+    info = warning = error = debug
+
+
+async def _wake_to_say_latencies(broker: LoopbackBroker, wakes: int) -> list[float]:
+    settings = RouterSettings(wake_ack_choices_raw="Yes?")
+    register_topics(settings.as_topic_map())
+    policy = RouterPolicy(settings, metrics=RouterMetrics())
+    logger = _QuietLogger()
+    loop = asyncio.get_running_loop()
+
+    router_client = broker.client(client_id="router")
+    await router_client.connect()
+    publisher = AsyncioMQTTPublisher(router_client)
+    dispatcher = Dispatcher(
+        AsyncioMQTTSubscriber(router_client),
+        _build_subscriptions(settings, policy),
+        lambda _env: Ctx(pub=publisher, policy=policy, logger=logger),
+        logger=logger,
+    )
+    router_task = asyncio.create_task(dispatcher.run())
+
+    sent_at: dict[str, float] = {}
+    latencies: list[float] = []
+    done = asyncio.Event()
+
+    async def on_say(payload: bytes) -> None:
+        envelope = orjson.loads(payload)
+        started = sent_at.pop(envelope["id"], None)
+        if started is not None:
+            latencies.append(loop.time() - started)
+        if len(latencies) == wakes:
+            done.set()
+
+    async with MQTTClient("mqtt://loopback", "tts", client_factory=broker.client) as tts, MQTTClient(
+        "mqtt://loopback", "wake", client_factory=broker.client
+    ) as wake:
+        await tts.subscribe(settings.topic_tts_say, on_say, qos=1)
+        await asyncio.sleep(0.01)  # let the router pumps subscribe
+
+        for _ in range(wakes):
+            event = WakeEvent(type="wake")
+            sent_at[event.message_id] = loop.time()
+            await wake.publish_event(
+                settings.topic_wake_event,
+                "wake.event",
+                event,
+                correlation_id=event.message_id,
+                qos=1,
+            )
+            await asyncio.sleep(0.002)
+
+        await asyncio.wait_for(done.wait(), 2.0)
+
+    router_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await router_task
+    await router_client.disconnect()
+    return latencies
+
+
+@pytest.mark.asyncio
+async def test_wake_produces_tts_say_through_loopback() -> None:
+    broker = LoopbackBroker()
+
+    latencies = await _wake_to_say_latencies(broker, wakes=5)
+
+    assert len(latencies) == 5
+    assert broker.stats.lost == 0
+
+
+@pytest.mark.asyncio
+async def test_wake_to_say_latency_reflects_injected_broker_latency() -> None:
+    hop = 0.003
+    broker = LoopbackBroker(latency=hop, jitter=0.001, seed=42)
+
+    latencies = await _wake_to_say_latencies(broker, wakes=10)
+
+    # Two broker hops: wake -> router, router -> tts.
+    assert len(latencies) == 10
+    assert min(latencies) >= 2 * hop
+    assert statistics.median(latencies) < 2 * hop + 0.05
+
+
+@pytest.mark.asyncio
+async def test_loadgen_against_live_mode_router() -> None:
+    broker = LoopbackBroker(latency=0.001, seed=9)
+    settings = RouterSettings(wake_ack_choices_raw="Yes?", live_mode_default=True)
+    register_topics(settings.as_topic_map())
+    policy = RouterPolicy(settings, metrics=RouterMetrics())
+    logger = _QuietLogger()
+    router_client = broker.client(client_id="router")
+    await router_client.connect()
+    publisher = AsyncioMQTTPublisher(router_client)
+    dispatcher = Dispatcher(
+        AsyncioMQTTSubscriber(router_client),
+        _build_subscriptions(settings, policy),
+        lambda _env: Ctx(pub=publisher, policy=policy, logger=logger),
+        logger=logger,
+    )
+    router_task = asyncio.create_task(dispatcher.run())
+    await asyncio.sleep(0.01)
+
+    generator = LoadGenerator(
+        "mqtt://loopback",
+        profile=TurnProfile(turns=8, concurrency=4, speech_delay=0.005, partials=3, partial_rate=500.0),
+        llm=LLMStandIn(first_token=0.005, token_rate=2000.0),
+        tts=TTSStandIn(start_delay=0.001, chars_per_sec=100000.0),
+        client_factory=broker.client,
+    )
+    report = (await generator.run()).to_dict()
+
+    router_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await router_task
+    await router_client.disconnect()
+
+    assert report["wake_to_first_tts_say"]["count"] == 8
+    assert report["stt_final_to_llm_request"]["count"] == 8
+    assert report["published"]["llm/stream"] > 0
+    assert report["published"]["tts/status"] > 0
@@ -132,3 +132,23 @@ async def test_streaming_speaks_residual_text(
     ]
     assert rid not in policy.llm_stream_segments
     assert rid not in policy.llm_stream_completed
+
+
+@pytest.mark.asyncio
+async def test_streaming_keeps_abbreviations_and_decimals_together(
+    streaming_policy: Tuple[RouterPolicy, RouterSettings],
+) -> None:
+    policy, settings = streaming_policy
+    ctx, publisher = _make_ctx(policy)
+    rid = "rt-stream-segmenter"
+
+    for delta in ["Dr", ". Lee says it is 3", ".5 degrees", ". Stay", " warm."]:
+        await policy.handle_llm_stream(LLMStreamDelta(id=rid, delta=delta, done=False), ctx)
+    await policy.handle_llm_stream(LLMStreamDelta(id=rid, delta="", done=True), ctx)
+
+    tts_messages = [msg for topic, msg in publisher.decoded() if topic == settings.topic_tts_say]
+    assert [m.text for m in tts_messages if isinstance(m, TtsSay)] == [
+        "Dr. Lee says it is 3.5 degrees.",
+        "Stay warm.",
+    ]
+    assert rid not in policy.llm_segmenters
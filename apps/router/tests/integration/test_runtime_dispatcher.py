@@ -84,9 +84,9 @@ async def test_dispatcher_drop_new_overflow_keeps_existing_message() -> None:
     await dispatcher._enqueue(sub, env_first, payload_first)
     await dispatcher._enqueue(sub, env_second, payload_second)
 
-    assert dispatcher._queue.qsize() == 1
-    queued_sub, queued_env, queued_payload = dispatcher._queue.get_nowait()
-    dispatcher._queue.task_done()
+    assert dispatcher._lanes["normal"].qsize() == 1
+    queued_sub, queued_env, queued_payload, _received_at = dispatcher._lanes["normal"].get_nowait()
+    dispatcher._lanes["normal"].task_done()
     assert queued_env.id == env_first.id
     assert queued_payload.text == "first"
     assert queued_sub is sub
@@ -102,9 +102,9 @@ async def test_dispatcher_drop_oldest_overflow_replaces_entry() -> None:
     await dispatcher._enqueue(sub, env_first, SampleEvent(text="old"))
     await dispatcher._enqueue(sub, env_second, SampleEvent(text="new"))
 
-    assert dispatcher._queue.qsize() == 1
-    queued_sub, queued_env, queued_payload = dispatcher._queue.get_nowait()
-    dispatcher._queue.task_done()
+    assert dispatcher._lanes["normal"].qsize() == 1
+    queued_sub, queued_env, queued_payload, _received_at = dispatcher._lanes["normal"].get_nowait()
+    dispatcher._lanes["normal"].task_done()
     assert queued_env.id == env_second.id
     assert queued_payload.text == "new"
     assert queued_sub is sub
@@ -121,17 +121,17 @@ async def test_dispatcher_block_strategy_waits_for_capacity() -> None:
 
     async def free_space() -> None:
         await asyncio.sleep(0.02)
-        queued = dispatcher._queue.get_nowait()
-        dispatcher._queue.task_done()
+        queued = dispatcher._lanes["normal"].get_nowait()
+        dispatcher._lanes["normal"].task_done()
         return queued
 
     free_task = asyncio.create_task(free_space())
     await dispatcher._enqueue(sub, env_second, SampleEvent(text="after"))
     await free_task
 
-    assert dispatcher._queue.qsize() == 1
-    queued_sub, queued_env, queued_payload = dispatcher._queue.get_nowait()
-    dispatcher._queue.task_done()
+    assert dispatcher._lanes["normal"].qsize() == 1
+    queued_sub, queued_env, queued_payload, _received_at = dispatcher._lanes["normal"].get_nowait()
+    dispatcher._lanes["normal"].task_done()
     assert queued_env.id == env_second.id
     assert queued_payload.text == "after"
     assert queued_sub is sub
@@ -151,9 +151,9 @@ async def test_dispatcher_block_strategy_honors_timeout() -> None:
     elapsed = asyncio.get_event_loop().time() - start
 
     assert elapsed >= 0.05
-    assert dispatcher._queue.qsize() == 1
-    queued_sub, queued_env, queued_payload = dispatcher._queue.get_nowait()
-    dispatcher._queue.task_done()
+    assert dispatcher._lanes["normal"].qsize() == 1
+    queued_sub, queued_env, queued_payload, _received_at = dispatcher._lanes["normal"].get_nowait()
+    dispatcher._lanes["normal"].task_done()
     assert queued_env.id == env_first.id
     assert queued_payload.text == "stay"
     assert queued_sub is sub
@@ -177,3 +177,129 @@ async def test_dispatcher_handler_timeout_logs_error() -> None:
 
     envelope = _sample_envelope("slow")
     await dispatcher._deliver(new_sub, envelope, SampleEvent(text="slow"))
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_records_topic_metrics() -> None:
+    dispatcher, sub, _logger = _make_dispatcher(overflow_strategy="drop_new")
+
+    await dispatcher._enqueue(sub, _sample_envelope("kept"), SampleEvent(text="kept"))
+    await dispatcher._enqueue(sub, _sample_envelope("dropped"), SampleEvent(text="dropped"))
+    snapshot = dispatcher.metrics.snapshot()
+    assert snapshot["gauges"]["dispatcher.queue_depth"] == 1.0
+
+    queued_sub, queued_env, queued_payload, received_at = dispatcher._lanes["normal"].get_nowait()
+    dispatcher._lanes["normal"].task_done()
+    await dispatcher._deliver(queued_sub, queued_env, queued_payload, received_at)
+
+    stats = dispatcher.metrics.snapshot()["topics"]["tests/topic"]
+    assert stats["dropped"] == 1
+    assert stats["handled"] == 1
+    assert stats["errors"] == 0
+    assert stats["queue_wait"]["count"] == 1
+    assert stats["handler_duration"]["count"] == 1
+
+
+class KeyedEvent(BaseModel):
+    text: str
+    utt_id: str | None = None
+
+
+def _lane_dispatcher(subs: tuple[Sub, ...], **kwargs: Any) -> Dispatcher:
+    return Dispatcher(
+        DummySubscriber(),
+        subs,
+        lambda envelope: {"envelope_id": envelope.id},
+        logger=CaptureLogger(),
+        queue_maxsize=16,
+        handler_timeout=1.0,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_control_lane_overtakes_bulk() -> None:
+    handled: list[str] = []
+
+    async def handler(event: SampleEvent, ctx: Any) -> None:
+        handled.append(event.text)
+
+    bulk = Sub("tests/bulk", SampleEvent, handler, priority="bulk")
+    control = Sub("tests/control", SampleEvent, handler, priority="control")
+    dispatcher = _lane_dispatcher((bulk, control))
+
+    for n in range(3):
+        await dispatcher._enqueue(bulk, _sample_envelope(f"b{n}"), SampleEvent(text=f"b{n}"))
+    await dispatcher._enqueue(control, _sample_envelope("wake"), SampleEvent(text="wake"))
+    gauges = dispatcher.metrics.snapshot()["gauges"]
+    assert gauges["dispatcher.lane.bulk.depth"] == 3.0
+    assert gauges["dispatcher.lane.control.depth"] == 1.0
+    assert gauges["dispatcher.queue_depth"] == 4.0
+
+    worker = asyncio.create_task(dispatcher._dispatch_loop())
+    await asyncio.sleep(0.01)
+    worker.cancel()
+
+    assert handled == ["wake", "b0", "b1", "b2"]
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_starvation_guard_serves_lower_lane() -> None:
+    handled: list[str] = []
+
+    async def handler(event: SampleEvent, ctx: Any) -> None:
+        handled.append(event.text)
+
+    normal = Sub("tests/normal", SampleEvent, handler)
+    bulk = Sub("tests/bulk", SampleEvent, handler, priority="bulk")
+    dispatcher = _lane_dispatcher((normal, bulk), starvation_limit=2)
+
+    await dispatcher._enqueue(bulk, _sample_envelope("bulk"), SampleEvent(text="bulk"))
+    for n in range(4):
+        await dispatcher._enqueue(normal, _sample_envelope(f"n{n}"), SampleEvent(text=f"n{n}"))
+
+    worker = asyncio.create_task(dispatcher._dispatch_loop())
+    await asyncio.sleep(0.01)
+    worker.cancel()
+
+    assert handled == ["n0", "n1", "bulk", "n2", "n3"]
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_serializes_per_key_across_workers() -> None:
+    handled: list[str] = []
+    active: set[str] = set()
+    overlap: list[str] = []
+
+    async def handler(event: KeyedEvent, ctx: Any) -> None:
+        if event.utt_id in active:
+            overlap.append(event.text)
+        active.add(event.utt_id or "")
+        await asyncio.sleep(0.005 if event.text.endswith("0") else 0)
+        active.discard(event.utt_id or "")
+        handled.append(event.text)
+
+    sub = Sub("tests/keyed", KeyedEvent, handler)
+    dispatcher = _lane_dispatcher((sub,), worker_count=3)
+
+    for text, utt in [("a0", "a"), ("a1", "a"), ("b0", "b"), ("a2", "a"), ("b1", "b")]:
+        await dispatcher._enqueue(sub, _sample_envelope(text), KeyedEvent(text=text, utt_id=utt))
+
+    workers = [asyncio.create_task(dispatcher._dispatch_loop()) for _ in range(3)]
+    await asyncio.sleep(0.05)
+    for worker in workers:
+        worker.cancel()
+
+    assert overlap == []
+    assert [t for t in handled if t.startswith("a")] == ["a0", "a1", "a2"]
+    assert [t for t in handled if t.startswith("b")] == ["b0", "b1"]
+    assert dispatcher.queue_depth() == 0
+    assert dispatcher._active_keys == set()
+
+
+def test_sub_rejects_unknown_priority() -> None:
+    async def handler(event: SampleEvent, ctx: Any) -> None:
+        return None
+
+    with pytest.raises(ValueError):
+        Sub("tests/topic", SampleEvent, handler, priority="urgent")
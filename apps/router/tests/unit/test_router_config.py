@@ -23,6 +23,7 @@ def test_router_settings_from_env_overrides() -> None:
         "STREAM_MIN_CHARS": "120",
         "ROUTER_STREAM_MAX_CHARS": "400",
         "ROUTER_STREAM_BOUNDARY_ONLY": "0",
+        "ROUTER_HISTORY_TOKEN_BUDGET": "800",
     }
     settings = RouterSettings.from_env(env=env)
 
@@ -31,6 +32,7 @@ def test_router_settings_from_env_overrides() -> None:
     assert settings.stream_min_chars == 120
     assert settings.stream_max_chars == 400
     assert settings.stream_boundary_only is False
+    assert settings.history_token_budget == 800
 
 
 def test_router_settings_uses_aliases_for_wake_phrases() -> None:
@@ -44,3 +44,17 @@ def test_router_metrics_abandon(monkeypatch: pytest.MonkeyPatch) -> None:
     assert snapshot["llm_responses"] == 0
     assert snapshot["llm_inflight"] == 0
     assert snapshot["avg_llm_latency"] == 0.0
+
+
+def test_router_metrics_speculation() -> None:
+    metrics = RouterMetrics()
+
+    metrics.record_speculation(hit=True, saved=0.4)
+    metrics.record_speculation(hit=True, saved=0.2)
+    metrics.record_speculation(hit=False)
+
+    snapshot = metrics.snapshot()
+
+    assert snapshot["speculations"] == 3
+    assert pytest.approx(snapshot["speculation_hit_rate"], rel=1e-3) == 2 / 3
+    assert pytest.approx(snapshot["avg_speculation_saved"], rel=1e-3) == 0.3
@@ -0,0 +1,131 @@
+import logging
+import time
+from typing import Tuple
+
+import pytest
+
+from tars.contracts.envelope import Envelope  # type: ignore[import]
+from tars.contracts.registry import register  # type: ignore[import]
+from tars.contracts.v1 import (  # type: ignore[import]
+    EVENT_TYPE_LLM_REQUEST,
+    EVENT_TYPE_SAY,
+    FinalTranscript,
+    LLMRequest,
+    LLMResponse,
+    LLMStreamDelta,
+    TtsSay,
+    TtsStatus,
+    WakeEvent,
+)
+from tars.domain.ports import Publisher  # type: ignore[import]
+from tars.domain.router import RouterPolicy, RouterSettings  # type: ignore[import]
+from tars.runtime.ctx import Ctx  # type: ignore[import]
+
+_EVENT_MODELS = {EVENT_TYPE_SAY: TtsSay, EVENT_TYPE_LLM_REQUEST: LLMRequest}
+
+
+class RecordingPublisher(Publisher):
+    def __init__(self) -> None:
+        self.events: list[Tuple[str, object]] = []
+
+    async def publish(self, topic: str, payload: bytes, qos: int = 0, retain: bool = False) -> None:
+        envelope = Envelope.model_validate_json(payload)
+        model_cls = _EVENT_MODELS.get(envelope.type)
+        self.events.append((envelope.type, model_cls.model_validate(envelope.data) if model_cls else envelope.data))
+
+    def of(self, event_type: str) -> list[object]:
+        return [data for kind, data in self.events if kind == event_type]
+
+
+def _policy(**overrides: object) -> Tuple[RouterPolicy, Ctx, RecordingPublisher]:
+    settings = RouterSettings(wake_ack_choices_raw="Yes?", wake_reprompt_text="", **overrides)
+    for event_type, topic in settings.as_topic_map().items():
+        register(event_type, topic)
+    policy = RouterPolicy(settings)
+    publisher = RecordingPublisher()
+    return policy, Ctx(pub=publisher, policy=policy, logger=logging.getLogger("router-test")), publisher
+
+
+@pytest.mark.asyncio
+async def test_wake_window_is_per_source() -> None:
+    policy, ctx, publisher = _policy()
+
+    await policy.handle_wake_event(WakeEvent(type="wake", source="kitchen"), ctx)
+    await policy.handle_stt_final(FinalTranscript(text="what is the weather", source="office"), ctx)
+    await policy.handle_stt_final(FinalTranscript(text="what is the weather", utt_id="k1", source="kitchen"), ctx)
+
+    requests = publisher.of(EVENT_TYPE_LLM_REQUEST)
+    assert [(req.id, req.source) for req in requests] == [("k1", "kitchen")]
+    assert publisher.of(EVENT_TYPE_SAY)[0].source == "kitchen"  # wake ack
+    assert not policy.wake_session_active  # the default session never woke
+
+
+@pytest.mark.asyncio
+async def test_interleaved_sources_keep_history_and_streams_apart() -> None:
+    policy, ctx, publisher = _policy(live_mode_default=True)
+
+    await policy.handle_stt_final(FinalTranscript(text="my name is Ada", utt_id="a1", source="a"), ctx)
+    await policy.handle_stt_final(FinalTranscript(text="my name is Bob", utt_id="b1", source="b"), ctx)
+    await policy.handle_llm_stream(LLMStreamDelta(id="a1", seq=1, delta="Hello Ada. "), ctx)
+    await policy.handle_llm_stream(LLMStreamDelta(id="b1", seq=1, delta="Hello Bob. "), ctx)
+    await policy.handle_llm_stream(LLMStreamDelta(id="b1", seq=2, delta="", done=True), ctx)
+    await policy.handle_llm_stream(LLMStreamDelta(id="a1", seq=2, delta="", done=True), ctx)
+    await policy.handle_llm_response(LLMResponse(id="a1", reply="Hello Ada."), ctx)
+    await policy.handle_llm_response(LLMResponse(id="b1", reply="Hello Bob."), ctx)
+    await policy.handle_stt_final(FinalTranscript(text="what is my name", utt_id="a2", source="a"), ctx)
+
+    says = {(say.source, say.text) for say in publisher.of(EVENT_TYPE_SAY)}
+    assert says == {("a", "Hello Ada."), ("b", "Hello Bob.")}
+    follow_up = publisher.of(EVENT_TYPE_LLM_REQUEST)[-1]
+    assert [m.content for m in follow_up.conversation_history] == ["my name is Ada", "Hello Ada."]
+    assert "Bob" not in (follow_up.conversation_summary or "")
+    assert len(policy.history) == 0  # default session untouched
+
+
+@pytest.mark.asyncio
+async def test_response_window_opens_for_the_speaking_source() -> None:
+    policy, ctx, publisher = _policy()
+
+    await policy.handle_wake_event(WakeEvent(type="wake", source="a"), ctx)
+    await policy.handle_stt_final(FinalTranscript(text="tell me a joke", utt_id="a1", source="a"), ctx)
+    await policy.handle_llm_response(LLMResponse(id="a1", reply="Knock knock."), ctx)
+    await policy.handle_tts_status(TtsStatus(event="speaking_end", text="Knock knock.", utt_id="a1"), ctx)
+    await policy.handle_stt_final(FinalTranscript(text="who is there", utt_id="a2", source="a"), ctx)
+    await policy.handle_stt_final(FinalTranscript(text="who is there", utt_id="b1", source="b"), ctx)
+
+    assert [req.id for req in publisher.of(EVENT_TYPE_LLM_REQUEST)] == ["a1", "a2"]
+
+
+@pytest.mark.asyncio
+async def test_replies_for_evicted_sessions_are_dropped() -> None:
+    policy, ctx, publisher = _policy(live_mode_default=True, max_sessions=1)
+
+    await policy.handle_stt_final(FinalTranscript(text="tell me a story", utt_id="a1", source="a"), ctx)
+    await policy.handle_stt_final(FinalTranscript(text="tell me a joke", utt_id="b1", source="b"), ctx)
+    await policy.handle_llm_response(LLMResponse(id="a1", reply="Once upon a time."), ctx)
+    await policy.handle_llm_response(LLMResponse(id="b1", reply="Knock knock."), ctx)
+
+    assert [say.text for say in publisher.of(EVENT_TYPE_SAY)] == ["Knock knock."]
+    assert len(policy.sessions) == 1
+
+
+@pytest.mark.asyncio
+async def test_per_message_cost_is_flat_in_session_count() -> None:
+    """Routing a turn costs the same with 10 or 1000 live sessions."""
+
+    async def per_turn(sources: int, turns: int = 2000) -> float:
+        policy, ctx, publisher = _policy(live_mode_default=True, max_sessions=sources)
+        for i in range(sources):
+            policy.sessions.get(f"dev{i}")
+        started = time.perf_counter()
+        for i in range(turns):
+            source, rid = f"dev{i % sources}", f"r{i}"
+            await policy.handle_stt_final(FinalTranscript(text="what is the weather", utt_id=rid, source=source), ctx)
+            await policy.handle_llm_response(LLMResponse(id=rid, reply="Sunny."), ctx)
+        assert len(publisher.of(EVENT_TYPE_SAY)) == turns
+        return (time.perf_counter() - started) / turns
+
+    small = min([await per_turn(10) for _ in range(2)])
+    large = min([await per_turn(1000) for _ in range(2)])
+
+    assert large < small * 3
@@ -0,0 +1,149 @@
+import logging
+from typing import Tuple
+
+import pytest
+
+from tars.contracts.envelope import Envelope  # type: ignore[import]
+from tars.contracts.registry import register  # type: ignore[import]
+from tars.contracts.v1 import (  # type: ignore[import]
+    EVENT_TYPE_LLM_CANCEL,
+    EVENT_TYPE_LLM_REQUEST,
+    EVENT_TYPE_SAY,
+    FinalTranscript,
+    LLMCancel,
+    LLMRequest,
+    LLMResponse,
+    LLMStreamDelta,
+    PartialTranscript,
+    TtsSay,
+)
+from tars.domain.ports import Publisher  # type: ignore[import]
+from tars.domain.router import RouterMetrics, RouterPolicy, RouterSettings  # type: ignore[import]
+from tars.domain.router.speculation import (  # type: ignore[import]
+    PartialTracker,
+    normalize_transcript,
+    transcript_similarity,
+)
+from tars.runtime.ctx import Ctx  # type: ignore[import]
+
+_EVENT_MODELS = {EVENT_TYPE_SAY: TtsSay, EVENT_TYPE_LLM_REQUEST: LLMRequest, EVENT_TYPE_LLM_CANCEL: LLMCancel}
+
+
+class RecordingPublisher(Publisher):
+    def __init__(self) -> None:
+        self.events: list[Tuple[str, object]] = []
+
+    async def publish(self, topic: str, payload: bytes, qos: int = 0, retain: bool = False) -> None:
+        envelope = Envelope.model_validate_json(payload)
+        model_cls = _EVENT_MODELS.get(envelope.type)
+        self.events.append((envelope.type, model_cls.model_validate(envelope.data) if model_cls else envelope.data))
+
+    def of(self, event_type: str) -> list[object]:
+        return [data for kind, data in self.events if kind == event_type]
+
+
+@pytest.fixture()
+def speculative() -> Tuple[RouterPolicy, Ctx, RecordingPublisher]:
+    settings = RouterSettings(speculate_enabled=True, live_mode_default=True)
+    for event_type, topic in settings.as_topic_map().items():
+        register(event_type, topic)
+    policy = RouterPolicy(settings, metrics=RouterMetrics())
+    publisher = RecordingPublisher()
+    return policy, Ctx(pub=publisher, policy=policy, logger=logging.getLogger("router-test")), publisher
+
+
+async def _partials(policy: RouterPolicy, ctx: Ctx, *texts: str) -> None:
+    for text in texts:
+        await policy.handle_stt_partial(PartialTranscript(text=text), ctx)
+
+
+def test_partial_tracker_needs_repeated_text() -> None:
+    tracker = PartialTracker(stable_updates=2, min_words=3)
+
+    assert tracker.observe("what is the") is None
+    assert tracker.observe("what is the weather") is None
+    assert tracker.observe("What is the weather?") == ("what", "is", "the", "weather")
+    assert tracker.observe("hi") is None
+    assert tracker.observe("hi") is None  # too short
+
+
+def test_transcript_similarity() -> None:
+    a = normalize_transcript("What's the weather like in Paris?")
+
+    assert transcript_similarity(a, normalize_transcript("whats the weather like in paris")) == 1.0
+    assert transcript_similarity(a, normalize_transcript("what's the weather like in Paris today")) > 0.9
+    assert transcript_similarity(a, normalize_transcript("play some music")) < 0.3
+    assert transcript_similarity(a, ()) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_speculation_hit_replays_held_stream(speculative) -> None:
+    policy, ctx, publisher = speculative
+
+    await _partials(policy, ctx, "tell me a", "tell me a joke", "tell me a joke.")
+    [request] = publisher.of(EVENT_TYPE_LLM_REQUEST)
+    assert request.id.startswith("spec-") and request.text == "tell me a joke."
+
+    await policy.handle_llm_stream(LLMStreamDelta(id=request.id, seq=1, delta="Why did the robot cross? "), ctx)
+    await policy.handle_llm_stream(LLMStreamDelta(id=request.id, seq=2, delta="To reboot.", done=True), ctx)
+    assert publisher.of(EVENT_TYPE_SAY) == []  # held until the final confirms
+
+    await policy.handle_stt_final(FinalTranscript(text="Tell me a joke."), ctx)
+
+    assert len(publisher.of(EVENT_TYPE_LLM_REQUEST)) == 1
+    assert publisher.of(EVENT_TYPE_LLM_CANCEL) == []
+    assert [say.text for say in publisher.of(EVENT_TYPE_SAY)] == ["Why did the robot cross?", "To reboot."]
+    assert policy.history.messages()[0].content == "Tell me a joke."
+    assert policy.metrics.speculation_hits == 1 and policy.metrics.speculation_saved_total > 0
+
+
+@pytest.mark.asyncio
+async def test_speculation_miss_cancels_and_requests_final(speculative) -> None:
+    policy, ctx, publisher = speculative
+
+    await _partials(policy, ctx, "turn on the", "turn on the")
+    [speculated] = publisher.of(EVENT_TYPE_LLM_REQUEST)
+
+    await policy.handle_stt_final(FinalTranscript(text="Turn on the kitchen lights and play jazz"), ctx)
+
+    [cancel] = publisher.of(EVENT_TYPE_LLM_CANCEL)
+    assert cancel.id == speculated.id
+    requests = publisher.of(EVENT_TYPE_LLM_REQUEST)
+    assert len(requests) == 2 and requests[1].text == "Turn on the kitchen lights and play jazz"
+
+    # Late output of the cancelled request is never spoken.
+    await policy.handle_llm_response(LLMResponse(id=speculated.id, reply="Lights on."), ctx)
+    assert publisher.of(EVENT_TYPE_SAY) == []
+    assert policy.metrics.speculations == 1 and policy.metrics.speculation_hits == 0
+
+
+@pytest.mark.asyncio
+async def test_local_routes_are_not_speculated(speculative) -> None:
+    policy, ctx, publisher = speculative
+
+    await _partials(policy, ctx, "wave your hand", "wave your hand")
+    assert publisher.of(EVENT_TYPE_LLM_REQUEST) == []
+
+
+@pytest.mark.asyncio
+async def test_final_routed_locally_cancels_speculation(speculative) -> None:
+    policy, ctx, publisher = speculative
+
+    await _partials(policy, ctx, "how are you", "how are you")
+    await policy.handle_stt_final(FinalTranscript(text="how are you wave"), ctx)
+
+    assert len(publisher.of(EVENT_TYPE_LLM_CANCEL)) == 1
+    assert len(publisher.of(EVENT_TYPE_LLM_REQUEST)) == 1
+
+
+@pytest.mark.asyncio
+async def test_partials_ignored_when_disabled_or_not_listening(speculative) -> None:
+    policy, ctx, publisher = speculative
+    policy.live_mode = False
+
+    await _partials(policy, ctx, "what is the time", "what is the time")
+    policy.settings.speculate_enabled = False
+    policy.live_mode = True
+    await _partials(policy, ctx, "what is the time", "what is the time")
+
+    assert publisher.events == []
@@ -10,6 +10,7 @@ from tars.contracts.v1 import (  # type: ignore[import]
     EVENT_TYPE_SAY,
     FinalTranscript,
     LLMRequest,
+    LLMResponse,
     TtsSay,
     WakeEvent,
 )
@@ -107,6 +108,56 @@ async def test_wake_then_llm_request(router_policy: Tuple[RouterPolicy, RouterSe
     assert llm_req.text == "What's the weather today?"
 
 
+@pytest.mark.asyncio
+async def test_llm_request_carries_prior_turns_only(
+    router_policy: Tuple[RouterPolicy, RouterSettings],
+) -> None:
+    policy, _settings = router_policy
+    policy.live_mode = True
+    ctx, publisher = _make_ctx(policy)
+
+    await policy.handle_stt_final(FinalTranscript(text="Remember that my cat is Nova."), ctx)
+    first = publisher.decoded()[0][1]
+    assert isinstance(first, LLMRequest)
+    assert first.conversation_history == []
+    await policy.handle_llm_response(LLMResponse(id=first.id, reply="Noted."), ctx)
+    publisher.clear()
+
+    await policy.handle_stt_final(FinalTranscript(text="What is my cat called?"), ctx)
+    second = publisher.decoded()[0][1]
+    assert isinstance(second, LLMRequest)
+    assert [(m.role, m.content) for m in second.conversation_history or []] == [
+        ("user", "Remember that my cat is Nova."),
+        ("assistant", "Noted."),
+    ]
+    assert second.conversation_summary and "my cat is Nova" in second.conversation_summary
+
+
+@pytest.mark.asyncio
+async def test_intents_route_movement_and_say(
+    router_policy: Tuple[RouterPolicy, RouterSettings],
+) -> None:
+    policy, settings = router_policy
+    policy.live_mode = True
+    ctx, publisher = _make_ctx(policy)
+
+    await policy.handle_stt_final(FinalTranscript(text="Could you walk backward?"), ctx)
+    topic, request = publisher.decoded()[0]
+    assert topic == settings.topic_movement_test
+    assert isinstance(request, dict) and request["command"] == "step_backward"
+    publisher.clear()
+
+    await policy.handle_stt_final(FinalTranscript(text="say stop moving"), ctx)
+    topic, say = publisher.decoded()[0]
+    assert topic == settings.topic_tts_say
+    assert isinstance(say, TtsSay) and say.text == "stop moving"
+    publisher.clear()
+
+    await policy.handle_stt_final(FinalTranscript(text="I know the microwave is on"), ctx)
+    topic, llm_req = publisher.decoded()[0]
+    assert topic == settings.topic_llm_req
+
+
 @pytest.mark.asyncio
 async def test_wake_inline_rule(router_policy: Tuple[RouterPolicy, RouterSettings]) -> None:
     policy, settings = router_policy
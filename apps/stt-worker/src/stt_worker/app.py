@@ -42,8 +42,10 @@ from .config import (
     POST_PUBLISH_COOLDOWN_MS,
     PREPROCESS_ENABLE,
     PREPROCESS_MIN_MS,
+    SAMPLE_RATE,
     STREAMING_PARTIALS,
     STT_BACKEND,
+    STT_SOURCE_ID,
     TTS_MAX_MUTE_MS,
     TTS_RESPONSE_WINDOW_SEC,
     UNMUTE_GUARD_MS,
@@ -56,9 +58,11 @@ from .transcriber import SpeechTranscriber
 from .vad import VADProcessor
 from .config_lib_adapter import initialize_and_subscribe, register_callback
 from tars.adapters.mqtt_client import MQTTClient  # type: ignore[import]
-from tars.contracts.envelope import Envelope  # type: ignore[import]
+from tars.contracts.binary import CONTENT_TYPE_FFT_F32, encode_fft_payload  # type: ignore[import]
+from tars.contracts.envelope import Envelope, TraceContext  # type: ignore[import]
 from tars.contracts.v1 import (  # type: ignore[import]
     EVENT_TYPE_SAY,
+    EVENT_TYPE_STT_AUDIO_FFT,
     EVENT_TYPE_STT_FINAL,
     EVENT_TYPE_STT_PARTIAL,
     EVENT_TYPE_TTS_STATUS,
@@ -80,6 +84,7 @@ from tars.domain.stt import (  # type: ignore[import]
     STTServiceConfig,
     PartialSettings,
 )
+from tars.runtime.tracing import Tracer, current_trace  # type: ignore[import]
 
 logging.basicConfig(
     level=LOG_LEVEL,
@@ -97,7 +102,8 @@ class STTWorker:
         self.audio_capture = AudioCapture()
         self.transcriber = SpeechTranscriber()
         self.vad_processor: VADProcessor | None = None
-        self.mqtt = MQTTClient(MQTT_URL, "tars-stt", enable_health=True, enable_heartbeat=True)
+        self.tracer = Tracer("stt")
+        self.mqtt = MQTTClient(MQTT_URL, "tars-stt", enable_health=True, enable_heartbeat=True, tracer=self.tracer)
         self.state = SuppressionState()
         self.suppress_engine = SuppressionEngine(self.state)
         self.pending_tts = False
@@ -115,6 +121,7 @@ class STTWorker:
         self._tts_response_window_task: asyncio.Task | None = None
         self._stay_muted_until_wake = False
         self._in_response_window = False
+        self._wake_trace: TraceContext | None = None
 
     async def initialize(self) -> None:
         if os.path.exists("/host-models"):
@@ -164,6 +171,8 @@ class STTWorker:
         await self.mqtt.publish_health(ok=ok, event=message or ("ready" if ok else ""), err=None if ok else (message or "error"))
 
     async def publish_transcript(self, transcript: FinalTranscript) -> None:
+        if STT_SOURCE_ID and not transcript.source:
+            transcript = transcript.model_copy(update={"source": STT_SOURCE_ID})
         envelope_id = await self.mqtt.publish_event(
             topic="stt/final",  
             event_type=EVENT_TYPE_STT_FINAL,
@@ -498,6 +507,8 @@ class STTWorker:
         event_type = (event.type or "").lower()
         if event_type in {"wake", "interrupt"}:
             logger.debug("Wake event (%s) received; arming microphone fallback", event_type)
+            # The next utterance continues the wake's trace
+            self._wake_trace = current_trace()
             delay_override = 0 if event_type == "interrupt" else None
             self._schedule_wake_fallback(event_type, delay_override)
         elif event_type in {"timeout", "cancelled", "resume"}:
@@ -598,6 +609,15 @@ class STTWorker:
                     pass
 
             self.fallback_unmute_task = asyncio.create_task(fallback_unmute())
+            await self._publish_traced(final, result.timings)
+
+    async def _publish_traced(self, final: FinalTranscript, timings: dict[str, tuple[float, float]]) -> None:
+        """Publish the transcript inside an ``stt.utterance`` span covering speech through publish."""
+        parent, self._wake_trace = self._wake_trace, None
+        start = min((begin for begin, _ in timings.values()), default=None)
+        with self.tracer.span("stt.utterance", parent=parent, start=start, new_trace=True, chars=len(final.text)):
+            for name, (begin, end) in timings.items():
+                self.tracer.record(name, begin, end)
             await self.publish_transcript(final)
 
     async def run(self) -> None:
@@ -690,6 +710,8 @@ class STTWorker:
             partial = await service.maybe_partial()
             if not partial:
                 continue
+            if STT_SOURCE_ID and not partial.source:
+                partial = partial.model_copy(update={"source": STT_SOURCE_ID})
             message_id = await self._publish_event(
                 EVENT_TYPE_STT_PARTIAL,
                 partial,
@@ -734,14 +756,21 @@ class STTWorker:
             pos = mag[: len(mag)]
             idx = np.linspace(0, len(pos) - 1, bins)
             down = np.interp(idx, np.arange(len(pos)), pos)
-            payload = {"fft": down.tolist(), "ts": now}
             logger.debug(f"FFT: broadcasting {len(down)} bins")
             if FFT_PUBLISH:
                 try:
-                    await self.mqtt.safe_publish(FFT_TOPIC, payload)
+                    # Raw float32 bins in a binary envelope; no JSON float lists on the wire
+                    await self.mqtt.publish_binary(
+                        topic=FFT_TOPIC,
+                        event_type=EVENT_TYPE_STT_AUDIO_FFT,
+                        payload=encode_fft_payload(down.tolist()),
+                        content_type=f"{CONTENT_TYPE_FFT_F32};rate={SAMPLE_RATE}",
+                        qos=0,
+                    )
                 except Exception:  # pragma: no cover - best effort
                     pass
             if self._fft_ws is not None:
+                payload = {"fft": down.tolist(), "ts": now}
                 try:
                     await self._fft_ws.broadcast(payload)
                 except Exception as exc:  # pragma: no cover - best effort
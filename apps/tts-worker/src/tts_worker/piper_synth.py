@@ -8,11 +8,12 @@ import subprocess
 import tempfile
 import threading
 import time
-import re
 from typing import Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Callable
 
+from tars.domain.segmenter import split_sentences  # type: ignore[import]
+
 
 logger = logging.getLogger("tts-worker.piper")
 
@@ -489,19 +490,15 @@ class PiperSynth:
 
     # ----- helpers -----
     def _split_sentences(self, text: str) -> list[str]:
-        """Lightweight sentence splitter.
+        """Split text into sentence chunks for pipelined synthesis.
 
-        Splits on punctuation that typically ends sentences: . ! ?
-        Collapses extra whitespace and preserves punctuation with the chunk.
+        Uses the shared tars-core segmenter, so abbreviations, decimals and
+        ellipses are chunked the same way the router streams them.
         """
         t = (text or "").strip()
         if not t:
             return []
-        # Split on whitespace following ., !, or ?
-        parts = re.split(r"(?<=[.!?])\s+", t)
-        # If no sentence-ending punctuation, return as single chunk
-        chunks = [p.strip() for p in parts if p and p.strip()]
-        return chunks if chunks else [t]
+        return split_sentences(t) or [t]
 
 
 def _supports_wav_file(voice: object) -> bool:
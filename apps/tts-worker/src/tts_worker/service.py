@@ -41,6 +41,7 @@ from tars.domain.tts import (  # type: ignore[import]
     TTSControlMessage,
     StatusEvent,
 )
+from tars.runtime.tracing import Tracer  # type: ignore[import]
 
 
 logger = logging.getLogger("tts-worker")
@@ -78,7 +79,8 @@ class TTSService:
             wake_cache_max_entries=wake_cache_max,
             wake_ack_preload_texts=tuple(TTS_WAKE_ACK_TEXTS),
         )
-        self._domain = TTSDomainService(primary_synth, config, wake_synth=wake_ack_synth)
+        self._tracer = Tracer("tts")
+        self._domain = TTSDomainService(primary_synth, config, wake_synth=wake_ack_synth, tracer=self._tracer)
         set_player_observer(self._domain.on_player_spawn)
         set_stop_checker(self._domain.should_abort_playback)
 
@@ -193,7 +195,7 @@ class TTSService:
             preload_task: asyncio.Task[None] | None = None
             
             try:
-                self._mqtt_client = MQTTClient(MQTT_URL, "tars-tts", enable_health=True)
+                self._mqtt_client = MQTTClient(MQTT_URL, "tars-tts", enable_health=True, tracer=self._tracer)
                 await self._mqtt_client.connect()
                 
                 logger.info("Connected to MQTT as tars-tts")
@@ -2,11 +2,14 @@ import os
 import asyncio
 import logging
 from pathlib import Path
-from typing import Set, Any, Dict
+from typing import Set, Any, Dict, Optional
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request
 from fastapi.responses import HTMLResponse, JSONResponse, FileResponse
 from fastapi.staticfiles import StaticFiles
 from tars.adapters.mqtt_client import MQTTClient  # type: ignore[import]
+from tars.contracts.binary import BinaryEnvelope, decode_fft_payload  # type: ignore[import]
+from tars.contracts.v1 import EVENT_TYPE_MEMORY_QUERY  # type: ignore[import]
+from tars.contracts.v1.memory import MemoryQuery  # type: ignore[import]
 import orjson
 
 from ui_web.config import Config
@@ -84,9 +87,11 @@ class ConnectionManager:
 manager = ConnectionManager()
 
 _last_memory_results: Dict[str, Any] = {}
+_bridge_client: Optional[MQTTClient] = None
 
 
 async def mqtt_bridge_task() -> None:
+    global _bridge_client
     topics = [
         config.partial_topic,
         config.final_topic,
@@ -129,6 +134,15 @@ async def mqtt_bridge_task() -> None:
         
         return handler
 
+    async def handle_fft(frame: BinaryEnvelope) -> None:
+        # Browsers keep receiving the JSON shape {"fft": [...], "ts": ...}
+        try:
+            fft = decode_fft_payload(frame.payload)
+        except ValueError as e:
+            logger.debug("Dropping malformed FFT frame: %s", e)
+            return
+        await manager.broadcast({"topic": config.fft_topic, "payload": {"fft": fft, "ts": frame.ts}})
+
     # Use centralized MQTT client with reconnection support
     while True:
         mqtt_client = None
@@ -140,8 +154,12 @@ async def mqtt_bridge_task() -> None:
             
             logger.info("Connected to MQTT, subscribing topics")
             for topic in topics:
-                await mqtt_client.subscribe(topic, make_handler(topic))
+                if topic == config.fft_topic:
+                    await mqtt_client.subscribe_binary(topic, handle_fft)
+                else:
+                    await mqtt_client.subscribe(topic, make_handler(topic))
                 logger.info(f"Subscribed to {topic}")
+            _bridge_client = mqtt_client
             
             # Keep connection alive and process messages
             # MQTTClient handles reconnection internally
@@ -150,6 +168,7 @@ async def mqtt_bridge_task() -> None:
                 
         except Exception as e:
             logger.error("MQTT bridge error: %s", e)
+            _bridge_client = None
             if mqtt_client:
                 try:
                     await mqtt_client.shutdown()
@@ -187,23 +206,30 @@ async def index() -> HTMLResponse:
 
 @app.get("/api/memory")
 async def api_memory(q: str = "*", k: int = 25) -> JSONResponse:
-    """Return the last known memory/results and optionally trigger a fresh query.
+    """Query memory over MQTT and return the correlated memory/results.
 
-    This is a lightweight proxy: it publishes memory/query and returns the
-    most recent memory/results snapshot cached by the bridge.
+    Uses the bridge's MQTT connection; identical queries already in flight
+    share one round trip and replies are cached briefly. Falls back to the
+    most recent memory/results snapshot if the memory worker does not answer.
     """
+    client = _bridge_client
+    if client is None or not client.connected:
+        return JSONResponse({"error": "MQTT bridge not connected"}, status_code=503)
     try:
-        # Create temporary MQTT client for one-off publish
-        mqtt_url = config.mqtt_url
-        temp_client = MQTTClient(mqtt_url, "ui-web-api", enable_health=False)
-        await temp_client.connect()
-        try:
-            await temp_client.publish(config.memory_query_topic, orjson.dumps({"text": q, "top_k": k}))
-        finally:
-            await temp_client.shutdown()
+        reply = await client.request(
+            config.memory_query_topic,
+            EVENT_TYPE_MEMORY_QUERY,
+            MemoryQuery(text=q, top_k=k),
+            reply_topic=config.memory_results_topic,
+            timeout=5.0,
+            cache_ttl=5.0,
+        )
+    except asyncio.TimeoutError:
+        logger.warning("memory/query timed out; returning last snapshot")
+        return JSONResponse(_last_memory_results or {"results": [], "query": q, "k": k})
     except Exception as e:
         return JSONResponse({"error": str(e)}, status_code=500)
-    return JSONResponse(_last_memory_results or {"results": [], "query": q, "k": k})
+    return JSONResponse(reply.model_dump())
 
 
 # --- Config Manager Proxy Endpoints ---
@@ -9,6 +9,7 @@ from collections.abc import Mapping
 
 import orjson
 import paho.mqtt.client as mqtt
+from tars.contracts.binary import BinaryEnvelope, decode_fft_payload  # type: ignore[import]
 
 logger = logging.getLogger("tars.ui.mqtt")
 
@@ -43,10 +44,19 @@ class MqttBridge:
         self._thread: threading.Thread | None = None
 
     def _on_message(self, client, userdata, msg):  # MQTT callback signature required
-        try:
-            payload = orjson.loads(msg.payload)
-        except Exception:
-            payload = {}
+        if BinaryEnvelope.is_binary(msg.payload):
+            # FFT frames arrive as binary envelopes; keep the {"fft", "ts"} shape
+            try:
+                frame = BinaryEnvelope.decode(msg.payload)
+                payload = {"fft": decode_fft_payload(frame.payload), "ts": frame.ts}
+            except ValueError as e:
+                logger.debug("Dropping malformed binary frame on %s: %s", msg.topic, e)
+                return
+        else:
+            try:
+                payload = orjson.loads(msg.payload)
+            except Exception:
+                payload = {}
         try:
             self.q.put_nowait((msg.topic, payload))
         except queue.Full:
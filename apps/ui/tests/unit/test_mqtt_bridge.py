@@ -0,0 +1,44 @@
+"""Unit tests for the MQTT bridge message decoding."""
+
+import queue
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+from tars.contracts.binary import BinaryEnvelope, encode_fft_payload
+from ui.mqtt_bridge import MqttBridge
+
+
+@pytest.fixture
+def bridge():
+    return MqttBridge(queue.Queue(), host="localhost", port=1883, topics={"audio": "stt/audio_fft"})
+
+
+def test_binary_fft_frame_is_decoded(bridge):
+    """Binary FFT frames become the {"fft", "ts"} payload the UI renders."""
+    frame = BinaryEnvelope.new(event_type="stt.audio_fft", payload=encode_fft_payload([0.5, 1.0]))
+
+    bridge._on_message(None, None, SimpleNamespace(topic="stt/audio_fft", payload=frame.encode()))
+
+    topic, payload = bridge.poll()
+    assert topic == "stt/audio_fft"
+    assert payload == {"fft": [0.5, 1.0], "ts": frame.ts}
+
+
+def test_json_payload_still_parsed(bridge):
+    """JSON envelopes are passed through unchanged."""
+    raw = orjson.dumps({"type": "stt.final", "data": {"text": "hi"}})
+
+    bridge._on_message(None, None, SimpleNamespace(topic="stt/final", payload=raw))
+
+    assert bridge.poll() == ("stt/final", {"type": "stt.final", "data": {"text": "hi"}})
+
+
+def test_malformed_binary_frame_is_dropped(bridge):
+    """A truncated binary frame is dropped instead of reaching the UI."""
+    frame = BinaryEnvelope.new(event_type="stt.audio_fft", payload=encode_fft_payload([1.0])).encode()
+
+    bridge._on_message(None, None, SimpleNamespace(topic="stt/audio_fft", payload=frame[:-1]))
+
+    assert bridge.poll() == (None, None)
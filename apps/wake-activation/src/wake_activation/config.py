@@ -63,6 +63,7 @@ class WakeActivationConfig:
     health_interval_sec: float = field(
         default_factory=lambda: float(os.getenv("WAKE_HEALTH_INTERVAL_SEC", "15"))
     )
+    source_id: str | None = field(default_factory=lambda: os.getenv("WAKE_SOURCE_ID") or None)
     log_level: str = field(default_factory=lambda: os.getenv("LOG_LEVEL", "INFO"))
     enable_speex_noise_suppression: bool = field(
         default_factory=lambda: os.getenv("WAKE_SPEEX_NOISE_SUPPRESSION", "0").lower()
@@ -25,6 +25,9 @@ class WakeEvent(BaseModel):
         default=None, description="Reason for the event (wake_phrase, silence, etc.)"
     )
     ts: float = Field(description="Monotonic timestamp in seconds")
+    source: str | None = Field(
+        default=None, description="Capture device id; keys the router's per-source session"
+    )
 
 
 class MicAction(str, Enum):
@@ -34,6 +34,7 @@ except ImportError:
 
 
 from tars.adapters.mqtt_client import MQTTClient  # type: ignore[import]
+from tars.runtime.tracing import Tracer  # type: ignore[import]
 import orjson
 
 from .audio import AudioFanoutClient
@@ -104,6 +105,7 @@ class WakeActivationService:
         self._tts_utt_id: str | None = None
         self._interrupt_task: asyncio.Task[None] | None = None
         self._active_interrupt: InterruptContext | None = None
+        self._tracer = Tracer("wake")
 
     async def run(self) -> None:
         """Run the wake activation event loop with automatic MQTT reconnection."""
@@ -118,7 +120,9 @@ class WakeActivationService:
         max_backoff = 30.0
         
         while not self._stop_event.is_set():
-            mqtt_client = MQTTClient(self.cfg.mqtt_url, "wake-activation", enable_health=True)
+            mqtt_client = MQTTClient(
+                self.cfg.mqtt_url, "wake-activation", enable_health=True, tracer=self._tracer
+            )
             self.log.info("Connecting to MQTT %s", self.cfg.mqtt_url)
             
             try:
@@ -291,6 +295,8 @@ class WakeActivationService:
             await self._cancel_idle_timeout()
 
     async def publish_wake_event(self, client: MQTTClient, event: WakeEvent) -> None:
+        if self.cfg.source_id and not event.source:
+            event = event.model_copy(update={"source": self.cfg.source_id})
         await client.publish_event(
             topic=self.cfg.wake_event_topic,
             event_type="wake.event",
@@ -326,10 +332,12 @@ class WakeActivationService:
     async def _handle_detection(self, client: MQTTClient, result: DetectionResult) -> None:
         confidence = max(0.0, min(result.score, 1.0))
         session_id = self._next_session_id()
-        if self._tts_state == "speaking":
-            await self._handle_interrupt_detection(client, result, confidence, session_id)
-        else:
-            await self._handle_standard_wake(client, result, confidence, session_id)
+        # Each detection starts a turn trace that downstream services continue
+        with self._tracer.span("wake.detect", new_trace=True, confidence=round(confidence, 3)):
+            if self._tts_state == "speaking":
+                await self._handle_interrupt_detection(client, result, confidence, session_id)
+            else:
+                await self._handle_standard_wake(client, result, confidence, session_id)
 
     async def _handle_standard_wake(
         self,
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark the compiled intent matcher against per-phrase substring checks.
+
+The baseline mirrors the router's former ``_detect_movement_command`` loop,
+which tested every phrase of every intent against each transcript. Both
+sides get the same synthetic grammar; the compiled matcher should stay flat
+as the number of patterns grows.
+
+Usage:
+    python scripts/benchmark_intents.py [--counts 20,200,2000,20000] [--utterances 2000]
+"""
+
+import argparse
+import random
+import time
+
+from tars.domain.router import IntentMatcher, IntentSpec
+
+VOCAB = "please could you the a to my on off up down lights music volume timer weather now".split()
+
+
+def make_grammar(count: int, rng: random.Random) -> list[IntentSpec]:
+    return [
+        IntentSpec(name=f"intent{i}", phrases=(f"{rng.choice(VOCAB)} action{i}", f"do task{i} {rng.choice(VOCAB)}"))
+        for i in range(count)
+    ]
+
+
+def make_utterances(count: int, patterns: int, rng: random.Random) -> list[str]:
+    out = []
+    for _ in range(count):
+        words = [rng.choice(VOCAB) for _ in range(rng.randint(4, 14))]
+        if rng.random() < 0.5:
+            words.insert(rng.randrange(len(words)), f"action{rng.randrange(patterns)}")
+        out.append(" ".join(words))
+    return out
+
+
+def substring_match(intents: list[IntentSpec], text: str) -> str | None:
+    t = text.lower().strip()
+    for spec in intents:
+        for phrase in spec.phrases:
+            if phrase in t:
+                return spec.name
+    return None
+
+
+def bench(name: str, fn, utterances: list[str]) -> float:
+    started = time.perf_counter()
+    for text in utterances:
+        fn(text)
+    per_us = (time.perf_counter() - started) / len(utterances) * 1e6
+    print(f"  {name:<10} {per_us:9.2f} us/utterance")
+    return per_us
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--counts", default="20,200,2000,20000", help="Comma-separated intent counts")
+    parser.add_argument("--utterances", type=int, default=2000)
+    args = parser.parse_args()
+
+    for count in (int(c) for c in args.counts.split(",")):
+        rng = random.Random(count)
+        intents = make_grammar(count, rng)
+        utterances = make_utterances(args.utterances, count, rng)
+        started = time.perf_counter()
+        matcher = IntentMatcher(intents)
+        compile_ms = (time.perf_counter() - started) * 1000
+        print(f"{count} intents ({2 * count} phrases), compiled in {compile_ms:.1f} ms")
+        substring = bench("substring", lambda text: substring_match(intents, text), utterances)
+        compiled = bench("compiled", matcher.match, utterances)
+        print(f"  speedup    {substring / compiled:9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark the router's conversation history over a long session.
+
+Compares the former unbounded list + "last 10 messages" window with
+``ConversationHistory``: prompt size (estimated tokens of history plus
+summary sent per request), retained memory and per-turn build time.
+
+Usage:
+    python scripts/benchmark_router_history.py [--turns 2000] [--budget 1200]
+"""
+
+import argparse
+import random
+import time
+
+from tars.contracts.v1 import ConversationMessage
+from tars.domain.router import ConversationHistory, estimate_tokens
+
+
+def make_turns(count: int, seed: int = 7) -> list[tuple[str, str]]:
+    rng = random.Random(seed)
+    turns = []
+    for i in range(count):
+        role = "user" if i % 2 == 0 else "assistant"
+        words = rng.choice((6, 12, 40, 120, 400)) if role == "assistant" else rng.randint(3, 25)
+        turns.append((role, f"Turn {i} is about topic {rng.randint(1, 50)}. " + "word " * words))
+    return turns
+
+
+def run_last_n(turns: list[tuple[str, str]], n: int = 10) -> tuple[list[int], float, int]:
+    history: list[ConversationMessage] = []
+    sizes = []
+    started = time.perf_counter()
+    for role, content in turns:
+        if role == "user":
+            window = history[-n:]
+            sizes.append(sum(estimate_tokens(m.content) for m in window))
+        history.append(ConversationMessage(role=role, content=content))
+    return sizes, time.perf_counter() - started, len(history)
+
+
+def run_budgeted(turns: list[tuple[str, str]], budget: int) -> tuple[list[int], float, int]:
+    history = ConversationHistory(token_budget=budget)
+    sizes = []
+    started = time.perf_counter()
+    for role, content in turns:
+        if role == "user":
+            window = history.messages()
+            summary = history.context() or ""
+            sizes.append(sum(estimate_tokens(m.content) for m in window) + estimate_tokens(summary))
+        history.add(role, content)
+    return sizes, time.perf_counter() - started, len(history)
+
+
+def report(name: str, sizes: list[int], elapsed: float, retained: int) -> None:
+    ordered = sorted(sizes)
+    p50 = ordered[len(ordered) // 2]
+    p99 = ordered[int(len(ordered) * 0.99) - 1]
+    per_turn_us = elapsed / len(sizes) / 2 * 1e6
+    print(
+        f"{name:<10} prompt p50={p50:5d} p99={p99:5d} max={ordered[-1]:5d} tokens  "
+        f"retained={retained:5d} msgs  {per_turn_us:7.2f} us/turn"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=2000)
+    parser.add_argument("--budget", type=int, default=1200)
+    args = parser.parse_args()
+
+    turns = make_turns(args.turns)
+    print(f"{len(turns)} turns, history budget {args.budget} tokens")
+    report("last-10", *run_last_n(turns))
+    report("budgeted", *run_budgeted(turns, args.budget))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Load-test the router with many concurrent sources.
+
+Each turn is a final transcript from one of N sources followed by the LLM
+reply for it, routed through ``RouterPolicy`` with a discarding publisher.
+Per-turn cost should stay flat as N grows, and every reply must be spoken
+for the source that asked.
+
+Usage:
+    python scripts/benchmark_router_sessions.py [--sources 1,10,100,1000] [--turns 20000]
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from tars.contracts.envelope import Envelope
+from tars.contracts.registry import register
+from tars.contracts.v1 import EVENT_TYPE_SAY, FinalTranscript, LLMResponse
+from tars.domain.ports import Publisher
+from tars.domain.router import RouterPolicy, RouterSettings
+from tars.runtime.ctx import Ctx
+
+
+class CheckingPublisher(Publisher):
+    """Counts spoken replies whose source differs from the one in their text."""
+
+    def __init__(self) -> None:
+        self.says = 0
+        self.crossed = 0
+
+    async def publish(self, topic: str, payload: bytes, qos: int = 0, retain: bool = False) -> None:
+        envelope = Envelope.model_validate_json(payload)
+        if envelope.type == EVENT_TYPE_SAY:
+            self.says += 1
+            if envelope.data["text"] != f"Reply for {envelope.data['source']}.":
+                self.crossed += 1
+
+
+async def run(sources: int, turns: int) -> None:
+    settings = RouterSettings(live_mode_default=True, max_sessions=sources)
+    for event_type, topic in settings.as_topic_map().items():
+        register(event_type, topic)
+    policy = RouterPolicy(settings)
+    publisher = CheckingPublisher()
+    ctx = Ctx(pub=publisher, policy=policy, logger=logging.getLogger("bench"))
+
+    started = time.perf_counter()
+    for i in range(turns):
+        source, rid = f"dev{i % sources}", f"r{i}"
+        await policy.handle_stt_final(FinalTranscript(text="what is the weather", utt_id=rid, source=source), ctx)
+        await policy.handle_llm_response(LLMResponse(id=rid, reply=f"Reply for {source}."), ctx)
+    per_us = (time.perf_counter() - started) / turns * 1e6
+    print(
+        f"{sources:>6} sources  {per_us:8.1f} us/turn  "
+        f"sessions={len(policy.sessions)} says={publisher.says} crossed={publisher.crossed}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sources", default="1,10,100,1000", help="Comma-separated source counts")
+    parser.add_argument("--turns", type=int, default=20000)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    for sources in (int(s) for s in args.sources.split(",")):
+        asyncio.run(run(sources, args.turns))
+
+
+if __name__ == "__main__":
+    main()
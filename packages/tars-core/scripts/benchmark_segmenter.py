@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark the incremental sentence segmenter against the old rescan approach.
+
+The rescan baseline mirrors the router's former ``_should_flush`` /
+``_split_on_boundary`` loop, which checked every boundary character against
+the whole buffer on each delta. Both consume the same token-sized deltas.
+
+Usage:
+    python scripts/benchmark_segmenter.py [--deltas 20000] [--sentence-words 40]
+"""
+
+import argparse
+import time
+
+from tars.domain.segmenter import SentenceSegmenter
+
+BOUNDARY_CHARS = ".!?;:"
+
+
+def rescan_segment(deltas: list[str]) -> int:
+    def should_flush(buf: str) -> bool:
+        return any(ch in buf for ch in BOUNDARY_CHARS)
+
+    def split_on_boundary(text: str) -> tuple[str, str]:
+        idx = -1
+        for i in range(len(text) - 1, -1, -1):
+            if text[i] in BOUNDARY_CHARS and (i == len(text) - 1 or text[i + 1].isspace()):
+                idx = i
+                break
+        if idx < 0:
+            idx = max((text.rfind(ch) for ch in BOUNDARY_CHARS), default=-1)
+        if idx >= 0:
+            return text[: idx + 1].strip(), text[idx + 1 :].lstrip()
+        return "", text
+
+    emitted, buf = 0, ""
+    for delta in deltas:
+        buf += delta
+        while should_flush(buf):
+            sent, buf = split_on_boundary(buf)
+            if not sent:
+                break
+            emitted += 1
+    return emitted + (1 if buf.strip() else 0)
+
+
+def incremental_segment(deltas: list[str]) -> int:
+    segmenter = SentenceSegmenter()
+    emitted = sum(len(segmenter.push(delta)) for delta in deltas)
+    return emitted + (1 if segmenter.finish() else 0)
+
+
+def make_deltas(count: int, sentence_words: int) -> list[str]:
+    deltas = []
+    for i in range(count):
+        deltas.append(" word")
+        if i % sentence_words == sentence_words - 1:
+            deltas.append(".")
+    return deltas
+
+
+def bench(name: str, fn, deltas: list[str], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        sentences = fn(deltas)
+        best = min(best, time.perf_counter() - started)
+    per_delta_us = best / len(deltas) * 1e6
+    print(f"{name:<12} {best * 1000:9.2f} ms  {per_delta_us:7.3f} us/delta  sentences={sentences}")
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--deltas", type=int, default=20000)
+    parser.add_argument("--sentence-words", type=int, default=40, help="Words per sentence (0 = one long run-on)")
+    args = parser.parse_args()
+
+    sentence_words = args.sentence_words or args.deltas + 1
+    deltas = make_deltas(args.deltas, sentence_words)
+    print(f"{len(deltas)} deltas, {sentence_words} words per sentence")
+    baseline = bench("rescan", rescan_segment, deltas)
+    incremental = bench("incremental", incremental_segment, deltas)
+    print(f"speedup      {baseline / incremental:9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,8 +10,10 @@ import asyncio_mqtt as mqtt
 import orjson
 from pydantic import ValidationError
 
+from tars.adapters.mqtt_client import shared_topic, split_shared_topic
 from tars.contracts.envelope import Envelope
 from tars.domain.ports import Publisher, Subscriber
+from tars.runtime.metrics import MetricsRegistry
 
 @dataclass(slots=True)
 class MQTTSubscriberOptions:
@@ -24,11 +26,14 @@ class MQTTSubscriberOptions:
 class AsyncioMQTTPublisher(Publisher):
     """Publisher implementation backed by an asyncio-mqtt client."""
 
-    def __init__(self, client: mqtt.Client) -> None:
+    def __init__(self, client: mqtt.Client, *, metrics: MetricsRegistry | None = None) -> None:
         self._client = client
+        self._metrics = metrics
 
     async def publish(self, topic: str, payload: bytes, qos: int = 0, retain: bool = False) -> None:
         await self._client.publish(topic, payload, qos=qos, retain=retain)
+        if self._metrics is not None:
+            self._metrics.record_published(topic, len(payload))
 
 
 class AsyncioMQTTSubscriber(Subscriber):
@@ -48,9 +53,18 @@ class AsyncioMQTTSubscriber(Subscriber):
             else None
         )
 
-    async def messages(self, topic: str, qos: int = 0) -> AsyncIterable[mqtt.Message]:
-        manager = self._client.filtered_messages(topic)
-        await self._client.subscribe(topic, qos=qos)
+    async def messages(
+        self,
+        topic: str,
+        qos: int = 0,
+        *,
+        share_group: Optional[str] = None,
+    ) -> AsyncIterable[mqtt.Message]:
+        # Shared deliveries carry the plain topic, so filter on that and only
+        # use the $share form for the broker subscription.
+        embedded_group, plain_topic = split_shared_topic(topic)
+        manager = self._client.filtered_messages(plain_topic)
+        await self._client.subscribe(shared_topic(plain_topic, share_group or embedded_group), qos=qos)
 
         async with manager as messages:
             async for message in messages:
@@ -17,10 +17,14 @@ Constitutional Compliance:
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 import os
+import socket
 import time
+import uuid
 from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Any, Awaitable, Callable, Optional
 from urllib.parse import urlparse
 
@@ -28,8 +32,13 @@ import asyncio_mqtt as mqtt
 import orjson
 from pydantic import BaseModel, Field, field_validator, ValidationInfo
 
+from tars.adapters.mqtt_outbox import OutboxEntry, PublishOutbox
+from tars.contracts.binary import CONTENT_TYPE_OCTET_STREAM, BinaryEnvelope
 from tars.contracts.envelope import Envelope
 from tars.contracts.v1.health import HealthPing
+from tars.contracts.v1.trace import EVENT_TYPE_TRACE_SPANS
+from tars.runtime.metrics import MetricsRegistry
+from tars.runtime.tracing import Tracer, current_trace, trace_from_payload, use_trace
 
 logger = logging.getLogger(__name__)
 
@@ -99,6 +108,69 @@ def parse_mqtt_url(url: str) -> ConnectionParams:
     )
 
 
+SHARED_SUBSCRIPTION_PREFIX = "$share/"
+
+
+def shared_topic(topic: str, group: Optional[str]) -> str:
+    """Build an MQTT shared-subscription filter (``$share/<group>/<topic>``).
+    
+    The broker load-balances messages on a shared filter across all
+    subscribers in the same group, so N replicas each receive ~1/N of the
+    traffic instead of every message.
+    
+    Args:
+        topic: Topic filter to share (wildcards allowed)
+        group: Share group name; None/empty returns topic unchanged
+    
+    Returns:
+        Shared subscription filter, or the original topic when group is unset
+    
+    Raises:
+        ValueError: If group contains '/', '+' or '#'
+    
+    Examples:
+        >>> shared_topic("llm/request", "llm-workers")
+        '$share/llm-workers/llm/request'
+        >>> shared_topic("llm/request", None)
+        'llm/request'
+    """
+    if not group:
+        return topic
+    if any(ch in group for ch in "/+#"):
+        raise ValueError(f"Invalid share group {group!r}: must not contain '/', '+' or '#'")
+    _, plain = split_shared_topic(topic)
+    return f"{SHARED_SUBSCRIPTION_PREFIX}{group}/{plain}"
+
+
+def split_shared_topic(topic: str) -> tuple[Optional[str], str]:
+    """Split a shared-subscription filter into (group, topic).
+    
+    Messages delivered through a shared subscription carry the plain topic,
+    so handlers must be matched against the part after the group name.
+    
+    Examples:
+        >>> split_shared_topic("$share/llm-workers/llm/request")
+        ('llm-workers', 'llm/request')
+        >>> split_shared_topic("llm/request")
+        (None, 'llm/request')
+    """
+    if not topic.startswith(SHARED_SUBSCRIPTION_PREFIX):
+        return None, topic
+    group, sep, plain = topic[len(SHARED_SUBSCRIPTION_PREFIX):].partition("/")
+    if not group or not sep or not plain:
+        raise ValueError(f"Malformed shared subscription filter: {topic!r}")
+    return group, plain
+
+
+def replica_client_id(base: str) -> str:
+    """Derive a per-replica client ID (``<base>-<host>-<pid>``).
+    
+    Brokers disconnect the older session when two clients share an ID, so
+    horizontally scaled workers must not reuse a fixed client ID.
+    """
+    return f"{base}-{socket.gethostname()}-{os.getpid()}"
+
+
 class MQTTClientConfig(BaseModel):
     """Configuration for centralized MQTT client.
     
@@ -116,6 +188,13 @@ class MQTTClientConfig(BaseModel):
         dedupe_max_entries: Max deduplication cache entries (0=disabled)
         reconnect_min_delay: Min reconnection backoff delay in seconds
         reconnect_max_delay: Max reconnection backoff delay in seconds
+        metrics_interval: Publish metrics snapshot to system/metrics/{client_id}
+            every N seconds (0=disabled)
+        outbox_max_entries: Queue up to N QoS>=1 publishes in memory while
+            disconnected and flush them after reconnect (0=disabled)
+        outbox_path: Optional JSON-lines file for publishes beyond the
+            in-memory bound (also replayed on the next start)
+        outbox_ttl: Default expiry for queued publishes in seconds (0=never)
     """
 
     mqtt_url: str
@@ -129,6 +208,10 @@ class MQTTClientConfig(BaseModel):
     dedupe_max_entries: int = Field(default=0, ge=0)
     reconnect_min_delay: float = Field(default=0.5, ge=0.1)
     reconnect_max_delay: float = Field(default=5.0, ge=0.5)
+    metrics_interval: float = Field(default=0.0, ge=0.0)
+    outbox_max_entries: int = Field(default=0, ge=0)
+    outbox_path: Optional[str] = None
+    outbox_ttl: float = Field(default=30.0, ge=0.0)
 
     @field_validator("reconnect_max_delay")
     @classmethod
@@ -174,6 +257,10 @@ class MQTTClientConfig(BaseModel):
             MQTT_DEDUPE_MAX_ENTRIES: Dedup cache size (default: 0)
             MQTT_RECONNECT_MIN_DELAY: Min backoff delay (default: 0.5)
             MQTT_RECONNECT_MAX_DELAY: Max backoff delay (default: 5.0)
+            MQTT_METRICS_INTERVAL: Metrics publish interval (default: 0, disabled)
+            MQTT_OUTBOX_MAX_ENTRIES: Outbox size (default: 0, disabled)
+            MQTT_OUTBOX_PATH: Outbox spill file (default: unset, memory only)
+            MQTT_OUTBOX_TTL: Default outbox expiry in seconds (default: 30)
         
         Returns:
             MQTTClientConfig instance
@@ -197,6 +284,10 @@ class MQTTClientConfig(BaseModel):
             dedupe_max_entries=int(os.getenv("MQTT_DEDUPE_MAX_ENTRIES", "0")),
             reconnect_min_delay=float(os.getenv("MQTT_RECONNECT_MIN_DELAY", "0.5")),
             reconnect_max_delay=float(os.getenv("MQTT_RECONNECT_MAX_DELAY", "5.0")),
+            metrics_interval=float(os.getenv("MQTT_METRICS_INTERVAL", "0.0")),
+            outbox_max_entries=int(os.getenv("MQTT_OUTBOX_MAX_ENTRIES", "0")),
+            outbox_path=os.getenv("MQTT_OUTBOX_PATH") or None,
+            outbox_ttl=float(os.getenv("MQTT_OUTBOX_TTL", "30.0")),
         )
 
 
@@ -249,6 +340,67 @@ class MessageDeduplicator:
         return self._impl.is_duplicate(payload)
 
 
+# --- Request/Response Support ---
+
+
+class ReplyCache:
+    """TTL-bound LRU cache of reply envelopes keyed by request key."""
+
+    def __init__(self, *, max_entries: int = 256) -> None:
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple[float, Envelope]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Envelope]:
+        """Return the cached reply, or None when missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, reply = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return reply
+
+    def put(self, key: str, reply: Envelope, ttl: float) -> None:
+        """Store a reply for ttl seconds, evicting least recently used entries."""
+        self._entries[key] = (time.monotonic() + ttl, reply)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached replies."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def request_key(topic: str, event_type: str, data: dict[str, Any] | BaseModel) -> str:
+    """Derive the coalescing/cache key for a request.
+    
+    Two requests share a key when they target the same topic with the same
+    event type and an identical payload (dict key order is ignored). The
+    per-message ``message_id`` carried by contract models is not part of the
+    request's content and is excluded.
+    """
+    if isinstance(data, BaseModel):
+        data = data.model_dump()
+    data = {k: v for k, v in data.items() if k != "message_id"}
+    raw = orjson.dumps([topic, event_type, data], option=orjson.OPT_SORT_KEYS)
+    return hashlib.sha256(raw).hexdigest()
+
+
+@dataclass(slots=True)
+class _InflightRequest:
+    """A published request awaiting its reply, shared by coalesced callers."""
+
+    future: asyncio.Future[Envelope]
+    task: Optional[asyncio.Task[None]] = None
+    waiters: int = 0
+
+
 # --- Type Aliases ---
 
 
@@ -260,6 +412,13 @@ Should not raise exceptions (errors are isolated by dispatch loop).
 Should be idempotent if deduplication is disabled.
 """
 
+BinarySubscriptionHandler = Callable[[BinaryEnvelope], Awaitable[None]]
+"""Type alias for binary subscription handlers.
+
+Handler receives a decoded BinaryEnvelope (header + raw payload bytes).
+Frames that are not binary envelopes are logged and skipped.
+"""
+
 
 # --- Main MQTT Client ---
 
@@ -276,6 +435,7 @@ class MQTTClient:
         - Optional health status publishing (system/health/{client_id})
         - Optional heartbeat publishing (system/keepalive/{client_id})
         - Optional message deduplication by Envelope ID
+        - Per-topic metrics, optionally published to system/metrics/{client_id}
         - Graceful shutdown with task cancellation
         - Error isolation for subscription handlers
     
@@ -318,6 +478,13 @@ class MQTTClient:
         dedupe_max_entries: int = 0,
         reconnect_min_delay: float = 0.5,
         reconnect_max_delay: float = 5.0,
+        metrics_interval: Optional[float] = None,
+        outbox_max_entries: Optional[int] = None,
+        outbox_path: Optional[str] = None,
+        outbox_ttl: Optional[float] = None,
+        client_factory: Optional[Callable[..., mqtt.Client]] = None,
+        tracer: Optional[Tracer] = None,
+        trace_export_interval: float = 1.0,
     ) -> None:
         """Initialize MQTT client with configuration.
         
@@ -333,6 +500,23 @@ class MQTTClient:
             dedupe_max_entries: Max deduplication cache entries (0=disabled)
             reconnect_min_delay: Min reconnection backoff delay in seconds
             reconnect_max_delay: Max reconnection backoff delay in seconds
+            metrics_interval: Metrics publish interval in seconds (0=disabled).
+                None reads MQTT_METRICS_INTERVAL so deployments can enable it
+                without code changes.
+            outbox_max_entries: Outbox size for QoS>=1 publishes made while
+                disconnected (0=disabled). None reads MQTT_OUTBOX_MAX_ENTRIES.
+            outbox_path: Spill file for publishes beyond the in-memory bound.
+                None reads MQTT_OUTBOX_PATH.
+            outbox_ttl: Default expiry for queued publishes in seconds
+                (0=never). None reads MQTT_OUTBOX_TTL.
+            client_factory: Callable building the underlying client from
+                asyncio_mqtt.Client keyword arguments (default:
+                asyncio_mqtt.Client). Pass ``LoopbackBroker.client`` to run
+                against the in-process broker.
+            tracer: Service tracer whose finished spans are exported on
+                ``system/trace/<service>`` every ``trace_export_interval``
+                seconds. Trace context propagates through publish_event and
+                handlers with or without one.
         
         Raises:
             ValueError: If configuration validation fails
@@ -350,9 +534,24 @@ class MQTTClient:
             dedupe_max_entries=dedupe_max_entries,
             reconnect_min_delay=reconnect_min_delay,
             reconnect_max_delay=reconnect_max_delay,
+            metrics_interval=(
+                float(os.getenv("MQTT_METRICS_INTERVAL", "0.0"))
+                if metrics_interval is None
+                else metrics_interval
+            ),
+            outbox_max_entries=(
+                int(os.getenv("MQTT_OUTBOX_MAX_ENTRIES", "0"))
+                if outbox_max_entries is None
+                else outbox_max_entries
+            ),
+            outbox_path=(os.getenv("MQTT_OUTBOX_PATH") or None) if outbox_path is None else outbox_path,
+            outbox_ttl=float(os.getenv("MQTT_OUTBOX_TTL", "30.0")) if outbox_ttl is None else outbox_ttl,
         )
         
         self._conn_params = parse_mqtt_url(mqtt_url)
+        self._client_factory = client_factory
+        self._tracer = tracer
+        self._trace_export_interval = trace_export_interval
         self._source_name = source_name or client_id
         
         # State
@@ -361,9 +560,31 @@ class MQTTClient:
         self._subscriptions: set[str] = set()
         self._dispatch_task: Optional[asyncio.Task[None]] = None
         self._heartbeat_task: Optional[asyncio.Task[None]] = None
+        self._metrics_task: Optional[asyncio.Task[None]] = None
+        self._trace_task: Optional[asyncio.Task[None]] = None
+        self._flush_task: Optional[asyncio.Task[None]] = None
         self._connected: bool = False
         self._shutdown: bool = False
         
+        # Instrumentation (shared with Dispatcher/AsyncioMQTTPublisher on this connection)
+        self.metrics = MetricsRegistry()
+        
+        # Request/response
+        self._reply_topics: set[str] = set()
+        self._pending_replies: dict[str, asyncio.Future[Envelope]] = {}
+        self._inflight_requests: dict[str, _InflightRequest] = {}
+        self._reply_cache = ReplyCache()
+        
+        # Outbox for QoS>=1 publishes while disconnected
+        self._outbox: Optional[PublishOutbox] = None
+        if self._config.outbox_max_entries > 0:
+            self._outbox = PublishOutbox(
+                max_entries=self._config.outbox_max_entries,
+                spill_path=self._config.outbox_path,
+            )
+            outbox = self._outbox
+            self.metrics.register_gauge("mqtt.outbox_depth", lambda: len(outbox))
+        
         # Deduplication
         self._deduplicator: Optional[MessageDeduplicator] = None
         if dedupe_ttl > 0 and dedupe_max_entries > 0:
@@ -380,11 +601,33 @@ class MQTTClient:
         """
         return self._client
 
+    @property
+    def tracer(self) -> Optional[Tracer]:
+        """Tracer whose spans this client exports, if any."""
+        return self._tracer
+
     @property
     def connected(self) -> bool:
         """Check if client is currently connected to broker."""
         return self._connected
 
+    def metrics_snapshot(self) -> dict[str, Any]:
+        """Return per-topic counters, histograms and gauges for this client.
+        
+        Includes anything recorded by a Dispatcher or AsyncioMQTTPublisher
+        constructed with ``metrics=client.metrics``.
+        """
+        snapshot = self.metrics.snapshot()
+        snapshot["client_id"] = self._config.client_id
+        snapshot["connected"] = self._connected
+        if self._outbox is not None:
+            snapshot["outbox"] = {
+                "pending": len(self._outbox),
+                "dropped": self._outbox.dropped,
+                "expired": self._outbox.expired,
+            }
+        return snapshot
+
     async def __aenter__(self) -> MQTTClient:
         """Async context manager entry (auto-connect)."""
         await self.connect()
@@ -408,6 +651,7 @@ class MQTTClient:
         - Parses connection parameters from URL
         - Creates asyncio-mqtt Client
         - Enters client context (establishes connection)
+        - Re-subscribes reply topics used by request()
         - Starts message dispatch task
         - Starts heartbeat task (if enabled)
         - Publishes health status (if enabled)
@@ -421,7 +665,8 @@ class MQTTClient:
             return
         
         # Create MQTT client with connection parameters
-        self._client = mqtt.Client(
+        factory = self._client_factory or mqtt.Client
+        self._client = factory(
             hostname=self._conn_params.hostname,
             port=self._conn_params.port,
             username=self._conn_params.username,
@@ -441,12 +686,28 @@ class MQTTClient:
             self._config.client_id,
         )
         
+        # Reply topics belong to this client, not to the service's handler
+        # setup, so they are restored here after a reconnect
+        for reply_topic in sorted(self._reply_topics):
+            self._subscriptions.add(reply_topic)
+            await self._client.subscribe(reply_topic, qos=1)
+        
         # Start background tasks
         self._dispatch_task = asyncio.create_task(self._dispatch_messages())
         
         if self._config.enable_heartbeat:
             self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
         
+        if self._config.metrics_interval > 0:
+            self._metrics_task = asyncio.create_task(self._metrics_loop())
+        
+        if self._tracer is not None and self._tracer.enabled:
+            self._trace_task = asyncio.create_task(self._trace_loop())
+        
+        # Replay publishes queued while disconnected
+        if self._outbox:
+            self._schedule_outbox_flush()
+        
         # Publish health status
         if self._config.enable_health:
             await self.publish_health(ok=True, event="ready")
@@ -473,7 +734,7 @@ class MQTTClient:
         This method:
         - Cancels dispatch and heartbeat tasks
         - Exits client context (closes connection)
-        - Resets connection state
+        - Resets connection state (reply topics are re-subscribed on connect)
         
         Safe to call when not connected (no-op).
         """
@@ -495,11 +756,38 @@ class MQTTClient:
             except (asyncio.CancelledError, asyncio.TimeoutError):
                 pass
         
+        if self._metrics_task:
+            self._metrics_task.cancel()
+            try:
+                await asyncio.wait_for(self._metrics_task, timeout=1.0)
+            except (asyncio.CancelledError, asyncio.TimeoutError):
+                pass
+            self._metrics_task = None
+        
+        if self._trace_task:
+            self._trace_task.cancel()
+            try:
+                await asyncio.wait_for(self._trace_task, timeout=1.0)
+            except (asyncio.CancelledError, asyncio.TimeoutError):
+                pass
+            self._trace_task = None
+            await self._export_spans()
+        
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await asyncio.wait_for(self._flush_task, timeout=1.0)
+            except (asyncio.CancelledError, asyncio.TimeoutError):
+                pass
+            self._flush_task = None
+        
         # Close MQTT connection
         if self._client:
             await self._client.__aexit__(None, None, None)
             self._client = None
         
+        # The broker session is gone with the connection
+        self._subscriptions.clear()
         self._connected = False
         logger.info("Disconnected from MQTT broker")
 
@@ -542,9 +830,14 @@ class MQTTClient:
         correlation_id: Optional[str] = None,
         qos: int = 0,
         retain: bool = False,
+        expiry: Optional[float] = None,
     ) -> str:
         """Publish event wrapped in Envelope to MQTT topic.
         
+        With the outbox enabled, QoS>=1 events published while disconnected
+        are queued and flushed in order after reconnect instead of raising.
+        The current trace context (if any) is attached to the envelope.
+        
         Args:
             topic: MQTT topic to publish to
             event_type: Event type identifier (e.g., "stt.final", "llm.response")
@@ -552,12 +845,15 @@ class MQTTClient:
             correlation_id: Optional correlation ID for request tracing
             qos: MQTT QoS level (0, 1, or 2)
             retain: Whether to retain message on broker
+            expiry: Seconds a queued copy stays valid in the outbox
+                (None=outbox_ttl, 0=never expires)
         
         Returns:
             Envelope ID (serves as message ID for tracking)
         
         Raises:
-            RuntimeError: If not connected to broker
+            RuntimeError: If not connected to broker and the event cannot be
+                queued (outbox disabled, QoS 0, or outbox full)
         
         Example:
             msg_id = await client.publish_event(
@@ -568,11 +864,9 @@ class MQTTClient:
                 qos=1,
             )
         """
-        if not self._connected:
+        if not self._connected and not self._can_queue(qos):
             raise RuntimeError("Cannot publish: not connected to MQTT broker")
         
-        assert self._client is not None, "Client must be set when connected"
-        
         # Convert Pydantic model to dict if needed
         if isinstance(data, BaseModel):
             data = data.model_dump()
@@ -583,13 +877,14 @@ class MQTTClient:
             data=data,
             source=self._source_name,
             correlate=correlation_id,
+            trace=current_trace(),
         )
         
         # Serialize with orjson
         payload = orjson.dumps(envelope.model_dump())
         
-        # Publish to broker
-        await self._client.publish(topic, payload, qos=qos, retain=retain)
+        # Publish to broker (or queue while disconnected)
+        await self._send(topic, payload, qos=qos, retain=retain, expiry=expiry)
         
         logger.debug(
             "Published event: topic=%s type=%s envelope_id=%s correlation_id=%s qos=%d retain=%s",
@@ -645,6 +940,377 @@ class MQTTClient:
         
         logger.info("Published health: ok=%s event=%s error=%s", ok, event, err)
 
+    async def publish_binary(
+        self,
+        topic: str,
+        event_type: str,
+        payload: bytes,
+        *,
+        content_type: str = CONTENT_TYPE_OCTET_STREAM,
+        correlation_id: Optional[str] = None,
+        qos: int = 0,
+        retain: bool = False,
+        expiry: Optional[float] = None,
+    ) -> str:
+        """Publish raw bytes wrapped in a BinaryEnvelope.
+        
+        Use for high-rate payloads (camera frames, FFT, audio) where the
+        JSON Envelope would add base64/float-list overhead.
+        
+        Args:
+            topic: MQTT topic to publish to
+            event_type: Event type identifier (e.g., "camera.frame")
+            payload: Raw payload bytes (sent without re-encoding)
+            content_type: MIME-style content type, parameters allowed
+                (e.g., "image/jpeg;w=640;h=480")
+            correlation_id: Optional correlation ID for request tracing
+            qos: MQTT QoS level (0, 1, or 2)
+            retain: Whether to retain message on broker
+            expiry: Seconds a queued copy stays valid in the outbox
+                (None=outbox_ttl, 0=never expires)
+        
+        Returns:
+            Envelope ID (serves as message ID for tracking)
+        
+        Raises:
+            RuntimeError: If not connected to broker and the frame cannot be
+                queued
+            ValueError: If a header field exceeds 255 bytes
+        
+        Example:
+            await client.publish_binary(
+                topic="camera/frame",
+                event_type="camera.frame",
+                payload=jpeg_bytes,
+                content_type="image/jpeg;w=640;h=480",
+            )
+        """
+        if not self._connected and not self._can_queue(qos):
+            raise RuntimeError("Cannot publish: not connected to MQTT broker")
+        
+        envelope = BinaryEnvelope.new(
+            event_type=event_type,
+            payload=payload,
+            content_type=content_type,
+            correlate=correlation_id,
+        )
+        frame = envelope.encode()
+        await self._send(topic, frame, qos=qos, retain=retain, expiry=expiry)
+        
+        logger.debug(
+            "Published binary: topic=%s type=%s envelope_id=%s content_type=%s size=%d",
+            topic,
+            event_type,
+            envelope.id,
+            content_type,
+            len(payload),
+        )
+        
+        return envelope.id
+
+    async def publish(
+        self,
+        topic: str,
+        payload: bytes,
+        qos: int = 0,
+        retain: bool = False,
+        *,
+        expiry: Optional[float] = None,
+    ) -> None:
+        """Publish already-encoded bytes through the outbox-aware send path.
+
+        Satisfies the domain ``Publisher`` port, so ``Ctx``/``Dispatcher``
+        publishes get the same queue-while-disconnected behaviour as
+        ``publish_event``. Unlike publishing on ``client`` directly, this
+        keeps working across reconnects of the same ``MQTTClient``.
+
+        Args:
+            topic: MQTT topic to publish to
+            payload: Encoded payload bytes
+            qos: MQTT QoS level (0, 1, or 2)
+            retain: Whether to retain message on broker
+            expiry: Seconds a queued copy stays valid in the outbox
+                (None=outbox_ttl, 0=never expires)
+
+        Raises:
+            RuntimeError: If not connected to broker and the message cannot
+                be queued
+        """
+        await self._send(topic, payload, qos=qos, retain=retain, expiry=expiry)
+
+    def _can_queue(self, qos: int) -> bool:
+        return self._outbox is not None and qos >= 1
+
+    async def _send(
+        self,
+        topic: str,
+        payload: bytes,
+        *,
+        qos: int,
+        retain: bool,
+        expiry: Optional[float],
+    ) -> None:
+        """Publish an encoded payload, routing through the outbox when needed.
+        
+        While the outbox holds entries, new QoS>=1 publishes queue behind them
+        so the broker sees them in publish order.
+        """
+        if self._can_queue(qos) and (not self._connected or self._outbox):
+            self._enqueue(topic, payload, qos=qos, retain=retain, expiry=expiry)
+            return
+        
+        if not self._connected or self._client is None:
+            raise RuntimeError("Cannot publish: not connected to MQTT broker")
+        
+        try:
+            await self._client.publish(topic, payload, qos=qos, retain=retain)
+        except mqtt.MqttError as e:
+            if not self._can_queue(qos):
+                raise
+            logger.warning("Publish to %s failed (%s); queued in outbox", topic, e)
+            self._enqueue(topic, payload, qos=qos, retain=retain, expiry=expiry)
+            return
+        self.metrics.record_published(topic, len(payload))
+
+    def _enqueue(
+        self,
+        topic: str,
+        payload: bytes,
+        *,
+        qos: int,
+        retain: bool,
+        expiry: Optional[float],
+    ) -> None:
+        assert self._outbox is not None
+        ttl = self._config.outbox_ttl if expiry is None else expiry
+        entry = OutboxEntry(
+            topic=topic,
+            payload=payload,
+            qos=qos,
+            retain=retain,
+            expires_at=time.time() + ttl if ttl > 0 else None,
+        )
+        if not self._outbox.put(entry):
+            self.metrics.record_dropped(topic)
+            raise RuntimeError("Cannot publish: not connected to MQTT broker and outbox is full")
+        if self._connected:
+            self._schedule_outbox_flush()
+
+    def _schedule_outbox_flush(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_outbox())
+
+    async def _flush_outbox(self) -> None:
+        """Background task replaying queued publishes in order.
+        
+        Expired entries are skipped. On a publish failure or cancellation
+        (disconnect) the entry goes back to the head of the queue and flushing
+        stops until the next connect.
+        """
+        assert self._outbox is not None
+        flushed = 0
+        expired_before = self._outbox.expired
+        try:
+            while self._connected and self._client is not None:
+                entry = self._outbox.pop()
+                if entry is None:
+                    break
+                try:
+                    await self._client.publish(
+                        entry.topic, entry.payload, qos=entry.qos, retain=entry.retain
+                    )
+                except Exception as e:
+                    self._outbox.push_front(entry)
+                    logger.warning("Outbox flush interrupted (%d pending): %s", len(self._outbox), e)
+                    break
+                except BaseException:
+                    self._outbox.push_front(entry)
+                    raise
+                self.metrics.record_published(entry.topic, len(entry.payload))
+                flushed += 1
+        finally:
+            expired = self._outbox.expired - expired_before
+            if flushed or expired:
+                logger.info("Outbox flushed %d publishes (%d expired)", flushed, expired)
+
+    # --- Request/Response Methods ---
+
+    async def request(
+        self,
+        topic: str,
+        event_type: str,
+        data: dict[str, Any] | BaseModel,
+        *,
+        reply_topic: str,
+        timeout: float = 5.0,
+        qos: int = 1,
+        correlation_id: Optional[str] = None,
+        coalesce: bool = True,
+        cache_ttl: float = 0.0,
+    ) -> Envelope:
+        """Publish a request and await the correlated reply envelope.
+        
+        The request is published as an Envelope whose id is the correlation
+        ID; responders reply on ``reply_topic`` reusing that id (the existing
+        ``correlate`` convention). Replies are routed to the waiting caller
+        before any handler subscribed to ``reply_topic`` runs, so both can
+        coexist.
+        
+        Identical concurrent requests (same topic, event type and payload)
+        share one in-flight request when ``coalesce`` is True. A caller that
+        joins an in-flight request receives the reply to the first caller's
+        correlation ID. Cancelling one caller does not affect the others; the
+        request is abandoned once every caller has been cancelled.
+        
+        Args:
+            topic: MQTT topic to publish the request to
+            event_type: Event type identifier (e.g., "memory.query")
+            data: Request data (dict or Pydantic model)
+            reply_topic: Topic the responder publishes replies on
+            timeout: Seconds to wait for the reply
+            qos: MQTT QoS level for the request
+            correlation_id: Optional correlation ID (generated when omitted)
+            coalesce: Share identical in-flight requests
+            cache_ttl: Cache replies for this many seconds (0 disables)
+        
+        Returns:
+            Reply envelope
+        
+        Raises:
+            RuntimeError: If not connected to broker
+            asyncio.TimeoutError: If no reply arrives within timeout
+        
+        Example:
+            reply = await client.request(
+                "memory/query",
+                "memory.query",
+                {"text": "favourite colour", "top_k": 3},
+                reply_topic="memory/results",
+                cache_ttl=30.0,
+            )
+            results = reply.data["results"]
+        """
+        if not self._connected:
+            raise RuntimeError("Cannot send request: not connected to MQTT broker")
+        
+        key = request_key(topic, event_type, data) if coalesce or cache_ttl > 0 else ""
+        if cache_ttl > 0:
+            cached = self._reply_cache.get(key)
+            if cached is not None:
+                logger.debug("Request cache hit: topic=%s type=%s", topic, event_type)
+                return cached
+        
+        inflight = self._inflight_requests.get(key) if coalesce else None
+        if inflight is None:
+            inflight = _InflightRequest(future=asyncio.get_running_loop().create_future())
+            if coalesce:
+                self._inflight_requests[key] = inflight
+            inflight.task = asyncio.create_task(
+                self._run_request(
+                    key,
+                    inflight,
+                    topic=topic,
+                    event_type=event_type,
+                    data=data,
+                    reply_topic=reply_topic,
+                    timeout=timeout,
+                    qos=qos,
+                    correlation_id=correlation_id or uuid.uuid4().hex,
+                    cache_ttl=cache_ttl,
+                )
+            )
+        else:
+            logger.debug("Coalesced request: topic=%s type=%s", topic, event_type)
+        
+        inflight.waiters += 1
+        try:
+            return await asyncio.shield(inflight.future)
+        finally:
+            inflight.waiters -= 1
+            if inflight.waiters == 0 and not inflight.future.done() and inflight.task:
+                # Every caller gave up: stop waiting for the reply
+                inflight.task.cancel()
+
+    def clear_request_cache(self) -> None:
+        """Drop all cached request replies."""
+        self._reply_cache.clear()
+
+    async def _run_request(
+        self,
+        key: str,
+        inflight: _InflightRequest,
+        *,
+        topic: str,
+        event_type: str,
+        data: dict[str, Any] | BaseModel,
+        reply_topic: str,
+        timeout: float,
+        qos: int,
+        correlation_id: str,
+        cache_ttl: float,
+    ) -> None:
+        """Publish one request and resolve the shared future with its reply."""
+        reply_future: asyncio.Future[Envelope] = asyncio.get_running_loop().create_future()
+        self._pending_replies[correlation_id] = reply_future
+        try:
+            # Subscribe before publishing so a fast reply cannot be missed
+            await self._ensure_reply_subscription(reply_topic)
+            await self.publish_event(
+                topic, event_type, data, correlation_id=correlation_id, qos=qos
+            )
+            reply = await asyncio.wait_for(reply_future, timeout=timeout)
+            if cache_ttl > 0:
+                self._reply_cache.put(key, reply, cache_ttl)
+            inflight.future.set_result(reply)
+        except asyncio.CancelledError:
+            inflight.future.cancel()
+            raise
+        except Exception as e:
+            if isinstance(e, asyncio.TimeoutError):
+                logger.warning(
+                    "Request timed out: topic=%s correlation_id=%s timeout=%.1fs",
+                    topic,
+                    correlation_id,
+                    timeout,
+                )
+            inflight.future.set_exception(e)
+        finally:
+            self._pending_replies.pop(correlation_id, None)
+            if self._inflight_requests.get(key) is inflight:
+                del self._inflight_requests[key]
+
+    async def _ensure_reply_subscription(self, reply_topic: str) -> None:
+        """Subscribe to a reply topic once; existing handlers stay in place."""
+        if reply_topic in self._reply_topics:
+            return
+        self._reply_topics.add(reply_topic)
+        if reply_topic in self._subscriptions:
+            return
+        assert self._client is not None, "Client must be set when connected"
+        self._subscriptions.add(reply_topic)
+        await self._client.subscribe(reply_topic, qos=1)
+        logger.info("Subscribed to reply topic: %s", reply_topic)
+
+    def _is_reply_topic(self, topic: str) -> bool:
+        return any(
+            topic == pattern or self._topic_matches(topic, pattern)
+            for pattern in self._reply_topics
+        )
+
+    def _resolve_reply(self, payload: bytes) -> None:
+        """Complete the pending request whose correlation ID matches the reply."""
+        try:
+            reply_id = orjson.loads(payload).get("id")
+        except (orjson.JSONDecodeError, AttributeError):
+            return
+        future = self._pending_replies.get(reply_id) if isinstance(reply_id, str) else None
+        if future is None or future.done():
+            return
+        try:
+            future.set_result(Envelope.model_validate_json(payload))
+        except ValueError as e:
+            future.set_exception(e)
+
     # --- Subscription Methods ---
 
     async def subscribe(
@@ -652,16 +1318,22 @@ class MQTTClient:
         topic: str,
         handler: SubscriptionHandler,
         qos: int = 0,
+        *,
+        share_group: Optional[str] = None,
     ) -> None:
         """Subscribe to MQTT topic with message handler.
         
         Args:
-            topic: MQTT topic pattern (supports wildcards: + for single level, # for multi-level)
+            topic: MQTT topic pattern (supports wildcards: + for single level, # for multi-level).
+                A ``$share/<group>/<topic>`` filter is also accepted.
             handler: Async function to handle received messages (payload: bytes) -> None
             qos: MQTT QoS level for subscription (0, 1, or 2)
+            share_group: Optional shared-subscription group. Replicas subscribing
+                with the same group are load-balanced by the broker.
         
         Raises:
             RuntimeError: If not connected to broker
+            ValueError: If share_group is not a valid group name
         
         Example:
             async def handle_event(payload: bytes) -> None:
@@ -669,20 +1341,62 @@ class MQTTClient:
                 print(f"Received: {envelope.type}")
             
             await client.subscribe("events/#", handle_event, qos=1)
+            await client.subscribe("llm/request", handle_request, share_group="llm-workers")
         """
         if not self._connected:
             raise RuntimeError("Cannot subscribe: not connected to MQTT broker")
         
         assert self._client is not None, "Client must be set when connected"
         
-        # Register handler
-        self._handlers[topic] = handler
-        self._subscriptions.add(topic)
+        embedded_group, plain_topic = split_shared_topic(topic)
+        broker_filter = shared_topic(plain_topic, share_group or embedded_group)
+        
+        # Register handler against the plain topic: shared deliveries carry it
+        self._handlers[plain_topic] = handler
+        self._subscriptions.add(broker_filter)
         
         # Subscribe to broker
-        await self._client.subscribe(topic, qos=qos)
+        await self._client.subscribe(broker_filter, qos=qos)
+        
+        logger.info("Subscribed to topic: %s (qos=%d)", broker_filter, qos)
+
+    async def subscribe_binary(
+        self,
+        topic: str,
+        handler: BinarySubscriptionHandler,
+        qos: int = 0,
+        *,
+        share_group: Optional[str] = None,
+    ) -> None:
+        """Subscribe to MQTT topic carrying BinaryEnvelope frames.
+        
+        Frames are decoded before the handler runs; payloads that are not
+        binary envelopes (e.g. legacy JSON publishers) are logged and skipped.
+        
+        Args:
+            topic: MQTT topic pattern (wildcards supported)
+            handler: Async function receiving the decoded BinaryEnvelope
+            qos: MQTT QoS level for subscription (0, 1, or 2)
+            share_group: Optional shared-subscription group (see subscribe)
+        
+        Raises:
+            RuntimeError: If not connected to broker
         
-        logger.info("Subscribed to topic: %s (qos=%d)", topic, qos)
+        Example:
+            async def handle_frame(frame: BinaryEnvelope) -> None:
+                print(frame.media_type, len(frame.payload))
+            
+            await client.subscribe_binary("camera/frame", handle_frame)
+        """
+        async def _decode_and_dispatch(payload: bytes) -> None:
+            try:
+                envelope = BinaryEnvelope.decode(payload)
+            except ValueError as e:
+                logger.warning("Dropping non-binary frame on topic %s: %s", topic, e)
+                return
+            await handler(envelope)
+
+        await self.subscribe(topic, _decode_and_dispatch, qos=qos, share_group=share_group)
 
     async def _dispatch_messages(self) -> None:
         """Background task to dispatch messages to handlers.
@@ -720,6 +1434,11 @@ class MQTTClient:
                         logger.debug("Skipping duplicate message on topic: %s", topic_value)
                         continue
                     
+                    # Route replies to pending request() callers first
+                    is_reply = bool(self._reply_topics) and self._is_reply_topic(topic_value)
+                    if is_reply and self._pending_replies:
+                        self._resolve_reply(payload_bytes)
+                    
                     # Find matching handler
                     handler = self._handlers.get(topic_value)
                     if not handler:
@@ -729,17 +1448,25 @@ class MQTTClient:
                                 handler = h
                                 break
                     
+                    self.metrics.record_received(topic_value)
                     if handler:
+                        started = time.monotonic()
                         try:
-                            await handler(payload_bytes)
+                            with use_trace(trace_from_payload(payload_bytes)):
+                                await handler(payload_bytes)
                         except Exception as e:
+                            self.metrics.observe_handler(
+                                topic_value, time.monotonic() - started, ok=False
+                            )
                             logger.error(
                                 "Error in message handler for topic %s: %s",
                                 topic_value,
                                 e,
                                 exc_info=True,
                             )
-                    else:
+                        else:
+                            self.metrics.observe_handler(topic_value, time.monotonic() - started)
+                    elif not is_reply:
                         logger.warning("No handler for topic: %s", topic_value)
         
         except asyncio.CancelledError:
@@ -805,6 +1532,50 @@ class MQTTClient:
             logger.debug("Heartbeat task cancelled")
             raise
 
+    async def _metrics_loop(self) -> None:
+        """Background task publishing metrics snapshots.
+        
+        Publishes to system/metrics/{client_id} every metrics_interval seconds
+        (QoS 0, not retained).
+        """
+        topic = f"system/metrics/{self._config.client_id}"
+        try:
+            while not self._shutdown:
+                await asyncio.sleep(self._config.metrics_interval)
+                if not self._connected:
+                    continue
+                try:
+                    await self.publish_event(topic, "system.metrics", self.metrics_snapshot(), qos=0)
+                except Exception as e:
+                    logger.warning("Metrics publish error: %s", e)
+        except asyncio.CancelledError:
+            logger.debug("Metrics task cancelled")
+            raise
+
+    async def _trace_loop(self) -> None:
+        """Background task exporting finished spans in batches (QoS 0)."""
+        try:
+            while not self._shutdown:
+                await asyncio.sleep(self._trace_export_interval)
+                if self._connected:
+                    await self._export_spans()
+        except asyncio.CancelledError:
+            logger.debug("Trace export task cancelled")
+            raise
+
+    async def _export_spans(self) -> None:
+        if self._tracer is None or not self._connected:
+            return
+        batch = self._tracer.batch()
+        if batch is None:
+            return
+        try:
+            # Export envelopes are not part of any turn.
+            with use_trace(None):
+                await self.publish_event(self._tracer.topic, EVENT_TYPE_TRACE_SPANS, batch, qos=0)
+        except Exception as e:
+            logger.warning("Trace export error: %s", e)
+
     @staticmethod
     def _topic_matches(topic: str, pattern: str) -> bool:
         """Check if topic matches MQTT wildcard pattern.
@@ -0,0 +1,375 @@
+"""In-process MQTT broker for multi-service tests and benchmarks.
+
+``LoopbackBroker`` routes publishes between ``LoopbackClient`` instances in
+the same event loop. Clients expose the subset of the ``asyncio_mqtt.Client``
+API that py-tars uses (``publish``, ``subscribe``, ``unsubscribe``,
+``messages``, ``filtered_messages``, async context manager), so they plug in
+behind ``MQTTClient`` (via ``client_factory=broker.client``),
+``AsyncioMQTTPublisher`` and ``AsyncioMQTTSubscriber`` unchanged.
+
+Semantics follow the parts of MQTT 3.1.1 the services rely on:
+
+- ``+``/``#`` wildcard filters and ``$share/<group>/`` shared subscriptions
+  (round-robin within a group)
+- retained messages (empty payload clears; replayed on subscribe)
+- QoS 0/1 (QoS 2 is treated as 1): delivery QoS is min(publish,
+  subscription); injected loss drops QoS 0 deliveries, while a lost QoS 1
+  attempt is redelivered one latency period later
+- per-client in-order delivery, including under injected latency/jitter
+
+Randomness comes from a seeded ``random.Random`` so latency/loss runs are
+reproducible.
+
+Example:
+    broker = LoopbackBroker(latency=0.002, seed=7)
+    router = MQTTClient("mqtt://loopback", "router", client_factory=broker.client)
+    tts = MQTTClient("mqtt://loopback", "tts", client_factory=broker.client)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import random
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import asyncio_mqtt as mqtt
+
+from tars.adapters.mqtt_client import split_shared_topic
+
+logger = logging.getLogger(__name__)
+
+
+def _to_bytes(payload: Any) -> bytes:
+    if payload is None:
+        return b""
+    if isinstance(payload, bytes):
+        return payload
+    if isinstance(payload, bytearray):
+        return bytes(payload)
+    if isinstance(payload, str):
+        return payload.encode("utf-8")
+    if isinstance(payload, (int, float)):
+        return str(payload).encode("ascii")
+    raise TypeError(f"Unsupported payload type {type(payload).__name__}")
+
+
+def topic_matches(topic: str, topic_filter: str) -> bool:
+    """Match a concrete topic against an MQTT filter (``$share/`` prefix allowed)."""
+    _, plain = split_shared_topic(topic_filter)
+    return mqtt.Topic(topic).matches(plain)
+
+
+@dataclass(slots=True)
+class _Subscription:
+    topic_filter: str
+    qos: int
+    group: Optional[str] = None
+
+
+@dataclass(slots=True)
+class BrokerStats:
+    """Counters for a LoopbackBroker run."""
+
+    published: int = 0
+    delivered: int = 0
+    lost: int = 0
+    redelivered: int = 0
+
+
+class LoopbackBroker:
+    """In-memory MQTT broker shared by LoopbackClients in one event loop.
+
+    Args:
+        latency: Fixed delivery delay in seconds
+        jitter: Extra uniform random delay in [0, jitter) seconds
+        loss: Probability that a delivery attempt is lost
+        seed: Seed for the jitter/loss RNG (None = nondeterministic)
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        loss: float = 0.0,
+        seed: Optional[int] = None,
+    ) -> None:
+        if latency < 0 or jitter < 0:
+            raise ValueError("latency and jitter must be >= 0")
+        if not 0.0 <= loss < 1.0:
+            raise ValueError("loss must be in [0, 1)")
+        self.latency = latency
+        self.jitter = jitter
+        self.loss = loss
+        self.stats = BrokerStats()
+        self._rng = random.Random(seed)
+        self._clients: dict[str, LoopbackClient] = {}
+        self._retained: dict[str, mqtt.Message] = {}
+        self._share_cursor: dict[tuple[str, str], int] = {}
+        self._mids = itertools.count(1)
+        self._anon = itertools.count(1)
+
+    def client(self, *, client_id: str = "", **_connection: Any) -> LoopbackClient:
+        """Create a client; accepts (and ignores) ``asyncio_mqtt.Client`` connection kwargs."""
+        return LoopbackClient(self, client_id or f"loopback-{next(self._anon)}")
+
+    @property
+    def retained(self) -> dict[str, bytes]:
+        return {topic: message.payload for topic, message in self._retained.items()}
+
+    def disconnect(self, client_id: str) -> None:
+        """Simulate a dropped connection for ``client_id``."""
+        client = self._clients.get(client_id)
+        if client is not None:
+            client._on_connection_lost()
+
+    # --- Client hooks ---
+
+    def _attach(self, client: LoopbackClient) -> None:
+        previous = self._clients.get(client.id)
+        if previous is not None and previous is not client:
+            # Like a real broker: a second session with the same id kicks the first.
+            previous._on_connection_lost()
+        self._clients[client.id] = client
+
+    def _detach(self, client: LoopbackClient) -> None:
+        if self._clients.get(client.id) is client:
+            del self._clients[client.id]
+
+    def _replay_retained(self, client: LoopbackClient, sub: _Subscription) -> None:
+        if sub.group is not None:
+            return  # shared subscriptions don't receive retained messages
+        for topic, message in self._retained.items():
+            if topic_matches(topic, sub.topic_filter):
+                self._schedule(client, topic, message.payload, min(message.qos, sub.qos), True)
+
+    def _route(self, topic: str, payload: bytes, qos: int, retain: bool) -> None:
+        self.stats.published += 1
+        if retain:
+            if payload:
+                self._retained[topic] = mqtt.Message(topic, payload, qos, True, 0, None)
+            else:
+                self._retained.pop(topic, None)
+
+        groups: dict[tuple[str, str], list[tuple[LoopbackClient, _Subscription]]] = {}
+        for client in list(self._clients.values()):
+            best: Optional[int] = None
+            for sub in client._subscriptions.values():
+                if not topic_matches(topic, sub.topic_filter):
+                    continue
+                if sub.group is not None:
+                    groups.setdefault((sub.group, sub.topic_filter), []).append((client, sub))
+                elif best is None or sub.qos > best:
+                    best = sub.qos
+            if best is not None:
+                self._schedule(client, topic, payload, min(qos, best), False)
+
+        for key, members in groups.items():
+            cursor = self._share_cursor.get(key, 0)
+            client, sub = members[cursor % len(members)]
+            self._share_cursor[key] = cursor + 1
+            self._schedule(client, topic, payload, min(qos, sub.qos), False)
+
+    def _schedule(self, client: LoopbackClient, topic: str, payload: bytes, qos: int, retain: bool) -> None:
+        delay = self._delay()
+        while self.loss and self._rng.random() < self.loss:
+            if qos == 0:
+                self.stats.lost += 1
+                return
+            self.stats.redelivered += 1
+            delay += self._delay()
+        message = mqtt.Message(topic, payload, qos, retain, next(self._mids), None)
+        client._enqueue(message, delay)
+
+    def _delay(self) -> float:
+        return self.latency + (self._rng.random() * self.jitter if self.jitter else 0.0)
+
+
+class LoopbackClient:
+    """Stand-in for ``asyncio_mqtt.Client`` connected to a LoopbackBroker."""
+
+    def __init__(self, broker: LoopbackBroker, client_id: str) -> None:
+        self._broker = broker
+        self.id = client_id
+        self._subscriptions: dict[str, _Subscription] = {}
+        self._message_queues: list[asyncio.Queue[mqtt.Message]] = []
+        self._filtered_queues: list[tuple[str, asyncio.Queue[mqtt.Message]]] = []
+        self._unfiltered_queue: Optional[asyncio.Queue[mqtt.Message]] = None
+        self._connected = False
+        self._disconnected: asyncio.Future[None] | None = None
+        self._pending: deque[tuple[float, mqtt.Message]] = deque()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    # --- Lifecycle ---
+
+    async def connect(self, *, timeout: int = 10) -> None:
+        self._disconnected = asyncio.get_running_loop().create_future()
+        self._connected = True
+        self._broker._attach(self)
+
+    async def disconnect(self, *, timeout: int = 10) -> None:
+        if not self._connected:
+            return
+        self._connected = False
+        self._cancel_pending()
+        self._subscriptions.clear()
+        self._broker._detach(self)
+        if self._disconnected is not None and not self._disconnected.done():
+            self._disconnected.set_result(None)
+
+    async def __aenter__(self) -> LoopbackClient:
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        await self.disconnect()
+
+    def _on_connection_lost(self) -> None:
+        self._connected = False
+        self._cancel_pending()
+        self._subscriptions.clear()
+        self._broker._detach(self)
+        if self._disconnected is not None and not self._disconnected.done():
+            self._disconnected.set_result(None)
+
+    def _cancel_pending(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._pending.clear()
+
+    def _require_connected(self) -> None:
+        if not self._connected:
+            raise mqtt.MqttCodeError(4, "Could not publish/subscribe: not connected")
+
+    # --- Outgoing calls ---
+
+    async def publish(
+        self,
+        topic: str,
+        payload: Any = None,
+        qos: int = 0,
+        retain: bool = False,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        self._require_connected()
+        self._broker._route(str(topic), _to_bytes(payload), qos, retain)
+
+    async def subscribe(self, topic: str | list[tuple[str, int]], qos: int = 0, *args: Any, **kwargs: Any) -> None:
+        self._require_connected()
+        pairs = topic if isinstance(topic, list) else [(topic, qos)]
+        for topic_filter, sub_qos in pairs:
+            mqtt.Wildcard(split_shared_topic(topic_filter)[1])  # validate like the real client
+            group, _ = split_shared_topic(topic_filter)
+            sub = _Subscription(topic_filter=topic_filter, qos=min(sub_qos, 1), group=group)
+            self._subscriptions[topic_filter] = sub
+            self._broker._replay_retained(self, sub)
+
+    async def unsubscribe(self, topic: str | list[str], *args: Any, **kwargs: Any) -> None:
+        self._require_connected()
+        for topic_filter in topic if isinstance(topic, list) else [topic]:
+            self._subscriptions.pop(topic_filter, None)
+
+    # --- Incoming messages ---
+
+    @asynccontextmanager
+    async def messages(self, *, queue_maxsize: int = 0) -> AsyncIterator[AsyncGenerator[mqtt.Message, None]]:
+        queue: asyncio.Queue[mqtt.Message] = asyncio.Queue(maxsize=queue_maxsize)
+        self._message_queues.append(queue)
+        try:
+            yield self._generator(queue)
+        finally:
+            self._message_queues.remove(queue)
+
+    @asynccontextmanager
+    async def filtered_messages(
+        self, topic_filter: str, *, queue_maxsize: int = 0
+    ) -> AsyncIterator[AsyncGenerator[mqtt.Message, None]]:
+        queue: asyncio.Queue[mqtt.Message] = asyncio.Queue(maxsize=queue_maxsize)
+        entry = (topic_filter, queue)
+        self._filtered_queues.append(entry)
+        try:
+            yield self._generator(queue)
+        finally:
+            self._filtered_queues.remove(entry)
+
+    @asynccontextmanager
+    async def unfiltered_messages(
+        self, *, queue_maxsize: int = 0
+    ) -> AsyncIterator[AsyncGenerator[mqtt.Message, None]]:
+        if self._unfiltered_queue is not None:
+            raise RuntimeError("Only a single unfiltered_messages generator can be used at a time.")
+        queue: asyncio.Queue[mqtt.Message] = asyncio.Queue(maxsize=queue_maxsize)
+        self._unfiltered_queue = queue
+        try:
+            yield self._generator(queue)
+        finally:
+            self._unfiltered_queue = None
+
+    async def _generator(self, queue: asyncio.Queue[mqtt.Message]) -> AsyncGenerator[mqtt.Message, None]:
+        while True:
+            if self._disconnected is None:
+                raise mqtt.MqttError("Not connected")
+            get = asyncio.ensure_future(queue.get())
+            try:
+                done, _ = await asyncio.wait((get, self._disconnected), return_when=asyncio.FIRST_COMPLETED)
+            except asyncio.CancelledError:
+                get.cancel()
+                raise
+            if get in done:
+                yield get.result()
+            else:
+                get.cancel()
+                raise mqtt.MqttError("Disconnected during message iteration")
+
+    def _enqueue(self, message: mqtt.Message, delay: float) -> None:
+        if delay <= 0 and not self._pending:
+            self._dispatch(message)
+            return
+        loop = asyncio.get_running_loop()
+        # Never let jitter reorder deliveries to the same client.
+        due = loop.time() + delay
+        if self._pending:
+            due = max(due, self._pending[-1][0])
+        self._pending.append((due, message))
+        if self._timer is None:
+            self._timer = loop.call_at(self._pending[0][0], self._drain)
+
+    def _drain(self) -> None:
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        while self._pending and self._pending[0][0] <= now:
+            self._dispatch(self._pending.popleft()[1])
+        self._timer = loop.call_at(self._pending[0][0], self._drain) if self._pending else None
+
+    def _dispatch(self, message: mqtt.Message) -> None:
+        if not self._connected:
+            return
+        self._broker.stats.delivered += 1
+        topic = message.topic.value
+        matched = False
+        for topic_filter, queue in self._filtered_queues:
+            if topic_matches(topic, topic_filter):
+                matched = True
+                self._offer(queue, message)
+        if not matched and self._unfiltered_queue is not None:
+            self._offer(self._unfiltered_queue, message)
+        for queue in self._message_queues:
+            self._offer(queue, message)
+
+    @staticmethod
+    def _offer(queue: asyncio.Queue[mqtt.Message], message: mqtt.Message) -> None:
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            logger.warning("Loopback message queue is full. Discarding message on %s", message.topic)
+
+
+__all__ = ["BrokerStats", "LoopbackBroker", "LoopbackClient", "topic_matches"]
@@ -0,0 +1,166 @@
+"""Bounded outbox for QoS>=1 publishes made while the broker is unreachable.
+
+``MQTTClient`` queues encoded payloads here instead of raising when it is
+disconnected (or a publish fails mid-flight) and flushes them in order after
+the next successful ``connect()``. Each entry carries an absolute expiry so
+stale events (e.g. ``llm/stream`` deltas) are dropped instead of being
+replayed late.
+
+Entries live in memory up to ``max_entries``. When a ``spill_path`` is set,
+further entries are appended to a JSON-lines file and read back once memory
+drains; a spill file left behind by a previous process is replayed on start
+(expired entries are skipped). Expiry uses wall-clock time so it stays
+meaningful across restarts.
+"""
+
+from __future__ import annotations
+
+import base64
+import logging
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class OutboxEntry:
+    """One queued publish (already-encoded payload)."""
+
+    topic: str
+    payload: bytes
+    qos: int = 1
+    retain: bool = False
+    expires_at: Optional[float] = None
+
+    def expired(self, now: float) -> bool:
+        return self.expires_at is not None and self.expires_at <= now
+
+    def to_json(self) -> bytes:
+        return orjson.dumps(
+            {
+                "topic": self.topic,
+                "payload": base64.b64encode(self.payload).decode("ascii"),
+                "qos": self.qos,
+                "retain": self.retain,
+                "expires_at": self.expires_at,
+            }
+        )
+
+    @classmethod
+    def from_json(cls, line: bytes) -> OutboxEntry:
+        raw = orjson.loads(line)
+        return cls(
+            topic=raw["topic"],
+            payload=base64.b64decode(raw["payload"]),
+            qos=int(raw.get("qos", 1)),
+            retain=bool(raw.get("retain", False)),
+            expires_at=raw.get("expires_at"),
+        )
+
+
+class PublishOutbox:
+    """FIFO of pending publishes, bounded in memory with optional disk spill.
+
+    Ordering is preserved across the two tiers: once anything has spilled,
+    new entries go to disk behind it until memory has drained and the spill
+    file has been read back.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        spill_path: Optional[str | Path] = None,
+        max_spill_entries: int = 10_000,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self._max_entries = max_entries
+        self._max_spill_entries = max_spill_entries
+        self._memory: deque[OutboxEntry] = deque()
+        self._spill_path = Path(spill_path) if spill_path else None
+        self._spilled = 0
+        self.dropped = 0
+        self.expired = 0
+        if self._spill_path is not None and self._spill_path.exists():
+            with self._spill_path.open("rb") as fh:
+                self._spilled = sum(1 for line in fh if line.strip())
+            if self._spilled:
+                logger.info("Outbox: %d spilled publishes pending in %s", self._spilled, self._spill_path)
+
+    def __len__(self) -> int:
+        return len(self._memory) + self._spilled
+
+    def __bool__(self) -> bool:
+        return bool(self._memory) or self._spilled > 0
+
+    def put(self, entry: OutboxEntry) -> bool:
+        """Queue an entry; returns False when both tiers are full."""
+        if not self._spilled and len(self._memory) >= self._max_entries:
+            self._purge_expired()
+        if not self._spilled and len(self._memory) < self._max_entries:
+            self._memory.append(entry)
+            return True
+        if self._spill_path is not None and self._spilled < self._max_spill_entries:
+            self._spill_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._spill_path.open("ab") as fh:
+                fh.write(entry.to_json() + b"\n")
+            self._spilled += 1
+            return True
+        self.dropped += 1
+        return False
+
+    def pop(self) -> Optional[OutboxEntry]:
+        """Return the oldest unexpired entry, or None when empty."""
+        now = time.time()
+        while True:
+            if not self._memory and self._spilled:
+                self._load_spill()
+            if not self._memory:
+                return None
+            entry = self._memory.popleft()
+            if entry.expired(now):
+                self.expired += 1
+                continue
+            return entry
+
+    def push_front(self, entry: OutboxEntry) -> None:
+        """Return an entry whose publish failed to the head of the queue."""
+        self._memory.appendleft(entry)
+
+    def _purge_expired(self) -> None:
+        now = time.time()
+        before = len(self._memory)
+        self._memory = deque(e for e in self._memory if not e.expired(now))
+        self.expired += before - len(self._memory)
+
+    def _load_spill(self) -> None:
+        """Move up to max_entries spilled entries back into memory."""
+        assert self._spill_path is not None
+        try:
+            lines = [line for line in self._spill_path.read_bytes().splitlines() if line.strip()]
+        except FileNotFoundError:
+            lines = []
+        head, rest = lines[: self._max_entries], lines[self._max_entries :]
+        for line in head:
+            try:
+                self._memory.append(OutboxEntry.from_json(line))
+            except (ValueError, KeyError) as exc:
+                logger.warning("Outbox: skipping corrupt spill record: %s", exc)
+        if rest:
+            tmp = self._spill_path.with_suffix(self._spill_path.suffix + ".tmp")
+            tmp.write_bytes(b"\n".join(rest) + b"\n")
+            os.replace(tmp, self._spill_path)
+        else:
+            self._spill_path.unlink(missing_ok=True)
+        self._spilled = len(rest)
+
+
+__all__ = ["OutboxEntry", "PublishOutbox"]
@@ -0,0 +1,383 @@
+"""Record MQTT traffic to an indexed file and replay it with original timing.
+
+File layout (little endian)::
+
+    <path>      b"TARSREC1" then records:
+                f64 ts | u16 topic_len | u32 payload_len | topic | payload
+    <path>.idx  b"TARSIDX1" | u32 index_every, then one (f64 ts, u64 offset)
+                entry every ``index_every`` records
+
+The data file is append-only; a torn final record (crash mid-write) is
+ignored on read. The sparse index lets readers seek to a start time without
+scanning, and is rebuilt from the data file when missing or stale.
+
+``record`` captures from any asyncio_mqtt-compatible client (including
+``LoopbackClient``); ``replay`` publishes through any object with an
+``asyncio_mqtt.Client``-style ``publish`` at real, scaled or max speed, with
+topic filters and optional envelope-id remapping so a replayed session does
+not collide with (or get deduplicated against) the original one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import struct
+import time
+import uuid
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Protocol
+
+import orjson
+
+from tars.adapters.mqtt_loopback import topic_matches
+from tars.contracts.binary import BinaryEnvelope
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"TARSREC1"
+INDEX_MAGIC = b"TARSIDX1"
+_RECORD_HEADER = struct.Struct("<dHI")
+_INDEX_HEADER = struct.Struct("<I")
+_INDEX_ENTRY = struct.Struct("<dQ")
+
+# Envelope/data fields whose ids are remapped together so correlation survives.
+REMAP_FIELDS = ("id", "message_id", "request_id", "utt_id")
+
+
+@dataclass(slots=True, frozen=True)
+class RecordedMessage:
+    ts: float
+    topic: str
+    payload: bytes
+
+
+def _index_path(path: Path) -> Path:
+    return path.with_name(path.name + ".idx")
+
+
+class RecordingWriter:
+    """Append-only writer for recording files."""
+
+    def __init__(self, path: str | Path, *, index_every: int = 64) -> None:
+        if index_every < 1:
+            raise ValueError("index_every must be >= 1")
+        self.path = Path(path)
+        self._index_every = index_every
+        self._count = 0
+        if self.path.exists() and self.path.stat().st_size > 0:
+            # Resume: drop a torn tail, then rebuild the index so entries line
+            # up with index_every before appending.
+            reader = RecordingReader(self.path, index_every=index_every)
+            self._count = reader.count
+            with self.path.open("r+b") as fh:
+                fh.truncate(reader.end_offset)
+            reader.rebuild_index(index_every=index_every)
+        self._data = self.path.open("ab")
+        if self._data.tell() == 0:
+            self._data.write(MAGIC)
+        index_path = _index_path(self.path)
+        self._index = index_path.open("ab")
+        if self._index.tell() == 0:
+            self._index.write(INDEX_MAGIC + _INDEX_HEADER.pack(index_every))
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def append(self, topic: str, payload: bytes, ts: Optional[float] = None) -> None:
+        ts = time.time() if ts is None else ts
+        topic_bytes = topic.encode("utf-8")
+        offset = self._data.tell()
+        self._data.write(_RECORD_HEADER.pack(ts, len(topic_bytes), len(payload)))
+        self._data.write(topic_bytes)
+        self._data.write(payload)
+        if self._count % self._index_every == 0:
+            self._index.write(_INDEX_ENTRY.pack(ts, offset))
+        self._count += 1
+
+    def flush(self) -> None:
+        self._data.flush()
+        self._index.flush()
+
+    def close(self) -> None:
+        self.flush()
+        self._data.close()
+        self._index.close()
+
+    def __enter__(self) -> RecordingWriter:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class RecordingReader:
+    """Reader with index-assisted seeking by timestamp.
+
+    ``index_every`` only applies when the index has to be rebuilt; an existing
+    index keeps the spacing it was written with.
+    """
+
+    def __init__(self, path: str | Path, *, index_every: int = 64) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as fh:
+            if fh.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{self.path} is not a tars recording")
+        self._index_every = index_every
+        self._index: list[tuple[float, int]] = self._load_index()
+        self.count, self.end_offset = self._scan_tail()
+
+    def _load_index(self) -> list[tuple[float, int]]:
+        index_path = _index_path(self.path)
+        try:
+            raw = index_path.read_bytes()
+        except FileNotFoundError:
+            return self.rebuild_index()
+        header_end = len(INDEX_MAGIC) + _INDEX_HEADER.size
+        if not raw.startswith(INDEX_MAGIC) or len(raw) < header_end:
+            return self.rebuild_index()
+        (self._index_every,) = _INDEX_HEADER.unpack_from(raw, len(INDEX_MAGIC))
+        body = raw[header_end:]
+        usable = len(body) - len(body) % _INDEX_ENTRY.size
+        entries = [_INDEX_ENTRY.unpack_from(body, pos) for pos in range(0, usable, _INDEX_ENTRY.size)]
+        return [(ts, offset) for ts, offset in entries]
+
+    def rebuild_index(self, *, index_every: Optional[int] = None) -> list[tuple[float, int]]:
+        """Rewrite ``<path>.idx`` from the data file."""
+        if index_every is not None:
+            self._index_every = index_every
+        entries: list[tuple[float, int]] = []
+        for n, (offset, message) in enumerate(self._records(len(MAGIC))):
+            if n % self._index_every == 0:
+                entries.append((message.ts, offset))
+        index_path = _index_path(self.path)
+        header = INDEX_MAGIC + _INDEX_HEADER.pack(self._index_every)
+        index_path.write_bytes(header + b"".join(_INDEX_ENTRY.pack(*e) for e in entries))
+        self._index = entries
+        return entries
+
+    def _scan_tail(self) -> tuple[int, int]:
+        """Count records and find the end of the last complete one."""
+        if self._index:
+            start, base = self._index[-1][1], (len(self._index) - 1) * self._index_every
+        else:
+            start, base = len(MAGIC), 0
+        count, end = base, start
+        for offset, message in self._records(start):
+            count += 1
+            end = offset + _RECORD_HEADER.size + len(message.topic.encode("utf-8")) + len(message.payload)
+        return count, end
+
+    def _records(self, offset: int) -> Iterator[tuple[int, RecordedMessage]]:
+        with self.path.open("rb") as fh:
+            fh.seek(offset)
+            while True:
+                header = fh.read(_RECORD_HEADER.size)
+                if len(header) < _RECORD_HEADER.size:
+                    return
+                ts, topic_len, payload_len = _RECORD_HEADER.unpack(header)
+                body = fh.read(topic_len + payload_len)
+                if len(body) < topic_len + payload_len:
+                    logger.warning("Ignoring truncated record at offset %d in %s", offset, self.path)
+                    return
+                yield offset, RecordedMessage(ts, body[:topic_len].decode("utf-8"), body[topic_len:])
+                offset += _RECORD_HEADER.size + topic_len + payload_len
+
+    def messages(
+        self,
+        *,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        topics: Sequence[str] = (),
+    ) -> Iterator[RecordedMessage]:
+        """Iterate messages with ts in [start, end), optionally filtered by topic filters."""
+        offset = len(MAGIC)
+        if start is not None and self._index:
+            pos = bisect_right([ts for ts, _ in self._index], start) - 1
+            if pos >= 0:
+                offset = self._index[pos][1]
+        for record_offset, message in self._records(offset):
+            if record_offset >= self.end_offset:
+                return
+            if start is not None and message.ts < start:
+                continue
+            if end is not None and message.ts >= end:
+                return
+            if topics and not any(topic_matches(message.topic, f) for f in topics):
+                continue
+            yield message
+
+    def __iter__(self) -> Iterator[RecordedMessage]:
+        return self.messages()
+
+    def summary(self) -> dict[str, Any]:
+        per_topic: Counter[str] = Counter()
+        first = last = None
+        size = 0
+        for message in self.messages():
+            per_topic[message.topic] += 1
+            size += len(message.payload)
+            first = message.ts if first is None else first
+            last = message.ts
+        return {
+            "path": str(self.path),
+            "messages": self.count,
+            "payload_bytes": size,
+            "start": first,
+            "duration_sec": round((last - first), 3) if first is not None and last is not None else 0.0,
+            "topics": dict(per_topic.most_common()),
+        }
+
+
+class _Publisher(Protocol):
+    async def publish(self, topic: str, payload: Any = ..., qos: int = ..., retain: bool = ...) -> Any: ...
+
+
+class _MessageSource(Protocol):
+    async def subscribe(self, topic: str, qos: int = ...) -> Any: ...
+
+    def messages(self) -> Any: ...
+
+
+async def record(
+    client: _MessageSource,
+    writer: RecordingWriter,
+    *,
+    topics: Iterable[str] = ("#",),
+    duration: Optional[float] = None,
+    limit: Optional[int] = None,
+    flush_every: int = 256,
+) -> int:
+    """Subscribe to ``topics`` and append every received message to ``writer``.
+
+    Stops after ``duration`` seconds or ``limit`` messages (runs until
+    cancelled when both are None). Returns the number of messages recorded.
+    """
+    recorded = 0
+
+    async def _capture() -> None:
+        nonlocal recorded
+        async with client.messages() as messages:
+            for topic in topics:
+                await client.subscribe(topic, qos=1)
+            async for message in messages:
+                payload = message.payload
+                if isinstance(payload, str):
+                    payload = payload.encode("utf-8")
+                writer.append(str(message.topic), bytes(payload or b""))
+                recorded += 1
+                if recorded % flush_every == 0:
+                    writer.flush()
+                if limit is not None and recorded >= limit:
+                    return
+
+    try:
+        if duration is None:
+            await _capture()
+        else:
+            try:
+                await asyncio.wait_for(_capture(), timeout=duration)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        writer.flush()
+    return recorded
+
+
+@dataclass(slots=True)
+class IdRemapper:
+    """Consistently replace envelope ids (and id-like data fields) with fresh ones."""
+
+    mapping: dict[str, str] = field(default_factory=dict)
+
+    def _map(self, value: str) -> str:
+        mapped = self.mapping.get(value)
+        if mapped is None:
+            mapped = self.mapping[value] = uuid.uuid4().hex
+        return mapped
+
+    def remap(self, payload: bytes) -> bytes:
+        if BinaryEnvelope.is_binary(payload):
+            try:
+                frame = BinaryEnvelope.decode(payload)
+            except ValueError:
+                return payload
+            frame.id = self._map(frame.id)
+            if frame.correlation_id:
+                frame.correlation_id = self._map(frame.correlation_id)
+            return frame.encode()
+        try:
+            doc = orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            return payload
+        if not isinstance(doc, dict) or not isinstance(doc.get("id"), str) or "type" not in doc:
+            return payload
+        doc["id"] = self._map(doc["id"])
+        data = doc.get("data")
+        if isinstance(data, dict):
+            for name in REMAP_FIELDS:
+                value = data.get(name)
+                if isinstance(value, str) and value:
+                    data[name] = self._map(value)
+        return orjson.dumps(doc)
+
+
+@dataclass(slots=True)
+class ReplayStats:
+    published: int = 0
+    max_lag: float = 0.0
+    wall_time: float = 0.0
+
+
+async def replay(
+    messages: Iterable[RecordedMessage],
+    publisher: _Publisher,
+    *,
+    speed: float = 1.0,
+    qos: int = 1,
+    remap_ids: bool = False,
+) -> ReplayStats:
+    """Publish recorded messages, preserving inter-message timing.
+
+    ``speed`` scales the original timeline (2.0 = twice as fast); ``0`` replays
+    as fast as possible. ``max_lag`` reports how far publishing fell behind
+    the scaled schedule.
+    """
+    if speed < 0:
+        raise ValueError("speed must be >= 0")
+    loop = asyncio.get_running_loop()
+    remapper = IdRemapper() if remap_ids else None
+    stats = ReplayStats()
+    started = loop.time()
+    origin: Optional[float] = None
+    for message in messages:
+        if origin is None:
+            origin = message.ts
+        if speed > 0:
+            due = started + (message.ts - origin) / speed
+            delay = due - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                stats.max_lag = max(stats.max_lag, -delay)
+        payload = remapper.remap(message.payload) if remapper else message.payload
+        await publisher.publish(message.topic, payload, qos=qos)
+        stats.published += 1
+    stats.wall_time = loop.time() - started
+    return stats
+
+
+__all__ = [
+    "IdRemapper",
+    "RecordedMessage",
+    "RecordingReader",
+    "RecordingWriter",
+    "ReplayStats",
+    "record",
+    "replay",
+]
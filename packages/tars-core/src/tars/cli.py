@@ -0,0 +1,184 @@
+"""``tars`` command-line tools.
+
+Subcommands:
+    tars record PATH   Record MQTT traffic to an indexed recording file
+    tars replay PATH   Replay a recording into a broker (real/scaled/max speed)
+    tars info PATH     Summarize a recording (counts per topic, duration)
+    tars loadgen       Drive synthetic turns and report latency percentiles
+    tars trace PATH    Per-stage latency percentiles or one turn's waterfall
+
+The broker URL comes from ``--mqtt-url`` or ``MQTT_URL``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+from dataclasses import asdict
+from typing import Optional, Sequence
+
+import asyncio_mqtt as mqtt
+import orjson
+
+from tars.adapters.mqtt_client import parse_mqtt_url, replica_client_id
+from tars.adapters.mqtt_recording import RecordingReader, RecordingWriter, record, replay
+from tars.contracts.v1.trace import TOPIC_SYSTEM_TRACE_PREFIX
+from tars.loadgen import LLMStandIn, LoadGenerator, TTSStandIn, TurnProfile
+from tars.runtime.tracing import TraceCollector
+
+
+def _connect(url: str, role: str) -> mqtt.Client:
+    params = parse_mqtt_url(url)
+    return mqtt.Client(
+        hostname=params.hostname,
+        port=params.port,
+        username=params.username,
+        password=params.password,
+        client_id=replica_client_id(f"tars-{role}"),
+    )
+
+
+async def _record(args: argparse.Namespace) -> int:
+    with RecordingWriter(args.path) as writer:
+        async with _connect(args.mqtt_url, "recorder") as client:
+            count = await record(
+                client,
+                writer,
+                topics=args.topic or ["#"],
+                duration=args.duration,
+                limit=args.limit,
+            )
+    print(orjson.dumps({"path": args.path, "recorded": count, "total": writer.count}).decode())
+    return 0
+
+
+async def _replay(args: argparse.Namespace) -> int:
+    reader = RecordingReader(args.path)
+    messages = reader.messages(start=args.start, end=args.end, topics=args.topic or ())
+    async with _connect(args.mqtt_url, "replayer") as client:
+        stats = await replay(
+            messages,
+            client,
+            speed=0.0 if args.max_speed else args.speed,
+            qos=args.qos,
+            remap_ids=args.remap_ids,
+        )
+    print(orjson.dumps(asdict(stats)).decode())
+    return 0
+
+
+async def _loadgen(args: argparse.Namespace) -> int:
+    generator = LoadGenerator(
+        args.mqtt_url,
+        profile=TurnProfile(
+            turns=args.turns,
+            concurrency=args.concurrency,
+            turn_rate=args.rate,
+            speech_delay=args.speech_delay,
+            partials=args.partials,
+            partial_rate=args.partial_rate,
+            turn_timeout=args.timeout,
+        ),
+        llm=LLMStandIn(first_token=args.first_token, token_rate=args.token_rate),
+        tts=TTSStandIn(chars_per_sec=args.tts_chars_per_sec),
+        enable_llm=not args.no_llm,
+        enable_tts=not args.no_tts,
+    )
+    report = await generator.run()
+    print(orjson.dumps(report.to_dict(), option=orjson.OPT_INDENT_2).decode())
+    return 0
+
+
+def _info(args: argparse.Namespace) -> int:
+    print(orjson.dumps(RecordingReader(args.path).summary(), option=orjson.OPT_INDENT_2).decode())
+    return 0
+
+
+def _trace(args: argparse.Namespace) -> int:
+    collector = TraceCollector()
+    collector.add_messages(RecordingReader(args.path).messages(topics=[f"{TOPIC_SYSTEM_TRACE_PREFIX}#"]))
+    if args.trace_id is None and not args.last:
+        stats = {"turns": len(collector.trace_ids), "stages": collector.stage_latencies()}
+        print(orjson.dumps(stats, option=orjson.OPT_INDENT_2).decode())
+        return 0
+    trace_ids = collector.trace_ids
+    trace_id = args.trace_id or (trace_ids[-1] if trace_ids else None)
+    if trace_id is None or trace_id not in trace_ids:
+        raise ValueError(f"trace {trace_id or '(none)'} not found in {args.path}")
+    print(f"trace {trace_id}")
+    print(collector.format_waterfall(trace_id))
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="tars", description="py-tars developer tools")
+    parser.add_argument(
+        "--mqtt-url",
+        default=os.getenv("MQTT_URL", "mqtt://localhost:1883"),
+        help="Broker URL (default: $MQTT_URL or mqtt://localhost:1883)",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rec = commands.add_parser("record", help="Record MQTT traffic to a file")
+    rec.add_argument("path")
+    rec.add_argument("-t", "--topic", action="append", help="Topic filter (repeatable, default: #)")
+    rec.add_argument("--duration", type=float, help="Stop after N seconds")
+    rec.add_argument("--limit", type=int, help="Stop after N messages")
+
+    rep = commands.add_parser("replay", help="Replay a recording into the broker")
+    rep.add_argument("path")
+    rep.add_argument("-t", "--topic", action="append", help="Only replay matching topics (repeatable)")
+    rep.add_argument("--speed", type=float, default=1.0, help="Timeline scale (2.0 = twice as fast)")
+    rep.add_argument("--max-speed", action="store_true", help="Ignore original timing")
+    rep.add_argument("--start", type=float, help="Skip messages before this unix timestamp")
+    rep.add_argument("--end", type=float, help="Stop at this unix timestamp")
+    rep.add_argument("--qos", type=int, default=1, choices=(0, 1, 2))
+    rep.add_argument("--remap-ids", action="store_true", help="Give envelopes fresh ids (correlation preserved)")
+
+    info = commands.add_parser("info", help="Summarize a recording")
+    info.add_argument("path")
+
+    load = commands.add_parser("loadgen", help="Drive synthetic turns and report latency percentiles")
+    load.add_argument("--turns", type=int, default=20)
+    load.add_argument("--concurrency", type=int, default=1, help="Turns in flight (router should run in live mode)")
+    load.add_argument("--rate", type=float, default=0.0, help="New turns per second (0 = back-to-back)")
+    load.add_argument("--speech-delay", type=float, default=0.3, help="Seconds from wake to first partial")
+    load.add_argument("--partials", type=int, default=4, help="stt/partial messages per turn")
+    load.add_argument("--partial-rate", type=float, default=10.0, help="stt/partial messages per second")
+    load.add_argument("--timeout", type=float, default=10.0, help="Per-turn wait for correlated replies")
+    load.add_argument("--first-token", type=float, default=0.25, help="LLM stand-in time to first delta")
+    load.add_argument("--token-rate", type=float, default=40.0, help="LLM stand-in deltas per second")
+    load.add_argument("--tts-chars-per-sec", type=float, default=15.0, help="TTS stand-in speaking rate")
+    load.add_argument("--no-llm", action="store_true", help="Do not answer llm/request (use a real llm-worker)")
+    load.add_argument("--no-tts", action="store_true", help="Do not answer tts/say (use a real TTS worker)")
+
+    trace = commands.add_parser("trace", help="Summarize exported trace spans in a recording")
+    trace.add_argument("path")
+    trace.add_argument("--trace-id", help="Print the waterfall of one turn")
+    trace.add_argument("--last", action="store_true", help="Print the waterfall of the most recent turn")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        if args.command == "record":
+            return asyncio.run(_record(args))
+        if args.command == "replay":
+            return asyncio.run(_replay(args))
+        if args.command == "loadgen":
+            return asyncio.run(_loadgen(args))
+        if args.command == "trace":
+            return _trace(args)
+        return _info(args)
+    except KeyboardInterrupt:
+        return 130
+    except (OSError, ValueError, mqtt.MqttError) as exc:
+        print(f"tars {args.command}: {exc}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""Binary envelope for high-rate raw payloads (camera frames, FFT, audio).
+
+JSON envelopes are a poor fit for bulk bytes: camera JPEGs grow by a third
+once base64-encoded, and FFT magnitudes become long float lists. A binary
+envelope keeps the same metadata as :class:`~tars.contracts.envelope.Envelope`
+in a compact header and appends the payload untouched.
+
+Wire format (network byte order)::
+
+    magic    2s   b"TB"
+    version  B    1
+    flags    B    bit 0 = correlation id present
+    ts       d    unix timestamp (seconds)
+    lengths  4B   len(type), len(id), len(content_type), len(correlation_id)
+    header strings (utf-8, in the order above)
+    payload  raw bytes (remainder of the frame)
+
+Content types may carry MIME-style parameters (``image/jpeg;w=640;h=480``)
+so small per-frame attributes travel without a second serialization layer.
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+import time
+import uuid
+from array import array
+from dataclasses import dataclass, field
+from typing import Iterable
+
+MAGIC = b"TB"
+VERSION = 1
+
+_FLAG_CORRELATION = 0x01
+_HEADER = struct.Struct("!2sBBdBBBB")
+_MAX_FIELD_LEN = 255
+
+CONTENT_TYPE_OCTET_STREAM = "application/octet-stream"
+CONTENT_TYPE_JPEG = "image/jpeg"
+CONTENT_TYPE_PNG = "image/png"
+CONTENT_TYPE_FFT_F32 = "application/x-tars-fft+f32"
+CONTENT_TYPE_PCM16 = "audio/L16"
+
+
+@dataclass(slots=True)
+class BinaryEnvelope:
+    """Metadata header plus raw payload bytes."""
+
+    type: str
+    payload: bytes
+    content_type: str = CONTENT_TYPE_OCTET_STREAM
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    ts: float = field(default_factory=time.time)
+    correlation_id: str | None = None
+
+    @classmethod
+    def new(
+        cls,
+        *,
+        event_type: str,
+        payload: bytes,
+        content_type: str = CONTENT_TYPE_OCTET_STREAM,
+        correlate: str | None = None,
+    ) -> "BinaryEnvelope":
+        """Build an envelope, reusing ``correlate`` as id like ``Envelope.new``."""
+
+        return cls(
+            type=event_type,
+            payload=payload,
+            content_type=content_type,
+            id=correlate or uuid.uuid4().hex,
+            correlation_id=correlate,
+        )
+
+    @property
+    def media_type(self) -> str:
+        """Content type without parameters (``image/jpeg;w=1`` -> ``image/jpeg``)."""
+
+        return self.content_type.split(";", 1)[0].strip()
+
+    @property
+    def content_params(self) -> dict[str, str]:
+        """MIME-style parameters attached to the content type."""
+
+        params: dict[str, str] = {}
+        for part in self.content_type.split(";")[1:]:
+            key, sep, value = part.partition("=")
+            if sep:
+                params[key.strip()] = value.strip()
+        return params
+
+    def encode(self) -> bytes:
+        """Serialize header and payload into a single frame."""
+
+        fields = [
+            _encode_field("type", self.type),
+            _encode_field("id", self.id),
+            _encode_field("content_type", self.content_type),
+            _encode_field("correlation_id", self.correlation_id or ""),
+        ]
+        flags = _FLAG_CORRELATION if self.correlation_id is not None else 0
+        header = _HEADER.pack(MAGIC, VERSION, flags, self.ts, *(len(f) for f in fields))
+        return b"".join((header, *fields, self.payload))
+
+    @classmethod
+    def decode(cls, frame: bytes | bytearray | memoryview) -> "BinaryEnvelope":
+        """Parse a frame produced by :meth:`encode`.
+
+        Raises:
+            ValueError: If the frame is truncated or not a binary envelope.
+        """
+
+        view = memoryview(frame)
+        if len(view) < _HEADER.size:
+            raise ValueError("Binary envelope truncated: header incomplete")
+        magic, version, flags, ts, *lengths = _HEADER.unpack_from(view)
+        if magic != MAGIC:
+            raise ValueError("Not a binary envelope (bad magic)")
+        if version != VERSION:
+            raise ValueError(f"Unsupported binary envelope version: {version}")
+
+        offset = _HEADER.size
+        values: list[str] = []
+        for length in lengths:
+            end = offset + length
+            if end > len(view):
+                raise ValueError("Binary envelope truncated: header field incomplete")
+            values.append(bytes(view[offset:end]).decode("utf-8"))
+            offset = end
+
+        event_type, message_id, content_type, correlation = values
+        return cls(
+            type=event_type,
+            payload=bytes(view[offset:]),
+            content_type=content_type,
+            id=message_id,
+            ts=ts,
+            correlation_id=correlation if flags & _FLAG_CORRELATION else None,
+        )
+
+    @staticmethod
+    def is_binary(frame: bytes | bytearray | memoryview) -> bool:
+        """Cheap sniff used to tell binary frames from JSON envelopes."""
+
+        return len(frame) >= _HEADER.size and bytes(frame[:2]) == MAGIC
+
+
+def encode_fft_payload(values: Iterable[float]) -> bytes:
+    """Pack FFT magnitudes as little-endian float32."""
+
+    packed = array("f", values)
+    if sys.byteorder != "little":  # pragma: no cover - big-endian hosts
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def decode_fft_payload(payload: bytes) -> list[float]:
+    """Unpack little-endian float32 FFT magnitudes."""
+
+    if len(payload) % 4:
+        raise ValueError("FFT payload length must be a multiple of 4 bytes")
+    values = array("f")
+    values.frombytes(payload)
+    if sys.byteorder != "little":  # pragma: no cover - big-endian hosts
+        values.byteswap()
+    return values.tolist()
+
+
+def _encode_field(name: str, value: str) -> bytes:
+    raw = value.encode("utf-8")
+    if len(raw) > _MAX_FIELD_LEN:
+        raise ValueError(f"Binary envelope {name} exceeds {_MAX_FIELD_LEN} bytes")
+    return raw
+
+
+__all__ = [
+    "BinaryEnvelope",
+    "CONTENT_TYPE_FFT_F32",
+    "CONTENT_TYPE_JPEG",
+    "CONTENT_TYPE_OCTET_STREAM",
+    "CONTENT_TYPE_PCM16",
+    "CONTENT_TYPE_PNG",
+    "MAGIC",
+    "VERSION",
+    "decode_fft_payload",
+    "encode_fft_payload",
+]
@@ -7,6 +7,15 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 
+class TraceContext(BaseModel):
+    """Trace propagated across services: the turn's trace id and the sender's span."""
+
+    trace_id: str
+    span_id: str
+
+    model_config = {"extra": "forbid"}
+
+
 class Envelope(BaseModel):
     """Wrapper adding metadata around event payloads."""
 
@@ -15,6 +24,7 @@ class Envelope(BaseModel):
     ts: float = Field(default_factory=time.time)
     source: str = "router"
     data: dict[str, Any]
+    trace: TraceContext | None = None
 
     model_config = {"extra": "forbid"}
 
@@ -26,6 +36,7 @@ class Envelope(BaseModel):
         data: Any,
         correlate: str | None = None,
         source: str = "router",
+        trace: TraceContext | None = None,
     ) -> "Envelope":
         payload = data.model_dump() if hasattr(data, "model_dump") else data
-        return cls(id=correlate or uuid.uuid4().hex, type=event_type, data=payload, source=source)
+        return cls(id=correlate or uuid.uuid4().hex, type=event_type, data=payload, source=source, trace=trace)
@@ -3,6 +3,7 @@
 # Camera contracts
 from .camera import (
 	EVENT_TYPE_CAMERA_CAPTURE,
+	EVENT_TYPE_CAMERA_FRAME,
 	EVENT_TYPE_CAMERA_IMAGE,
 	TOPIC_CAMERA_CAPTURE,
 	TOPIC_CAMERA_IMAGE,
@@ -106,6 +107,7 @@ from .movement import (
 
 # STT contracts
 from .stt import (
+	EVENT_TYPE_STT_AUDIO_FFT,
 	EVENT_TYPE_STT_FINAL,
 	EVENT_TYPE_STT_PARTIAL,
 	TOPIC_STT_FINAL,
@@ -128,6 +130,14 @@ from .tts import (
 	TtsStatus,
 )
 
+# Trace contracts
+from .trace import (
+	EVENT_TYPE_TRACE_SPANS,
+	TOPIC_SYSTEM_TRACE_PREFIX,
+	SpanRecord,
+	TraceSpans,
+)
+
 # Wake contracts
 from .wake import (
 	EVENT_TYPE_WAKE_EVENT,
@@ -141,6 +151,7 @@ from .wake import (
 __all__ = [
 	# Camera
 	"EVENT_TYPE_CAMERA_CAPTURE",
+	"EVENT_TYPE_CAMERA_FRAME",
 	"EVENT_TYPE_CAMERA_IMAGE",
 	"TOPIC_CAMERA_CAPTURE",
 	"TOPIC_CAMERA_IMAGE",
@@ -226,6 +237,7 @@ __all__ = [
 	"validate_movement_command",
 	"validate_test_movement",
 	# STT
+	"EVENT_TYPE_STT_AUDIO_FFT",
 	"EVENT_TYPE_STT_FINAL",
 	"EVENT_TYPE_STT_PARTIAL",
 	"TOPIC_STT_FINAL",
@@ -243,6 +255,11 @@ __all__ = [
 	"TtsControlCommand",
 	"TtsSay",
 	"TtsStatus",
+	# Trace
+	"EVENT_TYPE_TRACE_SPANS",
+	"TOPIC_SYSTEM_TRACE_PREFIX",
+	"SpanRecord",
+	"TraceSpans",
 	# Wake
 	"EVENT_TYPE_WAKE_EVENT",
 	"EVENT_TYPE_WAKE_MIC",
@@ -11,6 +11,7 @@ from pydantic import BaseModel, Field, ConfigDict
 # Event types (legacy - prefer topic constants)
 EVENT_TYPE_CAMERA_CAPTURE = "camera.capture"
 EVENT_TYPE_CAMERA_IMAGE = "camera.image"
+EVENT_TYPE_CAMERA_FRAME = "camera.frame"
 
 # MQTT Topic constants
 TOPIC_CAMERA_CAPTURE = "camera/capture"
@@ -47,6 +47,9 @@ class LLMRequest(BaseLLMMessage):
     system: str | None = None
     params: dict | None = None
     conversation_history: List[ConversationMessage] | None = None
+    # Pinned facts and a summary of turns that no longer fit conversation_history.
+    conversation_summary: str | None = None
+    source: str | None = None  # router session (capture device); workers queue fairly per source
 
 
 class LLMResponse(BaseLLMMessage):
@@ -14,6 +14,9 @@ class ToolSpec(BaseModel):
     """Specification for a tool function."""
     type: str = "function"
     function: Dict[str, Any] = Field(..., description="OpenAI-style function specification")
+    cache_ttl: Optional[float] = Field(
+        None, description="Seconds a result may be reused (read-only tools only); not sent to the model"
+    )
 
 
 class ToolsRegistry(BaseModel):
@@ -8,6 +8,7 @@ from pydantic import BaseModel, Field
 # Event types (legacy - prefer topic constants)
 EVENT_TYPE_STT_FINAL = "stt.final"
 EVENT_TYPE_STT_PARTIAL = "stt.partial"
+EVENT_TYPE_STT_AUDIO_FFT = "stt.audio_fft"
 
 # MQTT Topic constants
 TOPIC_STT_FINAL = "stt/final"
@@ -23,6 +24,7 @@ class FinalTranscript(BaseModel):
     lang: str = "en"
     confidence: float | None = Field(default=None, ge=0.0, le=1.0)
     utt_id: str | None = None
+    source: str | None = None  # capture device / client id; keys router sessions
     ts: float = Field(default_factory=time.time)
     is_final: bool = True
 
@@ -37,6 +39,7 @@ class PartialTranscript(BaseModel):
     lang: str = "en"
     confidence: float | None = Field(default=None, ge=0.0, le=1.0)
     utt_id: str | None = None
+    source: str | None = None  # capture device / client id; keys router sessions
     ts: float = Field(default_factory=time.time)
     is_final: bool = False
 
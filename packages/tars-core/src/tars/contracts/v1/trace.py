@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import uuid
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+# Event types (legacy - prefer topic constants)
+EVENT_TYPE_TRACE_SPANS = "system.trace.spans"
+
+# MQTT Topic constants
+TOPIC_SYSTEM_TRACE_PREFIX = "system/trace/"  # Append service name
+
+
+class SpanRecord(BaseModel):
+    """One timed stage of a turn (wall-clock seconds, comparable across hosts)."""
+
+    trace_id: str
+    span_id: str
+    parent_id: str | None = None
+    name: str
+    service: str
+    start: float
+    end: float
+    attrs: dict[str, Any] = Field(default_factory=dict)
+
+    model_config = {"extra": "forbid"}
+
+    @property
+    def duration(self) -> float:
+        return max(0.0, self.end - self.start)
+
+
+class TraceSpans(BaseModel):
+    """Batch of finished spans exported by one service."""
+
+    message_id: str = Field(default_factory=lambda: uuid.uuid4().hex)
+    service: str
+    spans: list[SpanRecord]
+
+    model_config = {"extra": "forbid"}
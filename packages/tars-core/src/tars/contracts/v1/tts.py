@@ -28,6 +28,7 @@ class TtsSay(BaseModel):
     stt_ts: float | None = None
     wake_ack: bool | None = None
     system_announce: bool | None = None  # System announcements don't open response windows
+    source: str | None = None  # router session the reply belongs to
 
     model_config = {"extra": "forbid"}
 
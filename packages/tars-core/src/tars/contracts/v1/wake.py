@@ -22,6 +22,7 @@ class WakeEvent(BaseModel):
     energy: float | None = Field(default=None, ge=0.0)
     cause: str | None = None
     ts: float | None = None
+    source: str | None = None  # capture device / client id; keys router sessions
 
     model_config = {"extra": "forbid"}
 
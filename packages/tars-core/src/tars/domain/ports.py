@@ -13,4 +13,6 @@ class Publisher(Protocol):
 
 
 class Subscriber(Protocol):
-    async def messages(self, topic: str, qos: int = 0) -> AsyncIterable[MQTTMessage]: ...
+    async def messages(
+        self, topic: str, qos: int = 0, *, share_group: str | None = None
+    ) -> AsyncIterable[MQTTMessage]: ...
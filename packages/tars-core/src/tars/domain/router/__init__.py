@@ -1,7 +1,22 @@
 """Router domain utilities."""
 
 from .config import RouterSettings, RouterStreamSettings
+from .history import ConversationHistory, estimate_tokens
+from .intents import IntentMatch, IntentMatcher, IntentSpec
 from .metrics import RouterMetrics
 from .policy import RouterPolicy
+from .session import RouterSession, SessionStore
 
-__all__ = ["RouterSettings", "RouterStreamSettings", "RouterPolicy", "RouterMetrics"]
+__all__ = [
+    "ConversationHistory",
+    "IntentMatch",
+    "IntentMatcher",
+    "IntentSpec",
+    "RouterSettings",
+    "RouterStreamSettings",
+    "RouterPolicy",
+    "RouterMetrics",
+    "RouterSession",
+    "SessionStore",
+    "estimate_tokens",
+]
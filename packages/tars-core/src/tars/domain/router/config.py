@@ -13,6 +13,7 @@ from tars.contracts.v1 import (
     TOPIC_MOVEMENT_STOP,
     TOPIC_MOVEMENT_TEST,
     TOPIC_STT_FINAL,
+    TOPIC_STT_PARTIAL,
     TOPIC_TTS_SAY,
     TOPIC_TTS_STATUS,
     TOPIC_WAKE_EVENT,
@@ -25,6 +26,8 @@ class RouterStreamSettings:
     queue_maxsize: int = 256
     queue_overflow: str = "drop_oldest"  # drop_oldest | drop_new | block
     handler_timeout_sec: float = 30.0
+    worker_count: int = 1
+    starvation_limit: int = 8  # higher-lane picks before a waiting lower lane is served
 
 
 @dataclass(slots=True)
@@ -37,6 +40,7 @@ class RouterSettings:
     topic_health_stt: str = "system/health/tars-stt"
     topic_health_router: str = "system/health/router"
     topic_stt_final: str = TOPIC_STT_FINAL
+    topic_stt_partial: str = TOPIC_STT_PARTIAL
     topic_tts_say: str = TOPIC_TTS_SAY
     topic_tts_status: str = TOPIC_TTS_STATUS
     topic_llm_req: str = TOPIC_LLM_REQUEST
@@ -53,6 +57,16 @@ class RouterSettings:
     stream_boundary_chars: str = ".!?;:"
     stream_boundary_only: bool = True
     stream_hard_max_chars: int = 2000
+    history_token_budget: int = 1200
+    history_max_messages: int = 40
+    history_summary_tokens: int = 200
+    speculate_enabled: bool = False
+    speculate_stable_updates: int = 2
+    speculate_min_words: int = 3
+    speculate_similarity: float = 0.9
+    max_sessions: int = 64
+    session_idle_sec: float = 3600.0
+    intents_path: str = ""  # YAML intent grammar; empty uses the built-in rules
     wake_phrases_raw: str = "hey tars"
     wake_window_sec: float = 8.0
     wake_ack_enabled: bool = True
@@ -105,6 +119,7 @@ class RouterSettings:
 
         return {
             "stt.final": self.topic_stt_final,
+            "stt.partial": self.topic_stt_partial,
             "tts.say": self.topic_tts_say,
             "tts.status": self.topic_tts_status,
             "llm.request": self.topic_llm_req,
@@ -148,6 +163,16 @@ class RouterSettings:
                 defaults.stream_settings.handler_timeout_sec,
                 env=env,
             ),
+            worker_count=runtime_env.get_int(
+                "ROUTER_WORKER_COUNT",
+                defaults.stream_settings.worker_count,
+                env=env,
+            ),
+            starvation_limit=runtime_env.get_int(
+                "ROUTER_STARVATION_LIMIT",
+                defaults.stream_settings.starvation_limit,
+                env=env,
+            ),
         )
 
         return cls(
@@ -158,6 +183,7 @@ class RouterSettings:
             topic_health_stt=get_str("TOPIC_HEALTH_STT", defaults.topic_health_stt, env=env),
             topic_health_router=get_str("TOPIC_HEALTH_ROUTER", defaults.topic_health_router, env=env),
             topic_stt_final=get_str("TOPIC_STT_FINAL", defaults.topic_stt_final, env=env),
+            topic_stt_partial=get_str("TOPIC_STT_PARTIAL", defaults.topic_stt_partial, env=env),
             topic_tts_say=get_str("TOPIC_TTS_SAY", defaults.topic_tts_say, env=env),
             topic_tts_status=get_str("TOPIC_TTS_STATUS", defaults.topic_tts_status, env=env),
             topic_llm_req=get_str("TOPIC_LLM_REQUEST", defaults.topic_llm_req, env=env),
@@ -203,6 +229,36 @@ class RouterSettings:
                 defaults.stream_hard_max_chars,
                 env=env,
             ),
+            history_token_budget=get_int(
+                "ROUTER_HISTORY_TOKEN_BUDGET",
+                defaults.history_token_budget,
+                env=env,
+            ),
+            history_max_messages=get_int(
+                "ROUTER_HISTORY_MAX_MESSAGES",
+                defaults.history_max_messages,
+                env=env,
+            ),
+            history_summary_tokens=get_int(
+                "ROUTER_HISTORY_SUMMARY_TOKENS",
+                defaults.history_summary_tokens,
+                env=env,
+            ),
+            speculate_enabled=get_bool("ROUTER_SPECULATE", defaults.speculate_enabled, env=env),
+            speculate_stable_updates=get_int(
+                "ROUTER_SPECULATE_STABLE_UPDATES",
+                defaults.speculate_stable_updates,
+                env=env,
+            ),
+            speculate_min_words=get_int("ROUTER_SPECULATE_MIN_WORDS", defaults.speculate_min_words, env=env),
+            speculate_similarity=get_float(
+                "ROUTER_SPECULATE_SIMILARITY",
+                defaults.speculate_similarity,
+                env=env,
+            ),
+            max_sessions=get_int("ROUTER_MAX_SESSIONS", defaults.max_sessions, env=env),
+            session_idle_sec=get_float("ROUTER_SESSION_IDLE_SEC", defaults.session_idle_sec, env=env),
+            intents_path=get_str("ROUTER_INTENTS_PATH", defaults.intents_path, env=env),
             wake_phrases_raw=get_str(
                 "ROUTER_WAKE_PHRASES",
                 defaults.wake_phrases_raw,
@@ -0,0 +1,165 @@
+"""Token-budgeted conversation history for LLM requests.
+
+Recent turns are kept verbatim while they fit ``token_budget``. Turns pushed
+out by the budget (or by ``max_messages``) are folded into a rolling
+extractive summary: the first sentence of each turn, capped at
+``summary_budget`` tokens, oldest lines dropped first. Facts the user asks
+to remember ("remember that ...", "my name is ...") are pinned and survive
+summarisation. Token counts are estimated locally and cached per message,
+so building a request window is O(window), not O(session).
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from tars.contracts.v1 import ConversationMessage
+from tars.domain.segmenter import split_sentences
+
+TokenCounter = Callable[[str], int]
+
+_WORD_OR_PUNCT = re.compile(r"\w+|[^\w\s]")
+_PIN_PATTERNS = (
+    re.compile(r"^\s*(?:please\s+)?remember(?:\s+that)?\s+(?P<fact>.+?)[.!]?\s*$", re.IGNORECASE),
+    re.compile(r"\b(?P<fact>my name is\s+[\w' -]+?)(?:[.,!?]|\s+and\b|$)", re.IGNORECASE),
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate BPE token count: one per word or symbol, plus one per 6 chars of long words."""
+
+    count = 0
+    for piece in _WORD_OR_PUNCT.findall(text):
+        count += 1 + (len(piece) - 1) // 6
+    return count
+
+
+def _clip(text: str, max_tokens: int, counter: TokenCounter) -> str:
+    """Cut ``text`` at a word boundary so it fits ``max_tokens``."""
+
+    if counter(text) <= max_tokens:
+        return text
+    words = text.split()
+    lo, hi = 0, len(words)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if counter(" ".join(words[:mid])) + 1 <= max_tokens:
+            lo = mid
+        else:
+            hi = mid - 1
+    return " ".join(words[:lo]) + " …"
+
+
+@dataclass(slots=True)
+class _Turn:
+    message: ConversationMessage
+    tokens: int
+
+
+@dataclass(slots=True)
+class ConversationHistory:
+    """Bounded conversation memory with a rolling summary and pinned facts."""
+
+    token_budget: int = 1200
+    max_messages: int = 40
+    summary_budget: int = 200
+    max_facts: int = 8
+    counter: TokenCounter = estimate_tokens
+    _turns: deque[_Turn] = field(init=False, default_factory=deque)
+    _tokens: int = field(init=False, default=0)
+    _summary: deque[tuple[str, int]] = field(init=False, default_factory=deque)
+    _summary_tokens: int = field(init=False, default=0)
+    _facts: list[str] = field(init=False, default_factory=list)
+
+    def __post_init__(self) -> None:
+        if self.token_budget <= 0 or self.max_messages <= 0:
+            raise ValueError("token_budget and max_messages must be positive")
+
+    def __len__(self) -> int:
+        return len(self._turns)
+
+    @property
+    def tokens(self) -> int:
+        """Estimated tokens of the verbatim turns."""
+
+        return self._tokens
+
+    @property
+    def facts(self) -> list[str]:
+        return list(self._facts)
+
+    @property
+    def summary(self) -> str:
+        return " ".join(line for line, _ in self._summary)
+
+    def add(self, role: str, content: str, timestamp: Optional[float] = None) -> None:
+        """Append a turn, pinning stated facts and folding what no longer fits."""
+
+        content = (content or "").strip()
+        if not content:
+            return
+        if role == "user":
+            for pattern in _PIN_PATTERNS:
+                match = pattern.search(content)
+                if match:
+                    self.pin(match.group("fact"))
+        # A single turn may use at most half the budget so context never collapses to one message.
+        content = _clip(content, max(1, self.token_budget // 2), self.counter)
+        turn = _Turn(ConversationMessage(role=role, content=content, timestamp=timestamp), self.counter(content))
+        self._turns.append(turn)
+        self._tokens += turn.tokens
+        while len(self._turns) > 1 and (self._tokens > self.token_budget or len(self._turns) > self.max_messages):
+            self._fold(self._turns.popleft())
+
+    def pin(self, fact: str) -> None:
+        """Keep ``fact`` for the rest of the session (oldest dropped beyond ``max_facts``)."""
+
+        fact = " ".join(fact.split()).rstrip(".")
+        if not fact:
+            return
+        lowered = fact.lower()
+        self._facts = [f for f in self._facts if f.lower() != lowered]
+        self._facts.append(fact)
+        del self._facts[: -self.max_facts]
+
+    def messages(self) -> list[ConversationMessage]:
+        """Verbatim turns within the token budget, oldest first."""
+
+        return [turn.message for turn in self._turns]
+
+    def context(self) -> Optional[str]:
+        """Rendered pinned facts and rolling summary, or None when both are empty."""
+
+        parts = []
+        if self._facts:
+            parts.append("Facts the user asked you to remember:\n" + "\n".join(f"- {f}" for f in self._facts))
+        if self._summary:
+            parts.append("Earlier in this conversation:\n" + "\n".join(f"- {line}" for line, _ in self._summary))
+        return "\n\n".join(parts) or None
+
+    def clear(self) -> None:
+        """Forget turns and summary; pinned facts are kept."""
+
+        self._turns.clear()
+        self._tokens = 0
+        self._summary.clear()
+        self._summary_tokens = 0
+
+    def _fold(self, turn: _Turn) -> None:
+        self._tokens -= turn.tokens
+        if self.summary_budget <= 0:
+            return
+        sentences = split_sentences(turn.message.content)
+        gist = _clip(sentences[0] if sentences else turn.message.content, 32, self.counter)
+        line = f"{'User' if turn.message.role == 'user' else 'Assistant'}: {gist}"
+        tokens = self.counter(line)
+        self._summary.append((line, tokens))
+        self._summary_tokens += tokens
+        while len(self._summary) > 1 and self._summary_tokens > self.summary_budget:
+            self._summary_tokens -= self._summary.popleft()[1]
+
+
+__all__ = ["ConversationHistory", "TokenCounter", "estimate_tokens"]
@@ -0,0 +1,368 @@
+"""Declarative intent grammar compiled into a word-level Aho-Corasick automaton.
+
+An intent lists phrase templates such as ``"turn {direction}"`` or
+``"say {text}"``. Each template starts with a literal anchor; all anchors are
+compiled into one automaton over normalised word tokens, so a transcript is
+scanned once regardless of how many intents exist, and phrases only match on
+word boundaries ("microwave" never triggers "wave"). Anchor hits are then
+verified against the rest of their template, where slot parsers extract
+values:
+
+- ``text``: one or more words, up to the next literal (raw transcript text)
+- ``word``: a single word
+- ``number``: digits or a number word ("three")
+- a list of choices: a single word from the list
+
+Synonyms map alternative words onto a canonical one before matching, both in
+templates and transcripts. Matches are ranked by intent priority, then by the
+fraction of the transcript they cover (the score), then by literal length.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Optional, Sequence, Union
+
+import yaml
+
+SlotType = Union[str, tuple[str, ...]]
+
+MATCH_MODES = ("contains", "prefix", "exact")
+SLOT_TYPES = ("text", "word", "number")
+
+_TOKEN = re.compile(r"\w+(?:'\w+)*")
+_PLACEHOLDER = re.compile(r"^\{(\w+)\}$")
+_NUMBER_WORDS = {
+    word: value
+    for value, word in enumerate(
+        "zero one two three four five six seven eight nine ten eleven twelve thirteen "
+        "fourteen fifteen sixteen seventeen eighteen nineteen twenty".split()
+    )
+}
+_NUMBER_WORDS.update({"thirty": 30, "forty": 40, "fifty": 50, "sixty": 60, "seventy": 70, "eighty": 80, "ninety": 90})
+
+
+@dataclass(frozen=True, slots=True)
+class IntentSpec:
+    """One intent: phrase templates plus what the router does on a match."""
+
+    name: str
+    phrases: tuple[str, ...]
+    slots: Mapping[str, SlotType] = field(default_factory=dict)
+    match: str = "contains"  # contains | prefix | exact
+    priority: int = 0
+    min_score: float = 0.0
+    reply: Optional[str] = None  # str.format template over slots (+ "time")
+    style: str = "neutral"
+    command: Optional[str] = None  # movement command value
+
+    def __post_init__(self) -> None:
+        if not self.phrases:
+            raise ValueError(f"intent {self.name!r} has no phrases")
+        if self.match not in MATCH_MODES:
+            raise ValueError(f"intent {self.name!r}: match must be one of {MATCH_MODES}")
+        for slot, kind in self.slots.items():
+            if isinstance(kind, str) and kind not in SLOT_TYPES:
+                raise ValueError(f"intent {self.name!r}: unknown slot type {kind!r} for {slot!r}")
+
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any]) -> "IntentSpec":
+        phrases = data.get("phrases") or ()
+        if isinstance(phrases, str):
+            phrases = (phrases,)
+        slots = {
+            name: kind if isinstance(kind, str) else tuple(str(choice) for choice in kind)
+            for name, kind in (data.get("slots") or {}).items()
+        }
+        return cls(
+            name=str(data["name"]),
+            phrases=tuple(str(phrase) for phrase in phrases),
+            slots=slots,
+            match=str(data.get("match", "contains")),
+            priority=int(data.get("priority", 0)),
+            min_score=float(data.get("min_score", 0.0)),
+            reply=data.get("reply"),
+            style=str(data.get("style", "neutral")),
+            command=data.get("command"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class IntentMatch:
+    intent: IntentSpec
+    score: float
+    slots: dict[str, Any]
+    start: int  # character span of the match in the transcript
+    end: int
+
+    @property
+    def name(self) -> str:
+        return self.intent.name
+
+
+@dataclass(frozen=True, slots=True)
+class _Token:
+    norm: str
+    start: int
+    end: int
+
+
+@dataclass(frozen=True, slots=True)
+class _Template:
+    intent: int
+    anchor_len: int
+    rest: tuple[tuple[str, Any], ...]  # ("lit", word) | ("slot", (name, kind))
+    literal_len: int
+
+
+class IntentMatcher:
+    """Compiled intent grammar; build once, call :meth:`match` per transcript."""
+
+    __slots__ = ("intents", "_synonyms", "_goto", "_fail", "_out", "_templates")
+
+    def __init__(
+        self,
+        intents: Iterable[IntentSpec],
+        synonyms: Optional[Mapping[str, Sequence[str]]] = None,
+    ) -> None:
+        self.intents: tuple[IntentSpec, ...] = tuple(intents)
+        self._synonyms: dict[str, str] = {}
+        for canonical, alternatives in (synonyms or {}).items():
+            for alternative in alternatives:
+                self._synonyms[alternative.lower()] = canonical.lower()
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+        self._templates: list[_Template] = []
+        anchors: dict[tuple[str, ...], int] = {}
+        for index, spec in enumerate(self.intents):
+            for phrase in spec.phrases:
+                anchor, template = self._compile(index, spec, phrase)
+                self._templates.append(template)
+                node = anchors.get(anchor)
+                if node is None:
+                    node = anchors[anchor] = self._insert(anchor)
+                self._out[node] += (len(self._templates) - 1,)
+        self._link()
+
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_config(cls, data: Mapping[str, Any]) -> "IntentMatcher":
+        """Build from ``{"intents": [...], "synonyms": {...}}`` (parsed YAML/JSON)."""
+
+        intents = [IntentSpec.from_mapping(item) for item in data.get("intents") or ()]
+        return cls(intents, data.get("synonyms") or {})
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> "IntentMatcher":
+        """Load a YAML (or JSON) grammar file."""
+
+        with open(path, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
+        if not isinstance(data, Mapping):
+            raise ValueError(f"intent grammar {path} must be a mapping")
+        return cls.from_config(data)
+
+    # ------------------------------------------------------------------
+    def match(self, text: str) -> Optional[IntentMatch]:
+        """Best intent for ``text``, or None."""
+
+        best: Optional[tuple[tuple[int, float, int], IntentMatch]] = None
+        for key, found in self._candidates(text):
+            if best is None or key > best[0]:
+                best = (key, found)
+        return best[1] if best else None
+
+    def matches(self, text: str) -> list[IntentMatch]:
+        """All verified matches, best first."""
+
+        ranked = sorted(self._candidates(text), key=lambda item: item[0], reverse=True)
+        return [found for _, found in ranked]
+
+    def _candidates(self, text: str) -> Iterable[tuple[tuple[int, float, int], IntentMatch]]:
+        tokens = self._tokenize(text)
+        if not tokens:
+            return
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for end, token in enumerate(tokens):
+            while node and token.norm not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(token.norm, 0)
+            hit = node
+            while hit:
+                for template_id in out[hit]:
+                    template = self._templates[template_id]
+                    found = self._verify(text, tokens, end + 1 - template.anchor_len, end + 1, template)
+                    if found is not None:
+                        yield (found.intent.priority, found.score, template.literal_len), found
+                hit = fail[hit]
+
+    # ------------------------------------------------------------------
+    def _tokenize(self, text: str) -> list[_Token]:
+        synonyms = self._synonyms
+        tokens = []
+        for m in _TOKEN.finditer(text):
+            norm = m.group().lower().replace("'", "")
+            tokens.append(_Token(synonyms.get(norm, norm), m.start(), m.end()))
+        return tokens
+
+    def _compile(self, index: int, spec: IntentSpec, phrase: str) -> tuple[tuple[str, ...], _Template]:
+        elements: list[tuple[str, Any]] = []
+        for part in phrase.split():
+            placeholder = _PLACEHOLDER.match(part)
+            if placeholder:
+                name = placeholder.group(1)
+                kind = spec.slots.get(name, "text")
+                if not isinstance(kind, str):
+                    kind = tuple(tok.norm for choice in kind for tok in self._tokenize(choice))
+                elements.append(("slot", (name, kind)))
+            else:
+                elements.extend(("lit", tok.norm) for tok in self._tokenize(part))
+        anchor: list[str] = []
+        while len(anchor) < len(elements) and elements[len(anchor)][0] == "lit":
+            anchor.append(elements[len(anchor)][1])
+        if not anchor:
+            raise ValueError(f"intent {spec.name!r}: phrase {phrase!r} must start with a literal word")
+        literal_len = sum(1 for kind, _ in elements if kind == "lit")
+        return tuple(anchor), _Template(index, len(anchor), tuple(elements[len(anchor) :]), literal_len)
+
+    def _insert(self, words: Sequence[str]) -> int:
+        node = 0
+        for word in words:
+            nxt = self._goto[node].get(word)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][word] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            node = nxt
+        return node
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for word, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and word not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(word, 0)
+                self._fail[child] = target if target != child else 0
+
+    def _verify(
+        self, text: str, tokens: list[_Token], start: int, pos: int, template: _Template
+    ) -> Optional[IntentMatch]:
+        spec = self.intents[template.intent]
+        n = len(tokens)
+        if spec.match != "contains" and start != 0:
+            return None
+        slots: dict[str, Any] = {}
+        end_char = tokens[pos - 1].end
+        rest = template.rest
+        for i, (kind, value) in enumerate(rest):
+            if kind == "lit":
+                if pos >= n or tokens[pos].norm != value:
+                    return None
+                end_char = tokens[pos].end
+                pos += 1
+                continue
+            name, slot_type = value
+            if pos >= n:
+                return None
+            if slot_type == "text":
+                stop = n
+                if i + 1 < len(rest) and rest[i + 1][0] == "lit":
+                    stop = next((j for j in range(pos + 1, n) if tokens[j].norm == rest[i + 1][1]), -1)
+                    if stop < 0:
+                        return None
+                # A trailing text slot keeps the transcript's closing punctuation.
+                end_char = len(text.rstrip()) if stop == n else tokens[stop - 1].end
+                slots[name] = text[tokens[pos].start : end_char]
+                pos = stop
+            elif slot_type == "number":
+                word = tokens[pos].norm
+                if word.isdigit():
+                    slots[name] = int(word)
+                elif word in _NUMBER_WORDS:
+                    slots[name] = _NUMBER_WORDS[word]
+                else:
+                    return None
+                end_char = tokens[pos].end
+                pos += 1
+            elif slot_type == "word" or tokens[pos].norm in slot_type:
+                slots[name] = tokens[pos].norm
+                end_char = tokens[pos].end
+                pos += 1
+            else:
+                return None
+        if spec.match == "exact" and pos != n:
+            return None
+        score = (pos - start) / n
+        if score < spec.min_score:
+            return None
+        return IntentMatch(spec, score, slots, tokens[start].start, end_char)
+
+
+def _movement(name: str, *phrases: str, **kwargs: Any) -> IntentSpec:
+    return IntentSpec(name=f"movement.{name}", phrases=phrases, command=name, priority=10, **kwargs)
+
+
+DEFAULT_SYNONYMS: dict[str, tuple[str, ...]] = {
+    "step": ("walk", "move"),
+    "turn": ("rotate",),
+    "backward": ("back", "backwards"),
+}
+
+DEFAULT_INTENTS: tuple[IntentSpec, ...] = (
+    IntentSpec(name="say", phrases=("say {text}",), match="prefix", reply="{text}", priority=30),
+    IntentSpec(
+        name="time",
+        phrases=("what time", "time is it"),
+        reply="It is {time}.",
+        priority=20,
+    ),
+    _movement("wave", "wave", "wave your hand", "wave hello"),
+    _movement("laugh", "laugh", "do a laugh", "laugh animation"),
+    _movement("bow", "bow", "take a bow", "bow down"),
+    _movement("swing_legs", "swing legs", "swing your legs", "leg swing"),
+    _movement("balance", "balance", "stand up", "balance yourself"),
+    _movement("pose", "pose", "strike a pose", "do a pose"),
+    _movement("step_forward", "step forward"),
+    _movement("step_backward", "step backward"),
+    _movement("turn_left", "turn left"),
+    _movement("turn_right", "turn right"),
+    _movement("reset", "reset", "reset position", "go to reset"),
+    _movement("disable", "disable", "turn off", "power down"),
+    _movement("stop", "stop", "stop moving", "halt"),
+    _movement("mic_drop", "mic drop", "drop the mic"),
+    _movement("monster", "monster", "monster pose"),
+    _movement("pezz_dispenser", "pez", "pez dispenser", "pezz"),
+    # "now" is too common a word to match anywhere in a sentence.
+    _movement("now", "now", "now pose", match="exact"),
+    IntentSpec(
+        name="greeting",
+        phrases=("hello", "hi", "hey", "hiya", "howdy"),
+        reply="Hello! How can I help?",
+        style="friendly",
+    ),
+)
+
+
+def default_intent_matcher() -> IntentMatcher:
+    return IntentMatcher(DEFAULT_INTENTS, DEFAULT_SYNONYMS)
+
+
+__all__ = [
+    "DEFAULT_INTENTS",
+    "DEFAULT_SYNONYMS",
+    "IntentMatch",
+    "IntentMatcher",
+    "IntentSpec",
+    "default_intent_matcher",
+]
@@ -13,6 +13,9 @@ class RouterMetrics:
     llm_responses: int = 0
     tts_messages: int = 0
     llm_latency_total: float = 0.0
+    speculations: int = 0
+    speculation_hits: int = 0
+    speculation_saved_total: float = 0.0
     _llm_inflight: Dict[str, float] = field(default_factory=dict)
 
     def record_llm_request(self, request_id: str) -> None:
@@ -34,6 +37,14 @@ class RouterMetrics:
             return
         self._llm_inflight.pop(request_id, None)
 
+    def record_speculation(self, hit: bool, saved: float = 0.0) -> None:
+        """Count a resolved speculative request; ``saved`` is its head start in seconds."""
+
+        self.speculations += 1
+        if hit:
+            self.speculation_hits += 1
+            self.speculation_saved_total += max(0.0, saved)
+
     def record_tts_message(self) -> None:
         self.tts_messages += 1
 
@@ -43,6 +54,18 @@ class RouterMetrics:
             return 0.0
         return self.llm_latency_total / self.llm_responses
 
+    @property
+    def speculation_hit_rate(self) -> float:
+        if self.speculations == 0:
+            return 0.0
+        return self.speculation_hits / self.speculations
+
+    @property
+    def avg_speculation_saved(self) -> float:
+        if self.speculation_hits == 0:
+            return 0.0
+        return self.speculation_saved_total / self.speculation_hits
+
     def snapshot(self) -> dict[str, float | int]:
         return {
             "llm_requests": self.llm_requests,
@@ -50,4 +73,7 @@ class RouterMetrics:
             "tts_messages": self.tts_messages,
             "avg_llm_latency": round(self.avg_llm_latency, 6),
             "llm_inflight": len(self._llm_inflight),
+            "speculations": self.speculations,
+            "speculation_hit_rate": round(self.speculation_hit_rate, 6),
+            "avg_speculation_saved": round(self.avg_speculation_saved, 6),
         }
@@ -8,24 +8,36 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 from tars.contracts.v1 import (
+    EVENT_TYPE_LLM_CANCEL,
     EVENT_TYPE_LLM_REQUEST,
     EVENT_TYPE_SAY,
-    ConversationMessage,
     FinalTranscript,
     HealthPing,
     LLMCancel,
     LLMRequest,
     LLMResponse,
     LLMStreamDelta,
+    PartialTranscript,
     TestMovementCommand,
     TestMovementRequest,
     TtsSay,
     TtsStatus,
     WakeEvent,
 )
+from tars.domain.segmenter import SegmentPolicy, SentenceSegmenter
 from tars.runtime.ctx import Ctx
 
 from .config import RouterSettings
+from .history import ConversationHistory
+from .intents import IntentMatch, IntentMatcher, default_intent_matcher
+from .session import DEFAULT_SOURCE, RouterSession, SessionStore
+from .speculation import (
+    CancelledRequests,
+    PartialTracker,
+    Speculation,
+    normalize_transcript,
+    transcript_similarity,
+)
 from .metrics import RouterMetrics
 
 
@@ -37,20 +49,31 @@ class RouterPolicy:
     metrics: RouterMetrics | None = None
     ready: Dict[str, bool] = field(default_factory=lambda: {"tts": False, "stt": False})
     announced: bool = False
-    llm_buf: Dict[str, str] = field(default_factory=dict)
-    llm_stream_segments: Dict[str, List[str]] = field(default_factory=dict)
-    llm_stream_completed: set[str] = field(default_factory=set)
-    live_mode: bool = field(init=False)
-    wake_active_until: float = 0.0
-    wake_session_active: bool = False
-    response_window_active: bool = False
-    response_window_until: float = 0.0
-    conversation_history: List[ConversationMessage] = field(default_factory=list)
+    sessions: SessionStore = field(init=False)
     _wake_regex: re.Pattern[str] = field(init=False)
     _wake_ack_cycle: Optional[itertools.cycle[str]] = field(init=False, default=None)
+    _segment_policy: SegmentPolicy = field(init=False)
+    _intents: IntentMatcher = field(init=False)
+    _cancelled_llm: CancelledRequests = field(init=False, default_factory=CancelledRequests)
 
     def __post_init__(self) -> None:
-        self.live_mode = self.settings.live_mode_default
+        boundary_only = self.settings.stream_boundary_only
+        self._segment_policy = SegmentPolicy(
+            boundary_chars=self.settings.stream_boundary_chars or ".!?",
+            min_chars=0 if boundary_only else self.settings.stream_min_chars,
+            max_chars=None if boundary_only else self.settings.stream_max_chars,
+            hard_max_chars=self.settings.stream_hard_max_chars or None,
+        )
+        self.sessions = SessionStore(
+            self._new_session,
+            max_sessions=self.settings.max_sessions,
+            idle_sec=self.settings.session_idle_sec,
+        )
+        path = self.settings.intents_path
+        self._intents = IntentMatcher.from_file(path) if path else default_intent_matcher()
+        for spec in self._intents.intents:
+            if spec.command is not None:
+                TestMovementCommand(spec.command)  # fail at startup on unknown commands
         wake_pattern = "|".join(re.escape(phrase) for phrase in self.settings.wake_phrases)
         self._wake_regex = re.compile(rf"^\s*(?:{wake_pattern})\\b[\s,]*", re.IGNORECASE)
         self._wake_ack_cycle = (
@@ -59,6 +82,50 @@ class RouterPolicy:
             else None
         )
 
+    def _new_session(self, source: str) -> RouterSession:
+        return RouterSession(
+            source=source,
+            history=ConversationHistory(
+                token_budget=self.settings.history_token_budget,
+                max_messages=self.settings.history_max_messages,
+                summary_budget=self.settings.history_summary_tokens,
+            ),
+            partials=PartialTracker(
+                stable_updates=max(1, self.settings.speculate_stable_updates),
+                min_words=self.settings.speculate_min_words,
+            ),
+            live_mode=self.settings.live_mode_default,
+        )
+
+    # State of the default session, for single-source deployments.
+    @property
+    def live_mode(self) -> bool:
+        return self.sessions.get().live_mode
+
+    @live_mode.setter
+    def live_mode(self, value: bool) -> None:
+        self.sessions.get().live_mode = value
+
+    @property
+    def wake_session_active(self) -> bool:
+        return self.sessions.get().wake_session_active
+
+    @property
+    def history(self) -> ConversationHistory:
+        return self.sessions.get().history
+
+    @property
+    def llm_segmenters(self) -> Dict[str, SentenceSegmenter]:
+        return self.sessions.get().llm_segmenters
+
+    @property
+    def llm_stream_segments(self) -> Dict[str, List[str]]:
+        return self.sessions.get().llm_stream_segments
+
+    @property
+    def llm_stream_completed(self) -> set[str]:
+        return self.sessions.get().llm_stream_completed
+
     async def handle_health(self, service: str, event: HealthPing, ctx: Ctx) -> None:
         ctx.logger.debug("router.health", extra={"service": service, "ok": event.ok})
         if service not in self.ready:
@@ -87,15 +154,20 @@ class RouterPolicy:
 
     async def handle_wake_event(self, event: WakeEvent, ctx: Ctx) -> None:
         event_type = (event.type or "").lower()
-        ctx.logger.info("router.wake", extra={"event": event_type})
+        session = self.sessions.get(event.source)
+        ctx.logger.info("router.wake", extra={"event": event_type, "source": session.source})
+        session.partials.reset()
+        if session.speculation is not None:
+            await self._cancel_speculation(ctx, session, reason="wake")
         tts_id = event.tts_id
         if event_type == "wake":
-            self._open_wake_window()
+            self._open_wake_window(session)
             ack_text = self._next_wake_ack_text()
             if ack_text:
                 ack_utt_id = tts_id or f"wake-ack-{int(time.time() * 1000)}"
                 await self._speak(
                     ctx,
+                    session=session,
                     text=ack_text,
                     style=self.settings.wake_ack_style,
                     utt_id=ack_utt_id,
@@ -105,42 +177,47 @@ class RouterPolicy:
             if self.settings.wake_reprompt_text:
                 await self._speak(
                     ctx,
+                    session=session,
                     text=self.settings.wake_reprompt_text,
                     utt_id=tts_id,
                     correlate=ctx.id_from(event),
                 )
         elif event_type == "interrupt":
-            self._open_wake_window()
+            self._open_wake_window(session)
             if self.settings.wake_interrupt_text:
                 await self._speak(
                     ctx,
+                    session=session,
                     text=self.settings.wake_interrupt_text,
                     utt_id=tts_id,
                     correlate=ctx.id_from(event),
                 )
         elif event_type == "resume":
-            self._close_wake_window()
+            self._close_wake_window(session)
             if self.settings.wake_resume_text:
                 await self._speak(
                     ctx,
+                    session=session,
                     text=self.settings.wake_resume_text,
                     utt_id=tts_id,
                     correlate=ctx.id_from(event),
                 )
         elif event_type == "cancelled":
-            self._close_wake_window()
+            self._close_wake_window(session)
             if self.settings.wake_cancel_text:
                 await self._speak(
                     ctx,
+                    session=session,
                     text=self.settings.wake_cancel_text,
                     utt_id=tts_id,
                     correlate=ctx.id_from(event),
                 )
         elif event_type == "timeout":
-            self._close_wake_window()
+            self._close_wake_window(session)
             if self.settings.wake_timeout_text:
                 await self._speak(
                     ctx,
+                    session=session,
                     text=self.settings.wake_timeout_text,
                     utt_id=tts_id,
                     correlate=ctx.id_from(event),
@@ -151,9 +228,15 @@ class RouterPolicy:
     async def handle_tts_status(self, event: TtsStatus, ctx: Ctx) -> None:
         event_type = (event.event or "").lower()
         if event_type == "speaking_end" and not event.wake_ack:
+            session = self.sessions.owner(event.utt_id)
+            if session is None:
+                return
             # Start a response window for conversational follow-ups
-            self._open_response_window()
-            ctx.logger.debug("router.response_window.opened", extra={"until": self.response_window_until})
+            self._open_response_window(session)
+            ctx.logger.debug(
+                "router.response_window.opened",
+                extra={"until": session.response_window_until, "source": session.source},
+            )
 
     async def handle_movement_status(self, event: Any, ctx: Ctx) -> None:
         """
@@ -176,55 +259,99 @@ class RouterPolicy:
         )
 
 
+    async def handle_stt_partial(self, event: PartialTranscript, ctx: Ctx) -> None:
+        """Send the LLM request early once the partial transcript stops changing."""
+
+        if not self.settings.speculate_enabled:
+            return
+        session = self.sessions.get(event.source)
+        now = time.monotonic()
+        listening = (
+            session.live_mode
+            or (session.wake_session_active and now <= session.wake_active_until)
+            or (session.response_window_active and now <= session.response_window_until)
+        )
+        if not listening:
+            return
+        text = (event.text or "").strip()
+        candidate_text = self._strip_wake_phrase(text) or text
+        words = session.partials.observe(candidate_text)
+        if words is None:
+            return
+        current = session.speculation
+        if current is not None:
+            if current.words == words:
+                return
+            await self._cancel_speculation(ctx, session, reason="partial-changed")
+        if not self._wants_llm(candidate_text):
+            return
+        speculation = Speculation(id=f"spec-{uuid.uuid4().hex[:8]}", text=candidate_text, words=words)
+        session.speculation = speculation
+        await self._publish_llm_request(
+            ctx, session, speculation.id, candidate_text, reason="speculative", correlate=ctx.id_from(event)
+        )
+
     async def handle_stt_final(self, event: FinalTranscript, ctx: Ctx) -> None:
+        session = self.sessions.get(event.source)
+        session.partials.reset()
+        try:
+            await self._route_final(event, session, ctx)
+        finally:
+            if session.speculation is not None:
+                # The final was dropped or routed locally, so the early request is moot.
+                await self._cancel_speculation(ctx, session, reason="final-not-llm")
+
+    async def _route_final(self, event: FinalTranscript, session: RouterSession, ctx: Ctx) -> None:
         text = (event.text or "").strip()
         if not text:
             ctx.logger.debug("router.stt.empty")
             return
 
         now = time.monotonic()
-        if self.wake_session_active and now > self.wake_active_until:
+        if session.wake_session_active and now > session.wake_active_until:
             ctx.logger.info("router.wake.expired")
-            self._close_wake_window()
+            self._close_wake_window(session)
 
-        if self.response_window_active and now > self.response_window_until:
+        if session.response_window_active and now > session.response_window_until:
             ctx.logger.debug("router.response_window.expired")
-            self._close_response_window()
+            self._close_response_window(session)
 
         candidate_text = text
         remainder = self._strip_wake_phrase(text)
         if remainder:
             candidate_text = remainder
 
-        window_active = self.wake_session_active
-        response_window_active = self.response_window_active
+        window_active = session.wake_session_active
+        response_window_active = session.response_window_active
         gating_reason: Optional[str] = None
-        if self.live_mode:
+        if session.live_mode:
             gating_reason = "live-mode"
         elif window_active:
             gating_reason = "wake-event"
         elif response_window_active:
             gating_reason = "response-window"
 
-        if not self.live_mode and not window_active and not response_window_active:
-            ctx.logger.info("router.stt.dropped", extra={"reason": "no-wake"})
+        if not session.live_mode and not window_active and not response_window_active:
+            ctx.logger.info("router.stt.dropped", extra={"reason": "no-wake", "source": session.source})
             return
 
         norm_candidate = self._normalize_command(candidate_text)
 
         if norm_candidate == self.settings.live_mode_enter_phrase:
-            if self.live_mode:
+            if session.live_mode:
                 await self._speak(
                     ctx,
+                    session=session,
                     text=self.settings.live_mode_active_hint,
                     utt_id=event.utt_id,
                     correlate=ctx.id_from(event),
                 )
             else:
-                self.live_mode = True
-                self._close_wake_window()
+                session.live_mode = True
+                self._close_wake_window(session)
                 await self._speak(
                     ctx,
+                    session=session,
                     text=self.settings.live_mode_enter_ack,
                     utt_id=event.utt_id,
                     correlate=ctx.id_from(event),
@@ -232,18 +359,20 @@ class RouterPolicy:
             return
 
         if norm_candidate == self.settings.live_mode_exit_phrase:
-            if not self.live_mode:
+            if not session.live_mode:
                 await self._speak(
                     ctx,
+                    session=session,
                     text=self.settings.live_mode_inactive_hint,
                     utt_id=event.utt_id,
                     correlate=ctx.id_from(event),
                 )
             else:
-                self.live_mode = False
-                self._close_wake_window()
+                session.live_mode = False
+                self._close_wake_window(session)
                 await self._speak(
                     ctx,
+                    session=session,
                     text=self.settings.live_mode_exit_ack,
                     utt_id=event.utt_id,
                     correlate=ctx.id_from(event),
@@ -251,15 +380,17 @@ class RouterPolicy:
             return
 
         if window_active:
-            self._close_wake_window()
+            self._close_wake_window(session)
 
         if response_window_active:
-            self._close_response_window()
+            self._close_response_window(session)
 
         ctx.logger.debug("router.stt.route", extra={"gating": gating_reason or "wake"})
 
-        # Check for movement commands first
-        movement_cmd = self._detect_movement_command(candidate_text)
+        intent = self._intents.match(candidate_text)
+        if intent is not None:
+            ctx.logger.debug("router.intent", extra={"intent": intent.name, "score": round(intent.score, 3)})
+        movement_cmd = self._movement_command(intent)
         if movement_cmd is not None:
             req = TestMovementRequest(
                 command=movement_cmd,
@@ -267,7 +398,7 @@ class RouterPolicy:
                 request_id=event.utt_id or f"mv-{uuid.uuid4().hex[:8]}"
             )
             await ctx.publish(
-                self.settings.topic_movement_test,
+                "movement.test",
                 req,
                 correlate=ctx.id_from(event),
                 qos=1
@@ -275,10 +406,11 @@ class RouterPolicy:
             ctx.logger.info("router.movement.command", extra={"command": movement_cmd.value})
             return
 
-        resp = self._rule_route(candidate_text)
+        resp = self._rule_route(intent)
         if resp is not None:
             await self._speak(
                 ctx,
+                session=session,
                 text=resp["text"],
                 style=resp["style"],
                 utt_id=event.utt_id,
@@ -287,29 +419,24 @@ class RouterPolicy:
             )
             return
 
+        if session.speculation is not None and await self._commit_speculation(ctx, session, candidate_text, event):
+            return
+
         req_id = event.utt_id or f"rt-{uuid.uuid4().hex[:8]}"
-        # Add user message to conversation history
-        self._add_user_message(candidate_text, event.ts)
-        # Include recent conversation history (limit to avoid token limits)
-        recent_history = self._get_recent_history(max_messages=10)
-        llm_req = LLMRequest(id=req_id, text=candidate_text, stream=True, conversation_history=recent_history)
-        ctx.logger.info(
-            "router.llm.request",
-            extra={"id": req_id, "len": len(candidate_text or ""), "reason": gating_reason, "history_len": len(recent_history)},
+        await self._publish_llm_request(
+            ctx, session, req_id, candidate_text, reason=gating_reason, correlate=ctx.id_from(event)
         )
-        await ctx.publish(EVENT_TYPE_LLM_REQUEST, llm_req, correlate=ctx.id_from(event), qos=1)
-        if self.metrics:
-            self.metrics.record_llm_request(req_id)
-            self._log_metrics(ctx)
+        session.history.add("user", candidate_text, event.ts)
 
     async def handle_llm_cancel(self, event: LLMCancel, ctx: Ctx) -> None:
         rid = event.id.strip()
-        if rid and rid in self.llm_buf:
-            ctx.logger.info("router.llm.cancel", extra={"id": rid})
-            self.llm_buf.pop(rid, None)
-        if rid:
-            self.llm_stream_segments.pop(rid, None)
-            self.llm_stream_completed.discard(rid)
+        session = self.sessions.owner(rid) if rid else None
+        if session is not None:
+            if rid in session.llm_segmenters:
+                ctx.logger.info("router.llm.cancel", extra={"id": rid})
+                session.llm_segmenters.pop(rid, None)
+            session.llm_stream_segments.pop(rid, None)
+            session.llm_stream_completed.discard(rid)
         if self.metrics:
             self.metrics.abandon_llm_request(rid)
             self._log_metrics(ctx)
@@ -318,20 +445,29 @@ class RouterPolicy:
         ctx.logger.info("router.llm.response.raw", extra={"id": event.id or "", "error": bool(event.error)})
         text = (event.reply or "").strip()
         rid = (event.id or "").strip()
+        session = self.sessions.owner(rid)
+        if session is None:
+            ctx.logger.info("router.llm.response.orphaned", extra={"id": rid})
+            return
+        if self._hold_speculative(session, rid, "response", event):
+            return
         ctx.logger.info(
             "router.llm.response.received",
             extra={"id": event.id or "", "len": len(text), "provider": event.provider, "model": event.model},
         )
-        stream_completed = bool(rid and rid in self.llm_stream_completed)
+        if text:
+            # Record the full reply, even when it was already spoken from the stream.
+            session.history.add("assistant", text, time.time())
+        stream_completed = bool(rid and rid in session.llm_stream_completed)
         if self.settings.router_llm_tts_stream and rid and stream_completed:
-            segments = self.llm_stream_segments.pop(rid, [])
+            segments = session.llm_stream_segments.pop(rid, [])
             residual, matched = self._residual_after_stream(text, segments)
             if matched and not residual:
                 ctx.logger.info(
                     "router.llm.response.skip",
                     extra={"id": rid, "reason": "already-streamed"},
                 )
-                self.llm_stream_completed.discard(rid)
+                session.llm_stream_completed.discard(rid)
                 return
             if matched and residual:
                 ctx.logger.info(
@@ -346,96 +482,186 @@ class RouterPolicy:
                 )
         else:
             if rid:
-                self.llm_stream_segments.pop(rid, None)
+                session.llm_stream_segments.pop(rid, None)
         if not text:
             return
         ctx.logger.info("router.llm.response", extra={"len": len(text)})
-        # Add assistant response to conversation history
-        self._add_assistant_message(text)
         await self._speak(
             ctx,
+            session=session,
             text=text,
             utt_id=rid or None,
             correlate=ctx.id_from(event),
         )
-        if self.metrics and (not rid or rid not in self.llm_stream_completed):
+        if self.metrics and (not rid or rid not in session.llm_stream_completed):
             self.metrics.record_llm_response(rid or "")
             self._log_metrics(ctx)
         if rid:
-            self.llm_stream_completed.discard(rid)
+            session.llm_stream_completed.discard(rid)
 
     async def handle_llm_stream(self, event: LLMStreamDelta, ctx: Ctx) -> None:
         if not self.settings.router_llm_tts_stream:
             return
         rid = (event.id or "").strip()
-        if not rid:
+        session = self.sessions.owner(rid) if rid else None
+        if session is None or self._hold_speculative(session, rid, "stream", event):
             return
-        self.llm_stream_completed.discard(rid)
+        session.llm_stream_completed.discard(rid)
         delta = event.delta or ""
         done = bool(event.done)
-        buf = self.llm_buf.get(rid, "")
         if delta:
-            buf += delta
-            flushed_any = False
-            while self._should_flush(buf):
-                sent, remainder = self._split_on_boundary(buf)
-                if not sent:
-                    if self.settings.stream_boundary_only:
-                        break
-                    cut = min(len(buf), self.settings.stream_max_chars)
-                    if cut <= 0:
-                        break
-                    sent, remainder = buf[:cut].strip(), buf[cut:].lstrip()
-                    if not sent:
-                        break
+            segmenter = session.llm_segmenters.get(rid)
+            if segmenter is None:
+                segmenter = session.llm_segmenters[rid] = SentenceSegmenter(self._segment_policy)
+            sentences = segmenter.push(delta)
+            for sent in sentences:
                 ctx.logger.info("router.llm.stream.flush", extra={"len": len(sent), "id": rid})
-                self._record_stream_segment(rid, sent)
-                await self._speak(ctx, text=sent, utt_id=rid, correlate=ctx.id_from(event))
-                buf = remainder
-                flushed_any = True
-            self.llm_buf[rid] = buf
-            if not flushed_any:
-                ctx.logger.debug("router.llm.stream.buffer", extra={"id": rid, "len": len(buf)})
-            if self.settings.stream_boundary_only and len(buf) > self.settings.stream_hard_max_chars:
-                cut_idx = buf.rfind(" ", 0, self.settings.stream_hard_max_chars)
-                if cut_idx <= 0:
-                    cut_idx = self.settings.stream_hard_max_chars
-                sent, remainder = buf[:cut_idx].strip(), buf[cut_idx:].lstrip()
-                if sent:
-                    ctx.logger.info("router.llm.stream.safety", extra={"len": len(sent), "id": rid})
-                    self._record_stream_segment(rid, sent)
-                    await self._speak(ctx, text=sent, utt_id=rid, correlate=ctx.id_from(event))
-                    self.llm_buf[rid] = remainder
+                self._record_stream_segment(session, rid, sent)
+                await self._speak(ctx, session=session, text=sent, utt_id=rid, correlate=ctx.id_from(event))
+            if not sentences:
+                ctx.logger.debug("router.llm.stream.buffer", extra={"id": rid, "len": len(segmenter.pending)})
         if done:
-            final = self.llm_buf.pop(rid, "").strip()
+            segmenter = session.llm_segmenters.pop(rid, None)
+            final = segmenter.finish() if segmenter else ""
             if final:
                 ctx.logger.info("router.llm.stream.final", extra={"len": len(final), "id": rid})
-                self._record_stream_segment(rid, final)
-                await self._speak(ctx, text=final, utt_id=rid, correlate=ctx.id_from(event))
+                self._record_stream_segment(session, rid, final)
+                await self._speak(ctx, session=session, text=final, utt_id=rid, correlate=ctx.id_from(event))
             if self.metrics:
                 self.metrics.record_llm_response(rid)
                 self._log_metrics(ctx)
-            self.llm_stream_completed.add(rid)
+            session.llm_stream_completed.add(rid)
 
     # ------------------------------------------------------------------
     # Helpers
 
-    def _open_wake_window(self) -> None:
-        self.wake_session_active = True
-        self.wake_active_until = time.monotonic() + self.settings.wake_window_sec
+    async def _publish_llm_request(
+        self,
+        ctx: Ctx,
+        session: RouterSession,
+        req_id: str,
+        text: str,
+        *,
+        reason: Optional[str],
+        correlate: Optional[str],
+    ) -> None:
+        # Snapshot prior turns before recording this one: the current utterance travels as `text`.
+        recent_history = session.history.messages()
+        llm_req = LLMRequest(
+            id=req_id,
+            text=text,
+            stream=True,
+            conversation_history=recent_history,
+            conversation_summary=session.history.context(),
+            source=session.source if session.source != DEFAULT_SOURCE else None,
+        )
+        self.sessions.bind(req_id, session)
+        ctx.logger.info(
+            "router.llm.request",
+            extra={
+                "id": req_id,
+                "len": len(text or ""),
+                "reason": reason,
+                "source": session.source,
+                "history_len": len(recent_history),
+                "history_tokens": session.history.tokens,
+            },
+        )
+        await ctx.publish(EVENT_TYPE_LLM_REQUEST, llm_req, correlate=correlate, qos=1)
+        if self.metrics:
+            self.metrics.record_llm_request(req_id)
+            self._log_metrics(ctx)
+
+    def _wants_llm(self, text: str) -> bool:
+        """Whether a final with this text would go to the LLM rather than a local route."""
+
+        norm = self._normalize_command(text)
+        if norm in (self.settings.live_mode_enter_phrase, self.settings.live_mode_exit_phrase):
+            return False
+        intent = self._intents.match(text)
+        return intent is None or (intent.intent.command is None and intent.intent.reply is None)
+
+    def _hold_speculative(self, session: RouterSession, rid: str, kind: str, event: Any) -> bool:
+        """Hold events of an uncommitted speculation and drop those of cancelled ones."""
+
+        if rid in self._cancelled_llm:
+            return True
+        speculation = session.speculation
+        if speculation is not None and rid == speculation.id:
+            speculation.held.append((kind, event))
+            return True
+        return False
+
+    async def _commit_speculation(
+        self, ctx: Ctx, session: RouterSession, text: str, event: FinalTranscript
+    ) -> bool:
+        speculation = session.speculation
+        assert speculation is not None
+        similarity = transcript_similarity(speculation.words, normalize_transcript(text))
+        if similarity < self.settings.speculate_similarity:
+            await self._cancel_speculation(ctx, session, reason="mismatch", similarity=similarity)
+            return False
+        session.speculation = None
+        saved = time.monotonic() - speculation.started
+        ctx.logger.info(
+            "router.speculation.commit",
+            extra={
+                "id": speculation.id,
+                "similarity": round(similarity, 3),
+                "saved_ms": round(saved * 1000.0, 1),
+                "held": len(speculation.held),
+            },
+        )
+        if self.metrics:
+            self.metrics.record_speculation(hit=True, saved=saved)
+        session.history.add("user", text, event.ts)
+        for kind, held in speculation.held:
+            if kind == "stream":
+                await self.handle_llm_stream(held, ctx)
+            else:
+                await self.handle_llm_response(held, ctx)
+        return True
+
+    async def _cancel_speculation(
+        self, ctx: Ctx, session: RouterSession, *, reason: str, similarity: Optional[float] = None
+    ) -> None:
+        speculation = session.speculation
+        if speculation is None:
+            return
+        session.speculation = None
+        self._cancelled_llm.add(speculation.id)
+        ctx.logger.info(
+            "router.speculation.cancel",
+            extra={
+                "id": speculation.id,
+                "reason": reason,
+                "similarity": None if similarity is None else round(similarity, 3),
+            },
+        )
+        if self.metrics:
+            self.metrics.abandon_llm_request(speculation.id)
+            self.metrics.record_speculation(hit=False)
+        await ctx.publish(EVENT_TYPE_LLM_CANCEL, LLMCancel(id=speculation.id), qos=1)
 
-    def _close_wake_window(self) -> None:
-        self.wake_session_active = False
-        self.wake_active_until = 0.0
+    def _open_wake_window(self, session: RouterSession) -> None:
+        session.wake_session_active = True
+        session.wake_active_until = time.monotonic() + self.settings.wake_window_sec
 
-    def _open_response_window(self) -> None:
+    @staticmethod
+    def _close_wake_window(session: RouterSession) -> None:
+        session.wake_session_active = False
+        session.wake_active_until = 0.0
+
+    @staticmethod
+    def _open_response_window(session: RouterSession) -> None:
         # Use the same duration as the STT worker's response window
-        self.response_window_active = True
-        self.response_window_until = time.monotonic() + 10.0  # 10 seconds
+        session.response_window_active = True
+        session.response_window_until = time.monotonic() + 10.0  # 10 seconds
 
-    def _close_response_window(self) -> None:
-        self.response_window_active = False
-        self.response_window_until = 0.0
+    @staticmethod
+    def _close_response_window(session: RouterSession) -> None:
+        session.response_window_active = False
+        session.response_window_until = 0.0
 
     def _next_wake_ack_text(self) -> Optional[str]:
         if not self.settings.wake_ack_enabled:
@@ -449,6 +675,7 @@ class RouterPolicy:
         ctx: Ctx,
         *,
         text: str,
+        session: Optional[RouterSession] = None,
         style: str = "neutral",
         utt_id: Optional[str] = None,
         wake_ack: Optional[bool] = None,
@@ -467,7 +694,10 @@ class RouterPolicy:
             wake_ack=wake_ack,
             system_announce=system_announce,
             stt_ts=stt_ts,
+            source=session.source if session is not None and session.source != DEFAULT_SOURCE else None,
         )
+        if session is not None:
+            self.sessions.bind(utt_id, session)
         await ctx.publish(EVENT_TYPE_SAY, say, correlate=correlate, qos=1)
         ctx.logger.info(
             "router.tts.say",
@@ -483,11 +713,12 @@ class RouterPolicy:
             self.metrics.record_tts_message()
             self._log_metrics(ctx)
 
-    def _record_stream_segment(self, rid: str, segment: str) -> None:
+    @staticmethod
+    def _record_stream_segment(session: RouterSession, rid: str, segment: str) -> None:
         seg = segment.strip()
         if not rid or not seg:
             return
-        self.llm_stream_segments.setdefault(rid, []).append(seg)
+        session.llm_stream_segments.setdefault(rid, []).append(seg)
 
     def _residual_after_stream(self, text: str, segments: List[str]) -> tuple[str, bool]:
         remainder = text
@@ -507,43 +738,11 @@ class RouterPolicy:
         cleaned = re.sub(r"[^a-z0-9\s]", "", text.lower())
         return re.sub(r"\s+", " ", cleaned).strip()
 
-    def _detect_movement_command(self, text: str) -> Optional[TestMovementCommand]:
-        """
-        Detect movement commands from user input.
-        
-        Returns TestMovementCommand if a movement is detected, None otherwise.
-        """
-        t = text.lower().strip()
-        
-        # Map common phrases to movement commands
-        movement_patterns = {
-            TestMovementCommand.WAVE: ["wave", "wave your hand", "wave hello"],
-            TestMovementCommand.LAUGH: ["laugh", "do a laugh", "laugh animation"],
-            TestMovementCommand.BOW: ["bow", "take a bow", "bow down"],
-            TestMovementCommand.SWING_LEGS: ["swing legs", "swing your legs", "leg swing"],
-            TestMovementCommand.BALANCE: ["balance", "stand up", "balance yourself"],
-            TestMovementCommand.POSE: ["pose", "strike a pose", "do a pose"],
-            TestMovementCommand.STEP_FORWARD: ["step forward", "walk forward", "move forward"],
-            TestMovementCommand.STEP_BACKWARD: ["step backward", "step back", "walk backward", "move back"],
-            TestMovementCommand.TURN_LEFT: ["turn left", "rotate left"],
-            TestMovementCommand.TURN_RIGHT: ["turn right", "rotate right"],
-            TestMovementCommand.RESET: ["reset", "reset position", "go to reset"],
-            TestMovementCommand.DISABLE: ["disable", "turn off", "power down"],
-            TestMovementCommand.STOP: ["stop", "stop moving", "halt"],
-            TestMovementCommand.MIC_DROP: ["mic drop", "drop the mic"],
-            TestMovementCommand.MONSTER: ["monster", "monster pose"],
-            TestMovementCommand.PEZZ_DISPENSER: ["pez", "pez dispenser", "pezz"],
-            TestMovementCommand.NOW: ["now", "now pose"],
-        }
-        
-        # Check for exact or substring matches
-        for cmd, patterns in movement_patterns.items():
-            for pattern in patterns:
-                if pattern in t or t == pattern:
-                    return cmd
-        
-        return None
-
+    @staticmethod
+    def _movement_command(intent: Optional[IntentMatch]) -> Optional[TestMovementCommand]:
+        if intent is None or intent.intent.command is None:
+            return None
+        return TestMovementCommand(intent.intent.command)
 
     def _strip_wake_phrase(self, text: str) -> Optional[str]:
         match = self._wake_regex.match(text)
@@ -552,63 +751,24 @@ class RouterPolicy:
         remainder = text[match.end() :].strip()
         return remainder
 
-    def _rule_route(self, text: str) -> Optional[dict[str, str]]:
-        t = text.lower().strip()
-        if any(x in t for x in ("what time", "time is it")):
+    @staticmethod
+    def _rule_route(intent: Optional[IntentMatch]) -> Optional[dict[str, str]]:
+        if intent is None or intent.intent.reply is None:
+            return None
+        values: dict[str, Any] = dict(intent.slots)
+        if "{time}" in intent.intent.reply:
             from datetime import datetime
 
-            now = datetime.now().strftime("%-I:%M %p")
-            return {"text": f"It is {now}.", "style": "neutral"}
-        if t.startswith("say "):
-            return {"text": text[4:], "style": "neutral"}
-        if re.search(r"\b(hello|hi|hey|hiya|howdy)\b", t):
-            return {"text": "Hello! How can I help?", "style": "friendly"}
-        return None
-
-    def _should_flush(self, buf: str) -> bool:
-        if self.settings.stream_boundary_only:
-            return any(ch in buf for ch in self.settings.stream_boundary_chars)
-        if any(ch in buf for ch in self.settings.stream_boundary_chars):
-            return True
-        if len(buf) >= self.settings.stream_min_chars:
-            return True
-        return len(buf) >= self.settings.stream_max_chars
-
-    def _split_on_boundary(self, text: str) -> tuple[str, str]:
-        idx = -1
-        for i in range(len(text) - 1, -1, -1):
-            ch = text[i]
-            if ch in self.settings.stream_boundary_chars:
-                if i == len(text) - 1 or text[i + 1].isspace():
-                    idx = i
-                    break
-        if idx < 0:
-            idx = max((text.rfind(ch) for ch in self.settings.stream_boundary_chars), default=-1)
-        if idx >= 0:
-            return text[: idx + 1].strip(), text[idx + 1 :].lstrip()
-        return "", text
+            values["time"] = datetime.now().strftime("%-I:%M %p")
+        return {"text": intent.intent.reply.format_map(values), "style": intent.intent.style}
 
     def _log_metrics(self, ctx: Ctx) -> None:
         if not self.metrics:
             return
         ctx.logger.debug("router.metrics", extra=self.metrics.snapshot())
 
-    def _add_user_message(self, text: str, timestamp: Optional[float] = None) -> None:
-        """Add a user message to conversation history."""
-        self.conversation_history.append(
-            ConversationMessage(role="user", content=text, timestamp=timestamp)
-        )
-
-    def _add_assistant_message(self, text: str, timestamp: Optional[float] = None) -> None:
-        """Add an assistant message to conversation history."""
-        self.conversation_history.append(
-            ConversationMessage(role="assistant", content=text, timestamp=timestamp or time.time())
-        )
-
-    def _get_recent_history(self, max_messages: int = 10) -> List[ConversationMessage]:
-        """Get recent conversation history, limited to max_messages."""
-        return self.conversation_history[-max_messages:] if self.conversation_history else []
-
-    def _clear_conversation_history(self) -> None:
-        """Clear conversation history (useful for new sessions)."""
-        self.conversation_history.clear()
+    def _clear_conversation_history(self, source: Optional[str] = None) -> None:
+        """Clear a session's conversation history; pinned facts are kept."""
+        session = self.sessions.peek(source)
+        if session is not None:
+            session.history.clear()
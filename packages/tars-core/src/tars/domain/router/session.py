@@ -0,0 +1,126 @@
+"""Per-source router state.
+
+Each capture source (microphone, remote client) gets a ``RouterSession`` with
+its own wake/response windows, live mode, conversation history, speculation
+and LLM stream buffers, so concurrent sources never see each other's state.
+Events carry the source id (``WakeEvent.source``, ``FinalTranscript.source``);
+LLM and TTS events are mapped back through the request/utterance ids the
+router issued. ``SessionStore`` keeps at most ``max_sessions`` sessions and
+evicts the least recently used, plus any idle longer than ``idle_sec``; all
+operations are O(1) in the number of sessions.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional
+
+from tars.domain.segmenter import SentenceSegmenter
+
+from .history import ConversationHistory
+from .speculation import PartialTracker, Speculation
+
+DEFAULT_SOURCE = "default"
+
+
+@dataclass(slots=True)
+class RouterSession:
+    source: str
+    history: ConversationHistory
+    partials: PartialTracker
+    live_mode: bool = False
+    wake_session_active: bool = False
+    wake_active_until: float = 0.0
+    response_window_active: bool = False
+    response_window_until: float = 0.0
+    speculation: Optional[Speculation] = None
+    llm_segmenters: Dict[str, SentenceSegmenter] = field(default_factory=dict)
+    llm_stream_segments: Dict[str, List[str]] = field(default_factory=dict)
+    llm_stream_completed: set[str] = field(default_factory=set)
+    last_seen: float = field(default_factory=time.monotonic)
+
+
+class SessionStore:
+    """LRU of router sessions plus a bounded map of issued ids to sessions."""
+
+    __slots__ = ("_factory", "max_sessions", "idle_sec", "_sessions", "_owners", "_max_owners")
+
+    def __init__(
+        self,
+        factory: Callable[[str], RouterSession],
+        *,
+        max_sessions: int = 64,
+        idle_sec: float = 3600.0,
+    ) -> None:
+        if max_sessions <= 0:
+            raise ValueError("max_sessions must be positive")
+        self._factory = factory
+        self.max_sessions = max_sessions
+        self.idle_sec = idle_sec
+        self._sessions: OrderedDict[str, RouterSession] = OrderedDict()
+        self._owners: OrderedDict[str, str] = OrderedDict()
+        self._max_owners = max_sessions * 32
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __iter__(self) -> Iterator[RouterSession]:
+        return iter(list(self._sessions.values()))
+
+    def get(self, source: Optional[str] = None) -> RouterSession:
+        """Session for ``source`` (created on first use), marked as most recent."""
+
+        key = source or DEFAULT_SOURCE
+        now = time.monotonic()
+        session = self._sessions.get(key)
+        if session is None:
+            session = self._sessions[key] = self._factory(key)
+        else:
+            self._sessions.move_to_end(key)
+        session.last_seen = now
+        self._evict(now)
+        return session
+
+    def peek(self, source: Optional[str] = None) -> Optional[RouterSession]:
+        return self._sessions.get(source or DEFAULT_SOURCE)
+
+    def bind(self, request_id: Optional[str], session: RouterSession) -> None:
+        """Remember that ``request_id`` (LLM request or TTS utterance) belongs to ``session``."""
+
+        if not request_id:
+            return
+        self._owners[request_id] = session.source
+        self._owners.move_to_end(request_id)
+        while len(self._owners) > self._max_owners:
+            self._owners.popitem(last=False)
+
+    def owner(self, request_id: Optional[str]) -> Optional[RouterSession]:
+        """Session that issued ``request_id``.
+
+        Ids the router never issued belong to the default session; ids of an
+        evicted session return None so their late events are dropped.
+        """
+
+        source = self._owners.get(request_id) if request_id else None
+        if source is None:
+            return self.get(DEFAULT_SOURCE)
+        session = self._sessions.get(source)
+        if session is not None:
+            session.last_seen = time.monotonic()
+            self._sessions.move_to_end(source)
+        return session
+
+    def _evict(self, now: float) -> None:
+        sessions = self._sessions
+        while len(sessions) > self.max_sessions:
+            sessions.popitem(last=False)
+        while len(sessions) > 1:
+            oldest = next(iter(sessions.values()))
+            if now - oldest.last_seen <= self.idle_sec:
+                break
+            sessions.popitem(last=False)
+
+
+__all__ = ["DEFAULT_SOURCE", "RouterSession", "SessionStore"]
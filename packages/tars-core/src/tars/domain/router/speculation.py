@@ -0,0 +1,106 @@
+"""Speculative LLM requests issued from stable STT partials.
+
+While the user is still speaking, ``PartialTracker`` watches ``stt/partial``
+updates; once the normalised text has been identical for ``stable_updates``
+consecutive partials, the router sends the LLM request early. The
+``Speculation`` then holds every stream delta and response for that request
+until the final transcript arrives: if it is similar enough
+(``transcript_similarity``), the held events are replayed as if the request
+had been sent on the final; otherwise the request is cancelled and the held
+events dropped.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from typing import Any, Optional
+
+_WORD = re.compile(r"\w+(?:'\w+)*")
+
+
+def normalize_transcript(text: str) -> tuple[str, ...]:
+    """Lowercase words without punctuation, for comparing transcripts."""
+
+    return tuple(word.replace("'", "") for word in _WORD.findall(text.lower()))
+
+
+def transcript_similarity(a: tuple[str, ...], b: tuple[str, ...]) -> float:
+    """Word-level similarity in [0, 1] between two normalised transcripts."""
+
+    if a == b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+    return SequenceMatcher(None, a, b, autojunk=False).ratio()
+
+
+@dataclass(slots=True)
+class PartialTracker:
+    """Detect when consecutive partials stop changing."""
+
+    stable_updates: int = 2
+    min_words: int = 3
+    _words: tuple[str, ...] = field(init=False, default=())
+    _count: int = field(init=False, default=0)
+
+    def observe(self, text: str) -> Optional[tuple[str, ...]]:
+        """Record a partial; return its words once stable, else None."""
+
+        words = normalize_transcript(text)
+        if words and words == self._words:
+            self._count += 1
+        else:
+            self._words, self._count = words, 1
+        if len(words) >= self.min_words and self._count >= self.stable_updates:
+            return words
+        return None
+
+    def reset(self) -> None:
+        self._words, self._count = (), 0
+
+
+@dataclass(slots=True)
+class Speculation:
+    """An LLM request sent before the final transcript."""
+
+    id: str
+    text: str
+    words: tuple[str, ...]
+    started: float = field(default_factory=time.monotonic)
+    held: list[tuple[str, Any]] = field(default_factory=list)  # ("stream"|"response", event)
+
+
+@dataclass(slots=True)
+class CancelledRequests:
+    """Bounded memory of cancelled request ids whose late events are dropped."""
+
+    maxlen: int = 64
+    _order: deque[str] = field(init=False)
+    _ids: set[str] = field(init=False, default_factory=set)
+
+    def __post_init__(self) -> None:
+        self._order = deque()
+
+    def __contains__(self, request_id: object) -> bool:
+        return request_id in self._ids
+
+    def add(self, request_id: str) -> None:
+        if request_id in self._ids:
+            return
+        self._order.append(request_id)
+        self._ids.add(request_id)
+        while len(self._order) > self.maxlen:
+            self._ids.discard(self._order.popleft())
+
+
+__all__ = [
+    "CancelledRequests",
+    "PartialTracker",
+    "Speculation",
+    "normalize_transcript",
+    "transcript_similarity",
+]
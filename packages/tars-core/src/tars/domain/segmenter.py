@@ -0,0 +1,242 @@
+"""Incremental sentence segmentation for streamed LLM output.
+
+``SentenceSegmenter`` consumes text deltas and yields complete sentences as
+soon as their boundary is certain. Scanning resumes where the previous delta
+stopped, so each ``push`` costs O(len(delta)) rather than rescanning the
+buffer. A terminator only ends a sentence when followed by whitespace, which
+keeps decimals ("3.14"), versions and URLs intact; abbreviations ("Dr.",
+"e.g."), initials, list numbers ("1.") and terminators followed by a
+lowercase word ("5 p.m. tomorrow", "Well... maybe") never split. Closing quotes and brackets stay with their sentence.
+
+Length policy (``SegmentPolicy``):
+
+- ``min_chars``: shorter sentences merge with the next one
+- ``max_chars``: without a boundary, cut at the last space before this length
+- ``hard_max_chars``: same, applied even in boundary-only setups
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+DEFAULT_ABBREVIATIONS: frozenset[str] = frozenset(
+    {
+        "mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "mt", "ft",
+        "vs", "e.g", "i.e", "cf", "approx", "dept", "fig", "vol",
+        "gen", "col", "lt", "sgt", "capt", "gov", "sen", "rep",
+    }
+)
+_ELLIPSIS = "…"
+_CLOSERS = "\"')]}”’»"
+_COMPACT_AT = 256  # tail length worth moving into the scanned chunks
+
+
+@dataclass(frozen=True, slots=True)
+class SegmentPolicy:
+    boundary_chars: str = ".!?"
+    min_chars: int = 0
+    max_chars: Optional[int] = None
+    hard_max_chars: Optional[int] = None
+    abbreviations: frozenset[str] = DEFAULT_ABBREVIATIONS
+
+    def __post_init__(self) -> None:
+        if not self.boundary_chars:
+            raise ValueError("boundary_chars must not be empty")
+        for name in ("max_chars", "hard_max_chars"):
+            value = getattr(self, name)
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be positive")
+
+
+@dataclass(slots=True)
+class SentenceSegmenter:
+    """Resumable sentence splitter; one instance per stream.
+
+    Pending text is kept as already-scanned chunks plus a short tail that
+    starts at a word boundary. Only the tail is rescanned when a decision has
+    to wait for more input, so long run-on text is never copied per delta.
+    """
+
+    policy: SegmentPolicy = field(default_factory=SegmentPolicy)
+    _head: list[str] = field(init=False, default_factory=list)
+    _head_len: int = field(init=False, default=0)
+    _tail: str = field(init=False, default="")
+    _pos: int = field(init=False, default=0)
+    _limit: Optional[int] = field(init=False, default=None)
+    _terminator_run: re.Pattern[str] = field(init=False)
+
+    def __post_init__(self) -> None:
+        terminators = re.escape("".join(sorted(set(self.policy.boundary_chars) | {_ELLIPSIS})))
+        self._terminator_run = re.compile(rf"[{terminators}]+(?P<closers>[{re.escape(_CLOSERS)}]*)")
+        limits = [limit for limit in (self.policy.max_chars, self.policy.hard_max_chars) if limit]
+        self._limit = min(limits) if limits else None
+
+    @property
+    def pending(self) -> str:
+        """Text received but not yet emitted."""
+
+        return "".join(self._head) + self._tail
+
+    def push(self, delta: str) -> list[str]:
+        """Add a delta and return the sentences it completed."""
+
+        if not delta:
+            return []
+        self._tail += delta
+        out: list[str] = []
+        while True:
+            end = self._scan()
+            if end is not None:
+                segment = self._take(end)
+            elif self._limit is not None and self._head_len + len(self._tail) > self._limit:
+                segment = self._cut(self._limit)
+            else:
+                if len(self._tail) > _COMPACT_AT:
+                    self._compact()
+                return out
+            if segment:
+                out.append(segment)
+
+    def finish(self) -> str:
+        """End of stream: return whatever is left and reset."""
+
+        rest = self.pending.strip()
+        self.reset()
+        return rest
+
+    def reset(self) -> None:
+        self._head.clear()
+        self._head_len = 0
+        self._tail = ""
+        self._pos = 0
+
+    # ------------------------------------------------------------------
+    def _take(self, end: int) -> str:
+        """Emit pending text up to ``end`` (an offset into the tail)."""
+
+        segment = ("".join(self._head) + self._tail[:end]).strip()
+        self._head.clear()
+        self._head_len = 0
+        self._tail = self._tail[end:].lstrip()
+        self._pos = 0
+        return segment
+
+    def _cut(self, limit: int) -> str:
+        """No boundary within ``limit`` chars: cut at the last space before it."""
+
+        text = "".join(self._head) + self._tail
+        cut = text.rfind(" ", 0, limit + 1)
+        cut = cut if cut > 0 else limit
+        self._head.clear()
+        self._head_len = 0
+        self._tail = text
+        self._pos = 0
+        return self._take(cut)
+
+    def _compact(self) -> None:
+        """Move scanned text before the current word out of the tail."""
+
+        cut = max(self._tail.rfind(" ", 0, self._pos), self._tail.rfind("\n", 0, self._pos))
+        if cut > 0:
+            self._head.append(self._tail[:cut])
+            self._head_len += cut
+            self._tail = self._tail[cut:]
+            self._pos -= cut
+
+    def _scan(self) -> Optional[int]:
+        """Tail offset of the first certain boundary, advancing ``_pos``."""
+
+        buf = self._tail
+        n = len(buf)
+        i = self._pos
+        while (match := self._terminator_run.search(buf, i)) is not None:
+            i, j = match.start(), match.end()
+            if j == n:
+                break  # the next delta decides
+            if not buf[j].isspace():
+                i = j  # "3.14", "example.com", "?!x"
+                continue
+            verdict = self._is_boundary(buf, i, match.start("closers"), j)
+            if verdict is None:
+                break
+            if verdict and self._head_len + j >= self.policy.min_chars:
+                return j
+            i = j
+        else:
+            i = n
+        self._pos = i
+        return None
+
+    def _is_boundary(self, buf: str, start: int, run_end: int, after: int) -> Optional[bool]:
+        """Decide whether the terminator run ``buf[start:run_end]`` ends a sentence.
+
+        Returns None when the decision needs text that has not arrived yet.
+        """
+
+        run = buf[start:run_end]
+        if after > run_end or run != ".":
+            if after == run_end and any(ch not in "." + _ELLIPSIS for ch in run):
+                return True  # "!", "?", ";", mixed runs like "?!"
+            # Ellipses and quoted endings ('"Really?!" she asked') only end a
+            # sentence when the next word looks like the start of a new one.
+            starts = self._next_word_starts_sentence(buf, after)
+            if not starts or run != ".":
+                return starts
+        word_start = start
+        while word_start > 0 and not buf[word_start - 1].isspace():
+            word_start -= 1
+        word = buf[word_start:start].lstrip("\"'([{“‘«")
+        if not word:
+            return True
+        if word.lower() in self.policy.abbreviations:
+            return False
+        if len(word) == 1 and word.isalpha() and word.isupper():
+            return False  # initial: "J. R. R. Tolkien"
+        if word.isdigit() and (word_start == 0 or buf[word_start - 1] == "\n"):
+            return False  # list item: "1. First"
+        # Unknown abbreviations ("5 p.m. tomorrow") are followed by lowercase
+        return self._next_word_starts_sentence(buf, after)
+
+    @staticmethod
+    def _next_word_starts_sentence(buf: str, after: int) -> Optional[bool]:
+        """False when the word after ``after`` is lowercase, None if it has not arrived."""
+
+        k = after
+        while k < len(buf) and buf[k].isspace():
+            k += 1
+        if k == len(buf):
+            return None
+        return not buf[k].islower()
+
+
+def split_sentences(text: str, policy: Optional[SegmentPolicy] = None) -> list[str]:
+    """Segment a complete text with the streaming rules."""
+
+    segmenter = SentenceSegmenter(policy or SegmentPolicy())
+    sentences = segmenter.push(text)
+    rest = segmenter.finish()
+    if rest:
+        sentences.append(rest)
+    return sentences
+
+
+def segment_stream(deltas: Iterable[str], policy: Optional[SegmentPolicy] = None) -> list[str]:
+    """Segment a sequence of deltas, flushing the remainder at the end."""
+
+    segmenter = SentenceSegmenter(policy or SegmentPolicy())
+    sentences = [sentence for delta in deltas for sentence in segmenter.push(delta)]
+    rest = segmenter.finish()
+    if rest:
+        sentences.append(rest)
+    return sentences
+
+
+__all__ = [
+    "DEFAULT_ABBREVIATIONS",
+    "SegmentPolicy",
+    "SentenceSegmenter",
+    "segment_stream",
+    "split_sentences",
+]
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Callable, Optional, Protocol
 
 from tars.contracts.v1.stt import FinalTranscript, PartialTranscript
@@ -79,6 +79,8 @@ class STTProcessResult:
     confidence: Optional[float] = None
     rejection_reasons: tuple[str, ...] = ()
     error: Optional[str] = None
+    # Stage name -> (start, end) wall-clock seconds, for tracing.
+    timings: dict[str, tuple[float, float]] = field(default_factory=dict)
 
 
 class STTService:
@@ -134,15 +136,21 @@ class STTService:
         if not utterance:
             return result
 
+        timings = result.timings
+        duration_sec = (len(utterance) / 2) / self._sample_rate
+        timings["stt.speech"] = (current_time - duration_sec, current_time)
+
         processed = utterance
         if self._preprocess is not None:
-            duration_ms = (len(utterance) / 2) / self._sample_rate * 1000.0
-            if duration_ms >= self._config.preprocess_min_ms:
+            if duration_sec * 1000.0 >= self._config.preprocess_min_ms:
+                started = time.time()
                 try:
                     processed = await asyncio.to_thread(self._preprocess, utterance, self._sample_rate)
                 except Exception:  # pragma: no cover - preprocess errors fall back to raw audio
                     processed = utterance
+                timings["stt.preprocess"] = (started, time.time())
 
+        started = time.time()
         try:
             if self._has_async_transcribe:
                 # Use async transcriber (preferred - already uses to_thread internally)
@@ -157,6 +165,7 @@ class STTService:
         except Exception as exc:
             result.error = f"Transcription error: {exc}"
             return result
+        timings["stt.transcribe"] = (started, time.time())
 
         candidate = text.strip()
         if not candidate:
@@ -9,17 +9,21 @@ import subprocess
 import tempfile
 import threading
 import time
-from contextlib import suppress
+from contextlib import nullcontext, suppress
 from dataclasses import dataclass, field
 from html import unescape
 from pathlib import Path
-from typing import Any, Awaitable, Callable, ClassVar, Literal, Optional, Protocol
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, ClassVar, Literal, Optional, Protocol
 
 from bs4 import BeautifulSoup
 from markdown import markdown as md_render
 
+from tars.contracts.envelope import TraceContext
 from tars.contracts.v1 import TtsSay
 
+if TYPE_CHECKING:
+    from tars.runtime.tracing import Tracer
+
 logger = logging.getLogger("tars.domain.tts")
 
 StatusEvent = Literal["speaking_start", "speaking_end", "paused", "resumed", "stopped"]
@@ -160,13 +164,22 @@ class PlaybackSession:
     stop_requested: bool = False
     stop_reason: Optional[str] = None
     last_role: Optional[str] = None
+    trace: Optional[TraceContext] = None
 
 
 class TTSDomainService:
     """Domain orchestration for TTS playback, aggregation, and controls."""
 
-    def __init__(self, synth: Synthesizer, config: TTSConfig, *, wake_synth: Synthesizer | None = None) -> None:
+    def __init__(
+        self,
+        synth: Synthesizer,
+        config: TTSConfig,
+        *,
+        wake_synth: Synthesizer | None = None,
+        tracer: Tracer | None = None,
+    ) -> None:
         self._primary_synth = synth
+        self._tracer = tracer
         self._wake_synth = wake_synth
         self._config = config
         self._agg_id: str | None = None
@@ -245,6 +258,8 @@ class TTSDomainService:
         session = self._current_session
         if session is None:
             return
+        if session.player_proc is None and self._tracer is not None and session.trace is not None:
+            self._tracer.record("tts.first_audio", session.started_at, time.time(), parent=session.trace, role=role)
         session.player_proc = proc
         session.last_role = role
         if session.stop_requested:
@@ -339,67 +354,75 @@ class TTSDomainService:
     ) -> None:
         synth = self._wake_synth if wake_ack and self._wake_synth is not None else self._primary_synth
 
-        if self._play_lock.locked():
-            logger.debug("Playback busy; queuing next utterance (len=%d)", len(text or ""))
-        async with self._play_lock:
-            session = PlaybackSession(utt_id=utt_id, text=text, started_at=time.time())
-            self._current_session = session
-            try:
-                logger.debug("Playback start (len=%d)", len(text or ""))
-                await callbacks.publish_status(
-                    "speaking_start",
-                    text=text,
-                    utt_id=session.utt_id,
-                    reason=None,
-                    wake_ack=wake_ack,
-                    system_announce=system_announce,
-                )
+        speak_span = (
+            self._tracer.span("tts.speak", chars=len(text), wake_ack=wake_ack)
+            if self._tracer is not None
+            else nullcontext()
+        )
+        with speak_span as span:
+            if self._play_lock.locked():
+                logger.debug("Playback busy; queuing next utterance (len=%d)", len(text or ""))
+            async with self._play_lock:
+                session = PlaybackSession(utt_id=utt_id, text=text, started_at=time.time())
+                if span is not None:
+                    session.trace = TraceContext(trace_id=span.trace_id, span_id=span.span_id)
+                self._current_session = session
+                try:
+                    logger.debug("Playback start (len=%d)", len(text or ""))
+                    await callbacks.publish_status(
+                        "speaking_start",
+                        text=text,
+                        utt_id=session.utt_id,
+                        reason=None,
+                        wake_ack=wake_ack,
+                        system_announce=system_announce,
+                    )
 
-                t0 = time.time()
-                streaming = self._config.streaming_enabled if streaming_override is None else bool(streaming_override)
-                pipeline = self._config.pipeline_enabled if pipeline_override is None else bool(pipeline_override)
+                    t0 = time.time()
+                    streaming = self._config.streaming_enabled if streaming_override is None else bool(streaming_override)
+                    pipeline = self._config.pipeline_enabled if pipeline_override is None else bool(pipeline_override)
                 
-                # Use async synth if available to avoid double-threading overhead
-                if self._has_async_synth(synth):
-                    elapsed = await self._do_synth_and_play_async(
-                        synth,
-                        text,
-                        streaming,
-                        pipeline,
-                        wake_ack,
-                    )
-                else:
-                    # Offload to thread to avoid blocking event loop during synthesis
-                    elapsed = await asyncio.to_thread(
-                        self._do_synth_and_play_blocking,
-                        synth,
-                        text,
-                        streaming,
-                        pipeline,
-                        wake_ack,
+                    # Use async synth if available to avoid double-threading overhead
+                    if self._has_async_synth(synth):
+                        elapsed = await self._do_synth_and_play_async(
+                            synth,
+                            text,
+                            streaming,
+                            pipeline,
+                            wake_ack,
+                        )
+                    else:
+                        # Offload to thread to avoid blocking event loop during synthesis
+                        elapsed = await asyncio.to_thread(
+                            self._do_synth_and_play_blocking,
+                            synth,
+                            text,
+                            streaming,
+                            pipeline,
+                            wake_ack,
+                        )
+                    t1 = time.time()
+                    if stt_ts is not None:
+                        logger.info(
+                            "TTS time: %.3fs from STT final to playback-finished; time-to-first-audio ~%.3fs",
+                            (t1 - stt_ts),
+                            (elapsed if streaming else 0.0),
+                        )
+                    else:
+                        logger.info("TTS playback finished in %.3fs", (t1 - t0))
+
+                    reason = session.stop_reason if session.stop_requested else None
+                    await callbacks.publish_status(
+                        "speaking_end",
+                        text=text,
+                        utt_id=session.utt_id,
+                        reason=reason,
+                        wake_ack=wake_ack,
+                        system_announce=system_announce,
                     )
-                t1 = time.time()
-                if stt_ts is not None:
-                    logger.info(
-                        "TTS time: %.3fs from STT final to playback-finished; time-to-first-audio ~%.3fs",
-                        (t1 - stt_ts),
-                        (elapsed if streaming else 0.0),
-                    )
-                else:
-                    logger.info("TTS playback finished in %.3fs", (t1 - t0))
-
-                reason = session.stop_reason if session.stop_requested else None
-                await callbacks.publish_status(
-                    "speaking_end",
-                    text=text,
-                    utt_id=session.utt_id,
-                    reason=reason,
-                    wake_ack=wake_ack,
-                    system_announce=system_announce,
-                )
-                logger.debug("Playback end (len=%d)", len(text or ""))
-            finally:
-                self._current_session = None
+                    logger.debug("Playback end (len=%d)", len(text or ""))
+                finally:
+                    self._current_session = None
 
     async def _apply_pause(self, session: PlaybackSession, reason: str, callbacks: TTSCallbacks) -> None:
         if session.stop_requested:
@@ -0,0 +1,354 @@
+"""Synthetic whole-pipeline load generator.
+
+Drives realistic voice turns through the broker and measures the router and
+llm-worker under load::
+
+    wake/event -> stt/partial x N -> stt/final
+                       (router) -> tts/say (wake ack), llm/request
+    llm/request -> (LLM stand-in) llm/stream deltas + llm/response
+    tts/say     -> (TTS stand-in) tts/status speaking_start/speaking_end
+
+Latencies are matched through envelope correlation ids: the router publishes
+``tts/say`` for a wake with the wake envelope's id, and ``llm/request`` with
+the ``stt/final`` envelope's id. The stand-ins can be disabled to measure a
+real llm-worker or TTS service instead.
+
+The router gates ``stt/final`` on the wake window, so runs with
+``concurrency > 1`` should use a router in live mode
+(``ROUTER_LIVE_MODE_DEFAULT=1``); otherwise overlapping turns show up as
+timeouts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from tars.adapters.mqtt_client import MQTTClient
+from tars.contracts.envelope import Envelope
+from tars.contracts.v1 import (
+    EVENT_TYPE_LLM_RESPONSE,
+    EVENT_TYPE_LLM_STREAM,
+    EVENT_TYPE_STT_FINAL,
+    EVENT_TYPE_STT_PARTIAL,
+    EVENT_TYPE_TTS_STATUS,
+    EVENT_TYPE_WAKE_EVENT,
+    TOPIC_LLM_REQUEST,
+    TOPIC_LLM_RESPONSE,
+    TOPIC_LLM_STREAM,
+    TOPIC_STT_FINAL,
+    TOPIC_STT_PARTIAL,
+    TOPIC_TTS_SAY,
+    TOPIC_TTS_STATUS,
+    TOPIC_WAKE_EVENT,
+    FinalTranscript,
+    LLMRequest,
+    LLMResponse,
+    LLMStreamDelta,
+    PartialTranscript,
+    TtsSay,
+    TtsStatus,
+    WakeEvent,
+)
+from tars.runtime.metrics import percentile
+
+logger = logging.getLogger(__name__)
+
+DRAIN_TIMEOUT = 2.0
+DEFAULT_UTTERANCE = "what is the weather going to be like this afternoon"
+DEFAULT_REPLY = (
+    "It looks like a mild afternoon with a light breeze. "
+    "There is a small chance of rain later, so keep a jacket handy. "
+    "Anything else you want to know?"
+)
+
+
+@dataclass(slots=True)
+class LatencySeries:
+    """Latency samples for one correlated hop, plus turns that never completed it."""
+
+    samples: list[float] = field(default_factory=list)
+    timeouts: int = 0
+
+    def observe(self, seconds: float) -> None:
+        self.samples.append(seconds)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": len(self.samples),
+            "timeouts": self.timeouts,
+            "p50": round(percentile(self.samples, 0.50), 6),
+            "p95": round(percentile(self.samples, 0.95), 6),
+            "p99": round(percentile(self.samples, 0.99), 6),
+            "max": round(max(self.samples, default=0.0), 6),
+        }
+
+
+@dataclass(slots=True)
+class TurnProfile:
+    """Shape and pacing of the synthetic user turns."""
+
+    turns: int = 20
+    concurrency: int = 1
+    turn_rate: float = 0.0  # new turns per second; 0 = back-to-back per worker
+    speech_delay: float = 0.3  # wake -> first partial
+    partials: int = 4
+    partial_rate: float = 10.0  # stt/partial per second within a turn
+    utterance: str = DEFAULT_UTTERANCE
+    turn_timeout: float = 10.0
+
+    def __post_init__(self) -> None:
+        if self.turns < 1 or self.concurrency < 1:
+            raise ValueError("turns and concurrency must be >= 1")
+        if self.turn_rate < 0 or self.partial_rate <= 0 or self.partials < 0:
+            raise ValueError("turn_rate must be >= 0, partial_rate > 0 and partials >= 0")
+
+
+@dataclass(slots=True)
+class LLMStandIn:
+    """Timing of the stand-in LLM worker."""
+
+    first_token: float = 0.25
+    token_rate: float = 40.0  # deltas per second after the first
+    reply: str = DEFAULT_REPLY
+
+
+@dataclass(slots=True)
+class TTSStandIn:
+    """Timing of the stand-in TTS worker."""
+
+    start_delay: float = 0.05
+    chars_per_sec: float = 15.0  # synthetic audio duration per character
+
+
+@dataclass(slots=True)
+class LoadReport:
+    turns: int
+    wall_time: float
+    wake_to_say: LatencySeries
+    final_to_llm_request: LatencySeries
+    published: Counter[str]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "turns": self.turns,
+            "wall_time": round(self.wall_time, 3),
+            "turns_per_sec": round(self.turns / self.wall_time, 3) if self.wall_time else 0.0,
+            "wake_to_first_tts_say": self.wake_to_say.snapshot(),
+            "stt_final_to_llm_request": self.final_to_llm_request.snapshot(),
+            "published": dict(sorted(self.published.items())),
+        }
+
+
+class LoadGenerator:
+    """Emit synthetic turns and report correlated latency percentiles."""
+
+    def __init__(
+        self,
+        mqtt_url: str,
+        *,
+        profile: Optional[TurnProfile] = None,
+        llm: Optional[LLMStandIn] = None,
+        tts: Optional[TTSStandIn] = None,
+        enable_llm: bool = True,
+        enable_tts: bool = True,
+        client_factory: Optional[Callable[..., Any]] = None,
+    ) -> None:
+        self._url = mqtt_url
+        self.profile = profile or TurnProfile()
+        self.llm = (llm or LLMStandIn()) if enable_llm else None
+        self.tts = (tts or TTSStandIn()) if enable_tts else None
+        self._client_factory = client_factory
+        self._wake_sent: dict[str, tuple[float, asyncio.Future[None]]] = {}
+        self._final_sent: dict[str, tuple[float, asyncio.Future[None]]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._published: Counter[str] = Counter()
+        self._wake_to_say = LatencySeries()
+        self._final_to_request = LatencySeries()
+
+    def _client(self, role: str) -> MQTTClient:
+        return MQTTClient(self._url, f"tars-loadgen-{role}", client_factory=self._client_factory)
+
+    async def _publish(self, client: MQTTClient, topic: str, event_type: str, data: Any, **kw: Any) -> str:
+        self._published[topic] += 1
+        return await client.publish_event(topic, event_type, data, **kw)
+
+    def _spawn(self, coro: Any) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    # ------------------------------------------------------------------
+    # Correlation
+
+    @staticmethod
+    def _resolve(pending: dict[str, tuple[float, asyncio.Future[None]]], series: LatencySeries, payload: bytes) -> None:
+        try:
+            envelope = Envelope.model_validate_json(payload)
+        except ValueError:
+            return
+        entry = pending.pop(envelope.id, None)
+        if entry is None:
+            return
+        sent_at, done = entry
+        series.observe(time.perf_counter() - sent_at)
+        if not done.done():
+            done.set_result(None)
+
+    async def _on_tts_say(self, payload: bytes) -> None:
+        self._resolve(self._wake_sent, self._wake_to_say, payload)
+
+    async def _on_llm_request(self, payload: bytes) -> None:
+        self._resolve(self._final_sent, self._final_to_request, payload)
+
+    # ------------------------------------------------------------------
+    # Stand-ins
+
+    def _llm_handler(self, client: MQTTClient, llm: LLMStandIn) -> Callable[[bytes], Any]:
+        async def stream(request: LLMRequest) -> None:
+            await asyncio.sleep(llm.first_token)
+            tokens = [word + " " for word in llm.reply.split()]
+            for seq, token in enumerate(tokens):
+                if seq:
+                    await asyncio.sleep(1.0 / llm.token_rate)
+                delta = LLMStreamDelta(id=request.id, seq=seq, delta=token, provider="loadgen", model="stand-in")
+                await self._publish(client, TOPIC_LLM_STREAM, EVENT_TYPE_LLM_STREAM, delta, qos=1)
+            done = LLMStreamDelta(id=request.id, seq=len(tokens), done=True, provider="loadgen", model="stand-in")
+            await self._publish(client, TOPIC_LLM_STREAM, EVENT_TYPE_LLM_STREAM, done, qos=1)
+            response = LLMResponse(id=request.id, reply=llm.reply, provider="loadgen", model="stand-in")
+            await self._publish(client, TOPIC_LLM_RESPONSE, EVENT_TYPE_LLM_RESPONSE, response, qos=1)
+
+        async def handler(payload: bytes) -> None:
+            request = LLMRequest.model_validate(Envelope.model_validate_json(payload).data)
+            self._spawn(stream(request))
+
+        return handler
+
+    def _tts_handler(self, client: MQTTClient, tts: TTSStandIn) -> Callable[[bytes], Any]:
+        async def speak(say: TtsSay) -> None:
+            await asyncio.sleep(tts.start_delay)
+            start = TtsStatus(event="speaking_start", text=say.text, utt_id=say.utt_id, wake_ack=say.wake_ack)
+            await self._publish(client, TOPIC_TTS_STATUS, EVENT_TYPE_TTS_STATUS, start, qos=1)
+            await asyncio.sleep(len(say.text) / tts.chars_per_sec)
+            end = TtsStatus(event="speaking_end", text=say.text, utt_id=say.utt_id, wake_ack=say.wake_ack)
+            await self._publish(client, TOPIC_TTS_STATUS, EVENT_TYPE_TTS_STATUS, end, qos=1)
+
+        async def handler(payload: bytes) -> None:
+            self._spawn(speak(TtsSay.model_validate(Envelope.model_validate_json(payload).data)))
+
+        return handler
+
+    # ------------------------------------------------------------------
+    # Turns
+
+    async def _turn(self, client: MQTTClient) -> None:
+        profile = self.profile
+        loop = asyncio.get_running_loop()
+        utt_id = f"load-{uuid.uuid4().hex[:12]}"
+
+        wake = WakeEvent(type="wake", confidence=0.9, ts=time.time())
+        said: asyncio.Future[None] = loop.create_future()
+        self._wake_sent[wake.message_id] = (time.perf_counter(), said)
+        await self._publish(
+            client, TOPIC_WAKE_EVENT, EVENT_TYPE_WAKE_EVENT, wake, correlation_id=wake.message_id, qos=1
+        )
+
+        await asyncio.sleep(profile.speech_delay)
+        words = profile.utterance.split()
+        for n in range(profile.partials):
+            text = " ".join(words[: max(1, len(words) * (n + 1) // (profile.partials + 1))])
+            partial = PartialTranscript(text=text, utt_id=utt_id, confidence=0.5)
+            await self._publish(client, TOPIC_STT_PARTIAL, EVENT_TYPE_STT_PARTIAL, partial, qos=0)
+            await asyncio.sleep(1.0 / profile.partial_rate)
+
+        final = FinalTranscript(text=profile.utterance, utt_id=utt_id, confidence=0.95)
+        requested: asyncio.Future[None] = loop.create_future()
+        self._final_sent[final.message_id] = (time.perf_counter(), requested)
+        await self._publish(
+            client, TOPIC_STT_FINAL, EVENT_TYPE_STT_FINAL, final, correlation_id=final.message_id, qos=1
+        )
+
+        for future, pending, series, key in (
+            (said, self._wake_sent, self._wake_to_say, wake.message_id),
+            (requested, self._final_sent, self._final_to_request, final.message_id),
+        ):
+            try:
+                await asyncio.wait_for(future, profile.turn_timeout)
+            except asyncio.TimeoutError:
+                pending.pop(key, None)
+                series.timeouts += 1
+
+    async def _drive(self, client: MQTTClient) -> None:
+        profile = self.profile
+        slots = asyncio.Semaphore(profile.concurrency)
+        interval = 1.0 / profile.turn_rate if profile.turn_rate else 0.0
+        turns: list[asyncio.Task[None]] = []
+
+        async def run_turn() -> None:
+            try:
+                await self._turn(client)
+            finally:
+                slots.release()
+
+        for n in range(profile.turns):
+            await slots.acquire()
+            if interval and n:
+                await asyncio.sleep(interval)
+            turns.append(asyncio.create_task(run_turn()))
+        await asyncio.gather(*turns)
+
+    async def run(self) -> LoadReport:
+        """Connect, run all turns, and return the latency report."""
+        driver = self._client("driver")
+        stand_ins: list[MQTTClient] = []
+        await driver.connect()
+        try:
+            await driver.subscribe(TOPIC_TTS_SAY, self._on_tts_say, qos=1)
+            await driver.subscribe(TOPIC_LLM_REQUEST, self._on_llm_request, qos=1)
+            if self.llm is not None:
+                llm_client = self._client("llm")
+                stand_ins.append(llm_client)
+                await llm_client.connect()
+                await llm_client.subscribe(TOPIC_LLM_REQUEST, self._llm_handler(llm_client, self.llm), qos=1)
+            if self.tts is not None:
+                tts_client = self._client("tts")
+                stand_ins.append(tts_client)
+                await tts_client.connect()
+                await tts_client.subscribe(TOPIC_TTS_SAY, self._tts_handler(tts_client, self.tts), qos=1)
+
+            started = time.perf_counter()
+            await self._drive(driver)
+            wall_time = time.perf_counter() - started
+            if self._tasks:
+                # Let in-flight stand-in replies finish so services see whole turns.
+                await asyncio.wait(set(self._tasks), timeout=DRAIN_TIMEOUT)
+        finally:
+            for task in list(self._tasks):
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+            for client in (*stand_ins, driver):
+                await client.shutdown()
+
+        return LoadReport(
+            turns=self.profile.turns,
+            wall_time=wall_time,
+            wake_to_say=self._wake_to_say,
+            final_to_llm_request=self._final_to_request,
+            published=self._published,
+        )
+
+
+__all__ = [
+    "LLMStandIn",
+    "LatencySeries",
+    "LoadGenerator",
+    "LoadReport",
+    "TTSStandIn",
+    "TurnProfile",
+    "percentile",
+]
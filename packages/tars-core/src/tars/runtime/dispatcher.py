@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import time
+from collections import deque
 from collections.abc import Callable, Iterable
+from contextlib import nullcontext
 from typing import Any, Optional, Tuple
 
 import orjson
@@ -10,15 +13,32 @@ from pydantic import ValidationError
 from tars.contracts.envelope import Envelope
 from tars.contracts.v1 import LLMResponse, LLMStreamDelta
 from tars.contracts.registry import resolve_event
-from tars.runtime.subscription import Sub
+from tars.runtime.metrics import MetricsRegistry
+from tars.runtime.subscription import PRIORITIES, Sub
+from tars.runtime.tracing import Tracer, use_trace
 
 if True:  # type-checking alias
     from tars.domain.ports import Subscriber
     from tars.runtime.logging import Logger
 
 
+QueueItem = Tuple[Sub, Envelope, Any, float]
+
+
 class Dispatcher:
-    """Fan out subscribed messages to typed handlers with backpressure controls."""
+    """Fan out subscribed messages to typed handlers with backpressure controls.
+
+    Each priority lane (see ``Sub.priority``) has its own bounded queue and
+    overflow handling. Workers always take from the highest non-empty lane,
+    except that a lane passed over ``starvation_limit`` times in a row is
+    served next. Within a lane, messages with the same ordering key (utt_id /
+    request id) are handled one at a time in arrival order while different
+    keys run concurrently across workers.
+
+    Handlers run under the envelope's trace context, so anything they publish
+    joins the sender's trace; with a ``tracer`` each delivery of a traced
+    message is also recorded as a ``<service>.<topic>`` span.
+    """
 
     def __init__(
         self,
@@ -31,17 +51,38 @@ class Dispatcher:
         overflow_strategy: str = "drop_oldest",
         handler_timeout: float = 30.0,
         worker_count: int = 1,
+        metrics: Optional[MetricsRegistry] = None,
+        starvation_limit: int = 8,
+        tracer: Optional[Tracer] = None,
     ) -> None:
         self._sub_client = sub_client
         self._subs = list(subs)
         self._ctx_factory = ctx_factory
         self._logger = logger
-        self._queue: asyncio.Queue[Tuple[Sub, Envelope, Any]] = asyncio.Queue(maxsize=max(1, queue_maxsize))
+        self._lanes: dict[str, asyncio.Queue[QueueItem]] = {
+            lane: asyncio.Queue(maxsize=max(1, queue_maxsize)) for lane in PRIORITIES
+        }
+        self._skips: dict[str, int] = dict.fromkeys(PRIORITIES, 0)
+        self._starvation_limit = max(1, starvation_limit)
+        self._tracer = tracer
+        self._ready = asyncio.Semaphore(0)
+        self._active_keys: set[tuple[str, str]] = set()
+        self._key_backlog: dict[tuple[str, str], deque[QueueItem]] = {}
         self._overflow_strategy = overflow_strategy
         self._handler_timeout = handler_timeout
         self._worker_count = max(1, worker_count)
         self._pump_tasks: list[asyncio.Task[Any]] = []
         self._worker_tasks: list[asyncio.Task[Any]] = []
+        self.metrics = metrics or MetricsRegistry()
+        self.metrics.register_gauge("dispatcher.queue_depth", self.queue_depth)
+        for lane, queue in self._lanes.items():
+            self.metrics.register_gauge(f"dispatcher.lane.{lane}.depth", queue.qsize)
+
+    def queue_depth(self) -> int:
+        """Messages waiting across all lanes, including ones held for key ordering."""
+
+        held = sum(len(backlog) for backlog in self._key_backlog.values())
+        return sum(queue.qsize() for queue in self._lanes.values()) + held
 
     async def run(self) -> None:
         if self._worker_tasks or self._pump_tasks:
@@ -61,15 +102,23 @@ class Dispatcher:
         self._pump_tasks.clear()
         self._worker_tasks.clear()
 
-        while not self._queue.empty():
-            try:
-                self._queue.get_nowait()
-                self._queue.task_done()
-            except asyncio.QueueEmpty:  # pragma: no cover - defensive
-                break
+        for queue in self._lanes.values():
+            while not queue.empty():
+                try:
+                    queue.get_nowait()
+                    queue.task_done()
+                except asyncio.QueueEmpty:  # pragma: no cover - defensive
+                    break
+        self._key_backlog.clear()
+        self._active_keys.clear()
+        self._skips = dict.fromkeys(PRIORITIES, 0)
+        self._ready = asyncio.Semaphore(0)
 
     async def _pump(self, sub: Sub) -> None:
-        async for msg in self._sub_client.messages(sub.topic, qos=sub.qos):
+        extra = {"share_group": sub.share_group} if sub.share_group else {}
+        async for msg in self._sub_client.messages(sub.topic, qos=sub.qos, **extra):
+            received_at = time.monotonic()
+            self.metrics.record_received(sub.topic)
             try:
                 envelope = Envelope.model_validate_json(msg.payload)
                 payload_model = sub.model.model_validate(envelope.data)
@@ -97,11 +146,16 @@ class Dispatcher:
                     extra={"topic": sub.topic, "envelope_id": envelope.id},
                 )
 
-            await self._enqueue(sub, envelope, payload_model)
+            await self._enqueue(sub, envelope, payload_model, received_at)
 
-    async def _enqueue(self, sub: Sub, envelope: Envelope, payload: Any) -> None:
+    async def _enqueue(
+        self, sub: Sub, envelope: Envelope, payload: Any, received_at: float | None = None
+    ) -> None:
+        item = (sub, envelope, payload, time.monotonic() if received_at is None else received_at)
+        queue = self._lanes[sub.priority]
         try:
-            self._queue.put_nowait((sub, envelope, payload))
+            queue.put_nowait(item)
+            self._ready.release()
             return
         except asyncio.QueueFull:
             pass
@@ -109,55 +163,126 @@ class Dispatcher:
         strategy = self._overflow_strategy
         if strategy == "drop_oldest":
             try:
-                dropped_sub, dropped_env, _ = self._queue.get_nowait()
+                dropped_sub, dropped_env, _, _ = queue.get_nowait()
             except asyncio.QueueEmpty:  # pragma: no cover - defensive
-                self._log_overflow("drop_oldest_empty", sub.topic, envelope.id)
+                self._log_overflow("drop_oldest_empty", sub.topic, envelope.id, queue)
             else:
-                self._queue.task_done()
-                self._log_overflow("drop_oldest", dropped_sub.topic, dropped_env.id)
+                queue.task_done()
+                self.metrics.record_dropped(dropped_sub.topic)
+                self._log_overflow("drop_oldest", dropped_sub.topic, dropped_env.id, queue)
                 try:
-                    self._queue.put_nowait((sub, envelope, payload))
+                    queue.put_nowait(item)
                     return
                 except asyncio.QueueFull:  # pragma: no cover - race
-                    self._log_overflow("drop_new_after_drop_oldest", sub.topic, envelope.id)
+                    self.metrics.record_dropped(sub.topic)
+                    self._log_overflow("drop_new_after_drop_oldest", sub.topic, envelope.id, queue)
                     return
         elif strategy == "drop_new":
-            self._log_overflow("drop_new", sub.topic, envelope.id)
+            self.metrics.record_dropped(sub.topic)
+            self._log_overflow("drop_new", sub.topic, envelope.id, queue)
             return
 
-        self._log_overflow("block_wait", sub.topic, envelope.id)
+        self._log_overflow("block_wait", sub.topic, envelope.id, queue)
         try:
-            await asyncio.wait_for(self._queue.put((sub, envelope, payload)), timeout=self._handler_timeout)
+            await asyncio.wait_for(queue.put(item), timeout=self._handler_timeout)
         except asyncio.TimeoutError:
-            self._log_overflow("block_timeout", sub.topic, envelope.id)
+            self.metrics.record_dropped(sub.topic)
+            self._log_overflow("block_timeout", sub.topic, envelope.id, queue)
+        else:
+            self._ready.release()
+
+    def _next_item(self) -> Optional[QueueItem]:
+        """Pop the next item by lane priority, honouring the starvation guard."""
+
+        waiting = [lane for lane in PRIORITIES if not self._lanes[lane].empty()]
+        if not waiting:
+            return None
+        chosen = waiting[0]
+        for lane in waiting[1:]:
+            if self._skips[lane] >= self._starvation_limit:
+                chosen = lane
+                break
+        for lane in PRIORITIES:
+            self._skips[lane] = self._skips[lane] + 1 if lane in waiting and lane != chosen else 0
+        queue = self._lanes[chosen]
+        item = queue.get_nowait()
+        queue.task_done()
+        return item
+
+    def _release(self, slot: tuple[str, str]) -> Optional[QueueItem]:
+        """Hand back the next parked item for ``slot`` or free the key."""
+
+        backlog = self._key_backlog.get(slot)
+        if backlog:
+            item = backlog.popleft()
+            if not backlog:
+                del self._key_backlog[slot]
+            return item
+        self._active_keys.discard(slot)
+        return None
 
     async def _dispatch_loop(self) -> None:
         while True:
-            sub, envelope, payload = await self._queue.get()
-            try:
-                await self._deliver(sub, envelope, payload)
-            finally:
-                self._queue.task_done()
+            await self._ready.acquire()
+            item = self._next_item()
+            if item is None:  # pragma: no cover - semaphore/queue mismatch
+                continue
+            sub, _, payload, _ = item
+            key = sub.key_for(payload)
+            slot = (sub.priority, key) if key is not None else None
+            if slot is not None:
+                if slot in self._active_keys:
+                    # Another worker owns this key; it runs the item when done.
+                    self._key_backlog.setdefault(slot, deque()).append(item)
+                    continue
+                self._active_keys.add(slot)
+            while item is not None:
+                try:
+                    await self._deliver(*item)
+                finally:
+                    item = self._release(slot) if slot is not None else None
 
-    async def _deliver(self, sub: Sub, envelope: Envelope, payload: Any) -> None:
+    async def _deliver(
+        self, sub: Sub, envelope: Envelope, payload: Any, received_at: float | None = None
+    ) -> None:
+        started = time.monotonic()
+        queue_wait = started - received_at if received_at is not None else None
+        if queue_wait is not None:
+            self.metrics.observe_queue_wait(sub.topic, queue_wait)
+        span: Any = nullcontext()
+        if self._tracer is not None and envelope.trace is not None:
+            span = self._tracer.span(
+                f"{self._tracer.service}.{sub.topic}",
+                queue_wait_ms=round((queue_wait or 0.0) * 1000.0, 3),
+            )
+        ok = False
         try:
             ctx = self._ctx_factory(envelope)
-            await asyncio.wait_for(sub.handler(payload, ctx), timeout=self._handler_timeout)
+            # asyncio.timeout rather than wait_for: on 3.11 wait_for can swallow a
+            # cancel that lands as the handler finishes, leaving stop() hanging.
+            with use_trace(envelope.trace), span:
+                async with asyncio.timeout(self._handler_timeout):
+                    await sub.handler(payload, ctx)
+            ok = True
         except asyncio.TimeoutError:
             self._log_handler_error(sub.topic, "handler_timeout", envelope.id)
         except ValidationError as exc:
             self._log_handler_error(sub.topic, f"payload_revalidate_failed: {exc}", envelope.id)
         except Exception as exc:  # pragma: no cover - safety net
             self._log_handler_error(sub.topic, str(exc), envelope.id)
+        finally:
+            self.metrics.observe_handler(sub.topic, time.monotonic() - started, ok=ok)
 
-    def _log_overflow(self, mode: str, topic: str, envelope_id: str) -> None:
+    def _log_overflow(
+        self, mode: str, topic: str, envelope_id: str, queue: asyncio.Queue[QueueItem]
+    ) -> None:
         if self._logger:
             self._logger.warning(
                 "dispatcher.queue.overflow",
-                extra={"mode": mode, "topic": topic, "envelope_id": envelope_id, "size": self._queue.qsize()},
+                extra={"mode": mode, "topic": topic, "envelope_id": envelope_id, "size": queue.qsize()},
             )
         else:
-            print(f"[dispatcher] queue overflow mode={mode} topic={topic} envelope={envelope_id} size={self._queue.qsize()}")
+            print(f"[dispatcher] queue overflow mode={mode} topic={topic} envelope={envelope_id} size={queue.qsize()}")
 
     def _log_handler_error(self, topic: str, error: str, envelope_id: str) -> None:
         if self._logger:
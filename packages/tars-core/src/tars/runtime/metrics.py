@@ -0,0 +1,206 @@
+"""Low-overhead per-topic metrics for the MQTT layer.
+
+Counters, gauges and fixed-bucket histograms are plain Python objects
+updated inline on the hot path (a bisect and two additions per
+observation); nothing is allocated per message. ``MetricsRegistry.snapshot``
+renders a JSON-friendly view that ``MQTTClient`` can publish periodically on
+``system/metrics/<client_id>``.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from bisect import bisect_left
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+# Upper bounds (seconds) for latency histograms; one overflow bucket follows.
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """Exact nearest-rank percentile of raw ``samples`` (``q`` in [0, 1]).
+
+    For offline reports (load tests, trace analysis) where every sample is
+    kept; live paths use ``Histogram`` instead.
+    """
+
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(q * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+@dataclass(slots=True)
+class Histogram:
+    """Fixed-bucket histogram of non-negative observations."""
+
+    bounds: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS
+    counts: list[int] = field(init=False)
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def __post_init__(self) -> None:
+        self.counts = [0] * (len(self.bounds) + 1)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """Estimate the q-quantile as the upper bound of its bucket.
+
+        Observations in the overflow bucket report the largest value seen.
+        """
+
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                return self.bounds[index] if index < len(self.bounds) else self.max
+        return self.max
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "max": round(self.max, 6),
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": {
+                **{str(bound): n for bound, n in zip(self.bounds, self.counts)},
+                "+Inf": self.counts[-1],
+            },
+        }
+
+
+@dataclass(slots=True)
+class TopicStats:
+    """Counters and latency histograms for one topic."""
+
+    received: int = 0
+    published: int = 0
+    published_bytes: int = 0
+    handled: int = 0
+    errors: int = 0
+    dropped: int = 0
+    queue_wait: Histogram = field(default_factory=Histogram)
+    handler_duration: Histogram = field(default_factory=Histogram)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "received": self.received,
+            "published": self.published,
+            "published_bytes": self.published_bytes,
+            "handled": self.handled,
+            "errors": self.errors,
+            "dropped": self.dropped,
+            "queue_wait": self.queue_wait.snapshot(),
+            "handler_duration": self.handler_duration.snapshot(),
+        }
+
+
+class MetricsRegistry:
+    """Per-topic counters, gauges and histograms shared by MQTT components.
+
+    One registry is typically owned by ``MQTTClient`` and handed to the
+    ``Dispatcher`` and ``AsyncioMQTTPublisher`` built on the same connection,
+    so a single snapshot covers the whole service.
+    """
+
+    def __init__(self) -> None:
+        self._started = time.monotonic()
+        self._topics: dict[str, TopicStats] = {}
+        self._gauges: dict[str, Callable[[], float]] = {}
+
+    def topic(self, topic: str) -> TopicStats:
+        stats = self._topics.get(topic)
+        if stats is None:
+            stats = self._topics[topic] = TopicStats()
+        return stats
+
+    def record_received(self, topic: str) -> None:
+        self.topic(topic).received += 1
+
+    def record_published(self, topic: str, size: int) -> None:
+        stats = self.topic(topic)
+        stats.published += 1
+        stats.published_bytes += size
+
+    def record_dropped(self, topic: str) -> None:
+        self.topic(topic).dropped += 1
+
+    def observe_queue_wait(self, topic: str, seconds: float) -> None:
+        self.topic(topic).queue_wait.observe(seconds)
+
+    def observe_handler(self, topic: str, seconds: float, *, ok: bool = True) -> None:
+        stats = self.topic(topic)
+        stats.handler_duration.observe(seconds)
+        if ok:
+            stats.handled += 1
+        else:
+            stats.errors += 1
+
+    def register_gauge(self, name: str, read: Callable[[], float]) -> None:
+        """Register a gauge sampled at snapshot time (e.g. a queue depth)."""
+
+        self._gauges[name] = read
+
+    def unregister_gauge(self, name: str) -> None:
+        self._gauges.pop(name, None)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Render all metrics as a JSON-serializable dict.
+
+        Rates are averaged over the registry's lifetime.
+        """
+
+        uptime = max(time.monotonic() - self._started, 1e-9)
+        topics: dict[str, Any] = {}
+        for name, stats in self._topics.items():
+            view = stats.snapshot()
+            view["received_per_sec"] = round(stats.received / uptime, 3)
+            view["published_per_sec"] = round(stats.published / uptime, 3)
+            topics[name] = view
+        gauges: dict[str, float] = {}
+        for name, read in self._gauges.items():
+            try:
+                gauges[name] = float(read())
+            except Exception:  # pragma: no cover - gauge owner went away
+                continue
+        return {"uptime_sec": round(uptime, 3), "topics": topics, "gauges": gauges}
+
+
+__all__ = [
+    "DEFAULT_LATENCY_BUCKETS",
+    "Histogram",
+    "MetricsRegistry",
+    "TopicStats",
+    "percentile",
+]
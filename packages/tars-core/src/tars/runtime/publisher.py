@@ -7,6 +7,7 @@ from tars.contracts.registry import resolve_topic
 from tars.domain.ports import Publisher
 
 from .logging import Logger
+from .tracing import current_trace
 
 
 async def publish_event(
@@ -27,7 +28,8 @@ async def publish_event(
         logger: Structured logger for diagnostics.
         event_type: Event type identifier (matches registry key).
         data: Payload model (Pydantic) or serializable mapping.
-        correlate: Optional correlation/message id to reuse.
+        correlate: Optional correlation/message id to reuse. The current
+            trace context (if any) is attached automatically.
         qos: QoS level (defaults to 1 for at-least-once semantics).
         retain: Whether the MQTT broker should retain the message.
         source: Optional override for the envelope source field.
@@ -36,7 +38,13 @@ async def publish_event(
         The message id used for the published envelope.
     """
 
-    envelope = Envelope.new(event_type=event_type, data=data, correlate=correlate, source=source or "router")
+    envelope = Envelope.new(
+        event_type=event_type,
+        data=data,
+        correlate=correlate,
+        source=source or "router",
+        trace=current_trace(),
+    )
     topic = resolve_topic(event_type)
     logger.debug(
         "event.publish",
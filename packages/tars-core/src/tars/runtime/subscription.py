@@ -1,17 +1,54 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Awaitable, Callable, Type
+from typing import Any, Awaitable, Callable, Optional, Type
+
+# Dispatcher lanes, highest priority first.
+PRIORITY_CONTROL = "control"
+PRIORITY_NORMAL = "normal"
+PRIORITY_BULK = "bulk"
+PRIORITIES: tuple[str, ...] = (PRIORITY_CONTROL, PRIORITY_NORMAL, PRIORITY_BULK)
+
+_ORDERING_FIELDS = ("utt_id", "request_id", "id")
+
+
+def default_ordering_key(payload: Any) -> Optional[str]:
+    """Return the correlation key (utt_id / request id) carried by a payload.
+
+    Messages sharing a key are handled one at a time, in arrival order;
+    payloads without one are unordered.
+    """
+
+    for name in _ORDERING_FIELDS:
+        value = getattr(payload, name, None)
+        if isinstance(value, str) and value:
+            return value
+    return None
 
 
 @dataclass(frozen=True, slots=True)
 class Sub:
-    """Describe a subscription binding topic -> handler."""
+    """Describe a subscription binding topic -> handler.
+
+    ``priority`` picks the Dispatcher lane (control events overtake normal
+    and bulk traffic). ``ordering_key`` maps a payload to the key its
+    messages are serialized on; None uses ``default_ordering_key``.
+    """
 
     topic: str
     model: Type[Any]
     handler: Callable[[Any, "Ctx"], Awaitable[None]]
     qos: int = 1
+    share_group: str | None = None
+    priority: str = PRIORITY_NORMAL
+    ordering_key: Optional[Callable[[Any], Optional[str]]] = None
+
+    def __post_init__(self) -> None:
+        if self.priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority {self.priority!r}; expected one of {PRIORITIES}")
+
+    def key_for(self, payload: Any) -> Optional[str]:
+        return (self.ordering_key or default_ordering_key)(payload)
 
 
 # NOTE: We import Ctx lazily to avoid circular import at module load time.
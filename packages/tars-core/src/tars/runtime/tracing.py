@@ -0,0 +1,293 @@
+"""Cross-service turn tracing.
+
+A ``TraceContext`` (trace id + the sender's span id) rides in every
+``Envelope`` published while a trace is active. ``Ctx.publish`` and
+``MQTTClient.publish_event`` attach the current context automatically, and
+``Dispatcher``/``MQTTClient`` restore it from incoming envelopes before
+calling handlers. Trace context therefore flows through handler code and
+spawned tasks with no explicit plumbing.
+
+Services record stages with a ``Tracer``::
+
+    with tracer.span("llm.rag", k=5):
+        docs = await rag.query(text)
+    tracer.record("stt.vad_tail", start, end)  # timing measured elsewhere
+
+Finished spans are buffered and exported in batches on
+``system/trace/<service>``. ``TraceCollector`` rebuilds per-turn waterfalls
+from those batches, live or from a recording, and computes per-stage latency
+percentiles.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import uuid
+from collections import defaultdict, deque
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Optional
+
+import orjson
+
+from tars.contracts.envelope import Envelope, TraceContext
+from tars.contracts.v1.trace import (
+    TOPIC_SYSTEM_TRACE_PREFIX,
+    SpanRecord,
+    TraceSpans,
+)
+
+from .metrics import percentile
+
+_current: ContextVar[Optional[TraceContext]] = ContextVar("tars_trace", default=None)
+_TRACE_MARKER = b'"trace":{'
+
+
+def current_trace() -> Optional[TraceContext]:
+    """Trace context of the span currently executing, if any."""
+
+    return _current.get()
+
+
+@contextmanager
+def use_trace(trace: Optional[TraceContext]) -> Iterator[None]:
+    """Make ``trace`` current for the duration of the block."""
+
+    token = _current.set(trace)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+def trace_from_payload(payload: bytes) -> Optional[TraceContext]:
+    """Extract the trace context from a raw envelope without full validation.
+
+    The byte scan keeps untraced messages at a single ``in`` check.
+    """
+
+    if _TRACE_MARKER not in payload:
+        return None
+    try:
+        trace = orjson.loads(payload).get("trace")
+        return TraceContext.model_validate(trace) if trace else None
+    except (orjson.JSONDecodeError, AttributeError, ValueError):
+        return None
+
+
+def new_trace_id() -> str:
+    return uuid.uuid4().hex
+
+
+def new_span_id() -> str:
+    return uuid.uuid4().hex[:16]
+
+
+class Tracer:
+    """Records spans for one service and buffers them for export.
+
+    Disabled tracers (``TARS_TRACING=0``) still propagate incoming context but
+    never start traces or buffer spans.
+    """
+
+    def __init__(self, service: str, *, max_pending: int = 4096, enabled: Optional[bool] = None) -> None:
+        self.service = service
+        self.enabled = (os.getenv("TARS_TRACING", "1") != "0") if enabled is None else enabled
+        self._pending: deque[SpanRecord] = deque(maxlen=max_pending)
+        self.dropped = 0
+
+    def _finish(self, span: SpanRecord) -> None:
+        if len(self._pending) == self._pending.maxlen:
+            self.dropped += 1
+        self._pending.append(span)
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        *,
+        parent: Optional[TraceContext] = None,
+        start: Optional[float] = None,
+        new_trace: bool = False,
+        **attrs: Any,
+    ) -> Iterator[Optional[SpanRecord]]:
+        """Time the enclosed block as a child of ``parent`` (default: current).
+
+        Without a parent the span only starts a trace when ``new_trace`` is
+        set, so instrumented code stays silent outside traced turns.
+        ``start`` backdates the span (e.g. to when speech began).
+        """
+
+        parent = parent or current_trace()
+        if not self.enabled or (parent is None and not new_trace):
+            yield None
+            return
+        record = SpanRecord(
+            trace_id=parent.trace_id if parent else new_trace_id(),
+            span_id=new_span_id(),
+            parent_id=parent.span_id if parent else None,
+            name=name,
+            service=self.service,
+            start=time.time() if start is None else start,
+            end=0.0,
+            attrs=attrs,
+        )
+        with use_trace(TraceContext(trace_id=record.trace_id, span_id=record.span_id)):
+            try:
+                yield record
+            except BaseException as exc:
+                record.attrs["error"] = type(exc).__name__
+                raise
+            finally:
+                record.end = time.time()
+                self._finish(record)
+
+    def record(
+        self,
+        name: str,
+        start: float,
+        end: float,
+        *,
+        parent: Optional[TraceContext] = None,
+        **attrs: Any,
+    ) -> Optional[SpanRecord]:
+        """Record a span whose timing was measured elsewhere."""
+
+        parent = parent or current_trace()
+        if not self.enabled or parent is None:
+            return None
+        record = SpanRecord(
+            trace_id=parent.trace_id,
+            span_id=new_span_id(),
+            parent_id=parent.span_id,
+            name=name,
+            service=self.service,
+            start=start,
+            end=end,
+            attrs=attrs,
+        )
+        self._finish(record)
+        return record
+
+    def drain(self) -> list[SpanRecord]:
+        spans = list(self._pending)
+        self._pending.clear()
+        return spans
+
+    def batch(self) -> Optional[TraceSpans]:
+        spans = self.drain()
+        return TraceSpans(service=self.service, spans=spans) if spans else None
+
+    @property
+    def topic(self) -> str:
+        return f"{TOPIC_SYSTEM_TRACE_PREFIX}{self.service}"
+
+
+class TraceCollector:
+    """Reassemble exported spans into per-turn waterfalls and stage percentiles."""
+
+    def __init__(self) -> None:
+        self._spans: dict[str, list[SpanRecord]] = defaultdict(list)
+
+    def add(self, span: SpanRecord) -> None:
+        self._spans[span.trace_id].append(span)
+
+    def add_message(self, topic: str, payload: bytes) -> int:
+        """Ingest a ``system/trace/<service>`` envelope; returns spans added."""
+
+        if not topic.startswith(TOPIC_SYSTEM_TRACE_PREFIX):
+            return 0
+        try:
+            batch = TraceSpans.model_validate(Envelope.model_validate_json(payload).data)
+        except ValueError:
+            return 0
+        for span in batch.spans:
+            self.add(span)
+        return len(batch.spans)
+
+    def add_messages(self, messages: Iterable[Any]) -> int:
+        """Ingest recorded messages (anything with ``topic`` and ``payload``)."""
+
+        return sum(self.add_message(message.topic, message.payload) for message in messages)
+
+    @property
+    def trace_ids(self) -> list[str]:
+        """Trace ids ordered by when each turn started."""
+
+        return sorted(self._spans, key=lambda trace_id: min(s.start for s in self._spans[trace_id]))
+
+    def spans(self, trace_id: str) -> list[SpanRecord]:
+        return sorted(self._spans.get(trace_id, []), key=lambda s: (s.start, -s.end))
+
+    def waterfall(self, trace_id: str) -> list[dict[str, Any]]:
+        """Spans of one turn in start order with offsets from the turn start (ms)."""
+
+        spans = self.spans(trace_id)
+        if not spans:
+            return []
+        origin = spans[0].start
+        by_id = {span.span_id: span for span in spans}
+
+        def depth(span: SpanRecord) -> int:
+            level, seen = 0, set()
+            while span.parent_id in by_id and span.parent_id not in seen:
+                seen.add(span.parent_id)
+                span = by_id[span.parent_id]
+                level += 1
+            return level
+
+        return [
+            {
+                "name": span.name,
+                "service": span.service,
+                "depth": depth(span),
+                "offset_ms": round((span.start - origin) * 1000.0, 3),
+                "duration_ms": round(span.duration * 1000.0, 3),
+                **({"attrs": span.attrs} if span.attrs else {}),
+            }
+            for span in spans
+        ]
+
+    def format_waterfall(self, trace_id: str, *, width: int = 40) -> str:
+        rows = self.waterfall(trace_id)
+        if not rows:
+            return ""
+        total = max(row["offset_ms"] + row["duration_ms"] for row in rows) or 1.0
+        lines = []
+        for row in rows:
+            lead = int(row["offset_ms"] / total * width)
+            bar = max(1, int(row["duration_ms"] / total * width))
+            label = "  " * row["depth"] + row["name"]
+            lines.append(f"{label:<36} {' ' * lead}{'#' * bar:<{width - lead}} {row['duration_ms']:>9.1f} ms")
+        return "\n".join(lines)
+
+    def stage_latencies(self) -> dict[str, dict[str, Any]]:
+        """Per-stage (span name) count and p50/p95/p99/max in milliseconds."""
+
+        durations: dict[str, list[float]] = defaultdict(list)
+        for spans in self._spans.values():
+            for span in spans:
+                durations[span.name].append(span.duration * 1000.0)
+        return {
+            name: {
+                "count": len(samples),
+                "p50": round(percentile(samples, 0.50), 3),
+                "p95": round(percentile(samples, 0.95), 3),
+                "p99": round(percentile(samples, 0.99), 3),
+                "max": round(max(samples), 3),
+            }
+            for name, samples in sorted(durations.items())
+        }
+
+
+__all__ = [
+    "TraceCollector",
+    "Tracer",
+    "current_trace",
+    "new_span_id",
+    "new_trace_id",
+    "trace_from_payload",
+    "use_trace",
+]
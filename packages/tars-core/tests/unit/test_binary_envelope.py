@@ -0,0 +1,142 @@
+"""Unit tests for BinaryEnvelope and MQTTClient binary helpers."""
+
+from unittest.mock import patch
+
+import pytest
+
+from tars.adapters.mqtt_client import MQTTClient
+from tars.contracts.binary import (
+    CONTENT_TYPE_FFT_F32,
+    CONTENT_TYPE_JPEG,
+    BinaryEnvelope,
+    decode_fft_payload,
+    encode_fft_payload,
+)
+from tars.contracts.envelope import Envelope
+
+
+class TestBinaryEnvelope:
+    """Tests for the binary wire format."""
+
+    def test_roundtrip_preserves_header_and_payload(self):
+        """Decode what encode produced."""
+        env = BinaryEnvelope.new(
+            event_type="camera.frame",
+            payload=b"\xff\xd8jpeg-bytes\xff\xd9",
+            content_type=f"{CONTENT_TYPE_JPEG};w=640;h=480",
+            correlate="req-1",
+        )
+
+        decoded = BinaryEnvelope.decode(env.encode())
+
+        assert decoded == env
+        assert decoded.id == "req-1"
+        assert decoded.correlation_id == "req-1"
+
+    def test_correlation_absent_decodes_as_none(self):
+        """Distinguish missing correlation from empty string."""
+        env = BinaryEnvelope(type="x", payload=b"")
+
+        assert BinaryEnvelope.decode(env.encode()).correlation_id is None
+
+    def test_header_is_small_relative_to_payload(self):
+        """Raw bytes are not re-encoded (no base64 growth)."""
+        payload = bytes(range(256)) * 40
+        frame = BinaryEnvelope(type="camera.frame", payload=payload, content_type=CONTENT_TYPE_JPEG).encode()
+
+        assert len(frame) - len(payload) < 80
+
+    def test_content_params(self):
+        """Parse MIME-style parameters off the content type."""
+        env = BinaryEnvelope(type="camera.frame", payload=b"", content_type="image/jpeg; w=640;h=480;n=7")
+
+        assert env.media_type == "image/jpeg"
+        assert env.content_params == {"w": "640", "h": "480", "n": "7"}
+
+    def test_decode_rejects_json_envelope(self):
+        """JSON envelopes are not mistaken for binary frames."""
+        payload = Envelope.new(event_type="x", data={}).model_dump_json().encode()
+
+        assert not BinaryEnvelope.is_binary(payload)
+        with pytest.raises(ValueError):
+            BinaryEnvelope.decode(payload)
+
+    def test_decode_rejects_truncated_frame(self):
+        """Truncated header strings raise ValueError."""
+        frame = BinaryEnvelope(type="camera.frame", payload=b"").encode()
+
+        with pytest.raises(ValueError, match="truncated"):
+            BinaryEnvelope.decode(frame[:20])
+
+    def test_oversized_header_field_rejected(self):
+        """Header strings are length-prefixed with a single byte."""
+        with pytest.raises(ValueError, match="type"):
+            BinaryEnvelope(type="x" * 300, payload=b"").encode()
+
+    def test_fft_payload_roundtrip(self):
+        """FFT bins survive float32 packing."""
+        values = [0.0, 0.25, 0.5, 1.0]
+
+        packed = encode_fft_payload(values)
+
+        assert len(packed) == 16
+        assert decode_fft_payload(packed) == values
+
+    def test_fft_payload_rejects_partial_float(self):
+        """Reject payloads that are not whole float32 values."""
+        with pytest.raises(ValueError):
+            decode_fft_payload(b"\x00\x00\x00")
+
+
+class TestMQTTClientBinary:
+    """Tests for MQTTClient.publish_binary() / subscribe_binary()."""
+
+    @pytest.mark.asyncio
+    async def test_publish_binary_sends_encoded_frame(self, mqtt_url, mock_mqtt_client):
+        """Publish raw bytes inside a binary envelope."""
+        client = MQTTClient(mqtt_url, "test-client")
+
+        with patch("tars.adapters.mqtt_client.mqtt.Client", return_value=mock_mqtt_client):
+            await client.connect()
+            msg_id = await client.publish_binary(
+                topic="stt/audio_fft",
+                event_type="stt.audio_fft",
+                payload=encode_fft_payload([0.5, 1.0]),
+                content_type=CONTENT_TYPE_FFT_F32,
+                qos=0,
+            )
+
+        call_args = mock_mqtt_client.publish.call_args
+        assert call_args[0][0] == "stt/audio_fft"
+        frame = BinaryEnvelope.decode(call_args[0][1])
+        assert frame.id == msg_id
+        assert frame.type == "stt.audio_fft"
+        assert decode_fft_payload(frame.payload) == [0.5, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_publish_binary_not_connected_raises(self, mqtt_url):
+        """Raise RuntimeError if not connected."""
+        client = MQTTClient(mqtt_url, "test-client")
+
+        with pytest.raises(RuntimeError, match="not connected"):
+            await client.publish_binary("t", "e", b"")
+
+    @pytest.mark.asyncio
+    async def test_subscribe_binary_decodes_and_skips_non_binary(self, mqtt_url, mock_mqtt_client):
+        """Handler gets decoded frames; JSON payloads are dropped."""
+        client = MQTTClient(mqtt_url, "test-client")
+        received: list[BinaryEnvelope] = []
+
+        async def handler(frame: BinaryEnvelope) -> None:
+            received.append(frame)
+
+        with patch("tars.adapters.mqtt_client.mqtt.Client", return_value=mock_mqtt_client):
+            await client.connect()
+            await client.subscribe_binary("camera/frame", handler)
+
+        wrapped = client._handlers["camera/frame"]
+        await wrapped(BinaryEnvelope(type="camera.frame", payload=b"jpeg").encode())
+        await wrapped(b'{"type": "camera.frame"}')
+
+        assert [f.payload for f in received] == [b"jpeg"]
+        mock_mqtt_client.subscribe.assert_called_once_with("camera/frame", qos=0)
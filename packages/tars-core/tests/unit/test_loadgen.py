@@ -0,0 +1,118 @@
+"""Unit tests for the synthetic pipeline load generator."""
+
+import asyncio
+
+import pytest
+
+from tars.adapters.mqtt_client import MQTTClient
+from tars.adapters.mqtt_loopback import LoopbackBroker
+from tars.contracts.envelope import Envelope
+from tars.contracts.v1 import LLMRequest, TtsSay
+from tars.loadgen import LatencySeries, LLMStandIn, LoadGenerator, TTSStandIn, TurnProfile, percentile
+
+FAST_LLM = LLMStandIn(first_token=0.005, token_rate=1000.0, reply="Sure. Done.")
+FAST_TTS = TTSStandIn(start_delay=0.001, chars_per_sec=10000.0)
+
+
+class _EchoRouter:
+    """Minimal router: wake -> tts/say and stt/final -> llm/request, keeping correlation."""
+
+    def __init__(self, broker: LoopbackBroker, *, delay: float = 0.0) -> None:
+        self.client = MQTTClient("mqtt://loopback", "router", client_factory=broker.client)
+        self.delay = delay
+        self.llm_streams = 0
+        self.tts_statuses = 0
+
+    async def _forward(self, payload: bytes, topic: str, event_type: str, data) -> None:
+        envelope = Envelope.model_validate_json(payload)
+        await asyncio.sleep(self.delay)
+        await self.client.publish_event(topic, event_type, data, correlation_id=envelope.id, qos=1)
+
+    async def on_wake(self, payload: bytes) -> None:
+        await self._forward(payload, "tts/say", "tts.say", TtsSay(text="Yes?", wake_ack=True))
+
+    async def on_final(self, payload: bytes) -> None:
+        final = Envelope.model_validate_json(payload).data
+        request = LLMRequest(id=final["utt_id"], text=final["text"])
+        await self._forward(payload, "llm/request", "llm.request", request)
+
+    async def on_stream(self, payload: bytes) -> None:
+        self.llm_streams += 1
+
+    async def on_status(self, payload: bytes) -> None:
+        self.tts_statuses += 1
+
+    async def __aenter__(self) -> "_EchoRouter":
+        await self.client.connect()
+        await self.client.subscribe("wake/event", self.on_wake, qos=1)
+        await self.client.subscribe("stt/final", self.on_final, qos=1)
+        await self.client.subscribe("llm/stream", self.on_stream, qos=1)
+        await self.client.subscribe("tts/status", self.on_status, qos=1)
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.client.shutdown()
+
+
+class TestPercentile:
+    """Nearest-rank percentile helper."""
+
+    def test_nearest_rank(self):
+        samples = [float(n) for n in range(1, 101)]
+
+        assert percentile(samples, 0.50) == 50.0
+        assert percentile(samples, 0.95) == 95.0
+        assert percentile(samples, 0.99) == 99.0
+        assert percentile([3.0, 1.0, 2.0], 1.0) == 3.0
+
+    def test_empty_series_snapshot(self):
+        snapshot = LatencySeries().snapshot()
+
+        assert snapshot["count"] == 0
+        assert snapshot["p99"] == 0.0
+
+    def test_profile_validation(self):
+        with pytest.raises(ValueError):
+            TurnProfile(concurrency=0)
+
+
+class TestLoadGenerator:
+    """End-to-end runs against the loopback broker."""
+
+    @pytest.mark.asyncio
+    async def test_reports_correlated_latencies(self):
+        """Every turn yields one wake->say and one final->request sample."""
+        broker = LoopbackBroker(latency=0.001, seed=5)
+        profile = TurnProfile(turns=6, concurrency=3, speech_delay=0.0, partials=2, partial_rate=500.0)
+        generator = LoadGenerator(
+            "mqtt://loopback", profile=profile, llm=FAST_LLM, tts=FAST_TTS, client_factory=broker.client
+        )
+
+        async with _EchoRouter(broker, delay=0.01) as router:
+            report = await generator.run()
+            await asyncio.sleep(0.05)
+
+        data = report.to_dict()
+        for hop in ("wake_to_first_tts_say", "stt_final_to_llm_request"):
+            assert data[hop]["count"] == 6
+            assert data[hop]["timeouts"] == 0
+            assert 0.01 <= data[hop]["p50"] <= data[hop]["p95"] <= data[hop]["p99"] <= data[hop]["max"]
+        assert data["published"]["stt/partial"] == 12
+        assert data["published"]["wake/event"] == 6
+        assert router.llm_streams > 0
+        assert router.tts_statuses == 12  # start + end for each echoed tts/say
+
+    @pytest.mark.asyncio
+    async def test_unanswered_turns_count_as_timeouts(self):
+        """Without a router nothing correlates, so every hop times out."""
+        broker = LoopbackBroker()
+        profile = TurnProfile(turns=2, speech_delay=0.0, partials=0, turn_timeout=0.02)
+        generator = LoadGenerator(
+            "mqtt://loopback", profile=profile, enable_llm=False, enable_tts=False, client_factory=broker.client
+        )
+
+        report = await generator.run()
+
+        assert report.wake_to_say.timeouts == 2
+        assert report.final_to_llm_request.timeouts == 2
+        assert report.wake_to_say.samples == []
@@ -0,0 +1,145 @@
+"""Unit tests for the MQTT metrics registry and MQTTClient instrumentation."""
+
+import asyncio
+from unittest.mock import patch
+
+import orjson
+import pytest
+
+from tars.adapters.mqtt_asyncio import AsyncioMQTTPublisher
+from tars.adapters.mqtt_client import MQTTClient, MQTTClientConfig
+from tars.runtime.metrics import Histogram, MetricsRegistry
+
+
+class TestHistogram:
+    """Tests for fixed-bucket histograms."""
+
+    def test_observe_places_values_in_buckets(self):
+        """Values land in the first bucket whose bound is >= value."""
+        hist = Histogram(bounds=(0.1, 1.0))
+
+        for value in (0.05, 0.1, 0.5, 2.0):
+            hist.observe(value)
+
+        assert hist.counts == [2, 1, 1]
+        assert hist.count == 4
+        assert hist.max == 2.0
+        assert hist.total == pytest.approx(2.65)
+
+    def test_quantiles_report_bucket_upper_bound(self):
+        """Quantiles resolve to bucket bounds; overflow reports the max seen."""
+        hist = Histogram(bounds=(0.01, 0.1, 1.0))
+        for _ in range(90):
+            hist.observe(0.005)
+        for _ in range(9):
+            hist.observe(0.05)
+        hist.observe(3.0)
+
+        assert hist.quantile(0.5) == 0.01
+        assert hist.quantile(0.95) == 0.1
+        assert hist.quantile(1.0) == 3.0
+
+    def test_empty_histogram_quantile_is_zero(self):
+        """No observations yields 0.0."""
+        assert Histogram().quantile(0.99) == 0.0
+
+
+class TestMetricsRegistry:
+    """Tests for MetricsRegistry snapshots."""
+
+    def test_snapshot_is_json_serializable(self):
+        """Snapshot covers counters, histograms, rates and gauges."""
+        registry = MetricsRegistry()
+        depth = [3]
+        registry.register_gauge("queue_depth", lambda: depth[0])
+
+        registry.record_received("stt/final")
+        registry.record_published("tts/say", 42)
+        registry.record_dropped("stt/final")
+        registry.observe_queue_wait("stt/final", 0.002)
+        registry.observe_handler("stt/final", 0.01)
+        registry.observe_handler("stt/final", 0.5, ok=False)
+
+        snapshot = orjson.loads(orjson.dumps(registry.snapshot()))
+
+        stt = snapshot["topics"]["stt/final"]
+        assert stt["received"] == 1
+        assert stt["dropped"] == 1
+        assert stt["handled"] == 1
+        assert stt["errors"] == 1
+        assert stt["queue_wait"]["count"] == 1
+        assert stt["handler_duration"]["count"] == 2
+        assert snapshot["topics"]["tts/say"]["published_bytes"] == 42
+        assert snapshot["gauges"] == {"queue_depth": 3.0}
+
+    def test_unregister_gauge(self):
+        """Removed gauges no longer appear."""
+        registry = MetricsRegistry()
+        registry.register_gauge("g", lambda: 1)
+        registry.unregister_gauge("g")
+
+        assert registry.snapshot()["gauges"] == {}
+
+
+class TestMQTTClientMetrics:
+    """Tests for MQTTClient instrumentation."""
+
+    @pytest.mark.asyncio
+    async def test_publish_event_records_topic(self, mqtt_url, mock_mqtt_client):
+        """Published events are counted per topic."""
+        client = MQTTClient(mqtt_url, "test-client", metrics_interval=0)
+
+        with patch("tars.adapters.mqtt_client.mqtt.Client", return_value=mock_mqtt_client):
+            await client.connect()
+            await client.publish_event("llm/request", "llm.request", {"text": "hi"})
+
+        snapshot = client.metrics_snapshot()
+        assert snapshot["client_id"] == "test-client"
+        assert snapshot["topics"]["llm/request"]["published"] == 1
+        assert snapshot["topics"]["llm/request"]["published_bytes"] > 0
+
+    @pytest.mark.asyncio
+    async def test_shared_registry_with_publisher(self, mqtt_url, mock_mqtt_client):
+        """AsyncioMQTTPublisher records into the client's registry."""
+        client = MQTTClient(mqtt_url, "test-client", metrics_interval=0)
+        publisher = AsyncioMQTTPublisher(mock_mqtt_client, metrics=client.metrics)
+
+        await publisher.publish("tts/say", b"{}")
+
+        assert client.metrics_snapshot()["topics"]["tts/say"]["published"] == 1
+
+    @pytest.mark.asyncio
+    async def test_metrics_loop_publishes_snapshot(self, mqtt_url, mock_mqtt_client):
+        """Snapshots are published periodically on system/metrics/<client_id>."""
+        client = MQTTClient(mqtt_url, "test-client", metrics_interval=0.01)
+
+        with patch("tars.adapters.mqtt_client.mqtt.Client", return_value=mock_mqtt_client):
+            await client.connect()
+            await asyncio.sleep(0.05)
+            await client.disconnect()
+
+        topics = [call[0][0] for call in mock_mqtt_client.publish.call_args_list]
+        assert "system/metrics/test-client" in topics
+        payload = next(
+            call[0][1]
+            for call in mock_mqtt_client.publish.call_args_list
+            if call[0][0] == "system/metrics/test-client"
+        )
+        envelope = orjson.loads(payload)
+        assert envelope["type"] == "system.metrics"
+        assert envelope["data"]["client_id"] == "test-client"
+
+    def test_metrics_interval_from_env(self, monkeypatch, mqtt_url):
+        """MQTT_METRICS_INTERVAL enables publishing when not passed explicitly."""
+        monkeypatch.setenv("MQTT_METRICS_INTERVAL", "15")
+
+        assert MQTTClient(mqtt_url, "c")._config.metrics_interval == 15.0
+        assert MQTTClient(mqtt_url, "c", metrics_interval=0)._config.metrics_interval == 0.0
+
+    def test_config_from_env(self, monkeypatch):
+        """MQTTClientConfig.from_env reads the metrics interval."""
+        monkeypatch.setenv("MQTT_URL", "mqtt://localhost:1883")
+        monkeypatch.setenv("MQTT_CLIENT_ID", "svc")
+        monkeypatch.setenv("MQTT_METRICS_INTERVAL", "30")
+
+        assert MQTTClientConfig.from_env().metrics_interval == 30.0
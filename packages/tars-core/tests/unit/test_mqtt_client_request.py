@@ -0,0 +1,281 @@
+"""Unit tests for MQTTClient.request() (request/response RPC)."""
+
+import asyncio
+from unittest.mock import patch
+
+import orjson
+import pytest
+
+from tars.adapters.mqtt_client import MQTTClient, ReplyCache, request_key
+from tars.adapters.mqtt_loopback import LoopbackBroker
+from tars.contracts.envelope import Envelope
+from tars.contracts.v1.memory import MemoryQuery
+
+
+async def _connected_client(mqtt_url, mock_mqtt_client) -> MQTTClient:
+    client = MQTTClient(mqtt_url, "test-client", enable_health=False, enable_heartbeat=False)
+    with patch("tars.adapters.mqtt_client.mqtt.Client", return_value=mock_mqtt_client):
+        await client.connect()
+    return client
+
+
+def _published_ids(mock_mqtt_client, topic: str) -> list[str]:
+    return [
+        orjson.loads(call[0][1])["id"]
+        for call in mock_mqtt_client.publish.call_args_list
+        if call[0][0] == topic
+    ]
+
+
+def _reply(correlation_id: str, **data) -> bytes:
+    envelope = Envelope.new(event_type="memory.results", data=data, correlate=correlation_id)
+    return envelope.model_dump_json().encode()
+
+
+class TestRequest:
+    """Tests for MQTTClient.request()."""
+
+    @pytest.mark.asyncio
+    async def test_request_returns_correlated_reply(self, mqtt_url, mock_mqtt_client):
+        """Subscribe to the reply topic, publish, and resolve by envelope id."""
+        client = await _connected_client(mqtt_url, mock_mqtt_client)
+
+        task = asyncio.create_task(
+            client.request("memory/query", "memory.query", {"text": "hi"}, reply_topic="memory/results")
+        )
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        mock_mqtt_client.subscribe.assert_called_once_with("memory/results", qos=1)
+        [corr] = _published_ids(mock_mqtt_client, "memory/query")
+        client._resolve_reply(_reply("other-id", results=["ignored"]))
+        client._resolve_reply(_reply(corr, results=["a"]))
+
+        reply = await task
+        assert reply.id == corr
+        assert reply.data == {"results": ["a"]}
+        assert client._pending_replies == {}
+        assert client._inflight_requests == {}
+
+    @pytest.mark.asyncio
+    async def test_request_uses_given_correlation_id(self, mqtt_url, mock_mqtt_client):
+        """Caller-supplied correlation ID is used as the request envelope id."""
+        client = await _connected_client(mqtt_url, mock_mqtt_client)
+
+        task = asyncio.create_task(
+            client.request("q", "x", {}, reply_topic="r", correlation_id="corr-1")
+        )
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        client._resolve_reply(_reply("corr-1"))
+
+        assert (await task).id == "corr-1"
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_are_coalesced(self, mqtt_url, mock_mqtt_client):
+        """Concurrent identical requests publish once and share the reply."""
+        client = await _connected_client(mqtt_url, mock_mqtt_client)
+
+        tasks = [
+            asyncio.create_task(client.request("q", "x", {"text": "same", "k": 1}, reply_topic="r"))
+            for _ in range(3)
+        ]
+        other = asyncio.create_task(client.request("q", "x", {"text": "different"}, reply_topic="r"))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        ids = _published_ids(mock_mqtt_client, "q")
+        assert len(ids) == 2
+        for corr in ids:
+            client._resolve_reply(_reply(corr, corr=corr))
+
+        replies = await asyncio.gather(*tasks)
+        assert len({r.id for r in replies}) == 1
+        assert (await other).id != replies[0].id
+        mock_mqtt_client.subscribe.assert_called_once_with("r", qos=1)
+
+    @pytest.mark.asyncio
+    async def test_coalesce_disabled_publishes_each_request(self, mqtt_url, mock_mqtt_client):
+        """coalesce=False sends every request."""
+        client = await _connected_client(mqtt_url, mock_mqtt_client)
+
+        tasks = [
+            asyncio.create_task(client.request("q", "x", {}, reply_topic="r", coalesce=False))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        ids = _published_ids(mock_mqtt_client, "q")
+        assert len(ids) == 2
+        for corr in ids:
+            client._resolve_reply(_reply(corr))
+        await asyncio.gather(*tasks)
+
+    @pytest.mark.asyncio
+    async def test_request_timeout(self, mqtt_url, mock_mqtt_client):
+        """Raise TimeoutError and clear pending state when no reply arrives."""
+        client = await _connected_client(mqtt_url, mock_mqtt_client)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await client.request("q", "x", {}, reply_topic="r", timeout=0.01)
+
+        assert client._pending_replies == {}
+        assert client._inflight_requests == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelling_one_caller_keeps_shared_request(self, mqtt_url, mock_mqtt_client):
+        """A coalesced request survives until its last caller is cancelled."""
+        client = await _connected_client(mqtt_url, mock_mqtt_client)
+
+        first = asyncio.create_task(client.request("q", "x", {}, reply_topic="r"))
+        second = asyncio.create_task(client.request("q", "x", {}, reply_topic="r"))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        [corr] = _published_ids(mock_mqtt_client, "q")
+
+        first.cancel()
+        await asyncio.sleep(0)
+        assert client._pending_replies
+
+        client._resolve_reply(_reply(corr))
+        assert (await second).id == corr
+        assert first.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_cancelling_all_callers_abandons_request(self, mqtt_url, mock_mqtt_client):
+        """Pending state is dropped once nobody waits for the reply."""
+        client = await _connected_client(mqtt_url, mock_mqtt_client)
+
+        task = asyncio.create_task(client.request("q", "x", {}, reply_topic="r"))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        [inflight] = client._inflight_requests.values()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        with pytest.raises(asyncio.CancelledError):
+            await inflight.task
+
+        assert client._pending_replies == {}
+        assert client._inflight_requests == {}
+
+    @pytest.mark.asyncio
+    async def test_cache_ttl_serves_repeat_requests(self, mqtt_url, mock_mqtt_client):
+        """Cached replies short-circuit later identical requests."""
+        client = await _connected_client(mqtt_url, mock_mqtt_client)
+
+        task = asyncio.create_task(client.request("q", "x", {"a": 1}, reply_topic="r", cache_ttl=60))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        [corr] = _published_ids(mock_mqtt_client, "q")
+        client._resolve_reply(_reply(corr))
+        first = await task
+
+        second = await client.request("q", "x", {"a": 1}, reply_topic="r", cache_ttl=60)
+
+        assert second is first
+        assert len(_published_ids(mock_mqtt_client, "q")) == 1
+
+        client.clear_request_cache()
+        assert len(client._reply_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_reply_topic_keeps_existing_handler(self, mqtt_url, mock_mqtt_client):
+        """A topic already subscribed with a handler is not re-subscribed."""
+        client = await _connected_client(mqtt_url, mock_mqtt_client)
+
+        async def handler(payload: bytes) -> None:
+            pass
+
+        await client.subscribe("r", handler, qos=1)
+        await client._ensure_reply_subscription("r")
+
+        mock_mqtt_client.subscribe.assert_called_once_with("r", qos=1)
+        assert client._handlers["r"] is handler
+        assert client._is_reply_topic("r")
+
+    @pytest.mark.asyncio
+    async def test_reply_topic_survives_reconnect(self):
+        """After disconnect() and connect(), request() still receives its replies."""
+        broker = LoopbackBroker()
+        options = dict(client_factory=broker.client, enable_health=False, enable_heartbeat=False)
+        server = MQTTClient("mqtt://loopback", "server", **options)
+        client = MQTTClient("mqtt://loopback", "client", **options)
+
+        async def answer(payload: bytes) -> None:
+            query = Envelope.model_validate_json(payload)
+            await server.publish_event(
+                "memory/results", "memory.results", query.data, correlation_id=query.id, qos=1
+            )
+
+        async def ask(n: int) -> Envelope:
+            return await client.request(
+                "memory/query", "memory.query", {"n": n}, reply_topic="memory/results", timeout=1.0
+            )
+
+        await server.connect()
+        await server.subscribe("memory/query", answer, qos=1)
+        await client.connect()
+        try:
+            first = await ask(1)
+            await client.disconnect()
+            await client.connect()
+            second = await ask(2)
+        finally:
+            await client.shutdown()
+            await server.shutdown()
+
+        assert first.data == {"n": 1}
+        assert second.data == {"n": 2}
+
+    @pytest.mark.asyncio
+    async def test_request_not_connected_raises(self, mqtt_url):
+        """Raise RuntimeError if not connected."""
+        client = MQTTClient(mqtt_url, "test-client")
+
+        with pytest.raises(RuntimeError, match="not connected"):
+            await client.request("q", "x", {}, reply_topic="r")
+
+
+class TestReplyCache:
+    """Tests for the TTL reply cache and request keys."""
+
+    def test_expired_entries_are_dropped(self):
+        """Entries vanish once their TTL elapses."""
+        cache = ReplyCache()
+        reply = Envelope.new(event_type="x", data={})
+
+        cache.put("k", reply, ttl=-1)
+
+        assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        """Least recently used entries are evicted past max_entries."""
+        cache = ReplyCache(max_entries=2)
+        replies = [Envelope.new(event_type="x", data={"n": n}) for n in range(3)]
+
+        cache.put("a", replies[0], ttl=60)
+        cache.put("b", replies[1], ttl=60)
+        cache.get("a")
+        cache.put("c", replies[2], ttl=60)
+
+        assert cache.get("a") is replies[0]
+        assert cache.get("b") is None
+        assert cache.get("c") is replies[2]
+
+    def test_request_key_ignores_dict_order(self):
+        """Payload key order does not change the key."""
+        assert request_key("q", "x", {"a": 1, "b": 2}) == request_key("q", "x", {"b": 2, "a": 1})
+        assert request_key("q", "x", {"a": 1}) != request_key("q", "y", {"a": 1})
+
+    def test_request_key_ignores_message_id(self):
+        """Contract models with fresh message ids still coalesce."""
+        first = MemoryQuery(text="hello", top_k=3)
+        second = MemoryQuery(text="hello", top_k=3)
+
+        assert first.message_id != second.message_id
+        assert request_key("memory/query", "memory.query", first) == request_key(
+            "memory/query", "memory.query", second
+        )
@@ -4,11 +4,18 @@ TDD Workflow: Write tests FIRST (RED), then implement (GREEN).
 """
 
 import asyncio
+import os
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 import orjson
 
-from tars.adapters.mqtt_client import MQTTClient
+from tars.adapters.mqtt_asyncio import AsyncioMQTTSubscriber
+from tars.adapters.mqtt_client import (
+    MQTTClient,
+    replica_client_id,
+    shared_topic,
+    split_shared_topic,
+)
 from tars.contracts.envelope import Envelope
 
 
@@ -132,6 +139,90 @@ class TestSubscribe:
             await client.subscribe("test/topic", test_handler)
 
 
+
+class TestSharedSubscriptions:
+    """Tests for shared-subscription (worker group) support."""
+
+    def test_shared_topic_builds_filter(self):
+        """Prefix topic with $share/<group>/."""
+        assert shared_topic("llm/request", "llm-workers") == "$share/llm-workers/llm/request"
+        assert shared_topic("llm/request", None) == "llm/request"
+        assert shared_topic("$share/old/llm/request", "new") == "$share/new/llm/request"
+
+    def test_shared_topic_rejects_invalid_group(self):
+        """Group names cannot contain topic separators or wildcards."""
+        for group in ("a/b", "a+", "#"):
+            with pytest.raises(ValueError, match="share group"):
+                shared_topic("llm/request", group)
+
+    def test_split_shared_topic(self):
+        """Recover group and plain topic from a shared filter."""
+        assert split_shared_topic("$share/g/memory/query") == ("g", "memory/query")
+        assert split_shared_topic("memory/query") == (None, "memory/query")
+        with pytest.raises(ValueError):
+            split_shared_topic("$share/g")
+
+    def test_replica_client_id_is_unique_per_process(self):
+        """Derive a client ID that does not collide across replicas."""
+        client_id = replica_client_id("tars-llm")
+
+        assert client_id.startswith("tars-llm-")
+        assert client_id.endswith(f"-{os.getpid()}")
+
+    @pytest.mark.asyncio
+    async def test_subscribe_with_share_group(self, mqtt_url, mock_mqtt_client):
+        """Subscribe to $share filter but key the handler on the plain topic."""
+        client = MQTTClient(mqtt_url, "test-client")
+
+        async def test_handler(payload: bytes) -> None:
+            pass
+
+        with patch("tars.adapters.mqtt_client.mqtt.Client", return_value=mock_mqtt_client):
+            await client.connect()
+            await client.subscribe("llm/request", test_handler, qos=1, share_group="llm-workers")
+
+        mock_mqtt_client.subscribe.assert_called_once_with("$share/llm-workers/llm/request", qos=1)
+        assert client._handlers["llm/request"] is test_handler
+        assert "$share/llm-workers/llm/request" in client._subscriptions
+
+    @pytest.mark.asyncio
+    async def test_subscribe_accepts_shared_filter(self, mqtt_url, mock_mqtt_client):
+        """A pre-built $share filter is routed to the plain topic handler."""
+        client = MQTTClient(mqtt_url, "test-client")
+
+        async def test_handler(payload: bytes) -> None:
+            pass
+
+        with patch("tars.adapters.mqtt_client.mqtt.Client", return_value=mock_mqtt_client):
+            await client.connect()
+            await client.subscribe("$share/g/memory/+", test_handler)
+
+        mock_mqtt_client.subscribe.assert_called_once_with("$share/g/memory/+", qos=0)
+        assert "memory/+" in client._handlers
+
+    @pytest.mark.asyncio
+    async def test_asyncio_subscriber_share_group(self):
+        """AsyncioMQTTSubscriber filters on the plain topic, subscribes shared."""
+        mqtt_client = MagicMock()
+        mqtt_client.subscribe = AsyncMock()
+        messages = MagicMock()
+        messages.__aenter__ = AsyncMock(return_value=_aiter([]))
+        messages.__aexit__ = AsyncMock(return_value=None)
+        mqtt_client.filtered_messages.return_value = messages
+
+        subscriber = AsyncioMQTTSubscriber(mqtt_client)
+        async for _ in subscriber.messages("memory/query", qos=1, share_group="mem"):
+            pass
+
+        mqtt_client.filtered_messages.assert_called_once_with("memory/query")
+        mqtt_client.subscribe.assert_awaited_once_with("$share/mem/memory/query", qos=1)
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
 @pytest.mark.asyncio
 @pytest.mark.skip("Message dispatch tests require integration testing with real broker")
 class TestMessageDispatch:
@@ -0,0 +1,211 @@
+"""Unit tests for the in-process loopback MQTT broker."""
+
+import asyncio
+
+import asyncio_mqtt as mqtt
+import orjson
+import pytest
+
+from tars.adapters.mqtt_asyncio import AsyncioMQTTPublisher, AsyncioMQTTSubscriber
+from tars.adapters.mqtt_client import MQTTClient
+from tars.adapters.mqtt_loopback import LoopbackBroker, topic_matches
+
+
+async def _collect(client, n: int, *, timeout: float = 1.0) -> list[mqtt.Message]:
+    received: list[mqtt.Message] = []
+    async with client.messages() as messages:
+        async def _read() -> None:
+            async for message in messages:
+                received.append(message)
+                if len(received) == n:
+                    return
+
+        await asyncio.wait_for(_read(), timeout)
+    return received
+
+
+class TestLoopbackBroker:
+    """Tests for LoopbackBroker routing semantics."""
+
+    @pytest.mark.parametrize(
+        ("topic", "topic_filter", "expected"),
+        [
+            ("llm/stream", "llm/stream", True),
+            ("system/health/tts", "system/health/+", True),
+            ("system/health/tts/x", "system/health/+", False),
+            ("a/b/c", "a/#", True),
+            ("llm/request", "$share/workers/llm/request", True),
+            ("llm/request", "llm/response", False),
+        ],
+    )
+    def test_topic_matches(self, topic, topic_filter, expected):
+        """Wildcards and $share prefixes match like a real broker."""
+        assert topic_matches(topic, topic_filter) is expected
+
+    @pytest.mark.asyncio
+    async def test_publish_reaches_matching_subscribers(self):
+        """Only clients with a matching filter receive the message."""
+        broker = LoopbackBroker()
+        async with broker.client(client_id="pub") as pub, broker.client(client_id="a") as a, broker.client(
+            client_id="b"
+        ) as b:
+            await a.subscribe("system/health/+", qos=1)
+            await b.subscribe("tts/say")
+            reader = asyncio.create_task(_collect(a, 1))
+            await asyncio.sleep(0)
+
+            await pub.publish("system/health/tts", b"ok", qos=1)
+
+            [message] = await reader
+            assert str(message.topic) == "system/health/tts"
+            assert message.payload == b"ok"
+            assert message.qos == 1
+            assert broker.stats.delivered == 1
+
+    @pytest.mark.asyncio
+    async def test_retained_message_replayed_on_subscribe(self):
+        """Late subscribers get the retained message; empty payload clears it."""
+        broker = LoopbackBroker()
+        async with broker.client() as pub, broker.client() as sub:
+            await pub.publish("system/character/current", b"{}", qos=1, retain=True)
+            assert broker.retained == {"system/character/current": b"{}"}
+
+            reader = asyncio.create_task(_collect(sub, 1))
+            await asyncio.sleep(0)
+            await sub.subscribe("system/character/#", qos=1)
+            [message] = await reader
+            assert message.retain is True
+
+            await pub.publish("system/character/current", b"", retain=True)
+            assert broker.retained == {}
+
+    @pytest.mark.asyncio
+    async def test_shared_subscription_round_robin(self):
+        """Members of a share group split the traffic."""
+        broker = LoopbackBroker()
+        async with broker.client() as pub, broker.client() as w1, broker.client() as w2:
+            await w1.subscribe("$share/llm/llm/request", qos=1)
+            await w2.subscribe("$share/llm/llm/request", qos=1)
+            readers = [asyncio.create_task(_collect(w, 2)) for w in (w1, w2)]
+            await asyncio.sleep(0)
+
+            for n in range(4):
+                await pub.publish("llm/request", str(n).encode(), qos=1)
+
+            first, second = await asyncio.gather(*readers)
+            assert [m.payload for m in first] == [b"0", b"2"]
+            assert [m.payload for m in second] == [b"1", b"3"]
+
+    @pytest.mark.asyncio
+    async def test_latency_and_jitter_preserve_order(self):
+        """Injected delays never reorder deliveries to one client."""
+        broker = LoopbackBroker(latency=0.002, jitter=0.005, seed=3)
+        async with broker.client() as pub, broker.client() as sub:
+            await sub.subscribe("llm/stream")
+            reader = asyncio.create_task(_collect(sub, 20))
+            await asyncio.sleep(0)
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+
+            for n in range(20):
+                await pub.publish("llm/stream", str(n).encode())
+
+            received = await reader
+            assert [int(m.payload) for m in received] == list(range(20))
+            assert loop.time() - started >= 0.002
+
+    @pytest.mark.asyncio
+    async def test_loss_drops_qos0_and_redelivers_qos1(self):
+        """Seeded loss drops QoS 0 deliveries but QoS 1 always arrives."""
+        broker = LoopbackBroker(loss=0.5, seed=11)
+        async with broker.client() as pub, broker.client() as sub:
+            await sub.subscribe("t/qos1", qos=1)
+            await sub.subscribe("t/qos0", qos=0)
+            reader = asyncio.create_task(_collect(sub, 10))
+            await asyncio.sleep(0)
+
+            for n in range(10):
+                await pub.publish("t/qos0", b"x", qos=0)
+                await pub.publish("t/qos1", str(n).encode(), qos=1)
+            await asyncio.sleep(0.01)
+            reader.cancel()
+
+        assert broker.stats.lost > 0
+        assert broker.stats.redelivered > 0
+        assert broker.stats.delivered == 20 - broker.stats.lost
+
+    @pytest.mark.asyncio
+    async def test_disconnect_ends_message_iteration(self):
+        """A dropped connection surfaces as MqttError in the message generator."""
+        broker = LoopbackBroker()
+        client = broker.client(client_id="svc")
+        await client.connect()
+        reader = asyncio.create_task(_collect(client, 1))
+        await asyncio.sleep(0)
+
+        broker.disconnect("svc")
+
+        with pytest.raises(mqtt.MqttError):
+            await reader
+        with pytest.raises(mqtt.MqttError):
+            await client.publish("t", b"")
+
+
+class TestLoopbackAdapters:
+    """LoopbackClient behind the existing MQTT interfaces."""
+
+    @pytest.mark.asyncio
+    async def test_mqtt_clients_exchange_events(self, mqtt_url):
+        """Two MQTTClients talk through the broker via client_factory."""
+        broker = LoopbackBroker(latency=0.001, seed=1)
+        router = MQTTClient(mqtt_url, "router", client_factory=broker.client)
+        tts = MQTTClient(mqtt_url, "tts", client_factory=broker.client)
+        received: asyncio.Queue[bytes] = asyncio.Queue()
+
+        async def on_say(payload: bytes) -> None:
+            await received.put(payload)
+
+        async with router, tts:
+            await tts.subscribe("tts/say", on_say, qos=1)
+            msg_id = await router.publish_event("tts/say", "tts.say", {"text": "hi"}, qos=1)
+            payload = await asyncio.wait_for(received.get(), 1.0)
+
+        assert orjson.loads(payload)["id"] == msg_id
+
+    @pytest.mark.asyncio
+    async def test_asyncio_publisher_and_subscriber(self):
+        """AsyncioMQTTPublisher/Subscriber work on LoopbackClient unchanged."""
+        broker = LoopbackBroker()
+        async with broker.client() as pub_client, broker.client() as sub_client:
+            subscriber = AsyncioMQTTSubscriber(sub_client)
+            publisher = AsyncioMQTTPublisher(pub_client)
+            stream = subscriber.messages("wake/event", qos=1).__aiter__()
+            first = asyncio.create_task(stream.__anext__())
+            await asyncio.sleep(0)
+
+            await publisher.publish("wake/event", b'{"type": "wake"}', qos=1)
+
+            message = await asyncio.wait_for(first, 1.0)
+            assert message.payload == b'{"type": "wake"}'
+
+    @pytest.mark.asyncio
+    async def test_outbox_flushes_after_broker_disconnect(self, mqtt_url):
+        """Publishes queued across a dropped connection arrive after reconnect."""
+        broker = LoopbackBroker()
+        client = MQTTClient(mqtt_url, "llm", client_factory=broker.client, outbox_max_entries=10)
+        async with broker.client() as sink:
+            await sink.subscribe("llm/response", qos=1)
+            reader = asyncio.create_task(_collect(sink, 2))
+            await asyncio.sleep(0)
+
+            await client.connect()
+            broker.disconnect("llm")
+            await client.publish_event("llm/response", "llm.response", {"reply": "a"}, qos=1)
+            await client.publish_event("llm/response", "llm.response", {"reply": "b"}, qos=1)
+            await client.disconnect()
+            await client.connect()
+
+            received = await reader
+            await client.shutdown()
+
+        assert [orjson.loads(m.payload)["data"]["reply"] for m in received] == ["a", "b"]
@@ -0,0 +1,213 @@
+"""Unit tests for the publish outbox and MQTTClient offline queuing."""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import asyncio_mqtt as mqtt
+import orjson
+import pytest
+
+from tars.adapters.mqtt_client import MQTTClient, MQTTClientConfig
+from tars.adapters.mqtt_outbox import OutboxEntry, PublishOutbox
+
+
+def _entry(n: int, *, expires_at: float | None = None) -> OutboxEntry:
+    return OutboxEntry(topic=f"t/{n}", payload=str(n).encode(), expires_at=expires_at)
+
+
+def _drain(outbox: PublishOutbox) -> list[str]:
+    topics = []
+    while (entry := outbox.pop()) is not None:
+        topics.append(entry.topic)
+    return topics
+
+
+class TestPublishOutbox:
+    """Tests for PublishOutbox ordering, bounds and expiry."""
+
+    def test_fifo_order(self):
+        """Entries come back in the order they were queued."""
+        outbox = PublishOutbox(max_entries=10)
+        for n in range(3):
+            outbox.put(_entry(n))
+
+        assert len(outbox) == 3
+        assert _drain(outbox) == ["t/0", "t/1", "t/2"]
+        assert not outbox
+
+    def test_expired_entries_are_skipped(self):
+        """Stale entries are dropped on pop and counted."""
+        outbox = PublishOutbox(max_entries=10)
+        outbox.put(_entry(0, expires_at=time.time() - 1))
+        outbox.put(_entry(1, expires_at=time.time() + 60))
+
+        assert _drain(outbox) == ["t/1"]
+        assert outbox.expired == 1
+
+    def test_full_outbox_purges_expired_then_rejects(self):
+        """A full memory tier frees expired slots before rejecting."""
+        outbox = PublishOutbox(max_entries=2)
+        outbox.put(_entry(0, expires_at=time.time() - 1))
+        outbox.put(_entry(1))
+
+        assert outbox.put(_entry(2))
+        assert not outbox.put(_entry(3))
+        assert outbox.dropped == 1
+        assert _drain(outbox) == ["t/1", "t/2"]
+
+    def test_spill_preserves_order(self, tmp_path):
+        """Overflow goes to disk and is read back after memory drains."""
+        path = tmp_path / "outbox.jsonl"
+        outbox = PublishOutbox(max_entries=2, spill_path=path)
+        for n in range(5):
+            assert outbox.put(_entry(n))
+
+        assert len(outbox) == 5
+        assert path.exists()
+        assert _drain(outbox) == [f"t/{n}" for n in range(5)]
+        assert not path.exists()
+
+    def test_push_front_requeues_at_head(self):
+        """A failed entry is retried before later ones."""
+        outbox = PublishOutbox(max_entries=10)
+        outbox.put(_entry(0))
+        outbox.put(_entry(1))
+
+        outbox.push_front(outbox.pop())
+
+        assert _drain(outbox) == ["t/0", "t/1"]
+
+    def test_spill_file_survives_restart(self, tmp_path):
+        """A new outbox replays entries spilled by a previous process."""
+        path = tmp_path / "outbox.jsonl"
+        first = PublishOutbox(max_entries=1, spill_path=path)
+        first.put(_entry(0))
+        first.put(OutboxEntry(topic="t/1", payload=b"\x00\xff", qos=2, retain=True))
+
+        second = PublishOutbox(max_entries=1, spill_path=path)
+
+        assert len(second) == 1
+        entry = second.pop()
+        assert (entry.topic, entry.payload, entry.qos, entry.retain) == ("t/1", b"\x00\xff", 2, True)
+
+
+class TestMQTTClientOutbox:
+    """Tests for MQTTClient publishing through the outbox."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_outbox_still_raises(self, mqtt_url):
+        """Without an outbox, publishing while disconnected raises."""
+        client = MQTTClient(mqtt_url, "test-client", outbox_max_entries=0)
+
+        with pytest.raises(RuntimeError, match="not connected"):
+            await client.publish_event("tts/say", "tts.say", {"text": "hi"}, qos=1)
+
+    @pytest.mark.asyncio
+    async def test_qos0_is_not_queued(self, mqtt_url):
+        """QoS 0 publishes are best-effort and never queued."""
+        client = MQTTClient(mqtt_url, "test-client", outbox_max_entries=10)
+
+        with pytest.raises(RuntimeError, match="not connected"):
+            await client.publish_event("llm/stream", "llm.stream", {"delta": "x"}, qos=0)
+
+    @pytest.mark.asyncio
+    async def test_queued_publishes_flush_in_order_after_connect(self, mqtt_url, mock_mqtt_client):
+        """Offline QoS>=1 publishes are replayed after reconnect; expired ones are dropped."""
+        client = MQTTClient(mqtt_url, "test-client", outbox_max_entries=10)
+
+        first = await client.publish_event("tts/say", "tts.say", {"text": "one"}, qos=1)
+        await client.publish_event("llm/stream", "llm.stream", {"delta": "x"}, qos=1, expiry=0.001)
+        second = await client.publish_event("tts/say", "tts.say", {"text": "two"}, qos=1)
+        await asyncio.sleep(0.01)
+        assert client.metrics_snapshot()["outbox"]["pending"] == 3
+
+        with patch("tars.adapters.mqtt_client.mqtt.Client", return_value=mock_mqtt_client):
+            await client.connect()
+            await client._flush_task
+
+        calls = mock_mqtt_client.publish.call_args_list
+        assert [orjson.loads(c[0][1])["id"] for c in calls] == [first, second]
+        assert all(c[1]["qos"] == 1 for c in calls)
+        snapshot = client.metrics_snapshot()
+        assert snapshot["outbox"] == {"pending": 0, "dropped": 0, "expired": 1}
+        assert snapshot["topics"]["tts/say"]["published"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_publish_is_queued(self, mqtt_url, mock_mqtt_client):
+        """A publish that fails mid-flight lands in the outbox instead of raising."""
+        client = MQTTClient(mqtt_url, "test-client", outbox_max_entries=10)
+
+        with patch("tars.adapters.mqtt_client.mqtt.Client", return_value=mock_mqtt_client):
+            await client.connect()
+        mock_mqtt_client.publish.side_effect = mqtt.MqttError("connection lost")
+
+        await client.publish_event("llm/response", "llm.response", {"reply": "ok"}, qos=1)
+        await client._flush_task
+
+        assert len(client._outbox) == 1
+
+    @pytest.mark.asyncio
+    async def test_disconnect_mid_flush_keeps_entry(self, mqtt_url, mock_mqtt_client):
+        """Cancelling the flush during a publish puts that entry back in the outbox."""
+        client = MQTTClient(mqtt_url, "test-client", outbox_max_entries=10)
+        await client.publish_event("tts/say", "tts.say", {"text": "one"}, qos=1)
+        started = asyncio.Event()
+
+        async def stalled_publish(*args, **kwargs):
+            started.set()
+            await asyncio.Event().wait()
+
+        mock_mqtt_client.publish.side_effect = stalled_publish
+        with patch("tars.adapters.mqtt_client.mqtt.Client", return_value=mock_mqtt_client):
+            await client.connect()
+            await started.wait()
+            await client.disconnect()
+
+        assert len(client._outbox) == 1
+        assert client._outbox.pop().topic == "tts/say"
+
+    @pytest.mark.asyncio
+    async def test_publisher_port_queues_across_reconnect(self, mqtt_url, mock_mqtt_client):
+        """Raw publishes via the Publisher port survive a disconnect/connect cycle."""
+        client = MQTTClient(mqtt_url, "test-client", outbox_max_entries=10)
+        with patch("tars.adapters.mqtt_client.mqtt.Client", return_value=mock_mqtt_client):
+            await client.connect()
+            await client.disconnect()
+
+            await client.publish("llm/request", b"one", qos=1)
+            await client.publish("llm/request", b"two", qos=1)
+            with pytest.raises(RuntimeError, match="not connected"):
+                await client.publish("stt/partial", b"x", qos=0)
+
+            mock_mqtt_client.publish.reset_mock()
+            await client.connect()
+            await client._flush_task
+
+        calls = mock_mqtt_client.publish.call_args_list
+        assert [(c[0][0], c[0][1]) for c in calls] == [("llm/request", b"one"), ("llm/request", b"two")]
+
+    @pytest.mark.asyncio
+    async def test_full_outbox_raises(self, mqtt_url):
+        """Once the outbox is full, publishing raises and counts a drop."""
+        client = MQTTClient(mqtt_url, "test-client", outbox_max_entries=1, outbox_ttl=0)
+
+        await client.publish_event("tts/say", "tts.say", {"text": "one"}, qos=1)
+        with pytest.raises(RuntimeError, match="outbox is full"):
+            await client.publish_event("tts/say", "tts.say", {"text": "two"}, qos=1)
+
+        assert client.metrics.topic("tts/say").dropped == 1
+
+    def test_config_from_env(self, monkeypatch):
+        """MQTTClientConfig.from_env reads outbox settings."""
+        monkeypatch.setenv("MQTT_URL", "mqtt://localhost:1883")
+        monkeypatch.setenv("MQTT_CLIENT_ID", "svc")
+        monkeypatch.setenv("MQTT_OUTBOX_MAX_ENTRIES", "500")
+        monkeypatch.setenv("MQTT_OUTBOX_PATH", "/tmp/outbox.jsonl")
+        monkeypatch.setenv("MQTT_OUTBOX_TTL", "5")
+
+        config = MQTTClientConfig.from_env()
+
+        assert config.outbox_max_entries == 500
+        assert config.outbox_path == "/tmp/outbox.jsonl"
+        assert config.outbox_ttl == 5.0
@@ -0,0 +1,208 @@
+"""Unit tests for the MQTT recorder/replayer and the ``tars`` CLI."""
+
+import asyncio
+
+import orjson
+import pytest
+
+from tars.adapters.mqtt_loopback import LoopbackBroker
+from tars.adapters.mqtt_recording import (
+    IdRemapper,
+    RecordingReader,
+    RecordingWriter,
+    record,
+    replay,
+)
+from tars.cli import main
+
+
+def _envelope(msg_id: str, **data) -> bytes:
+    return orjson.dumps({"id": msg_id, "type": "test.event", "ts": 0.0, "data": data})
+
+
+def _write(path, n: int, *, index_every: int = 4) -> None:
+    with RecordingWriter(path, index_every=index_every) as writer:
+        for i in range(n):
+            topic = "llm/stream" if i % 2 else "stt/final"
+            writer.append(topic, str(i).encode(), ts=1000.0 + i * 0.01)
+
+
+class _Sink:
+    def __init__(self) -> None:
+        self.sent: list[tuple[str, bytes]] = []
+        self.times: list[float] = []
+
+    async def publish(self, topic, payload=None, qos=0, retain=False):
+        self.sent.append((topic, payload))
+        self.times.append(asyncio.get_running_loop().time())
+
+
+class TestRecordingFile:
+    """Writer/reader format, index and crash tolerance."""
+
+    def test_roundtrip(self, tmp_path):
+        """Messages come back in order with timestamps and payloads intact."""
+        path = tmp_path / "session.tarsrec"
+        _write(path, 10)
+
+        reader = RecordingReader(path, index_every=4)
+        messages = list(reader)
+
+        assert reader.count == 10
+        assert [m.payload for m in messages] == [str(i).encode() for i in range(10)]
+        assert messages[3].topic == "llm/stream"
+        assert messages[3].ts == pytest.approx(1000.03)
+
+    def test_seek_by_time_and_topic_filter(self, tmp_path):
+        """start/end bound the window and topic filters use MQTT wildcards."""
+        path = tmp_path / "session.tarsrec"
+        _write(path, 20)
+        reader = RecordingReader(path, index_every=4)
+
+        window = list(reader.messages(start=1000.05, end=1000.10))
+        streams = list(reader.messages(topics=["llm/#"]))
+
+        assert [m.payload for m in window] == [b"5", b"6", b"7", b"8", b"9"]
+        assert len(streams) == 10
+        assert all(m.topic == "llm/stream" for m in streams)
+
+    def test_truncated_tail_is_ignored_and_resumed(self, tmp_path):
+        """A torn final record is skipped, then dropped when appending resumes."""
+        path = tmp_path / "session.tarsrec"
+        _write(path, 5)
+        with path.open("ab") as fh:
+            fh.write(b"\x00\x01\x02")
+
+        assert RecordingReader(path, index_every=4).count == 5
+
+        with RecordingWriter(path, index_every=4) as writer:
+            writer.append("tts/say", b"late", ts=2000.0)
+
+        reader = RecordingReader(path, index_every=4)
+        assert reader.count == 6
+        assert list(reader)[-1].payload == b"late"
+
+    def test_missing_index_is_rebuilt(self, tmp_path):
+        """Deleting the .idx file does not break seeking."""
+        path = tmp_path / "session.tarsrec"
+        _write(path, 12)
+        (tmp_path / "session.tarsrec.idx").unlink()
+
+        reader = RecordingReader(path, index_every=4)
+
+        assert [m.payload for m in reader.messages(start=1000.10)] == [b"10", b"11"]
+        assert (tmp_path / "session.tarsrec.idx").exists()
+
+    def test_rejects_foreign_file(self, tmp_path):
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"not a recording")
+
+        with pytest.raises(ValueError):
+            RecordingReader(path)
+
+
+class TestRecordReplay:
+    """Capturing from and replaying into a broker."""
+
+    @pytest.mark.asyncio
+    async def test_record_from_loopback(self, tmp_path):
+        """record() captures matching traffic until the limit is reached."""
+        broker = LoopbackBroker()
+        path = tmp_path / "live.tarsrec"
+        async with broker.client() as recorder, broker.client() as pub:
+            with RecordingWriter(path) as writer:
+                task = asyncio.create_task(record(recorder, writer, topics=["stt/#"], limit=3))
+                await asyncio.sleep(0.01)
+                await pub.publish("tts/say", b"skip")
+                for n in range(3):
+                    await pub.publish("stt/final", str(n).encode(), qos=1)
+                assert await asyncio.wait_for(task, 1.0) == 3
+
+        assert [(m.topic, m.payload) for m in RecordingReader(path)] == [
+            ("stt/final", b"0"),
+            ("stt/final", b"1"),
+            ("stt/final", b"2"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_replay_into_loopback_at_max_speed(self, tmp_path):
+        """A filtered replay reaches subscribers on the loopback broker."""
+        path = tmp_path / "session.tarsrec"
+        _write(path, 10)
+        broker = LoopbackBroker()
+        async with broker.client() as pub, broker.client() as sub:
+            await sub.subscribe("llm/stream", qos=1)
+            received: list[bytes] = []
+
+            async def _read() -> None:
+                async with sub.messages() as messages:
+                    async for message in messages:
+                        received.append(message.payload)
+                        if len(received) == 5:
+                            return
+
+            reader_task = asyncio.create_task(_read())
+            await asyncio.sleep(0)
+
+            stats = await replay(RecordingReader(path).messages(topics=["llm/stream"]), pub, speed=0)
+            await asyncio.wait_for(reader_task, 1.0)
+
+        assert stats.published == 5
+        assert received == [b"1", b"3", b"5", b"7", b"9"]
+
+    @pytest.mark.asyncio
+    async def test_replay_preserves_scaled_timing(self, tmp_path):
+        """Inter-message gaps follow the recording divided by speed."""
+        path = tmp_path / "timed.tarsrec"
+        with RecordingWriter(path) as writer:
+            for i in range(3):
+                writer.append("t", b"x", ts=10.0 + i * 0.1)
+        sink = _Sink()
+
+        await replay(RecordingReader(path), sink, speed=2.0)
+
+        gaps = [b - a for a, b in zip(sink.times, sink.times[1:])]
+        assert all(gap == pytest.approx(0.05, abs=0.03) for gap in gaps)
+
+    @pytest.mark.asyncio
+    async def test_remap_ids_keeps_correlation(self, tmp_path):
+        """Remapped ids are fresh but consistent across related messages."""
+        path = tmp_path / "ids.tarsrec"
+        with RecordingWriter(path) as writer:
+            writer.append("llm/request", _envelope("req-1", id="req-1", text="hi"), ts=1.0)
+            writer.append("llm/response", _envelope("resp-1", id="req-1", reply="yo"), ts=1.1)
+        sink = _Sink()
+
+        await replay(RecordingReader(path), sink, speed=0, remap_ids=True)
+
+        request, response = (orjson.loads(payload) for _, payload in sink.sent)
+        assert request["id"] != "req-1"
+        assert response["data"]["id"] == request["id"] == request["data"]["id"]
+        assert response["data"]["reply"] == "yo"
+
+    def test_remapper_passes_through_non_envelopes(self):
+        remapper = IdRemapper()
+
+        assert remapper.remap(b"raw audio") == b"raw audio"
+        assert remapper.remap(b'{"id": "x"}') == b'{"id": "x"}'
+
+
+class TestCli:
+    """``tars info`` output."""
+
+    def test_info_prints_summary(self, tmp_path, capsys):
+        path = tmp_path / "session.tarsrec"
+        _write(path, 6)
+
+        assert main(["info", str(path)]) == 0
+
+        summary = orjson.loads(capsys.readouterr().out)
+        assert summary["messages"] == 6
+        assert summary["topics"] == {"stt/final": 3, "llm/stream": 3}
+        assert summary["duration_sec"] == pytest.approx(0.05)
+
+    def test_info_reports_bad_file(self, tmp_path, capsys):
+        path = tmp_path / "missing.tarsrec"
+
+        assert main(["info", str(path)]) == 1
+        assert "tars info" in capsys.readouterr().err
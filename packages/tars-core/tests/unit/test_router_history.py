@@ -0,0 +1,100 @@
+"""Unit tests for the router's token-budgeted conversation history."""
+
+import time
+
+import pytest
+
+from tars.domain.router import ConversationHistory, estimate_tokens
+
+
+def _turns(history: ConversationHistory, count: int, words: int = 20) -> None:
+    for i in range(count):
+        role = "user" if i % 2 == 0 else "assistant"
+        history.add(role, f"Turn {i} starts here. Then " + "filler " * words)
+
+
+class TestEstimateTokens:
+    def test_counts_words_and_punctuation(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("Hello, world!") == 4
+
+    def test_long_words_cost_more(self):
+        assert estimate_tokens("internationalization") > estimate_tokens("cat")
+
+
+class TestConversationHistory:
+    def test_window_stays_within_budget(self):
+        history = ConversationHistory(token_budget=200, max_messages=100)
+        _turns(history, 50)
+
+        assert history.tokens <= 200
+        assert history.tokens == sum(estimate_tokens(m.content) for m in history.messages())
+        assert history.messages()[-1].content.startswith("Turn 49")
+
+    def test_max_messages_caps_turns(self):
+        history = ConversationHistory(token_budget=10_000, max_messages=4)
+        _turns(history, 10, words=1)
+
+        assert [m.content.split()[1] for m in history.messages()] == ["6", "7", "8", "9"]
+
+    def test_evicted_turns_fold_into_bounded_summary(self):
+        history = ConversationHistory(token_budget=100, max_messages=100, summary_budget=40)
+        _turns(history, 30)
+
+        context = history.context()
+        assert context is not None and "Earlier in this conversation:" in context
+        assert "filler" not in history.summary  # first sentence only
+        assert estimate_tokens(history.summary) <= 40 + 10
+        assert "Turn 0 " not in history.summary  # oldest summary lines roll off
+
+    def test_oversized_message_is_clipped(self):
+        history = ConversationHistory(token_budget=100)
+        history.add("assistant", "word " * 500)
+
+        assert len(history) == 1
+        assert history.tokens <= 50
+        assert history.messages()[0].content.endswith("…")
+
+    def test_pinned_facts_survive_eviction_and_clear(self):
+        history = ConversationHistory(token_budget=60, summary_budget=0)
+        history.add("user", "Remember that my cat is called Nova.")
+        history.add("user", "By the way, my name is Sam and I like tea.")
+        _turns(history, 20)
+        history.clear()
+
+        assert history.facts == ["my cat is called Nova", "my name is Sam"]
+        assert history.messages() == []
+        assert history.context() == (
+            "Facts the user asked you to remember:\n- my cat is called Nova\n- my name is Sam"
+        )
+
+    def test_pins_are_deduplicated_and_bounded(self):
+        history = ConversationHistory(max_facts=2)
+        for fact in ("a is 1", "b is 2", "A is 1", "c is 3"):
+            history.pin(fact)
+
+        assert history.facts == ["A is 1", "c is 3"]
+
+    def test_empty_history_has_no_context(self):
+        history = ConversationHistory()
+        history.add("user", "   ")
+
+        assert len(history) == 0
+        assert history.context() is None
+
+    def test_invalid_budget(self):
+        with pytest.raises(ValueError):
+            ConversationHistory(token_budget=0)
+
+    def test_long_session_cost_is_flat(self):
+        """Adding a turn and building the window do not grow with session length."""
+        history = ConversationHistory()
+        started = time.perf_counter()
+        for i in range(5000):
+            history.add("user", f"Question {i}. " + "word " * 30)
+            history.messages()
+            history.context()
+        elapsed = time.perf_counter() - started
+
+        assert history.tokens <= history.token_budget
+        assert elapsed < 5.0
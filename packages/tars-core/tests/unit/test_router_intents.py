@@ -0,0 +1,135 @@
+"""Unit tests for the compiled router intent grammar."""
+
+import time
+
+import pytest
+
+from tars.domain.router import IntentMatcher, IntentSpec
+from tars.domain.router.intents import default_intent_matcher
+
+
+@pytest.fixture(scope="module")
+def matcher() -> IntentMatcher:
+    return default_intent_matcher()
+
+
+class TestDefaultGrammar:
+    @pytest.mark.parametrize(
+        "text,intent",
+        [
+            ("wave your hand", "movement.wave"),
+            ("please move back", "movement.step_backward"),
+            ("walk forward", "movement.step_forward"),
+            ("rotate left", "movement.turn_left"),
+            ("drop the mic", "movement.mic_drop"),
+            ("Now!", "movement.now"),
+            ("what time is it now", "time"),
+            ("say stop moving", "say"),
+            ("hello, can you take a bow", "movement.bow"),
+            ("hiya", "greeting"),
+        ],
+    )
+    def test_routes(self, matcher, text, intent):
+        found = matcher.match(text)
+
+        assert found is not None and found.name == intent
+
+    @pytest.mark.parametrize(
+        "text", ["put it in the microwave", "I know", "for what purpose", "this elbow hurts", "", "!!!"]
+    )
+    def test_no_substring_false_positives(self, matcher, text):
+        assert matcher.match(text) is None
+
+    def test_say_keeps_raw_text(self, matcher):
+        found = matcher.match("Say Hello, World!")
+
+        assert found.slots == {"text": "Hello, World!"}
+        assert found.score == 1.0
+
+    def test_say_is_prefix_only(self, matcher):
+        assert matcher.match("did you say that") is None
+
+
+class TestIntentMatcher:
+    def test_slots_and_choices(self):
+        matcher = IntentMatcher(
+            [
+                IntentSpec(
+                    name="volume",
+                    phrases=("set volume to {level}", "turn it {direction}"),
+                    slots={"level": "number", "direction": ["up", "down"]},
+                ),
+                IntentSpec(name="remind", phrases=("remind me to {task} at {hour}",), slots={"hour": "number"}),
+            ]
+        )
+
+        assert matcher.match("set volume to seven").slots == {"level": 7}
+        assert matcher.match("set volume to 12 please").slots == {"level": 12}
+        assert matcher.match("set volume to loud") is None
+        assert matcher.match("turn it down").slots == {"direction": "down"}
+        assert matcher.match("turn it sideways") is None
+        assert matcher.match("remind me to feed the cat at 5").slots == {"task": "feed the cat", "hour": 5}
+
+    def test_ranking_and_min_score(self):
+        matcher = IntentMatcher(
+            [
+                IntentSpec(name="lights", phrases=("lights",), min_score=0.5),
+                IntentSpec(name="lights.off", phrases=("lights off",)),
+                IntentSpec(name="urgent", phrases=("off",), priority=5),
+            ]
+        )
+
+        assert matcher.match("lights").name == "lights"
+        assert [m.name for m in matcher.matches("lights off")] == ["urgent", "lights.off", "lights"]
+        assert matcher.match("could you dim the lights") is None
+
+    def test_match_modes(self):
+        matcher = IntentMatcher(
+            [IntentSpec(name="exact", phrases=("go",), match="exact"), IntentSpec(name="prefix", phrases=("stop",), match="prefix")]
+        )
+
+        assert matcher.match("go").name == "exact"
+        assert matcher.match("go home") is None
+        assert matcher.match("stop now").name == "prefix"
+        assert matcher.match("please stop") is None
+
+    def test_from_file(self, tmp_path):
+        grammar = tmp_path / "intents.yaml"
+        grammar.write_text(
+            "synonyms:\n  lamp: [light, lights]\n"
+            "intents:\n"
+            "  - name: lamp.on\n    phrases: ['lamp on', 'switch on the lamp']\n    reply: On.\n"
+            "  - name: dim\n    phrases: 'dim to {pct}'\n    slots: {pct: number}\n    priority: 2\n"
+        )
+
+        matcher = IntentMatcher.from_file(grammar)
+
+        assert matcher.match("switch on the lights").intent.reply == "On."
+        assert matcher.match("dim to 40").slots == {"pct": 40}
+
+    def test_invalid_specs(self):
+        with pytest.raises(ValueError):
+            IntentSpec(name="x", phrases=())
+        with pytest.raises(ValueError):
+            IntentSpec(name="x", phrases=("a",), match="fuzzy")
+        with pytest.raises(ValueError):
+            IntentSpec(name="x", phrases=("a {b}",), slots={"b": "date"})
+        with pytest.raises(ValueError):
+            IntentMatcher([IntentSpec(name="x", phrases=("{b} a",))])
+
+    def test_cost_is_flat_in_pattern_count(self):
+        """Matching 5000 intents costs about the same as matching 50."""
+        text = "could you please tell me something about the weather in town today"
+
+        def per_match(count: int) -> float:
+            matcher = IntentMatcher(
+                [IntentSpec(name=f"i{i}", phrases=(f"command {i} alpha", f"do thing {i}")) for i in range(count)]
+            )
+            started = time.perf_counter()
+            for _ in range(500):
+                matcher.match(text)
+            return time.perf_counter() - started
+
+        small, large = per_match(50), per_match(5000)
+
+        assert large < small * 5 + 0.05
@@ -0,0 +1,72 @@
+"""Unit tests for the router's per-source session store."""
+
+import pytest
+
+from tars.domain.router import ConversationHistory, RouterSession, SessionStore
+from tars.domain.router.session import DEFAULT_SOURCE
+from tars.domain.router.speculation import PartialTracker
+
+
+def _factory(source: str) -> RouterSession:
+    return RouterSession(source=source, history=ConversationHistory(), partials=PartialTracker())
+
+
+class TestSessionStore:
+    """Keying, LRU/idle eviction and request ownership."""
+
+    def test_missing_source_uses_default_session(self):
+        store = SessionStore(_factory)
+
+        assert store.get(None) is store.get("") is store.get(DEFAULT_SOURCE)
+        assert store.get("kitchen") is not store.get(None)
+        assert len(store) == 2
+
+    def test_evicts_least_recently_used(self):
+        store = SessionStore(_factory, max_sessions=2)
+        a = store.get("a")
+        store.get("b")
+        store.get("a")  # refresh a; b is now the oldest
+
+        store.get("c")
+
+        assert store.peek("a") is a
+        assert store.peek("b") is None
+        assert len(store) == 2
+
+    def test_evicts_idle_sessions(self):
+        store = SessionStore(_factory, idle_sec=10.0)
+        store.get("a").last_seen -= 60.0
+
+        store.get("b")
+
+        assert store.peek("a") is None
+        assert store.peek("b") is not None
+
+    def test_owner_maps_ids_back_to_their_session(self):
+        store = SessionStore(_factory, max_sessions=2)
+        a = store.get("a")
+        store.bind("req-1", a)
+
+        assert store.owner("req-1") is a
+        assert store.owner("never-issued") is store.get(DEFAULT_SOURCE)
+
+    def test_owner_of_evicted_session_is_none(self):
+        store = SessionStore(_factory, max_sessions=1)
+        store.bind("req-1", store.get("a"))
+
+        store.get("b")
+
+        assert store.owner("req-1") is None
+
+    def test_owner_map_is_bounded(self):
+        store = SessionStore(_factory, max_sessions=1)
+        session = store.get("a")
+        for i in range(100):
+            store.bind(f"req-{i}", session)
+
+        assert store.owner("req-99") is session
+        assert store.owner("req-0") is store.get(DEFAULT_SOURCE)
+
+    def test_rejects_non_positive_capacity(self):
+        with pytest.raises(ValueError):
+            SessionStore(_factory, max_sessions=0)
@@ -0,0 +1,87 @@
+"""Unit tests for the incremental sentence segmenter."""
+
+import json
+import random
+import time
+from pathlib import Path
+
+import pytest
+
+from tars.domain.segmenter import SegmentPolicy, SentenceSegmenter, segment_stream, split_sentences
+
+GOLDEN = json.loads((Path(__file__).parent.parent / "data" / "segmenter_golden.json").read_text())
+
+
+def _chunks(text: str, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    parts, i = [], 0
+    while i < len(text):
+        step = rng.randint(1, 7)
+        parts.append(text[i : i + step])
+        i += step
+    return parts
+
+
+@pytest.mark.parametrize("case", GOLDEN, ids=[case["name"] for case in GOLDEN])
+class TestGoldenCorpus:
+    """Expected sentences for tricky inputs, whole or streamed."""
+
+    def test_whole_text(self, case):
+        policy = SegmentPolicy(**case.get("policy", {}))
+
+        assert split_sentences(case["text"], policy) == case["expected"]
+
+    def test_streamed_deltas_match(self, case):
+        """Any delta split yields the same sentences as the whole text."""
+        policy = SegmentPolicy(**case.get("policy", {}))
+
+        for seed in range(20):
+            assert segment_stream(_chunks(case["text"], seed), policy) == case["expected"]
+
+
+class TestSentenceSegmenter:
+    """Streaming behaviour and policy validation."""
+
+    def test_emits_once_boundary_is_certain(self):
+        segmenter = SentenceSegmenter()
+
+        assert segmenter.push("It is 3.") == []
+        assert segmenter.push("5 degrees.") == []
+        assert segmenter.push(" Cold") == ["It is 3.5 degrees."]
+        assert segmenter.pending == "Cold"
+        assert segmenter.finish() == "Cold"
+        assert segmenter.pending == ""
+
+    def test_ellipsis_waits_for_next_word(self):
+        segmenter = SentenceSegmenter()
+
+        assert segmenter.push("Well... ") == []
+        assert segmenter.push("OK then") == ["Well..."]
+
+    def test_long_sentences_stream_like_whole_text(self):
+        """Compacted scan state keeps abbreviation and list checks intact."""
+        text = "alpha " * 80 + "met Dr. Who there. Beta " + "beta " * 80 + "end.\n2. Next item."
+        expected = [("alpha " * 80 + "met Dr. Who there.").strip(), ("Beta " + "beta " * 80 + "end.").strip(), "2. Next item."]
+
+        assert split_sentences(text) == expected
+        for seed in range(5):
+            assert segment_stream(_chunks(text, seed)) == expected
+
+    def test_invalid_policy(self):
+        with pytest.raises(ValueError):
+            SegmentPolicy(boundary_chars="")
+        with pytest.raises(ValueError):
+            SegmentPolicy(max_chars=0)
+
+    def test_long_unterminated_stream_is_linear(self):
+        """Token-sized deltas without boundaries do not rescan the buffer."""
+        segmenter = SentenceSegmenter()
+        deltas = ["word "] * 20000
+
+        started = time.perf_counter()
+        for delta in deltas:
+            segmenter.push(delta)
+        elapsed = time.perf_counter() - started
+
+        assert len(segmenter.finish()) == len("word ") * 20000 - 1
+        assert elapsed < 1.0
@@ -0,0 +1,227 @@
+"""Unit tests for envelope trace propagation, span export and the trace collector."""
+
+import asyncio
+
+import orjson
+import pytest
+
+from tars.adapters.mqtt_client import MQTTClient
+from tars.adapters.mqtt_loopback import LoopbackBroker
+from tars.adapters.mqtt_recording import RecordingWriter
+from tars.cli import main
+from tars.contracts.envelope import Envelope, TraceContext
+from tars.contracts.v1 import EVENT_TYPE_TRACE_SPANS, SpanRecord, TraceSpans
+from tars.runtime.tracing import TraceCollector, Tracer, current_trace, trace_from_payload, use_trace
+
+
+def _span(trace_id: str, span_id: str, name: str, start: float, end: float, parent_id=None) -> SpanRecord:
+    return SpanRecord(
+        trace_id=trace_id,
+        span_id=span_id,
+        parent_id=parent_id,
+        name=name,
+        service=name.split(".")[0],
+        start=start,
+        end=end,
+    )
+
+
+def _spans_message(service: str, spans: list[SpanRecord]) -> bytes:
+    envelope = Envelope.new(event_type=EVENT_TYPE_TRACE_SPANS, data=TraceSpans(service=service, spans=spans))
+    return envelope.model_dump_json().encode()
+
+
+class TestTracer:
+    """Span recording and context handling."""
+
+    def test_spans_nest_under_current_context(self):
+        tracer = Tracer("svc", enabled=True)
+
+        with tracer.span("svc.turn", new_trace=True) as root:
+            with tracer.span("svc.stage", k=5) as child:
+                assert current_trace() == TraceContext(trace_id=root.trace_id, span_id=child.span_id)
+            late = tracer.record("svc.measured", 1.0, 2.0)
+
+        assert current_trace() is None
+        assert child.parent_id == root.span_id
+        assert late.parent_id == root.span_id and late.duration == 1.0
+        assert [s.name for s in tracer.drain()] == ["svc.stage", "svc.measured", "svc.turn"]
+        assert child.attrs == {"k": 5}
+
+    def test_untraced_code_records_nothing(self):
+        """Without a parent or new_trace, spans are no-ops."""
+        tracer = Tracer("svc", enabled=True)
+
+        with tracer.span("svc.idle") as span:
+            pass
+
+        assert span is None
+        assert tracer.record("svc.idle", 0.0, 1.0) is None
+        assert tracer.batch() is None
+
+    def test_disabled_tracer_never_starts_traces(self):
+        tracer = Tracer("svc", enabled=False)
+
+        with tracer.span("svc.turn", new_trace=True) as span:
+            assert current_trace() is None
+
+        assert span is None
+
+    def test_errors_are_tagged(self):
+        tracer = Tracer("svc", enabled=True)
+
+        with pytest.raises(RuntimeError):
+            with tracer.span("svc.fail", new_trace=True):
+                raise RuntimeError("boom")
+
+        assert tracer.drain()[0].attrs["error"] == "RuntimeError"
+
+    def test_trace_from_payload(self):
+        trace = TraceContext(trace_id="t1", span_id="s1")
+        traced = Envelope.new(event_type="x", data={"a": 1}, trace=trace).model_dump_json().encode()
+        plain = Envelope.new(event_type="x", data={"a": 1}).model_dump_json().encode()
+
+        assert trace_from_payload(traced) == trace
+        assert trace_from_payload(plain) is None
+        assert trace_from_payload(b'{"trace":{broken') is None
+
+
+class TestPropagation:
+    """Trace context crossing services over the loopback broker."""
+
+    @pytest.mark.asyncio
+    async def test_context_follows_publish_and_spans_are_exported(self):
+        """A reply published by a handler joins the sender's trace; spans reach system/trace."""
+        broker = LoopbackBroker(latency=0.001)
+        front_tracer = Tracer("front", enabled=True)
+        back_tracer = Tracer("back", enabled=True)
+        front = MQTTClient("mqtt://loopback", "front", client_factory=broker.client, tracer=front_tracer)
+        back = MQTTClient(
+            "mqtt://loopback", "back", client_factory=broker.client, tracer=back_tracer, trace_export_interval=0.01
+        )
+        collector = TraceCollector()
+        replies: asyncio.Queue[bytes] = asyncio.Queue()
+
+        async def on_request(payload: bytes) -> None:
+            with back_tracer.span("back.work"):
+                await back.publish_event("demo/reply", "demo.reply", {"ok": True}, qos=1)
+
+        async def on_reply(payload: bytes) -> None:
+            await replies.put(payload)
+
+        async def on_spans(payload: bytes) -> None:
+            collector.add_message("system/trace/back", payload)
+
+        await front.connect()
+        await back.connect()
+        try:
+            await back.subscribe("demo/request", on_request, qos=1)
+            await front.subscribe("demo/reply", on_reply, qos=1)
+            await front.subscribe("system/trace/back", on_spans, qos=0)
+
+            with front_tracer.span("front.turn", new_trace=True) as root:
+                await front.publish_event("demo/request", "demo.request", {"q": 1}, qos=1)
+            reply = Envelope.model_validate_json(await asyncio.wait_for(replies.get(), 1.0))
+            for _ in range(100):
+                if collector.trace_ids:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await back.shutdown()
+            await front.shutdown()
+
+        assert reply.trace is not None and reply.trace.trace_id == root.trace_id
+        (work,) = collector.spans(root.trace_id)
+        assert work.name == "back.work"
+        assert work.parent_id == root.span_id
+        assert reply.trace.span_id == work.span_id
+
+    @pytest.mark.asyncio
+    async def test_untraced_handlers_publish_untraced(self):
+        broker = LoopbackBroker(latency=0.001)
+        client = MQTTClient("mqtt://loopback", "solo", client_factory=broker.client)
+        seen: asyncio.Queue[bytes] = asyncio.Queue()
+
+        async def on_event(payload: bytes) -> None:
+            await seen.put(payload)
+
+        await client.connect()
+        try:
+            await client.subscribe("demo/event", on_event, qos=1)
+            with use_trace(None):
+                await client.publish_event("demo/event", "demo.event", {"n": 1}, qos=1)
+            payload = await asyncio.wait_for(seen.get(), 1.0)
+        finally:
+            await client.shutdown()
+
+        assert Envelope.model_validate_json(payload).trace is None
+
+
+class TestCollector:
+    """Waterfalls and per-stage percentiles from exported batches."""
+
+    def _collector(self) -> TraceCollector:
+        collector = TraceCollector()
+        for turn in range(4):
+            t0 = 100.0 + turn * 10
+            trace_id = f"turn-{turn}"
+            collector.add_message(
+                "system/trace/stt",
+                _spans_message("stt", [_span(trace_id, "a", "stt.utterance", t0, t0 + 0.5)]),
+            )
+            collector.add_message(
+                "system/trace/llm",
+                _spans_message(
+                    "llm",
+                    [
+                        _span(trace_id, "b", "llm.request", t0 + 0.6, t0 + 1.6, parent_id="a"),
+                        _span(trace_id, "c", "llm.rag", t0 + 0.6, t0 + 0.6 + 0.1 * (turn + 1), parent_id="b"),
+                    ],
+                ),
+            )
+        return collector
+
+    def test_waterfall_orders_and_nests_spans(self):
+        collector = self._collector()
+
+        rows = collector.waterfall("turn-0")
+
+        assert [(r["name"], r["depth"]) for r in rows] == [
+            ("stt.utterance", 0),
+            ("llm.request", 1),
+            ("llm.rag", 2),
+        ]
+        assert rows[1]["offset_ms"] == pytest.approx(600.0)
+        assert rows[1]["duration_ms"] == pytest.approx(1000.0)
+        assert "llm.rag" in collector.format_waterfall("turn-0")
+
+    def test_stage_latencies(self):
+        stats = self._collector().stage_latencies()
+
+        assert stats["llm.rag"]["count"] == 4
+        assert stats["llm.rag"]["p50"] == pytest.approx(200.0)
+        assert stats["llm.rag"]["max"] == pytest.approx(400.0)
+        assert stats["stt.utterance"]["p99"] == pytest.approx(500.0)
+
+    def test_ignores_foreign_messages(self):
+        collector = TraceCollector()
+
+        assert collector.add_message("stt/final", b"{}") == 0
+        assert collector.add_message("system/trace/stt", b"not json") == 0
+        assert collector.trace_ids == []
+
+    def test_cli_reads_recording(self, tmp_path, capsys):
+        path = tmp_path / "traces.tarsrec"
+        spans = [_span("t1", "a", "stt.utterance", 1.0, 1.25), _span("t1", "b", "llm.request", 1.3, 2.0, "a")]
+        with RecordingWriter(path) as writer:
+            writer.append("stt/final", b"{}", ts=1.0)
+            writer.append("system/trace/stt", _spans_message("stt", spans), ts=2.0)
+
+        assert main(["trace", str(path)]) == 0
+        summary = orjson.loads(capsys.readouterr().out)
+        assert summary["turns"] == 1
+        assert summary["stages"]["stt.utterance"]["p50"] == pytest.approx(250.0)
+
+        assert main(["trace", str(path), "--last"]) == 0
+        assert "llm.request" in capsys.readouterr().out
+        assert main(["trace", str(path), "--trace-id", "nope"]) == 1